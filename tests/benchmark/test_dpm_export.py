@@ -0,0 +1,169 @@
+# Copyright 2026 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark for Cpc.export_dpm_configuration() on a synthetic large CPC.
+"""
+
+
+import time
+import pytest
+
+from zhmcclient import Client
+from zhmcclient.mock import FakedSession
+
+# Size of the synthetic DPM configuration
+NUM_PARTITIONS = 2000
+NUM_NICS_PER_PARTITION = 2
+NUM_HBAS_PER_PARTITION = 2
+NUM_ADAPTERS = 100
+NUM_VSWITCHES = 50
+
+
+def extract_by_parent(classname, parent_list, inventory_list):
+    """
+    Return all items from inventory_list that have the classname and where the
+    parent is in parent_list, by scanning the entire inventory list.
+
+    This is the approach export_dpm_configuration() used before it used an
+    index of the inventory list, and is used as a reference.
+    """
+    return [x for x in inventory_list
+            if x['class'] == classname and x['parent'] in parent_list]
+
+
+def setup_faked_hmc():
+    """
+    Set up a faked HMC with a DPM mode CPC that has a large synthetic DPM
+    configuration, and return the faked session.
+    """
+    session = FakedSession('fake-host', 'fake-hmc', '2.16.0', '4.10')
+    session.hmc.consoles.add({
+        'object-id': None,
+        'parent': None,
+        'class': 'console',
+        'name': 'fake-console1',
+        'version': '2.16.0',
+    })
+    faked_cpc = session.hmc.cpcs.add({
+        'object-id': 'cpc1-oid',
+        'parent': None,
+        'class': 'cpc',
+        'name': 'CPC1',
+        'dpm-enabled': True,
+        'se-version': '2.16.0',
+        'available-features-list': [],
+    })
+    port_uris = []
+    for i in range(NUM_ADAPTERS):
+        faked_adapter = faked_cpc.adapters.add({
+            'object-id': f'osa{i}-oid',
+            'parent': faked_cpc.uri,
+            'class': 'adapter',
+            'name': f'osa{i}',
+            'adapter-family': 'osa',
+            'type': 'osd',
+        })
+        faked_port = faked_adapter.ports.add({
+            'element-id': '0',
+            'parent': faked_adapter.uri,
+            'class': 'network-port',
+            'name': 'port0',
+        })
+        port_uris.append(faked_port.uri)
+    for i in range(NUM_VSWITCHES):
+        faked_cpc.virtual_switches.add({
+            'object-id': f'vswitch{i}-oid',
+            'parent': faked_cpc.uri,
+            'class': 'virtual-switch',
+            'name': f'vswitch{i}',
+            'backing-adapter-uri': f'/api/adapters/osa{i}-oid',
+        })
+    for i in range(NUM_PARTITIONS):
+        faked_partition = faked_cpc.partitions.add({
+            'object-id': f'part{i}-oid',
+            'parent': faked_cpc.uri,
+            'class': 'partition',
+            'name': f'part{i}',
+        })
+        for j in range(NUM_NICS_PER_PARTITION):
+            faked_partition.nics.add({
+                'element-id': f'nic{j}',
+                'parent': faked_partition.uri,
+                'class': 'nic',
+                'name': f'nic{j}',
+                'virtual-switch-uri':
+                    f'/api/virtual-switches/vswitch{i % NUM_VSWITCHES}-oid',
+            })
+        for j in range(NUM_HBAS_PER_PARTITION):
+            faked_partition.hbas.add({
+                'element-id': f'hba{j}',
+                'parent': faked_partition.uri,
+                'class': 'hba',
+                'name': f'hba{j}',
+            })
+    return session
+
+
+@pytest.mark.parametrize(
+    "include_unused_adapters", [False, True]
+)
+def test_benchmark_dpm_export(include_unused_adapters):
+    """
+    Benchmark Cpc.export_dpm_configuration() for a CPC with a large number of
+    partitions, and compare the result with the linear scans over the
+    inventory list that were used before the export was indexed.
+    """
+    session = setup_faked_hmc()
+    client = Client(session)
+    cpc = client.cpcs.find(name='CPC1')
+
+    start = time.perf_counter()
+
+    # The code to be benchmarked
+    config = cpc.export_dpm_configuration(
+        include_unused_adapters=include_unused_adapters)
+
+    export_time = time.perf_counter() - start
+
+    assert len(config['partitions']) == NUM_PARTITIONS
+    assert len(config['nics']) == NUM_PARTITIONS * NUM_NICS_PER_PARTITION
+    assert len(config['hbas']) == NUM_PARTITIONS * NUM_HBAS_PER_PARTITION
+    assert len(config['virtual-switches']) == NUM_VSWITCHES
+    if include_unused_adapters:
+        assert len(config['adapters']) == NUM_ADAPTERS
+        assert len(config['network-ports']) == NUM_ADAPTERS
+    else:
+        assert len(config['adapters']) == NUM_VSWITCHES
+        assert len(config['network-ports']) == NUM_VSWITCHES
+
+    # Reference: The linear scans for the partition children alone
+    inventory_list = client.get_inventory(['dpm-resources'])
+    start = time.perf_counter()
+    partition_uris = [x['object-uri'] for x in inventory_list
+                      if x['class'] == 'partition']
+    ref_nics = extract_by_parent('nic', partition_uris, inventory_list)
+    ref_hbas = extract_by_parent('hba', partition_uris, inventory_list)
+    scan_time = time.perf_counter() - start
+
+    assert sorted(n['element-uri'] for n in config['nics']) == \
+        sorted(n['element-uri'] for n in ref_nics)
+    assert sorted(h['element-uri'] for h in config['hbas']) == \
+        sorted(h['element-uri'] for h in ref_hbas)
+
+    print(f"\nexport_dpm_configuration("
+          f"include_unused_adapters={include_unused_adapters}) with "
+          f"{len(inventory_list)} inventory items: "
+          f"{export_time:.3f} s (linear scans for NICs and HBAs alone: "
+          f"{scan_time:.3f} s)")
@@ -0,0 +1,56 @@
+# Copyright 2026 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark for exporting large metrics responses in the OpenMetrics text
+format with OpenMetricsExporter.
+"""
+
+
+import time
+
+from zhmcclient import Client, MetricsResponse, OpenMetricsExporter
+from zhmcclient.mock import FakedSession
+
+from .test_metrics_parse import METRIC_GROUPS, NUM_RESOURCES, \
+    metrics_response_str
+
+
+def test_metrics_export():
+    """
+    Benchmark the first scrape and a subsequent scrape of a large metrics
+    response, each including the columnar parsing.
+    """
+    session = FakedSession('fake-host', 'fake-hmc', '2.16.0', '4.10')
+    client = Client(session)
+    mc = client.metrics_contexts.create({
+        'anticipated-frequency-seconds': 15,
+        'metric-groups': METRIC_GROUPS,
+    })
+    mr_str = metrics_response_str(mc)
+    exporter = OpenMetricsExporter(resolve_resources=False)
+
+    times = []
+    for _ in range(2):
+        start = time.perf_counter()
+        mr = MetricsResponse(mc, mr_str, columnar=True)
+        text = exporter.export(mr)
+        times.append(time.perf_counter() - start)
+
+    num_samples = sum(
+        1 for line in text.splitlines() if not line.startswith('#'))
+    assert num_samples > NUM_RESOURCES * len(METRIC_GROUPS)
+    print(f"\nOpenMetrics export of {num_samples} samples: "
+          f"first scrape: {times[0]:.3f} s, "
+          f"subsequent scrape: {times[1]:.3f} s")
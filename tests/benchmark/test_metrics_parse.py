@@ -0,0 +1,104 @@
+# Copyright 2026 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark for parsing large metrics response strings with MetricsResponse.
+"""
+
+
+import time
+
+from zhmcclient import Client, MetricsResponse
+from zhmcclient.mock import FakedSession
+
+# Size of the synthetic metrics response
+NUM_RESOURCES = 2000
+METRIC_GROUPS = [
+    'logical-partition-usage',
+    'partition-usage',
+    'channel-usage',
+    'zcpc-environmentals-and-power',
+]
+
+# Millisecond timestamp of the synthetic metric values
+TIMESTAMP = 1767268800000
+
+
+def metrics_response_str(mc):
+    """
+    Return a synthetic metrics response string for the metric groups of a
+    metrics context, with NUM_RESOURCES resources in each metric group.
+    """
+    sample_values = {
+        'integer-metric': '42',
+        'long-metric': '4200000000',
+        'double-metric': '21.5',
+        'boolean-metric': 'true',
+        'string-metric': '"CHN01"',
+    }
+    lines = []
+    for mg_info in mc.get_property('metric-group-infos'):
+        mg_name = mg_info['group-name']
+        row = ','.join(sample_values[m['metric-type']]
+                       for m in mg_info['metric-infos'])
+        lines.append(f'"{mg_name}"')
+        for i in range(NUM_RESOURCES):
+            lines.append(f'"/api/logical-partitions/lpar{i}-oid"')
+            lines.append(str(TIMESTAMP))
+            lines.append(row)
+            lines.append('')
+        lines.append('')
+    lines.append('')
+    return '\n'.join(lines) + '\n'
+
+
+def test_metrics_parse():
+    """
+    Benchmark parsing a large metrics response string row-based, columnar,
+    and lazily for only one metric group.
+    """
+    session = FakedSession('fake-host', 'fake-hmc', '2.16.0', '4.10')
+    client = Client(session)
+    mc = client.metrics_contexts.create({
+        'anticipated-frequency-seconds': 15,
+        'metric-groups': METRIC_GROUPS,
+    })
+    mr_str = metrics_response_str(mc)
+
+    start = time.perf_counter()
+    mr = MetricsResponse(mc, mr_str)
+    rows_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    mr_col = MetricsResponse(mc, mr_str, columnar=True)
+    mg_columns = mr_col.metric_group_columns
+    columnar_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    mr_lazy = MetricsResponse(mc, mr_str, lazy=True)
+    mgv_lazy = mr_lazy.metric_group(METRIC_GROUPS[0])
+    lazy_time = time.perf_counter() - start
+
+    assert len(mgv_lazy.object_values) == NUM_RESOURCES
+    assert len(mg_columns) == len(METRIC_GROUPS)
+    for mgc, mgv in zip(mg_columns, mr.metric_group_values):
+        assert len(mgc) == NUM_RESOURCES
+        ov = mgv.object_values[-1]
+        for m_name, m_value in ov.metrics.items():
+            assert mgc.columns[m_name][-1] == m_value
+
+    num_rows = NUM_RESOURCES * len(METRIC_GROUPS)
+    print(f"\nMetricsResponse parsing of {num_rows} value rows: "
+          f"row-based: {rows_time:.3f} s, columnar: {columnar_time:.3f} s, "
+          f"lazy with one metric group: {lazy_time:.3f} s")
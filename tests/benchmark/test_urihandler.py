@@ -0,0 +1,94 @@
+# Copyright 2026 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark for looking up the URI handlers of the zhmcclient mock support
+over the full URI table.
+"""
+
+
+import re
+import time
+
+from zhmcclient.mock._urihandler import UriHandler, URIS, \
+    URI_HANDLER_CACHE_SIZE
+
+# Number of rounds over the sample URIs
+NUM_ROUNDS = 200
+
+# Number of distinct resource IDs in the sample URIs
+NUM_OIDS = 20
+
+
+def sample_uris():
+    """
+    Return sample URIs that match the URI patterns of the URIS table, with
+    NUM_OIDS different resource IDs.
+    """
+    uris = []
+    for uri_pattern, _ in URIS:
+        for i in range(NUM_OIDS):
+            uri = uri_pattern.replace('([^/]+)', f'oid-{i}'). \
+                replace('([^?/]+)', f'oid-{i}'). \
+                replace(r'(?:\?(.*))?', '')
+            uris.append(uri)
+    return uris
+
+
+def linear_handler(uri_handlers, uri):
+    """
+    Return the handler for a URI by matching all URI patterns in their order.
+    """
+    for uri_pattern, handler_class in uri_handlers:
+        m = uri_pattern.match(uri)
+        if m:
+            return handler_class, m.groups()
+    return None
+
+
+def test_urihandler_lookup():
+    """
+    Benchmark looking up the URI handlers for URIs of the full URI table,
+    with a linear scan over all URI patterns, with the UriHandler lookup
+    without cache hits, and with cache hits.
+    """
+    uris = sample_uris()
+    uri_handlers = [(re.compile('^' + uri + '$'), handler_class)
+                    for uri, handler_class in URIS]
+
+    start = time.perf_counter()
+    for _ in range(NUM_ROUNDS):
+        exp_results = [linear_handler(uri_handlers, uri) for uri in uris]
+    linear_time = time.perf_counter() - start
+
+    urihandler = UriHandler(URIS)
+    assert len(uris) > URI_HANDLER_CACHE_SIZE
+    start = time.perf_counter()
+    for _ in range(NUM_ROUNDS):
+        # The number of URIs exceeds the cache size, so no cache hits
+        results = [urihandler.handler(uri, 'GET') for uri in uris]
+    uncached_time = time.perf_counter() - start
+    assert results == exp_results
+
+    cached_uris = uris[:URI_HANDLER_CACHE_SIZE]
+    start = time.perf_counter()
+    for _ in range(NUM_ROUNDS * len(uris) // len(cached_uris)):
+        results = [urihandler.handler(uri, 'GET') for uri in cached_uris]
+    cached_time = time.perf_counter() - start
+
+    num_lookups = NUM_ROUNDS * len(uris)
+    print(f"\nUriHandler lookup of {num_lookups} URIs for {len(URIS)} URI "
+          f"patterns: linear scan: {linear_time:.3f} s, "
+          f"without cache hits: {uncached_time:.3f} s, "
+          f"with cache hits: {cached_time:.3f} s")
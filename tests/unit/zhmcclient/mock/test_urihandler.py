@@ -18,6 +18,7 @@
 Unit tests for _urihandler module of the zhmcclient.mock package.
 """
 
+import re
 from datetime import datetime, timezone
 try:
     from zoneinfo import ZoneInfo
@@ -34,7 +35,7 @@ from zhmcclient.mock._hmc import FakedMetricObjectValues
 from zhmcclient.mock._urihandler import FakedHTTPError, InvalidResourceError, \
     InvalidMethodError, CpcNotInDpmError, CpcInDpmError, BadRequestError, \
     ConflictError, FakedConnectionError, \
-    parse_query_parms, UriHandler, \
+    parse_query_parms, UriHandler, URIS, \
     GenericGetPropertiesHandler, GenericUpdatePropertiesHandler, \
     GenericDeleteHandler, \
     VersionHandler, \
@@ -469,6 +470,44 @@ def test_urihandler_empty_2():
         urihandler.handler('', 'GET')
 
 
+def sample_uris(uri_pattern):
+    """
+    Return sample URIs that match a URI pattern of the URIS table.
+    """
+    uri = uri_pattern.replace('([^/]+)', 'fake-oid'). \
+        replace('([^?/]+)', 'fake-oid')
+    if uri.endswith(r'(?:\?(.*))?'):
+        uri = uri[:-len(r'(?:\?(.*))?')]
+        return [uri, uri + '?name=fake-name']
+    return [uri]
+
+
+def test_urihandler_full_table():
+    """
+    Test that UriHandler.handler() returns the same result for the URIS table
+    as matching all URI patterns in their order, also when cached.
+    """
+    urihandler = UriHandler(URIS)
+    uri_handlers = [(re.compile('^' + uri + '$'), handler_class)
+                    for uri, handler_class in URIS]
+    uris = [uri for uri_pattern, _ in URIS for uri in sample_uris(uri_pattern)]
+    uris += ['/api/cpcs/fake-oid/unknown', '/api/unknown', '/unknown']
+
+    for _ in range(2):
+        for uri in uris:
+            exp_result = None
+            for uri_pattern, handler_class in uri_handlers:
+                m = uri_pattern.match(uri)
+                if m:
+                    exp_result = handler_class, m.groups()
+                    break
+            if exp_result is None:
+                with pytest.raises(InvalidResourceError):
+                    urihandler.handler(uri, 'GET')
+            else:
+                assert urihandler.handler(uri, 'GET') == exp_result
+
+
 def uri_handler_cpcs_dummy():
     """
     Returns a URI handler for CPCs, using the dummy handlers.
@@ -0,0 +1,122 @@
+# Copyright 2026 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for _async_notification module.
+"""
+
+
+import asyncio
+import time
+from unittest.mock import patch
+
+from zhmcclient import AsyncNotificationReceiver
+
+from .test_notification import MockedStompConnection, _prop_change
+
+
+def setup_receiver(notifications):
+    """
+    Return an AsyncNotificationReceiver and its mocked STOMP connection,
+    with the notifications queued for being sent.
+    """
+    receiver = AsyncNotificationReceiver(
+        'fake-topic', 'fake-hmc', 'fake-userid', 'fake-password')
+    receiver.connect()
+    mocked_conn = receiver._conn  # pylint: disable=protected-access
+    for headers, message in notifications:
+        # pylint: disable=no-member
+        mocked_conn.mock_add_message(headers, message)
+    return receiver, mocked_conn
+
+
+@patch(target='stomp.Connection', new=MockedStompConnection)
+def test_async_notifications():
+    """
+    Test AsyncNotificationReceiver.notifications() for notifications that
+    are received while the consumer is waiting.
+    """
+    notifications = [
+        _prop_change('/api/p1', 'description', i, i + 1) for i in range(3)]
+    receiver, mocked_conn = setup_receiver(notifications)
+
+    async def consume():
+        received = []
+        async with receiver:
+            async for notification in receiver:
+                received.append(notification)
+                if len(received) == len(notifications):
+                    break
+        return received
+
+    async def main():
+        consumer = asyncio.create_task(consume())
+        # Let the consumer wait for the notifications
+        await asyncio.sleep(0.1)
+        mocked_conn.mock_start()  # pylint: disable=no-member
+        return await asyncio.wait_for(consumer, 5)
+
+    received = asyncio.run(main())
+    mocked_conn.mock_stop()  # pylint: disable=no-member
+
+    assert received == notifications
+    assert receiver._closed  # pylint: disable=protected-access
+
+
+@patch(target='stomp.Connection', new=MockedStompConnection)
+def test_async_notification_batches():
+    """
+    Test AsyncNotificationReceiver.notification_batches().
+    """
+    notifications = [
+        _prop_change('/api/p1', 'description', i, i + 1) for i in range(3)]
+    receiver, mocked_conn = setup_receiver(notifications)
+    mocked_conn.mock_start()  # pylint: disable=no-member
+    mocked_conn.mock_stop()  # pylint: disable=no-member
+
+    async def main():
+        async for batch in receiver.notification_batches(window=0.2):
+            await receiver.aclose()
+            return batch
+        return None
+
+    batch = asyncio.run(main())
+
+    assert batch == [_prop_change('/api/p1', 'description', 0, 3)]
+
+
+@patch(target='stomp.Connection', new=MockedStompConnection)
+def test_async_notifications_close():
+    """
+    Test that closing an AsyncNotificationReceiver ends a waiting consumer.
+    """
+    receiver, _ = setup_receiver([])
+
+    async def consume():
+        return [notification async for notification in receiver]
+
+    async def main():
+        consumer = asyncio.create_task(consume())
+        await asyncio.sleep(0.1)
+        start = time.monotonic()
+        await receiver.aclose()
+        received = await asyncio.wait_for(consumer, 5)
+        return received, time.monotonic() - start
+
+    received, duration = asyncio.run(main())
+
+    assert received == []
+    # The consumer is woken up, instead of checking the connection after
+    # STOMP_MIN_CONNECTION_CHECK_TIME
+    assert duration < 1
@@ -17,14 +17,17 @@ Unit tests for _auto_updater module.
 """
 
 
+import gc
 import time
 import re
+import threading
 import logging
 from unittest.mock import patch
 import pytest
 
-from zhmcclient import Client
+from zhmcclient import Client, NotificationJournal
 from zhmcclient.mock import FakedSession
+from zhmcclient._auto_updater import _NotificationDispatcher
 
 from .test_notification import MockedStompConnection
 
@@ -217,8 +220,6 @@ TESTCASES_AUTO_UPDATER_ALL = [
                  "JMS message for property change notification .*"
                  "resource /api/cpcs/fake-cpc1 .*"
                  "u?'property-name': u?'description'"),
-                ('zhmcclient.jms', logging.INFO,
-                 "JMS session .* disconnected"),
             ],
         ),
     ),
@@ -344,8 +345,6 @@ TESTCASES_AUTO_UPDATER_ALL = [
                  "resource /api/cpcs/fake-cpc1 .*"
                  "u?'property-name': u?'description'.*"
                  "u?'property-name': u?'degraded-status'"),
-                ('zhmcclient.jms', logging.INFO,
-                 "JMS session .* disconnected"),
             ],
         ),
     ),
@@ -411,8 +410,6 @@ TESTCASES_AUTO_UPDATER_ALL = [
                  "JMS message for property change notification .*"
                  "resource /api/partitions/fake-part1/nics/fake-nic1 .*"
                  "u?'property-name': u?'description'"),
-                ('zhmcclient.jms', logging.INFO,
-                 "JMS session .* disconnected"),
             ],
         ),
     ),
@@ -481,8 +478,6 @@ TESTCASES_AUTO_UPDATER_ALL = [
                  "JMS session .* established"),
                 ('zhmcclient.jms', logging.DEBUG,
                  "JMS message for status change notification"),
-                ('zhmcclient.jms', logging.INFO,
-                 "JMS session .* disconnected"),
             ],
         ),
     ),
@@ -530,8 +525,6 @@ TESTCASES_AUTO_UPDATER_ALL = [
                  "JMS message for inventory change notification .*"
                  "resource /api/partitions/fake-part1 .*"
                  "action: u?'remove'"),
-                ('zhmcclient.jms', logging.INFO,
-                 "JMS session .* disconnected"),
             ],
         ),
     ),
@@ -595,8 +588,6 @@ TESTCASES_AUTO_UPDATER_ALL = [
                  "JMS message for inventory change notification .*"
                  "resource /api/partitions/fake-part2 .*"
                  "action: u?'add'"),
-                ('zhmcclient.jms', logging.INFO,
-                 "JMS session .* disconnected"),
             ],
         ),
     ),
@@ -644,8 +635,6 @@ TESTCASES_AUTO_UPDATER_ALL = [
                  "JMS message for inventory change notification .*"
                  "resource /api/cpcs/fake-cpc1 .*"
                  "action: u?'remove'"),
-                ('zhmcclient.jms', logging.INFO,
-                 "JMS session .* disconnected"),
             ],
         ),
     ),
@@ -709,8 +698,6 @@ TESTCASES_AUTO_UPDATER_ALL = [
                  "JMS message for inventory change notification .*"
                  "resource /api/cpcs/fake-cpc2 .*"
                  "action: u?'add'"),
-                ('zhmcclient.jms', logging.INFO,
-                 "JMS session .* disconnected"),
             ],
         ),
     ),
@@ -759,8 +746,6 @@ TESTCASES_AUTO_UPDATER_ALL = [
                 ('zhmcclient.jms', logging.ERROR,
                  "JMS message for inventory change notification .*"
                  "unknown action 'xyz'"),
-                ('zhmcclient.jms', logging.INFO,
-                 "JMS session .* disconnected"),
             ],
         ),
     ),
@@ -817,8 +802,6 @@ TESTCASES_AUTO_UPDATER_ALL = [
                 ('zhmcclient.jms', logging.ERROR,
                  "JMS message for object notification .*"
                  "no 'element-uri' .*no 'object-uri'"),
-                ('zhmcclient.jms', logging.INFO,
-                 "JMS session .* disconnected"),
             ],
         ),
     ),
@@ -849,8 +832,6 @@ TESTCASES_AUTO_UPDATER_ALL = [
                 ('zhmcclient.jms', logging.WARNING,
                  "JMS message for notification of type job-completion .*"
                  "is ignored"),
-                ('zhmcclient.jms', logging.INFO,
-                 "JMS session .* disconnected"),
             ],
         ),
     ),
@@ -970,8 +951,13 @@ def test_auto_updater_all(desc, testcase, caplog):
 
     # Verify the log entries.
     # The expected log entries must appear in the specified order, but
-    # additional log entries are tolerated.
+    # additional log entries are tolerated. The disconnect of the mocked
+    # STOMP connection after sending the notifications does not wait for
+    # their processing, so its log entry is verified separately.
     caplog_records = list(caplog.records)
+    assert [r for r in caplog_records
+            if r.name == 'zhmcclient.jms' and r.levelno == logging.INFO
+            and re.match("JMS session .* disconnected", r.message)]
     next_aix = 0
     for eix, exp_log_entry in enumerate(exp_log_entries):
         exp_logger_name, exp_level, exp_message_pattern = exp_log_entry
@@ -1036,3 +1022,669 @@ def test_auto_updater_all(desc, testcase, caplog):
     assert updater.has_objects()
     assert updater.is_open()
     assert faked_session.auto_update_subscribed()
+
+
+@patch(target='stomp.Connection', new=MockedStompConnection)
+def test_auto_updater_add_burst():
+    """
+    Test that a burst of inventory change notifications for added resources
+    causes a single bulk pull of the added resources instead of a re-list.
+    """
+
+    faked_session = FakedSession(
+        'fake-hmc', 'fake-hmc', 'fake-version', 'fake-version')
+    client = Client(faked_session)
+    faked_session.hmc.add_resources(TEST_RESOURCES_BASE)
+
+    cpc = client.cpcs.find(name='fake-cpc1')
+    partition_mgr = cpc.partitions
+    partition_mgr.enable_auto_update()
+
+    # Add partitions on the HMC, one of which is deleted again before the
+    # next list() call.
+    faked_cpc = faked_session.hmc.lookup_by_uri(cpc.uri)
+    added_uris = []
+    for i in range(2, 6):
+        props = dict(TEST_PARTITION_2)
+        props['object-id'] = f'fake-part{i}'
+        props['object-uri'] = f'/api/partitions/fake-part{i}'
+        props['name'] = f'fake-part{i}'
+        faked_cpc.partitions.add(props)
+        added_uris.append(props['object-uri'])
+    faked_cpc.partitions.remove('fake-part5')
+
+    # pylint: disable=protected-access
+    updater = faked_session._auto_updater
+    stomp_conn = updater._conn
+    for uri in added_uris:
+        # pylint: disable=no-member
+        stomp_conn.mock_add_message(
+            {
+                'notification-type': 'inventory-change',
+                'object-uri': uri,
+                'object-id': uri.split('/')[-1],
+                'class': 'partition',
+                'action': 'add',
+            },
+            None)
+    stomp_conn.mock_start()  # pylint: disable=no-member
+    time.sleep(0.5)
+
+    with patch.object(faked_session, 'get', wraps=faked_session.get) \
+            as get_mock, \
+            patch.object(faked_session, 'post', wraps=faked_session.post) \
+            as post_mock:
+        partitions = partition_mgr.list()
+        partitions_2 = partition_mgr.list()
+
+    # The mocked "Submit Requests" operation performs the individual requests
+    # through the session, so only the list operation is checked here.
+    get_uris = [_call[0][0] for _call in get_mock.call_args_list]
+    assert not [uri for uri in get_uris
+                if uri.startswith(f'{cpc.uri}/partitions')]
+    assert post_mock.call_count == 1
+    assert post_mock.call_args[0][0] == '/api/services/aggregation/submit'
+
+    exp_uris = ['/api/partitions/fake-part1'] + added_uris[0:3]
+    assert sorted(p.uri for p in partitions) == sorted(exp_uris)
+    assert sorted(p.uri for p in partitions_2) == sorted(exp_uris)
+    part2 = [p for p in partitions if p.name == 'fake-part2'][0]
+    assert part2.full_properties
+    assert part2.properties['description'] == 'description2'
+
+    partition_mgr.disable_auto_update()
+
+
+def test_notification_dispatcher():
+    """
+    Test that _NotificationDispatcher processes the notifications for the
+    same resource URI in order, and maintains its statistics.
+    """
+    processed = []
+    lock = threading.Lock()
+
+    def process(items):
+        for uri, seq in items:
+            time.sleep(0.001 * (seq % 3))
+            with lock:
+                processed.append((uri, seq))
+
+    dispatcher = _NotificationDispatcher(process, 3, 100)
+    uris = [f'/api/partitions/part{i}' for i in range(5)]
+    for seq in range(50):
+        uri = uris[seq % len(uris)]
+        dispatcher.dispatch(uri, (uri, seq))
+    dispatcher.wait_processed()
+
+    assert len(processed) == 50
+    for uri in uris:
+        seqs = [seq for _uri, seq in processed if _uri == uri]
+        assert seqs == sorted(seqs)
+    assert dispatcher.queue_depth == 0
+    assert dispatcher.max_queue_depth >= 1
+    assert dispatcher.max_lag >= dispatcher.lag >= 0
+    assert dispatcher.dropped == 0
+
+    dispatcher.stop()
+
+
+def test_notification_dispatcher_full():
+    """
+    Test that _NotificationDispatcher drops notifications without blocking
+    when the queue of a worker thread is full.
+    """
+    started = threading.Event()
+    release = threading.Event()
+    processed = []
+
+    def process(items):
+        started.set()
+        assert release.wait(5)
+        processed.extend(items)
+
+    dispatcher = _NotificationDispatcher(process, 1, 1)
+    assert dispatcher.dispatch('uri', 'n1')
+    assert started.wait(5)
+    assert dispatcher.dispatch('uri', 'n2')
+
+    start_time = time.monotonic()
+    assert not dispatcher.dispatch('uri', 'n3')
+    assert time.monotonic() - start_time < 1
+    assert dispatcher.dropped == 1
+
+    release.set()
+    dispatcher.wait_processed()
+    assert processed == ['n1', 'n2']
+    dispatcher.stop()
+
+
+@patch(target='stomp.Connection', new=MockedStompConnection)
+def test_auto_updater_weak_registry():
+    """
+    Test that auto-updated resource objects are unregistered from the auto
+    updater when they are deleted.
+    """
+    faked_session = FakedSession(
+        'fake-hmc', 'fake-hmc', 'fake-version', 'fake-version')
+    client = Client(faked_session)
+    faked_session.hmc.add_resources(TEST_RESOURCES_BASE)
+    updater = faked_session.auto_updater
+
+    cpc = client.cpcs.find(name='fake-cpc1')
+    partition = cpc.partitions.find(name='fake-part1')
+    partition_uri = partition.uri
+    partition.enable_auto_update()
+    partition2 = cpc.partitions.find(name='fake-part1')
+    partition2.enable_auto_update()
+    assert set(map(id, updater.registered_objects(partition_uri))) == \
+        {id(partition), id(partition2)}
+
+    del partition
+    gc.collect()
+    assert list(updater.registered_objects(partition_uri)) == [partition2]
+
+    partition2.disable_auto_update()
+    assert not list(updater.registered_objects(partition_uri))
+    # pylint: disable=protected-access
+    assert partition_uri not in updater._registered_objects
+
+    # Deleting an object that was unregistered already has no effect
+    del partition2
+    gc.collect()
+    assert partition_uri not in updater._registered_objects
+
+
+@patch(target='stomp.Connection', new=MockedStompConnection)
+def test_auto_updater_coalesce():
+    """
+    Test that property change notifications for the same resource are
+    coalesced into one update when a coalescing window is set.
+    """
+    faked_session = FakedSession(
+        'fake-hmc', 'fake-hmc', 'fake-version', 'fake-version')
+    client = Client(faked_session)
+    faked_session.hmc.add_resources(TEST_RESOURCES_BASE)
+    updater = faked_session.auto_updater
+
+    cpc = client.cpcs.find(name='fake-cpc1')
+    partition = cpc.partitions.find(name='fake-part1')
+    partition.enable_auto_update()
+    updater.coalesce_window = 0.2
+
+    stomp_conn = updater._conn  # pylint: disable=protected-access
+    for i in range(5):
+        # pylint: disable=no-member
+        stomp_conn.mock_add_message(
+            {
+                'notification-type': 'property-change',
+                'object-uri': partition.uri,
+            },
+            {
+                'change-reports': [
+                    {
+                        'property-name': 'description',
+                        'old-value': f'desc{i}',
+                        'new-value': f'desc{i + 1}',
+                    },
+                ],
+            })
+
+    with patch.object(partition, 'update_properties_local',
+                      wraps=partition.update_properties_local) as update_mock:
+        stomp_conn.mock_start()  # pylint: disable=no-member
+        time.sleep(0.5)
+
+    assert update_mock.call_count == 1
+    assert update_mock.call_args[0][0] == {'description': 'desc5'}
+    assert partition.properties['description'] == 'desc5'
+
+    partition.disable_auto_update()
+
+
+@patch(target='stomp.Connection', new=MockedStompConnection)
+def test_auto_updater_callbacks():
+    """
+    Test the callback functions for changed, added and removed resources.
+    """
+    faked_session = FakedSession(
+        'fake-hmc', 'fake-hmc', 'fake-version', 'fake-version')
+    client = Client(faked_session)
+    faked_session.hmc.add_resources(TEST_RESOURCES_BASE)
+    updater = faked_session.auto_updater
+
+    cpc = client.cpcs.find(name='fake-cpc1')
+    partition_mgr = cpc.partitions
+    partition_mgr.enable_auto_update()
+    partition = partition_mgr.find(name='fake-part1')
+    partition.enable_auto_update()
+
+    calls = []
+    partition.on_change(
+        lambda res, props: calls.append(('status', res.uri, props)),
+        properties=['status'])
+    partition.on_change(
+        lambda res, props: calls.append(('any', res.uri, props)))
+    partition_mgr.on_added(
+        lambda mgr, res: calls.append(('added', res.uri, res.name)))
+    partition_mgr.on_removed(
+        lambda mgr, res: calls.append(('removed', res.uri, None)))
+
+    def failing_callback(res, props):
+        raise ValueError("callback failed")
+
+    partition.on_change(failing_callback)
+    partition.remove_callback(failing_callback)
+
+    faked_cpc = faked_session.hmc.lookup_by_uri(cpc.uri)
+    faked_cpc.partitions.add(TEST_PARTITION_2)
+
+    stomp_conn = updater._conn  # pylint: disable=protected-access
+    for headers, message in [
+        (
+            {'notification-type': 'property-change',
+             'object-uri': partition.uri},
+            {'change-reports': [
+                {'property-name': 'description', 'old-value': 'description1',
+                 'new-value': 'desc_new'}]},
+        ),
+        (
+            {'notification-type': 'status-change',
+             'object-uri': partition.uri},
+            {'change-reports': [
+                {'old-status': 'active', 'new-status': 'stopped'}]},
+        ),
+        (
+            {'notification-type': 'inventory-change',
+             'object-uri': TEST_PARTITION_2['object-uri'],
+             'class': 'partition', 'action': 'add'},
+            None,
+        ),
+        (
+            {'notification-type': 'inventory-change',
+             'object-uri': partition.uri,
+             'class': 'partition', 'action': 'remove'},
+            None,
+        ),
+    ]:
+        # pylint: disable=no-member
+        stomp_conn.mock_add_message(headers, message)
+    stomp_conn.mock_start()  # pylint: disable=no-member
+    time.sleep(0.5)
+
+    # Notifications for different resources may be processed by different
+    # worker threads
+    part1_calls = [call for call in calls if call[1] == partition.uri]
+    assert part1_calls == [
+        ('any', partition.uri, {'description': 'desc_new'}),
+        ('status', partition.uri, {'status': 'stopped'}),
+        ('any', partition.uri, {'status': 'stopped'}),
+        ('removed', partition.uri, None),
+        ('status', partition.uri, None),
+        ('any', partition.uri, None),
+    ]
+    part2_calls = [call for call in calls if call[1] != partition.uri]
+    assert part2_calls == [
+        ('added', TEST_PARTITION_2['object-uri'], TEST_PARTITION_2['name']),
+    ]
+
+    partition.disable_auto_update()
+    partition_mgr.disable_auto_update()
+
+
+@patch(target='stomp.Connection', new=MockedStompConnection)
+def test_auto_updater_wait_for_status():
+    """
+    Test waiting for a partition status using status change notifications.
+    """
+    faked_session = FakedSession(
+        'fake-hmc', 'fake-hmc', 'fake-version', 'fake-version')
+    client = Client(faked_session)
+    faked_session.hmc.add_resources(TEST_RESOURCES_BASE)
+    updater = faked_session.auto_updater
+
+    cpc = client.cpcs.find(name='fake-cpc1')
+    partition = cpc.partitions.find(name='fake-part1')
+    partition.enable_auto_update()
+    faked_partition = faked_session.hmc.lookup_by_uri(partition.uri)
+    faked_partition.properties['status'] = 'stopped'
+
+    stomp_conn = updater._conn  # pylint: disable=protected-access
+    # pylint: disable=no-member
+    stomp_conn.mock_add_message(
+        {'notification-type': 'status-change',
+         'object-uri': partition.uri},
+        {'change-reports': [
+            {'old-status': 'active', 'new-status': 'stopped'}]})
+    timer = threading.Timer(0.2, stomp_conn.mock_start)
+    timer.start()
+
+    start = time.time()
+
+    # Execute the code to be tested
+    partition.wait_for_status(
+        'stopped', status_timeout=5, use_notifications=True)
+
+    duration = time.time() - start
+    timer.join()
+
+    # The status must have been set from the notification, not by polling
+    assert duration < 2
+    assert partition.get_properties_local('status') == 'stopped'
+    # pylint: disable=protected-access
+    assert partition._change_callbacks == []
+    assert partition.auto_update_enabled()
+
+    partition.disable_auto_update()
+
+
+@patch(target='stomp.Connection', new=MockedStompConnection)
+def test_auto_updater_resync(tmp_path):
+    """
+    Test the re-synchronization of auto-updated objects after a gap in the
+    session sequence numbers and after a lost STOMP connection, and the
+    journaling of the notifications.
+    """
+    faked_session = FakedSession(
+        'fake-hmc', 'fake-hmc', 'fake-version', 'fake-version')
+    client = Client(faked_session)
+    faked_session.hmc.add_resources(TEST_RESOURCES_BASE)
+    updater = faked_session.auto_updater
+    journal = NotificationJournal(str(tmp_path / 'journal.jsonl'))
+    updater.journal = journal
+
+    cpc = client.cpcs.find(name='fake-cpc1')
+    partition = cpc.partitions.find(name='fake-part1')
+    partition.enable_auto_update()
+    cpc.partitions.enable_auto_update()
+    changes = []
+    partition.on_change(lambda res, props: changes.append(props))
+
+    # Changes on the HMC whose notifications are lost
+    faked_partition = faked_session.hmc.lookup_by_uri(partition.uri)
+    faked_partition.properties['description'] = 'desc_lost'
+
+    notifications = []
+    for seq_nr, status in ((0, 'starting'), (2, 'stopped')):
+        headers = {'notification-type': 'status-change',
+                   'object-uri': partition.uri,
+                   'session-sequence-nr': str(seq_nr)}
+        message = {'change-reports': [
+            {'old-status': 'active', 'new-status': status}]}
+        notifications.append((headers, message))
+    faked_partition.properties['status'] = 'stopped'
+
+    stomp_conn = updater._conn  # pylint: disable=protected-access
+    for headers, message in notifications:
+        # pylint: disable=no-member
+        stomp_conn.mock_add_message(headers, message)
+    stomp_conn.mock_start()  # pylint: disable=no-member
+    time.sleep(0.5)
+
+    assert updater.sequence_gaps == 1
+    assert updater.last_sequence_nr == 2
+    assert updater.resyncs == 1
+    # The resync marks the manager for re-listing, without re-listing
+    assert cpc.partitions.auto_update_needs_pull()
+    assert partition.get_properties_local('description') == 'desc_lost'
+    assert partition.get_properties_local('status') == 'stopped'
+    # The resync may happen before or after the second notification has been
+    # processed
+    assert any(props.get('description') == 'desc_lost' for props in changes)
+    journal.close()
+    assert list(journal.replay()) == notifications
+
+    # Lose the STOMP connection
+    faked_partition.properties['description'] = 'desc_lost2'
+    stomp_conn._state_connected = False  # pylint: disable=protected-access
+    # pylint: disable=protected-access
+    stomp_conn._listener.on_disconnected()
+    time.sleep(0.5)
+
+    assert updater._conn is not stomp_conn
+    assert updater._conn.is_connected()
+    assert updater.last_sequence_nr is None
+    assert updater.resyncs == 2
+    assert partition.get_properties_local('description') == 'desc_lost2'
+
+    cpc.partitions.disable_auto_update()
+    partition.disable_auto_update()
+
+
+@patch(target='stomp.Connection', new=MockedStompConnection)
+def test_auto_updater_add_with_pull():
+    """
+    Test that added resources are not pulled separately when the list() call
+    of the manager pulls all resources anyway.
+    """
+
+    faked_session = FakedSession(
+        'fake-hmc', 'fake-hmc', 'fake-version', 'fake-version')
+    client = Client(faked_session)
+    faked_session.hmc.add_resources(TEST_RESOURCES_BASE)
+
+    cpc = client.cpcs.find(name='fake-cpc1')
+    partition_mgr = cpc.partitions
+    partition_mgr.enable_auto_update()
+
+    faked_cpc = faked_session.hmc.lookup_by_uri(cpc.uri)
+    props = dict(TEST_PARTITION_2)
+    faked_cpc.partitions.add(props)
+
+    partition_mgr.auto_update_trigger_pull()
+    partition_mgr.auto_update_add_resource(props['object-uri'])
+
+    with patch.object(faked_session, 'post', wraps=faked_session.post) \
+            as post_mock:
+        partitions = partition_mgr.list()
+        partitions_2 = partition_mgr.list()
+
+    assert post_mock.call_count == 0
+    assert not partition_mgr.auto_update_needs_pull()
+    # pylint: disable=protected-access
+    assert partition_mgr._resource_list._added_uris == {}
+    exp_uris = ['/api/partitions/fake-part1', props['object-uri']]
+    assert sorted(p.uri for p in partitions) == sorted(exp_uris)
+    assert sorted(p.uri for p in partitions_2) == sorted(exp_uris)
+
+    partition_mgr.disable_auto_update()
+
+
+@patch(target='stomp.Connection', new=MockedStompConnection)
+def test_auto_updater_close_while_reconnecting():
+    """
+    Test that the auto updater stays open while its lost STOMP connection is
+    being re-established, and that closing it meanwhile discards the new
+    connection.
+    """
+    faked_session = FakedSession(
+        'fake-hmc', 'fake-hmc', 'fake-version', 'fake-version')
+    client = Client(faked_session)
+    faked_session.hmc.add_resources(TEST_RESOURCES_BASE)
+    updater = faked_session.auto_updater
+
+    cpc = client.cpcs.find(name='fake-cpc1')
+    partition = cpc.partitions.find(name='fake-part1')
+    partition.enable_auto_update()
+    stomp_conn = updater._conn  # pylint: disable=protected-access
+
+    connecting = threading.Event()
+    release = threading.Event()
+    new_conns = []
+
+    class SlowStompConnection(MockedStompConnection):
+        """STOMP connection whose connect() waits for being released."""
+
+        def connect(self, userid, password, wait):
+            new_conns.append(self)
+            connecting.set()
+            assert release.wait(5)
+            super().connect(userid, password, wait)
+
+    with patch(target='stomp.Connection', new=SlowStompConnection):
+
+        # Lose the STOMP connection
+        # pylint: disable=protected-access
+        stomp_conn._state_connected = False
+        stomp_conn._listener.on_disconnected()
+        assert connecting.wait(5)
+        assert updater.is_open()
+        reconnect_thread = updater._reconnect_thread
+
+        # Closing waits for the reconnect to finish
+        threading.Timer(0.2, release.set).start()
+        updater.close()
+
+    assert not updater.is_open()
+    assert not reconnect_thread.is_alive()
+    assert updater._conn is None  # pylint: disable=protected-access
+    assert len(new_conns) == 1
+    assert not new_conns[0].is_connected()
+
+    partition.disable_auto_update()
+
+
+@patch(target='stomp.Connection', new=MockedStompConnection)
+def test_auto_updater_reconnect_subscribe_fails():
+    """
+    Test that a STOMP connection whose subscription fails during a reconnect
+    is disconnected before the reconnect is retried.
+    """
+    faked_session = FakedSession(
+        'fake-hmc', 'fake-hmc', 'fake-version', 'fake-version')
+    client = Client(faked_session)
+    faked_session.hmc.add_resources(TEST_RESOURCES_BASE)
+    updater = faked_session.auto_updater
+
+    cpc = client.cpcs.find(name='fake-cpc1')
+    partition = cpc.partitions.find(name='fake-part1')
+    partition.enable_auto_update()
+    stomp_conn = updater._conn  # pylint: disable=protected-access
+
+    new_conns = []
+
+    class FailingStompConnection(MockedStompConnection):
+        """STOMP connection whose first subscribe() fails."""
+
+        def subscribe(self, destination, id, ack):
+            # pylint: disable=redefined-builtin
+            new_conns.append(self)
+            if len(new_conns) == 1:
+                raise RuntimeError("Subscription failed")
+            super().subscribe(destination, id, ack)
+
+    with patch(target='stomp.Connection', new=FailingStompConnection):
+
+        # Lose the STOMP connection
+        # pylint: disable=protected-access
+        stomp_conn._state_connected = False
+        stomp_conn._listener.on_disconnected()
+        reconnect_thread = updater._reconnect_thread
+        reconnect_thread.join(5)
+        assert not reconnect_thread.is_alive()
+
+    assert len(new_conns) == 2
+    assert not new_conns[0].is_connected()
+    assert updater._conn is new_conns[1]  # pylint: disable=protected-access
+    assert new_conns[1].is_connected()
+
+    partition.disable_auto_update()
+
+
+@patch(target='stomp.Connection', new=MockedStompConnection)
+def test_auto_updater_add_concurrent_changes():
+    """
+    Test that pulling added resources does not undo removals of resources and
+    triggers for pulling all resources that happened during the pull.
+    """
+
+    faked_session = FakedSession(
+        'fake-hmc', 'fake-hmc', 'fake-version', 'fake-version')
+    client = Client(faked_session)
+    faked_session.hmc.add_resources(TEST_RESOURCES_BASE)
+
+    cpc = client.cpcs.find(name='fake-cpc1')
+    partition_mgr = cpc.partitions
+    partition_mgr.enable_auto_update()
+
+    faked_cpc = faked_session.hmc.lookup_by_uri(cpc.uri)
+    added_uris = []
+    for i in range(2, 5):
+        props = dict(TEST_PARTITION_2)
+        props['object-id'] = f'fake-part{i}'
+        props['object-uri'] = f'/api/partitions/fake-part{i}'
+        props['name'] = f'fake-part{i}'
+        faked_cpc.partitions.add(props)
+        added_uris.append(props['object-uri'])
+
+    # pylint: disable=protected-access
+    bulk_get = partition_mgr._bulk_get
+    during_pull = []
+
+    def bulk_get_with_change(uris):
+        results = bulk_get(uris)
+        during_pull.pop(0)()
+        return results
+
+    with patch.object(partition_mgr, '_bulk_get', bulk_get_with_change):
+
+        # A resource is removed during the pull of the added resources
+        partition_mgr.auto_update_add_resource(added_uris[0])
+        partition_mgr.auto_update_add_resource(added_uris[1])
+        during_pull.append(
+            lambda: partition_mgr.remove_resource_local(added_uris[0]))
+        partition_mgr._pull_added_resources()
+
+        assert sorted(p.uri for p in partition_mgr.list_resources_local()) \
+            == ['/api/partitions/fake-part1', added_uris[1]]
+        assert not partition_mgr.auto_update_needs_pull()
+
+        # Pulling all resources is triggered during the pull of the added
+        # resources
+        partition_mgr.auto_update_add_resource(added_uris[2])
+        during_pull.append(partition_mgr.auto_update_trigger_pull)
+        partition_mgr._pull_added_resources()
+
+        assert added_uris[2] not in \
+            [p.uri for p in partition_mgr.list_resources_local()]
+        assert partition_mgr.auto_update_needs_pull()
+
+    assert partition_mgr._resource_list._removed_uris == {}
+    partition_mgr.disable_auto_update()
+
+
+@pytest.mark.parametrize(
+    "reason, exp_ceased", [
+        (1, True),
+        (2, False),
+    ]
+)
+@patch(target='stomp.Connection', new=MockedStompConnection)
+def test_auto_updater_resync_not_found(reason, exp_ceased, caplog):
+    """
+    Test that a re-synchronization sets a resource object to have ceased to
+    exist only if the HMC reports that the resource does not exist.
+    """
+    faked_session = FakedSession(
+        'fake-hmc', 'fake-hmc', 'fake-version', 'fake-version')
+    client = Client(faked_session)
+    faked_session.hmc.add_resources(TEST_RESOURCES_BASE)
+    updater = faked_session.auto_updater
+
+    cpc = client.cpcs.find(name='fake-cpc1')
+    partition = cpc.partitions.find(name='fake-part1')
+    partition.enable_auto_update()
+
+    error_body = {'http-status': 404, 'reason': reason, 'message': 'error'}
+    with patch.object(partition.manager, '_bulk_get',
+                      return_value=[(0, 404, error_body)]):
+
+        # Execute the code to be tested
+        updater.resync()
+
+    assert partition.ceased_existence == exp_ceased
+    if not exp_ceased:
+        assert [r for r in caplog.records
+                if r.levelno == logging.ERROR and
+                'failed with HTTP status 404' in r.message]
+
+    partition.disable_auto_update()
@@ -0,0 +1,290 @@
+# Copyright 2026 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for _dpm_import module.
+"""
+
+
+import os
+import json
+import pytest
+
+from zhmcclient import Client, DpmConfigurationImporter
+from zhmcclient.mock import FakedSession
+
+# URIs of the resources in the imported DPM configuration
+SRC_OSA_URI = '/api/adapters/src-osa-oid'
+SRC_PORT_URI = SRC_OSA_URI + '/network-ports/0'
+SRC_VSWITCH_URI = '/api/virtual-switches/src-vswitch-oid'
+SRC_CG_URI = '/api/cpcs/src-cpc-oid/capacity-groups/src-cg-oid'
+
+
+def src_partition_uri(i):
+    """Return the URI of partition i in the DPM configuration."""
+    return f'/api/partitions/src-part{i}-oid'
+
+
+def dpm_config(num_partitions):
+    """
+    Return a DPM configuration with a capacity group, an OSA adapter with a
+    port and a virtual switch, and partitions that have one NIC backed by
+    the port and one NIC backed by the virtual switch.
+    """
+    partitions = []
+    nics = []
+    for i in range(num_partitions):
+        part_uri = src_partition_uri(i)
+        partitions.append({
+            'object-id': f'src-part{i}-oid',
+            'object-uri': part_uri,
+            'parent': '/api/cpcs/src-cpc-oid',
+            'class': 'partition',
+            'name': f'part{i}',
+            'description': f'Partition {i}',
+            'status': 'stopped',
+            'ifl-processors': 2,
+            'initial-memory': 4096,
+            'maximum-memory': 4096,
+            'nic-uris': [f'{part_uri}/nics/1', f'{part_uri}/nics/2'],
+        })
+        nics.append({
+            'element-id': '1',
+            'element-uri': f'{part_uri}/nics/1',
+            'parent': part_uri,
+            'class': 'nic',
+            'name': f'nic{i}a',
+            'type': 'osd',
+            'network-adapter-port-uri': SRC_PORT_URI,
+        })
+        nics.append({
+            'element-id': '2',
+            'element-uri': f'{part_uri}/nics/2',
+            'parent': part_uri,
+            'class': 'nic',
+            'name': f'nic{i}b',
+            'type': 'osd',
+            'virtual-switch-uri': SRC_VSWITCH_URI,
+        })
+    config = {
+        'capacity-groups': [{
+            'element-id': 'src-cg-oid',
+            'element-uri': SRC_CG_URI,
+            'parent': '/api/cpcs/src-cpc-oid',
+            'class': 'capacity-group',
+            'name': 'cg1',
+            'partition-uris': [src_partition_uri(0)],
+        }],
+        'partitions': partitions,
+        'nics': nics,
+        'adapters': [{
+            'object-id': 'src-osa-oid',
+            'object-uri': SRC_OSA_URI,
+            'parent': '/api/cpcs/src-cpc-oid',
+            'class': 'adapter',
+            'name': 'imported-osa',
+            'description': 'Imported OSA',
+            'adapter-id': '100',
+            'type': 'osd',
+        }],
+        'network-ports': [{
+            'element-id': '0',
+            'element-uri': SRC_PORT_URI,
+            'parent': SRC_OSA_URI,
+            'class': 'network-port',
+            'name': 'port0',
+            'description': 'Imported port',
+        }],
+        'virtual-switches': [{
+            'object-id': 'src-vswitch-oid',
+            'object-uri': SRC_VSWITCH_URI,
+            'parent': '/api/cpcs/src-cpc-oid',
+            'class': 'virtual-switch',
+            'name': 'vswitch1',
+            'type': 'osd',
+            'backing-adapter-uri': SRC_OSA_URI,
+            'port': 0,
+        }],
+    }
+    return config
+
+
+class TestDpmConfigurationImporter:
+    """All tests for the DpmConfigurationImporter class."""
+
+    def setup_method(self):
+        """
+        Setup that is called by pytest before each test method.
+
+        Set up a faked session with a DPM mode target CPC that has an OSA
+        adapter with a port and a virtual switch.
+        """
+        # pylint: disable=attribute-defined-outside-init
+
+        self.session = FakedSession('fake-host', 'fake-hmc', '2.16.0', '4.10')
+        self.client = Client(self.session)
+        self.faked_cpc = self.session.hmc.cpcs.add({
+            'object-id': 'cpc1-oid',
+            'parent': None,
+            'class': 'cpc',
+            'name': 'CPC1',
+            'dpm-enabled': True,
+            'status': 'active',
+        })
+        self.faked_osa = self.faked_cpc.adapters.add({
+            'object-id': 'osa1-oid',
+            'parent': self.faked_cpc.uri,
+            'class': 'adapter',
+            'name': 'osa1',
+            'adapter-id': '120',
+            'adapter-family': 'osa',
+            'type': 'osd',
+            'status': 'active',
+        })
+        self.faked_port = self.faked_osa.ports.add({
+            'element-id': '0',
+            'parent': self.faked_osa.uri,
+            'class': 'network-port',
+            'name': 'port0',
+            'index': 0,
+        })
+        self.faked_vswitch = self.faked_cpc.virtual_switches.add({
+            'object-id': 'vswitch1-oid',
+            'parent': self.faked_cpc.uri,
+            'class': 'virtual-switch',
+            'name': 'vswitch1',
+            'type': 'osd',
+            'backing-adapter-uri': self.faked_osa.uri,
+            'port': 0,
+        })
+        self.cpc = self.client.cpcs.find(name='CPC1')
+
+    def test_importer_initial_attrs(self):
+        """Test initial attributes of DpmConfigurationImporter."""
+
+        # Execute the code to be tested
+        importer = DpmConfigurationImporter(self.cpc, dpm_config(1))
+
+        assert importer.cpc is self.cpc
+        assert importer.uri_map == {}
+        repr_str = repr(importer)
+        assert repr_str.startswith(importer.__class__.__name__)
+
+    @pytest.mark.parametrize(
+        "batch_size", [1, 3, 100]
+    )
+    def test_importer_run(self, batch_size):
+        """Test DpmConfigurationImporter.run() with a complete import."""
+
+        num_partitions = 5
+        importer = DpmConfigurationImporter(
+            self.cpc, dpm_config(num_partitions),
+            adapter_mapping={'100': '120'}, batch_size=batch_size)
+        progress_calls = []
+
+        # Execute the code to be tested
+        result = importer.run(
+            progress=lambda *args: progress_calls.append(args))
+
+        assert result is None
+
+        uri_map = importer.uri_map
+        assert uri_map[SRC_OSA_URI] == self.faked_osa.uri
+        assert uri_map[SRC_PORT_URI] == self.faked_port.uri
+        assert uri_map[SRC_VSWITCH_URI] == self.faked_vswitch.uri
+
+        partitions = self.cpc.partitions.list()
+        assert sorted(p.name for p in partitions) == \
+            [f'part{i}' for i in range(num_partitions)]
+        for i in range(num_partitions):
+            partition = self.cpc.partitions.find(name=f'part{i}')
+            assert uri_map[src_partition_uri(i)] == partition.uri
+            assert partition.get_property('description') == f'Partition {i}'
+            nics = {nic.name: nic for nic in
+                    partition.nics.list(full_properties=True)}
+            assert set(nics) == {f'nic{i}a', f'nic{i}b'}
+            assert nics[f'nic{i}a'].get_property(
+                'network-adapter-port-uri') == self.faked_port.uri
+            assert nics[f'nic{i}b'].get_property(
+                'virtual-switch-uri') == self.faked_vswitch.uri
+
+        cg = self.cpc.capacity_groups.find(name='cg1')
+        assert cg.get_property('partition-uris') == \
+            [uri_map[src_partition_uri(0)]]
+
+        assert self.faked_osa.properties['name'] == 'imported-osa'
+        assert self.faked_osa.properties['description'] == 'Imported OSA'
+        assert self.faked_port.properties['description'] == 'Imported port'
+
+        nic_calls = [c for c in progress_calls if c[0] == 'nics']
+        assert nic_calls[-1] == ('nics', 2 * num_partitions,
+                                 2 * num_partitions)
+        assert len(nic_calls) == -(-2 * num_partitions // batch_size)
+
+    def test_importer_unresolved(self):
+        """Test DpmConfigurationImporter.run() with unmapped adapters."""
+
+        importer = DpmConfigurationImporter(self.cpc, dpm_config(2))
+
+        # Execute the code to be tested
+        result = importer.run()
+
+        # The adapter, its port, the virtual switch and the NICs cannot be
+        # mapped, but the partitions and the capacity group are imported.
+        assert sorted(f['stage'] for f in result) == [
+            'adapters', 'nics', 'nics', 'nics', 'nics', 'ports',
+            'virtual-switches']
+        for failure in result:
+            assert failure['http-status'] is None
+        assert len(self.cpc.partitions.list()) == 2
+
+    def test_importer_resume(self, tmp_path):
+        """Test resuming an import with a checkpoint file."""
+
+        checkpoint_file = str(tmp_path / 'import-checkpoint.json')
+        importer = DpmConfigurationImporter(
+            self.cpc, dpm_config(2), checkpoint_file=checkpoint_file)
+        result = importer.run()
+        assert result is not None
+        assert os.path.exists(checkpoint_file)
+        with open(checkpoint_file, encoding='utf-8') as fp:
+            checkpoint = json.load(fp)
+        assert checkpoint['cpc-uri'] == self.cpc.uri
+        assert src_partition_uri(0) in checkpoint['uri-map']
+
+        # Execute the code to be tested
+        importer2 = DpmConfigurationImporter(
+            self.cpc, dpm_config(2), adapter_mapping={'100': '120'},
+            checkpoint_file=checkpoint_file)
+        result = importer2.run()
+
+        # The partitions are not created again
+        assert result is None
+        assert len(self.cpc.partitions.list()) == 2
+        for partition in self.cpc.partitions.list():
+            assert len(partition.nics.list()) == 2
+
+    def test_importer_checkpoint_other_cpc(self, tmp_path):
+        """Test a checkpoint file for a different CPC."""
+
+        checkpoint_file = str(tmp_path / 'import-checkpoint.json')
+        with open(checkpoint_file, 'w', encoding='utf-8') as fp:
+            json.dump({'cpc-uri': '/api/cpcs/foo', 'uri-map': {},
+                       'completed': []}, fp)
+
+        with pytest.raises(ValueError):
+
+            # Execute the code to be tested
+            DpmConfigurationImporter(
+                self.cpc, dpm_config(1), checkpoint_file=checkpoint_file)
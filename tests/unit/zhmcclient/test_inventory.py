@@ -0,0 +1,205 @@
+# Copyright 2026 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for _inventory module.
+"""
+
+
+import pytest
+
+from zhmcclient import Client, InventoryIndex, Cpc, Partition, Nic, Adapter
+from zhmcclient.mock import FakedSession
+
+
+class TestInventoryIndex:
+    """All tests for the InventoryIndex class."""
+
+    def setup_method(self):
+        """
+        Setup that is called by pytest before each test method.
+
+        Set up a faked session with a DPM mode CPC that has two partitions
+        with NICs and an adapter with a port.
+        """
+        # pylint: disable=attribute-defined-outside-init
+
+        self.session = FakedSession('fake-host', 'fake-hmc', '2.16.0', '4.10')
+        self.client = Client(self.session)
+        self.session.hmc.consoles.add({
+            'object-id': None,
+            'parent': None,
+            'class': 'console',
+            'name': 'fake-console1',
+        })
+        self.faked_cpc = self.session.hmc.cpcs.add({
+            'object-id': 'cpc1-oid',
+            'parent': None,
+            'class': 'cpc',
+            'name': 'CPC1',
+            'dpm-enabled': True,
+        })
+        self.faked_adapter = self.faked_cpc.adapters.add({
+            'object-id': 'osa1-oid',
+            'parent': self.faked_cpc.uri,
+            'class': 'adapter',
+            'name': 'osa1',
+            'adapter-family': 'osa',
+            'type': 'osd',
+        })
+        self.faked_port = self.faked_adapter.ports.add({
+            'element-id': 'port0-oid',
+            'parent': self.faked_adapter.uri,
+            'class': 'network-port',
+            'name': 'port0',
+        })
+        self.faked_partitions = []
+        self.faked_nics = []
+        for i in range(2):
+            faked_partition = self.faked_cpc.partitions.add({
+                'object-id': f'part{i}-oid',
+                'parent': self.faked_cpc.uri,
+                'class': 'partition',
+                'name': f'part{i}',
+                'status': 'stopped',
+            })
+            self.faked_partitions.append(faked_partition)
+            faked_nic = faked_partition.nics.add({
+                'element-id': f'nic{i}-oid',
+                'parent': faked_partition.uri,
+                'class': 'nic',
+                'name': 'nic',
+            })
+            self.faked_nics.append(faked_nic)
+
+    def test_index_initial_attrs(self):
+        """Test initial attributes of an InventoryIndex."""
+
+        # Execute the code to be tested
+        index = self.client.get_inventory_index(['cpc', 'dpm-resources'])
+
+        assert isinstance(index, InventoryIndex)
+        assert index.client is self.client
+        assert index.errors == []
+        assert len(index) == 7
+        assert set(index.classes) == {
+            'cpc', 'adapter', 'network-port', 'partition', 'nic'}
+        assert self.faked_cpc.uri in index
+        assert '/api/partitions/foo' not in index
+        repr_str = repr(index)
+        assert repr_str.startswith(index.__class__.__name__)
+
+    def test_index_lookups(self):
+        """Test the property lookup methods of InventoryIndex."""
+
+        index = self.client.get_inventory_index(['cpc', 'dpm-resources'])
+
+        # Execute the code to be tested
+        part0 = self.faked_partitions[0]
+        assert index.get(part0.uri)['name'] == 'part0'
+        assert index.get('/api/partitions/foo') is None
+
+        partitions = index.by_class('partition')
+        assert sorted(p['name'] for p in partitions) == ['part0', 'part1']
+        assert index.by_class('partition', parent='/api/cpcs/foo') == []
+
+        children = index.children(self.faked_cpc.uri)
+        assert sorted(c['class'] for c in children) == \
+            ['adapter', 'partition', 'partition']
+        nics = index.children(part0.uri, 'nic')
+        assert [n['element-uri'] for n in nics] == [self.faked_nics[0].uri]
+
+        nics = index.by_name('nic', 'nic')
+        assert len(nics) == 2
+        nics = index.by_name('nic', 'nic', parent=part0.uri)
+        assert [n['element-uri'] for n in nics] == [self.faked_nics[0].uri]
+
+    def test_index_errors(self):
+        """Test that inventory error items are not indexed."""
+        error_item = {
+            'class': 'inventory-error',
+            'uri': '/api/partitions/bad',
+            'inventory-error-code': 1,
+        }
+        inventory = self.client.get_inventory(['partition'])
+        inventory.append(error_item)
+
+        # Execute the code to be tested
+        index = InventoryIndex(self.client, inventory)
+
+        assert index.errors == [error_item]
+        assert '/api/partitions/bad' not in index
+        assert 'inventory-error' not in index.classes
+
+    def test_index_resources(self):
+        """Test materializing resource objects from the index."""
+
+        index = self.client.get_inventory_index(['cpc', 'dpm-resources'])
+
+        # Execute the code to be tested
+        partitions = index.resources('partition')
+
+        assert len(partitions) == 2
+        for partition in partitions:
+            assert isinstance(partition, Partition)
+            assert partition.full_properties
+            assert partition.properties['status'] == 'stopped'
+            assert isinstance(partition.manager.parent, Cpc)
+            assert partition.manager.parent.uri == self.faked_cpc.uri
+
+        # The CPC object is shared between the partitions
+        assert partitions[0].manager.parent is partitions[1].manager.parent
+        assert partitions[0].manager.parent is \
+            index.resource(self.faked_cpc.uri)
+
+        nic = index.resource(self.faked_nics[1].uri)
+        assert isinstance(nic, Nic)
+        assert nic.manager.partition.uri == self.faked_partitions[1].uri
+        assert nic is index.resource(self.faked_nics[1].uri)
+
+        port = index.resource(self.faked_port.uri)
+        assert isinstance(port.manager.adapter, Adapter)
+        assert port.manager.adapter.uri == self.faked_adapter.uri
+
+    def test_index_resource_without_cpc(self):
+        """Test materializing a partition whose CPC is not in the index."""
+
+        index = self.client.get_inventory_index(['partition'])
+
+        # Execute the code to be tested
+        partition = index.resource(self.faked_partitions[0].uri)
+
+        assert partition.manager.cpc.uri == self.faked_cpc.uri
+
+    def test_index_resource_errors(self):
+        """Test errors when materializing resource objects."""
+
+        index = InventoryIndex(self.client, [
+            {
+                'class': 'foo',
+                'object-uri': '/api/foos/1',
+            },
+            {
+                'class': 'nic',
+                'element-uri': '/api/partitions/p/nics/1',
+                'parent': '/api/partitions/p',
+            },
+        ])
+
+        with pytest.raises(KeyError):
+            index.resource('/api/bars/1')
+        with pytest.raises(KeyError):
+            index.resource('/api/foos/1')
+        with pytest.raises(KeyError):
+            index.resource('/api/partitions/p/nics/1')
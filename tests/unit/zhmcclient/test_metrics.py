@@ -18,10 +18,17 @@ Unit tests for _metrics module.
 
 
 import re
+import json
+from array import array
+from unittest import mock
+from datetime import datetime, timezone
 import pytest
 
-from zhmcclient import Client, MetricsContext, HTTPError, NotFound
-from zhmcclient.mock import FakedSession
+from zhmcclient import Client, MetricsContext, HTTPError, NotFound, \
+    MetricsResponse, MetricGroupColumns, MetricsResourceNotFound
+from zhmcclient.mock import FakedSession, FakedMetricObjectValues
+# pylint: disable=protected-access
+from zhmcclient import _metrics
 from tests.common.utils import assert_resources
 
 
@@ -354,3 +361,544 @@ class TestMetricsContext:
             # Check that the metrics context no longer exists
             with pytest.raises(NotFound) as exc_info:
                 metricscontext_mgr.find(name=faked_metricscontext.name)
+
+
+# Names of the metric groups used for testing MetricsResponse:
+MG_PARTITION = 'partition-usage'
+MG_CHANNEL = 'channel-usage'
+
+# Number of faked partitions for testing MetricsResponse
+NUM_PARTITIONS = 4
+
+# Timestamp of the faked metric values for testing MetricsResponse
+MR_TIMESTAMP = datetime(2026, 1, 1, 12, 0, 0, 0, timezone.utc)
+
+
+class TestMetricsResponse:
+    """All tests for the MetricsResponse class and its related classes."""
+
+    def setup_method(self):
+        """
+        Setup that is called by pytest before each test method.
+
+        Set up a faked session with faked metric values for partitions and
+        channels, and create a metrics context for them.
+        """
+        # pylint: disable=attribute-defined-outside-init
+
+        self.session = FakedSession('fake-host', 'fake-hmc', '2.16.0', '4.10')
+        self.client = Client(self.session)
+        for i in range(NUM_PARTITIONS):
+            self.session.hmc.add_metric_values(FakedMetricObjectValues(
+                group_name=MG_PARTITION,
+                resource_uri=f'/api/partitions/part{i}-oid',
+                timestamp=MR_TIMESTAMP,
+                values=[
+                    ('processor-usage', 10 + i),
+                    ('network-usage', 20 + i),
+                    ('storage-usage', 30 + i),
+                    ('accelerator-usage', 40 + i),
+                    ('crypto-usage', 50 + i),
+                ]))
+        for i, (name, shared) in enumerate([('CHN01', True),
+                                            ('CHN\\u00e4', False)]):
+            self.session.hmc.add_metric_values(FakedMetricObjectValues(
+                group_name=MG_CHANNEL,
+                resource_uri='/api/cpcs/cpc1-oid',
+                timestamp=MR_TIMESTAMP,
+                values=[
+                    ('channel-name', name),
+                    ('shared-channel', shared),
+                    ('logical-partition-name', f'LPAR{i}'),
+                    ('channel-usage', i),
+                ]))
+        self.mc = self.client.metrics_contexts.create({
+            'anticipated-frequency-seconds': 15,
+            'metric-groups': [MG_PARTITION, MG_CHANNEL],
+        })
+        self.mr_str = self.mc.get_metrics()
+
+    def test_mr_columnar(self):
+        """Test MetricsResponse.metric_group_columns."""
+
+        mr = MetricsResponse(self.mc, self.mr_str)
+
+        # Execute the code to be tested
+        mr_col = MetricsResponse(self.mc, self.mr_str, columnar=True)
+        mg_columns = mr_col.metric_group_columns
+
+        assert [mgc.name for mgc in mg_columns] == \
+            [mgv.name for mgv in mr.metric_group_values]
+        for mgc, mgv in zip(mg_columns, mr.metric_group_values):
+            assert isinstance(mgc, MetricGroupColumns)
+            assert len(mgc) == len(mgv.object_values)
+            assert mgc.metric_group_definition is \
+                self.mc.metric_group_definitions[mgc.name]
+            for i, ov in enumerate(mgv.object_values):
+                assert mgc.resource_uris[i] == ov.resource_uri
+                assert mgc.timestamps[i] == \
+                    int(ov.timestamp.timestamp() * 1000)
+                for m_name, m_value in ov.metrics.items():
+                    assert mgc.columns[m_name][i] == m_value
+
+        columns = mg_columns[0].columns
+        assert mg_columns[0].name == MG_PARTITION
+        assert columns['processor-usage'] == \
+            array('q', [10 + i for i in range(NUM_PARTITIONS)])
+        columns = mg_columns[1].columns
+        assert columns['channel-name'] == ['CHN01', 'CHN\u00e4']
+        assert columns['shared-channel'] == array('b', [1, 0])
+
+        # The row-based parsing is performed on demand
+        assert len(mr_col.metric_group_values) == 2
+
+    def test_mr_columnar_empty(self):
+        """Test MetricsResponse.metric_group_columns without values."""
+
+        mc = self.client.metrics_contexts.create({
+            'anticipated-frequency-seconds': 15,
+            'metric-groups': ['adapter-usage'],
+        })
+        # Metrics response string with a metric group without resources
+        mr_str = '"adapter-usage"\n\n\n'
+        mr = MetricsResponse(mc, mr_str, columnar=True)
+
+        # Execute the code to be tested
+        mg_columns = mr.metric_group_columns
+
+        assert len(mg_columns) == 1
+        assert len(mr.metric_group_values[0].object_values) == 0
+        assert len(mg_columns[0]) == 0
+        assert all(len(c) == 0 for c in mg_columns[0].columns.values())
+
+    @pytest.mark.parametrize(
+        "row, exp_metrics, exp_exc_pattern", [
+            (['"CHN01"', 'TRUE', '"LPAR1"', '7'],
+             {'channel-name': 'CHN01', 'shared-channel': True,
+              'logical-partition-name': 'LPAR1', 'channel-usage': 7},
+             None),
+            (['"CHN01"', 'maybe', '"LPAR1"', '7'],
+             None, r"Invalid boolean metric value: 'maybe'"),
+            (['"CHN01"', 'true', '"LPAR1"', '7.5'],
+             None, r"Invalid .* metric value: '7\.5'"),
+        ]
+    )
+    def test_mgd_row_decoder(self, row, exp_metrics, exp_exc_pattern):
+        """Test MetricGroupDefinition.row_decoder."""
+
+        mg_def = self.mc.metric_group_definitions[MG_CHANNEL]
+
+        # Execute the code to be tested
+        decode_row = mg_def.row_decoder
+
+        assert mg_def.row_decoder is decode_row
+        assert not hasattr(mg_def, '__dict__')
+        if exp_exc_pattern:
+            with pytest.raises(ValueError, match=exp_exc_pattern):
+                decode_row(row)
+        else:
+            metrics = decode_row(row)
+            assert metrics == exp_metrics
+            assert list(metrics) == list(mg_def.metric_definitions)
+
+    def test_mgd_metric_units(self):
+        """Test the units of the metric definitions."""
+
+        mc = self.client.metrics_contexts.create({
+            'anticipated-frequency-seconds': 15,
+            'metric-groups': ['partition-attached-network-interface'],
+        })
+        m_defs = mc.metric_group_definitions[
+            'partition-attached-network-interface'].metric_definitions
+
+        assert m_defs['bytes-sent'].unit == 'B'
+        assert m_defs['interval-bytes-sent'].unit == 'B'
+        assert m_defs['bytes-per-second-sent'].unit == 'B/s'
+        assert m_defs['packets-sent'].unit is None
+
+    def test_mc_save_load(self, tmp_path):
+        """Test MetricsContext.save() and MetricsContextManager.load()."""
+
+        filename = str(tmp_path / 'mc.json')
+        self.mc.save(filename)
+        self.mc.save(filename)  # replaces the file
+
+        # No temporary files are left over
+        assert [p.name for p in tmp_path.iterdir()] == ['mc.json']
+
+        # A second client, e.g. in a restarted process
+        client2 = Client(self.session)
+        get_uris = []
+        org_get = self.session.get
+
+        def counting_get(uri, *args, **kwargs):
+            get_uris.append(uri)
+            return org_get(uri, *args, **kwargs)
+
+        self.session.get = counting_get
+
+        # Execute the code to be tested
+        mc2 = client2.metrics_contexts.load(filename)
+
+        assert get_uris == []
+        assert mc2.uri == self.mc.uri
+        assert mc2.definitions == self.mc.definitions
+        assert mc2.metric_group_definitions == \
+            self.mc.metric_group_definitions
+        assert mc2.get_property('anticipated-frequency-seconds') == 15
+        assert client2.metrics_contexts.list() == [mc2]
+        assert client2.metrics_contexts.attach(mc2.uri, {}) is mc2
+
+        mr = MetricsResponse(mc2, mc2.get_metrics())
+        assert len(mr.metric_group_values) == 2
+
+    def test_mc_load_invalid(self, tmp_path):
+        """Test MetricsContextManager.load() with an invalid file."""
+
+        file_path = tmp_path / 'mc.json'
+        file_path.write_text('{"definitions": {}}', encoding='utf-8')
+
+        with pytest.raises(ValueError):
+
+            # Execute the code to be tested
+            self.client.metrics_contexts.load(str(file_path))
+
+    def test_mr_to_from_bytes(self):
+        """Test MetricsResponse.to_bytes() and from_bytes()."""
+
+        mr = MetricsResponse(self.mc, self.mr_str)
+
+        # Execute the code to be tested
+        data = mr.to_bytes()
+        mr2 = MetricsResponse.from_bytes(self.mc, data)
+
+        assert isinstance(data, bytes)
+        json_size = len(json.dumps([
+            ov.dump() for mgv in mr.metric_group_values
+            for ov in mgv.object_values]))
+        assert len(data) < json_size
+
+        assert mr2.metric_group_names == [MG_PARTITION, MG_CHANNEL]
+        for mgc, mgc2 in zip(mr.metric_group_columns,
+                             mr2.metric_group_columns):
+            assert mgc2.metric_group_definition is mgc.metric_group_definition
+            assert mgc2.resource_uris == mgc.resource_uris
+            assert mgc2.timestamps == mgc.timestamps
+            assert mgc2.columns == mgc.columns
+
+        # Row-based access re-creates the metrics response string
+        for mgv, mgv2 in zip(mr.metric_group_values,
+                             mr2.metric_group_values):
+            assert [(ov.resource_uri, ov.timestamp, ov.metrics)
+                    for ov in mgv2.object_values] == \
+                [(ov.resource_uri, ov.timestamp, ov.metrics)
+                 for ov in mgv.object_values]
+
+    @pytest.mark.parametrize(
+        "data", [
+            b'',
+            b'XYZ\x01',
+            b'ZMR\x01\x01\x00\x00\x00',
+            b'ZMR\x01\x01\x00\x00\x00\x03\x00\x00\x00foo',
+        ]
+    )
+    def test_mr_from_bytes_invalid(self, data):
+        """Test MetricsResponse.from_bytes() with invalid data."""
+
+        with pytest.raises(ValueError):
+
+            # Execute the code to be tested
+            MetricsResponse.from_bytes(self.mc, data)
+
+    def test_mc_replay(self):
+        """Test FakedMetricsContext.replay()."""
+
+        data = MetricsResponse(self.mc, self.mr_str).to_bytes()
+        mc_oid = self.mc.uri.split('/')[-1]
+        faked_mc = self.session.hmc.metrics_contexts.lookup_by_oid(mc_oid)
+
+        # Execute the code to be tested
+        faked_mc.replay([MetricsResponse.from_bytes(self.mc, data),
+                         '"partition-usage"\n\n\n'])
+
+        mr = MetricsResponse(self.mc, self.mc.get_metrics())
+        assert [len(mgv.object_values) for mgv in mr.metric_group_values] \
+            == [NUM_PARTITIONS, 2]
+        assert self.mc.get_metrics() == '"partition-usage"\n\n\n'
+        assert self.mc.get_metrics() == self.mr_str
+
+    def test_mgc_to_numpy(self):
+        """Test MetricGroupColumns.to_numpy()."""
+
+        numpy = pytest.importorskip('numpy')
+        mr = MetricsResponse(self.mc, self.mr_str, columnar=True)
+        mgc_part, mgc_chan = mr.metric_group_columns
+
+        # Execute the code to be tested
+        np_part = mgc_part.to_numpy()
+        np_chan = mgc_chan.to_numpy()
+
+        assert np_part['processor-usage'].dtype == numpy.int64
+        assert list(np_part['processor-usage']) == \
+            [10 + i for i in range(NUM_PARTITIONS)]
+        assert np_chan['shared-channel'].dtype == numpy.bool_
+        assert list(np_chan['shared-channel']) == [True, False]
+        assert list(np_chan['channel-name']) == ['CHN01', 'CHN\u00e4']
+
+    @staticmethod
+    def assert_mgv_equal(mgv1, mgv2):
+        """Assert that two MetricGroupValues objects have equal values."""
+        assert mgv1.name == mgv2.name
+        assert len(mgv1.object_values) == len(mgv2.object_values)
+        for ov1, ov2 in zip(mgv1.object_values, mgv2.object_values):
+            assert ov1.resource_uri == ov2.resource_uri
+            assert ov1.timestamp == ov2.timestamp
+            assert ov1.metrics == ov2.metrics
+
+    @pytest.mark.parametrize(
+        "line_end", ['\n', '\r\n']
+    )
+    def test_mr_lazy(self, line_end):
+        """Test MetricsResponse in lazy mode."""
+
+        mr_str = self.mr_str.replace('\n', line_end)
+        mr = MetricsResponse(self.mc, self.mr_str)
+
+        # Execute the code to be tested
+        mr_lazy = MetricsResponse(self.mc, mr_str, lazy=True)
+
+        assert mr_lazy.metric_group_names == [MG_PARTITION, MG_CHANNEL]
+
+        # Execute the code to be tested
+        mgv_channel = mr_lazy.metric_group(MG_CHANNEL)
+
+        self.assert_mgv_equal(mgv_channel, mr.metric_group_values[1])
+        assert mr_lazy.metric_group(MG_CHANNEL) is mgv_channel
+
+        # Execute the code to be tested
+        ov_iter = mr_lazy.iter_object_values(MG_PARTITION)
+
+        ov_list = list(ov_iter)
+        assert [ov.metrics for ov in ov_list] == \
+            [ov.metrics for ov in mr.metric_group_values[0].object_values]
+
+        # Execute the code to be tested
+        mgv_list = mr_lazy.metric_group_values
+
+        assert len(mgv_list) == 2
+        for mgv1, mgv2 in zip(mgv_list, mr.metric_group_values):
+            self.assert_mgv_equal(mgv1, mgv2)
+        assert mgv_list[1] is mgv_channel
+
+        with pytest.raises(KeyError):
+            mr_lazy.metric_group('adapter-usage')
+
+    def test_mr_lazy_empty_groups(self):
+        """Test MetricsResponse in lazy mode with empty metric groups."""
+
+        mc = self.client.metrics_contexts.create({
+            'anticipated-frequency-seconds': 15,
+            'metric-groups': ['adapter-usage', MG_PARTITION],
+        })
+        mr_str = (
+            '"adapter-usage"\n'
+            '\n'
+            '"partition-usage"\n'
+            '"/api/partitions/p1"\n'
+            '1767268800000\n'
+            '1,2,3,4,5\n'
+            '\n'
+            '"/api/partitions/p2"\n'
+            '1767268800000\n'
+            '6,7,8,9,10\n'
+            '\n'
+            '\n'
+            '\n')
+
+        # Execute the code to be tested
+        mr = MetricsResponse(mc, mr_str, lazy=True)
+
+        assert mr.metric_group_names == ['adapter-usage', MG_PARTITION]
+        assert mr.metric_group('adapter-usage').object_values == []
+        ov_list = mr.metric_group(MG_PARTITION).object_values
+        assert [ov.resource_uri for ov in ov_list] == \
+            ['/api/partitions/p1', '/api/partitions/p2']
+        assert ov_list[1].metrics['crypto-usage'] == 10
+        self.assert_mgv_equal(
+            mr.metric_group(MG_PARTITION),
+            MetricsResponse(mc, mr_str).metric_group_values[1])
+
+    def add_resources(self):
+        """
+        Add a faked console and a faked CPC with the faked partitions the
+        metric values apply to, except for the last partition. The first
+        partition has a NIC.
+
+        Returns the faked NIC.
+        """
+        self.session.hmc.consoles.add({
+            'object-id': None,
+            'parent': None,
+            'class': 'console',
+            'name': 'fake-console1',
+        })
+        faked_cpc = self.session.hmc.cpcs.add({
+            'object-id': 'cpc1-oid',
+            'parent': None,
+            'class': 'cpc',
+            'name': 'CPC1',
+            'dpm-enabled': True,
+        })
+        for i in range(NUM_PARTITIONS - 1):
+            faked_partition = faked_cpc.partitions.add({
+                'object-id': f'part{i}-oid',
+                'parent': faked_cpc.uri,
+                'class': 'partition',
+                'name': f'part{i}',
+                'status': 'active',
+            })
+            if i == 0:
+                faked_nic = faked_partition.nics.add({
+                    'element-id': 'nic1-oid',
+                    'parent': faked_partition.uri,
+                    'class': 'nic',
+                    'name': 'nic1',
+                })
+        return faked_nic
+
+    def test_mr_resolve_resources(self):
+        """Test MetricsResponse.resolve_resources()."""
+
+        faked_nic = self.add_resources()
+        self.session.hmc.add_metric_values(FakedMetricObjectValues(
+            group_name='partition-attached-network-interface',
+            resource_uri=faked_nic.uri,
+            timestamp=MR_TIMESTAMP,
+            values=[('partition-id', '01')] + [
+                (name, 0) for name in (
+                    'bytes-sent', 'bytes-received', 'packets-sent',
+                    'packets-received', 'packets-sent-dropped',
+                    'packets-received-dropped', 'packets-sent-discarded',
+                    'packets-received-discarded', 'multicast-packets-sent',
+                    'multicast-packets-received', 'broadcast-packets-sent',
+                    'broadcast-packets-received', 'interval-bytes-sent',
+                    'interval-bytes-received', 'bytes-per-second-sent',
+                    'bytes-per-second-received', 'flags')]))
+        mc = self.client.metrics_contexts.create({
+            'anticipated-frequency-seconds': 15,
+            'metric-groups': [MG_PARTITION, MG_CHANNEL,
+                              'partition-attached-network-interface'],
+        })
+        mr = MetricsResponse(mc, mc.get_metrics())
+
+        get_uris = []
+        session_get = self.session.get
+
+        def counting_get(uri, *args, **kwargs):
+            get_uris.append(uri)
+            return session_get(uri, *args, **kwargs)
+
+        self.session.get = counting_get
+
+        # Execute the code to be tested
+        resource_cache = mr.resolve_resources()
+
+        # One list operation per resource class, plus the list of NICs of
+        # the parent partition
+        assert len(get_uris) <= 5
+
+        mgv_part, mgv_chan, mgv_nic = mr.metric_group_values
+        for i, ov in enumerate(mgv_part.object_values[:-1]):
+            assert ov.resource.name == f'part{i}'
+            assert ov.resource is resource_cache[ov.resource_uri]
+        with pytest.raises(MetricsResourceNotFound):
+            _ = mgv_part.object_values[-1].resource
+        for ov in mgv_chan.object_values:
+            assert ov.resource.name == 'CPC1'
+        assert mgv_nic.object_values[0].resource.uri == faked_nic.uri
+
+        # Resolving the resources of another metric response with the same
+        # cache only retrieves the partitions that were not found before.
+        mr2 = MetricsResponse(mc, mc.get_metrics(), lazy=True)
+        get_uris.clear()
+
+        # Execute the code to be tested
+        mr2.resolve_resources(resource_cache)
+
+        assert get_uris == \
+            ['/api/console/operations/list-permitted-partitions']
+        assert mr2.metric_group(MG_CHANNEL).object_values[0].resource is \
+            resource_cache['/api/cpcs/cpc1-oid']
+
+
+@pytest.mark.parametrize(
+    "value", [
+        'abc',
+        '',
+        'a "quoted" value',
+        '"',
+        'a,b,c',
+        'back\\slash',
+        'non-ascii \u00e4',
+        'line\nbreak',
+    ]
+)
+def test_metric_value_str_roundtrip(value):
+    """
+    Test that string metric values survive the conversion to a metrics
+    response string and back, including values with quotes and commas.
+    """
+
+    # Execute the code to be tested
+    value_str = _metrics._metric_value_str(value, str)
+
+    assert value_str.startswith('"') and value_str.endswith('"')
+    inner = value_str[1:-1]
+    assert '"' not in inner
+    assert ',' not in inner
+    assert _metrics._metric_value(value_str, str) == value
+
+
+@pytest.mark.parametrize(
+    "native", [True, False]
+)
+@pytest.mark.parametrize(
+    "arr, exp_bytes", [
+        (array('b', [1, -1]), b'\x01\xff'),
+        (array('h', [1, -2]), b'\x01\x00\xfe\xff'),
+        (array('i', [1]), b'\x01\x00\x00\x00'),
+        (array('q', [1]), b'\x01\x00\x00\x00\x00\x00\x00\x00'),
+        (array('H', [0x102]), b'\x02\x01'),
+        (array('I', [0x1020304]), b'\x04\x03\x02\x01'),
+        (array('d', [1.0]), b'\x00\x00\x00\x00\x00\x00\xf0\x3f'),
+    ]
+)
+def test_binary_array_layout(arr, exp_bytes, native):
+    """
+    Test that arrays in the binary form of a metrics response have little
+    endian byte order and fixed item sizes, also on platforms where the
+    arrays cannot be copied as bytes.
+    """
+    with mock.patch.object(_metrics, '_array_native',
+                           return_value=native):
+
+        # Execute the code to be tested
+        writer = _metrics._BinaryWriter()
+        writer.array(arr)
+        data = writer.getvalue()
+        arr2 = _metrics._BinaryReader(data).array(len(arr))
+
+    assert data == arr.typecode.encode('ascii') + exp_bytes
+    assert arr2.typecode == arr.typecode
+    assert arr2 == arr
+
+
+def test_binary_array_invalid_typecode():
+    """
+    Test that an invalid array typecode in the binary form of a metrics
+    response raises ValueError.
+    """
+    with pytest.raises(ValueError):
+
+        # Execute the code to be tested
+        _metrics._BinaryReader(b'l\x00\x00\x00\x00').array(1)
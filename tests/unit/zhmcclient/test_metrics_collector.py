@@ -0,0 +1,167 @@
+# Copyright 2026 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for _metrics_collector module of the zhmcclient package.
+"""
+
+
+from datetime import datetime, timezone
+import threading
+import time
+
+from zhmcclient import Client, MetricsPoller, MetricsCollector, \
+    CollectedMetrics, MetricsResponse, OperationTimeout
+from zhmcclient.mock import FakedSession, FakedMetricObjectValues
+
+MG_PARTITION = 'partition-usage'
+TIMESTAMP = datetime(2026, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+
+def faked_poller(hmc_name):
+    """
+    Return a MetricsPoller for a new faked HMC with metric values for one
+    partition.
+    """
+    session = FakedSession('fake-host', hmc_name, '2.16.0', '4.10')
+    session.hmc.add_metric_values(FakedMetricObjectValues(
+        group_name=MG_PARTITION,
+        resource_uri='/api/partitions/part1-oid',
+        timestamp=TIMESTAMP,
+        values=[
+            ('processor-usage', 1),
+            ('network-usage', 2),
+            ('storage-usage', 3),
+            ('accelerator-usage', 4),
+            ('crypto-usage', 5),
+        ]))
+    return MetricsPoller(Client(session), [MG_PARTITION])
+
+
+class TestMetricsCollector:
+    """All tests for the MetricsCollector class."""
+
+    def setup_method(self):
+        """
+        Setup that is called by pytest before each test method.
+
+        Set up pollers for a fast HMC, a slow HMC whose retrievals block until
+        the 'release' event is set, and a failing HMC.
+        """
+        # pylint: disable=attribute-defined-outside-init
+        self.pollers = {
+            'fast': faked_poller('fast'),
+            'slow': faked_poller('slow'),
+            'failing': faked_poller('failing'),
+        }
+        self.release = threading.Event()
+        slow_poller = self.pollers['slow']
+        org_get_metrics_response = slow_poller.get_metrics_response
+
+        def slow_get_metrics_response():
+            self.release.wait(5)
+            return org_get_metrics_response()
+
+        slow_poller.get_metrics_response = slow_get_metrics_response
+
+        def failing_get_metrics_response():
+            raise ValueError("failed")
+
+        self.pollers['failing'].get_metrics_response = \
+            failing_get_metrics_response
+
+    def teardown_method(self):
+        """
+        Teardown that is called by pytest after each test method.
+        """
+        self.release.set()
+
+    def test_collect(self):
+        """Test MetricsCollector.collect()."""
+
+        with MetricsCollector(self.pollers, timeout=0.2) as collector:
+
+            # Execute the code to be tested
+            results = collector.collect()
+
+            by_hmc = {r.hmc: r for r in results}
+            assert len(results) == 3
+            assert all(isinstance(r, CollectedMetrics) for r in results)
+            assert isinstance(by_hmc['fast'].metrics_response, MetricsResponse)
+            assert by_hmc['fast'].exception is None
+            assert isinstance(by_hmc['failing'].exception, ValueError)
+            assert isinstance(by_hmc['slow'].exception, OperationTimeout)
+            assert by_hmc['slow'].metrics_response is None
+            assert results[-1].hmc == 'slow'
+
+            # The slow HMC still has its retrieval in progress
+            results = collector.collect()
+
+            assert sorted(r.hmc for r in results) == ['failing', 'fast']
+            assert collector.skipped == {'fast': 0, 'slow': 1, 'failing': 0}
+
+            self.release.set()
+            results = collector.collect()
+
+            by_hmc = {r.hmc: r for r in results}
+            assert by_hmc['slow'].exception is None
+            mr = by_hmc['slow'].metrics_response
+            assert mr.metrics_context.manager.client is \
+                self.pollers['slow'].client
+
+        # Closing the collector deletes the metrics contexts
+        for poller in self.pollers.values():
+            assert poller.metrics_context is None
+
+    def test_stream(self):
+        """Test MetricsCollector.stream() and stop()."""
+
+        results = []
+        with MetricsCollector(self.pollers, interval=0.05,
+                              timeout=0.2) as collector:
+
+            # Execute the code to be tested
+            for result in collector.stream():
+                results.append(result)
+                if result.hmc == 'slow' and result.exception:
+                    self.release.set()
+                if result.hmc == 'slow' and result.metrics_response:
+                    collector.stop()
+
+        hmcs = [r.hmc for r in results]
+        # The fast HMC is not delayed by the slow HMC
+        assert hmcs.count('fast') > 1
+        assert hmcs.index('fast') < hmcs.index('slow')
+        slow_results = [r for r in results if r.hmc == 'slow']
+        assert isinstance(slow_results[0].exception, OperationTimeout)
+        assert slow_results[1].metrics_response is not None
+
+    def test_close_hanging(self):
+        """Test MetricsCollector.close() with a hanging HMC."""
+
+        closed = []
+        self.pollers['slow'].close = lambda: closed.append('slow')
+        collector = MetricsCollector(self.pollers, timeout=0.2)
+        results = collector.collect()
+        assert len(results) == 3
+
+        # Execute the code to be tested
+        start = time.monotonic()
+        collector.close()
+        duration = time.monotonic() - start
+
+        # The slow HMC still has its retrieval in progress and is not closed
+        assert duration < 1
+        assert self.pollers['fast'].metrics_context is None
+        assert closed == []
@@ -0,0 +1,226 @@
+# Copyright 2026 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for _metrics_export module of the zhmcclient package.
+"""
+
+
+import math
+from datetime import datetime, timedelta, timezone
+
+from zhmcclient import Client, MetricsResponse, OpenMetricsExporter
+from zhmcclient.mock import FakedSession, FakedMetricObjectValues
+
+START_TIME = datetime(2026, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+START_TS = 1767268800000
+
+NIC_COUNTERS = (
+    'bytes-sent', 'bytes-received', 'packets-sent', 'packets-received',
+    'packets-sent-dropped', 'packets-received-dropped',
+    'packets-sent-discarded', 'packets-received-discarded',
+    'multicast-packets-sent', 'multicast-packets-received',
+    'broadcast-packets-sent', 'broadcast-packets-received',
+    'interval-bytes-sent', 'interval-bytes-received',
+    'bytes-per-second-sent', 'bytes-per-second-received', 'flags',
+)
+
+
+class TestOpenMetricsExporter:
+    """All tests for the OpenMetricsExporter class."""
+
+    def setup_method(self):
+        """
+        Setup that is called by pytest before each test method.
+
+        Set up a faked CPC with a partition that has a NIC, faked metric
+        values for them and for a channel and a partition that does not
+        exist, and create a metrics context for them.
+        """
+        # pylint: disable=attribute-defined-outside-init
+        self.session = FakedSession('fake-host', 'fake-hmc', '2.16.0', '4.10')
+        self.client = Client(self.session)
+        self.session.hmc.consoles.add({
+            'object-id': None,
+            'parent': None,
+            'class': 'console',
+            'name': 'fake-console1',
+        })
+        faked_cpc = self.session.hmc.cpcs.add({
+            'object-id': 'cpc1-oid',
+            'parent': None,
+            'class': 'cpc',
+            'name': 'CPC1',
+            'dpm-enabled': True,
+        })
+        faked_partition = faked_cpc.partitions.add({
+            'object-id': 'part1-oid',
+            'parent': faked_cpc.uri,
+            'class': 'partition',
+            'name': 'PART1',
+            'status': 'active',
+        })
+        faked_nic = faked_partition.nics.add({
+            'element-id': 'nic1-oid',
+            'parent': faked_partition.uri,
+            'class': 'nic',
+            'name': 'NIC1',
+        })
+        hmc = self.session.hmc
+        for i, partition_uri in enumerate(
+                [faked_partition.uri, '/api/partitions/gone-oid']):
+            hmc.add_metric_values(FakedMetricObjectValues(
+                group_name='partition-usage',
+                resource_uri=partition_uri,
+                timestamp=START_TIME,
+                values=[
+                    ('processor-usage', 10 + i),
+                    ('network-usage', 20),
+                    ('storage-usage', 30),
+                    ('accelerator-usage', 40),
+                    ('crypto-usage', 50),
+                ]))
+        # Two samples; only the newer one is exported
+        for seconds, bytes_sent in ((0, 1000), (15, 2500)):
+            hmc.add_metric_values(FakedMetricObjectValues(
+                group_name='partition-attached-network-interface',
+                resource_uri=faked_nic.uri,
+                timestamp=START_TIME + timedelta(seconds=seconds),
+                values=[('partition-id', '01')] + [
+                    (name, bytes_sent if name == 'bytes-sent' else 0)
+                    for name in NIC_COUNTERS]))
+        for name, shared in (('CHN01', True), ('CHN"2', False)):
+            hmc.add_metric_values(FakedMetricObjectValues(
+                group_name='channel-usage',
+                resource_uri=faked_cpc.uri,
+                timestamp=START_TIME,
+                values=[
+                    ('channel-name', name),
+                    ('shared-channel', shared),
+                    ('logical-partition-name', 'LPAR1'),
+                    ('channel-usage', 5),
+                ]))
+        self.mc = self.client.metrics_contexts.create({
+            'anticipated-frequency-seconds': 15,
+            'metric-groups': [
+                'partition-usage', 'partition-attached-network-interface',
+                'channel-usage'],
+        })
+        self.mr_str = self.mc.get_metrics()
+
+    def test_export(self):
+        """Test OpenMetricsExporter.export()."""
+
+        exporter = OpenMetricsExporter()
+        mr = MetricsResponse(self.mc, self.mr_str, columnar=True)
+
+        # Execute the code to be tested
+        text = exporter.export(mr)
+
+        lines = text.splitlines()
+        assert lines[-1] == '# EOF'
+        assert '# TYPE zhmc_partition_usage_processor_usage_percent gauge' \
+            in lines
+        assert '# UNIT zhmc_partition_usage_processor_usage_percent percent' \
+            in lines
+        assert 'zhmc_partition_usage_processor_usage_percent' \
+            '{cpc="CPC1",partition="PART1"} 10' in lines
+        assert 'zhmc_partition_usage_processor_usage_percent' \
+            '{resource_uri="/api/partitions/gone-oid"} 11' in lines
+
+        family = 'zhmc_partition_attached_network_interface_bytes_sent_bytes'
+        assert f'# TYPE {family} counter' in lines
+        nic_lines = [line for line in lines
+                     if line.startswith(f'{family}_total')]
+        assert nic_lines == [
+            f'{family}_total{{cpc="CPC1",partition="PART1",nic="NIC1",'
+            'partition_id="01"} 2500']
+
+        channel_lines = [
+            line for line in lines
+            if line.startswith('zhmc_channel_usage_shared_channel')]
+        assert channel_lines == [
+            'zhmc_channel_usage_shared_channel{cpc="CPC1",'
+            'channel_name="CHN01",logical_partition_name="LPAR1"} 1',
+            'zhmc_channel_usage_shared_channel{cpc="CPC1",'
+            'channel_name="CHN\\"2",logical_partition_name="LPAR1"} 0',
+        ]
+
+        # The labels are cached, so no HMC operations are performed
+        get_uris = []
+        org_get = self.session.get
+
+        def counting_get(uri, *args, **kwargs):
+            get_uris.append(uri)
+            return org_get(uri, *args, **kwargs)
+
+        self.session.get = counting_get
+        text2 = exporter.export(
+            MetricsResponse(self.mc, self.mr_str, columnar=True))
+
+        assert text2 == text
+        assert get_uris == []
+
+    def test_export_unresolved(self):
+        """Test OpenMetricsExporter.export() without resource resolution."""
+
+        exporter = OpenMetricsExporter(
+            prefix='', resolve_resources=False, timestamps=True)
+        mr = MetricsResponse(self.mc, self.mr_str)
+
+        # Execute the code to be tested
+        text = exporter.export(mr)
+
+        lines = text.splitlines()
+        assert 'partition_usage_crypto_usage_percent' \
+            '{resource_uri="/api/partitions/part1-oid"} ' \
+            f'50 {START_TS / 1000}' in lines
+
+    def test_export_non_finite(self):
+        """
+        Test OpenMetricsExporter.export() with non-finite float metric values.
+        """
+        hmc = self.session.hmc
+        cpc_values = [math.nan, math.inf, -math.inf, 1.5]
+        for i, value in enumerate(cpc_values):
+            hmc.add_metric_values(FakedMetricObjectValues(
+                group_name='zcpc-environmentals-and-power',
+                resource_uri=f'/api/cpcs/cpc{i}-oid',
+                timestamp=START_TIME,
+                values=[
+                    ('temperature-celsius', value),
+                    ('humidity', 40),
+                    ('dew-point-celsius', 10.0),
+                    ('power-consumption-watts', 1000),
+                    ('heat-load', 0),
+                    ('heat-load-forced-air', 0),
+                    ('heat-load-water', 0),
+                    ('exhaust-temperature-celsius', 30.0),
+                ]))
+        mc = self.client.metrics_contexts.create({
+            'anticipated-frequency-seconds': 15,
+            'metric-groups': ['zcpc-environmentals-and-power'],
+        })
+        exporter = OpenMetricsExporter(resolve_resources=False)
+        mr = MetricsResponse(mc, mc.get_metrics(), columnar=True)
+
+        # Execute the code to be tested
+        text = exporter.export(mr)
+
+        family = 'zhmc_zcpc_environmentals_and_power_temperature_celsius'
+        temp_lines = [line for line in text.splitlines()
+                      if line.startswith(f'{family}{{')]
+        assert temp_lines == [
+            f'{family}{{resource_uri="/api/cpcs/cpc{i}-oid"}} {exp_value}'
+            for i, exp_value in enumerate(['NaN', '+Inf', '-Inf', '1.5'])]
@@ -0,0 +1,189 @@
+# Copyright 2026 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for _metrics_poller module of the zhmcclient package.
+"""
+
+
+from datetime import datetime, timedelta, timezone
+
+from zhmcclient import Client, MetricsPoller, MetricsRecord
+from zhmcclient.mock import FakedSession, FakedMetricObjectValues
+
+MG_NIC = 'partition-attached-network-interface'
+MG_PARTITION = 'partition-usage'
+NIC_URI = '/api/partitions/part1-oid/nics/nic1-oid'
+PARTITION_URI = '/api/partitions/part1-oid'
+START_TIME = datetime(2026, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+
+def nic_values(bytes_sent, packets_sent):
+    """
+    Return the metric values for the NIC metric group, with the specified
+    counter values and all other counters set to 0.
+    """
+    return [
+        ('partition-id', 'part1'),
+        ('bytes-sent', bytes_sent),
+        ('bytes-received', 0),
+        ('packets-sent', packets_sent),
+        ('packets-received', 0),
+        ('packets-sent-dropped', 0),
+        ('packets-received-dropped', 0),
+        ('packets-sent-discarded', 0),
+        ('packets-received-discarded', 0),
+        ('multicast-packets-sent', 0),
+        ('multicast-packets-received', 0),
+        ('broadcast-packets-sent', 0),
+        ('broadcast-packets-received', 0),
+        ('interval-bytes-sent', 0),
+        ('interval-bytes-received', 0),
+        ('bytes-per-second-sent', 0),
+        ('bytes-per-second-received', 0),
+        ('flags', 0),
+    ]
+
+
+class TestMetricsPoller:
+    """All tests for the MetricsPoller class."""
+
+    def setup_method(self):
+        """
+        Setup that is called by pytest before each test method.
+        """
+        # pylint: disable=attribute-defined-outside-init
+        self.session = FakedSession('fake-host', 'fake-hmc', '2.16.0', '4.10')
+        self.client = Client(self.session)
+
+    def add_sample(self, seconds, bytes_sent, packets_sent):
+        """
+        Add faked metric values for the NIC and the partition, at the
+        specified number of seconds after the start time.
+        """
+        timestamp = START_TIME + timedelta(seconds=seconds)
+        self.session.hmc.add_metric_values(FakedMetricObjectValues(
+            group_name=MG_NIC,
+            resource_uri=NIC_URI,
+            timestamp=timestamp,
+            values=nic_values(bytes_sent, packets_sent)))
+        self.session.hmc.add_metric_values(FakedMetricObjectValues(
+            group_name=MG_PARTITION,
+            resource_uri=PARTITION_URI,
+            timestamp=timestamp,
+            values=[
+                ('processor-usage', seconds),
+                ('network-usage', 0),
+                ('storage-usage', 0),
+                ('accelerator-usage', 0),
+                ('crypto-usage', 0),
+            ]))
+
+    def test_poll_deltas(self):
+        """Test MetricsPoller.poll() with new and already returned samples."""
+
+        self.add_sample(0, 1000, 10)
+        poller = MetricsPoller(self.client, [MG_NIC, MG_PARTITION])
+
+        # Execute the code to be tested
+        records = poller.poll()
+
+        assert [(r.group_name, r.resource_uri) for r in records] == \
+            [(MG_NIC, NIC_URI), (MG_PARTITION, PARTITION_URI)]
+        nic_record = records[0]
+        assert isinstance(nic_record, MetricsRecord)
+        assert nic_record.timestamp == START_TIME
+        assert nic_record.metrics['bytes-sent'] == 1000
+        assert nic_record.metrics['partition-id'] == 'part1'
+        assert nic_record.deltas == {}
+        assert nic_record.rates == {}
+        assert poller.context_creations == 1
+
+        # No new samples
+        records = poller.poll()
+
+        assert records == []
+
+        # The faked HMC returns all samples added so far
+        self.add_sample(15, 4000, 25)
+        self.add_sample(30, 1500, 40)
+
+        records = poller.poll()
+
+        nic_records = [r for r in records if r.group_name == MG_NIC]
+        assert [r.timestamp for r in nic_records] == \
+            [START_TIME + timedelta(seconds=15),
+             START_TIME + timedelta(seconds=30)]
+        assert nic_records[0].deltas['bytes-sent'] == 3000
+        assert nic_records[0].rates['bytes-sent'] == 200.0
+        assert nic_records[0].deltas['packets-sent'] == 15
+        assert nic_records[0].rates['packets-sent'] == 1.0
+        assert nic_records[0].deltas['bytes-received'] == 0
+
+        # The bytes-sent counter has been reset
+        assert 'bytes-sent' not in nic_records[1].deltas
+        assert nic_records[1].deltas['packets-sent'] == 15
+
+        part_records = [r for r in records if r.group_name == MG_PARTITION]
+        assert len(part_records) == 2
+        assert part_records[1].metrics['processor-usage'] == 30
+        assert part_records[1].deltas == {}
+
+    def test_poll_recreate(self):
+        """Test that MetricsPoller.poll() re-creates a deleted context."""
+
+        self.add_sample(0, 1000, 10)
+        poller = MetricsPoller(self.client, [MG_NIC])
+        poller.poll()
+        mc = poller.metrics_context
+
+        # Simulate that the HMC deleted the metrics context
+        self.session.hmc.metrics_contexts.remove(mc.uri.split('/')[-1])
+        self.add_sample(15, 2500, 20)
+
+        # Execute the code to be tested
+        records = poller.poll()
+
+        assert poller.context_creations == 2
+        assert poller.metrics_context is not mc
+        assert self.client.metrics_contexts.list() == [poller.metrics_context]
+        assert len(records) == 1
+        assert records[0].rates['bytes-sent'] == 100.0
+
+        poller.close()
+
+        assert poller.metrics_context is None
+        assert self.client.metrics_contexts.list() == []
+
+    def test_records(self):
+        """Test MetricsPoller.records() and stop()."""
+
+        self.add_sample(0, 1000, 10)
+        timestamps = []
+
+        with MetricsPoller(self.client, [MG_NIC], interval=0.01,
+                           retry_interval=0.001) as poller:
+
+            # Execute the code to be tested
+            for record in poller.records():
+                timestamps.append(record.timestamp)
+                if len(timestamps) == 1:
+                    # A new sample that is returned by a subsequent poll
+                    self.add_sample(15, 2000, 20)
+                else:
+                    poller.stop()
+
+        assert timestamps == \
+            [START_TIME, START_TIME + timedelta(seconds=15)]
+        assert self.client.metrics_contexts.list() == []
@@ -0,0 +1,166 @@
+# Copyright 2026 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for _metrics_store module of the zhmcclient package.
+"""
+
+
+from datetime import datetime, timedelta, timezone
+import pytest
+
+from zhmcclient import Client, MetricsResponse, MetricsStore
+from zhmcclient.mock import FakedSession, FakedMetricObjectValues
+
+MG_PARTITION = 'partition-usage'
+MG_CHANNEL = 'channel-usage'
+PARTITION_URI = '/api/partitions/part1-oid'
+CPC_URI = '/api/cpcs/cpc1-oid'
+START_TIME = datetime(2026, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+
+class TestMetricsStore:
+    """All tests for the MetricsStore class."""
+
+    def setup_method(self):
+        """
+        Setup that is called by pytest before each test method.
+
+        Set up a faked session with 20 samples in 15 second intervals for a
+        partition and two channels, and create a metrics context for them.
+        """
+        # pylint: disable=attribute-defined-outside-init
+        self.session = FakedSession('fake-host', 'fake-hmc', '2.16.0', '4.10')
+        self.client = Client(self.session)
+        for i in range(20):
+            timestamp = START_TIME + timedelta(seconds=15 * i)
+            self.session.hmc.add_metric_values(FakedMetricObjectValues(
+                group_name=MG_PARTITION,
+                resource_uri=PARTITION_URI,
+                timestamp=timestamp,
+                values=[
+                    ('processor-usage', i),
+                    ('network-usage', 0),
+                    ('storage-usage', 0),
+                    ('accelerator-usage', 0),
+                    ('crypto-usage', 0),
+                ]))
+            self.session.hmc.add_metric_values(FakedMetricObjectValues(
+                group_name=MG_CHANNEL,
+                resource_uri=CPC_URI,
+                timestamp=timestamp,
+                values=[
+                    ('channel-name', 'CHN01'),
+                    ('shared-channel', i % 2 == 0),
+                    ('logical-partition-name', 'LPAR1'),
+                    ('channel-usage', 2 ** 63 if i == 19 else i),
+                ]))
+            self.session.hmc.add_metric_values(FakedMetricObjectValues(
+                group_name=MG_CHANNEL,
+                resource_uri=CPC_URI,
+                timestamp=timestamp,
+                values=[
+                    ('channel-name', 'CHN02'),
+                    ('shared-channel', True),
+                    ('logical-partition-name', 'LPAR1'),
+                    ('channel-usage', 100 + i),
+                ]))
+        self.mc = self.client.metrics_contexts.create({
+            'anticipated-frequency-seconds': 15,
+            'metric-groups': [MG_PARTITION, MG_CHANNEL],
+        })
+        self.mr_str = self.mc.get_metrics()
+
+    @pytest.mark.parametrize(
+        "columnar", [False, True]
+    )
+    def test_store_add_query(self, columnar):
+        """Test MetricsStore.add() and query() for raw samples."""
+
+        store = MetricsStore(capacity=8, downsampling=[])
+        mr = MetricsResponse(self.mc, self.mr_str, columnar=columnar)
+
+        # Execute the code to be tested
+        if columnar:
+            store.add(mr)
+        else:
+            store.add(mr.metric_group_values)
+        store.add(mr)  # already stored samples are ignored
+
+        # 5 partition metrics + 2 non-string metrics for each of 2 channels
+        assert len(store) == 9
+        assert (CPC_URI, 'channel-name', 0) not in store.keys()
+
+        samples = store.query(PARTITION_URI, 'processor-usage')
+        assert samples == [
+            (START_TIME + timedelta(seconds=15 * i), i) for i in range(12, 20)]
+
+        samples = store.query(
+            PARTITION_URI, 'processor-usage',
+            start=START_TIME + timedelta(seconds=200),
+            end=START_TIME + timedelta(seconds=240))
+        assert [v for _, v in samples] == [14, 15, 16]
+
+        samples = store.query(CPC_URI, 'shared-channel')
+        assert [v for _, v in samples] == [1, 0] * 4
+
+        # The last value exceeds 64 bits
+        samples = store.query(CPC_URI, 'channel-usage')
+        assert [v for _, v in samples] == list(range(12, 19)) + [2.0 ** 63]
+
+        # The second channel
+        samples = store.query(CPC_URI, 'channel-usage', row=1)
+        assert [v for _, v in samples] == list(range(112, 120))
+        samples = store.query(CPC_URI, 'shared-channel', row=1)
+        assert [v for _, v in samples] == [1] * 8
+
+        with pytest.raises(KeyError):
+            store.query(PARTITION_URI, 'foo')
+        with pytest.raises(ValueError):
+            store.query(PARTITION_URI, 'processor-usage', interval=60)
+
+        store.remove(PARTITION_URI)
+        assert len(store) == 4
+
+    def test_store_downsampling(self):
+        """Test MetricsStore.query() for downsampled samples."""
+
+        store = MetricsStore(capacity=4, downsampling=[(60, 3), (180, 10)])
+        mr = MetricsResponse(self.mc, self.mr_str, columnar=True)
+
+        # Execute the code to be tested
+        store.add(mr)
+
+        # Samples 0..19 in 15 s intervals; the interval of samples 16..19 is
+        # not complete yet, and the 1-minute level keeps 3 averages.
+        samples = store.query(PARTITION_URI, 'processor-usage', interval=60)
+        assert samples == [
+            (START_TIME + timedelta(seconds=60), 5.5),
+            (START_TIME + timedelta(seconds=120), 9.5),
+            (START_TIME + timedelta(seconds=180), 13.5),
+        ]
+
+        samples = store.query(PARTITION_URI, 'processor-usage', interval=180)
+        assert samples == [(START_TIME, 5.5)]
+
+        samples = store.query(CPC_URI, 'shared-channel', interval=60)
+        assert [v for _, v in samples] == [0.5, 0.5, 0.5]
+
+    def test_store_invalid(self):
+        """Test MetricsStore() with invalid parameters."""
+
+        with pytest.raises(ValueError):
+            MetricsStore(capacity=0)
+        with pytest.raises(ValueError):
+            MetricsStore(downsampling=[(0, 10)])
@@ -21,6 +21,7 @@ requests_mock package.
 
 
 import json
+import queue
 import threading
 from collections import namedtuple
 import logging
@@ -29,7 +30,9 @@ from unittest.mock import patch
 import pytest
 import stomp
 
-from zhmcclient._notification import NotificationReceiver
+from zhmcclient._notification import NotificationReceiver, \
+    NotificationJournal, StompRetryTimeoutConfig, merge_notifications, \
+    _HandoverQueue, _NotificationItem
 from zhmcclient._utils import stomp_uses_frames
 from zhmcclient._exceptions import SubscriptionNotFound, \
     NotificationConnectionError
@@ -513,3 +516,348 @@ class TestNotificationSubscriptionMgmt:
         assert mocked_conn.mock_get_subscription('fake-topic1')
         # pylint: disable=no-member
         assert mocked_conn.mock_get_subscription('fake-topic2')
+
+
+def _prop_change(uri, name, old, new):
+    """Return a property change notification for merge tests."""
+    return (
+        {'notification-type': 'property-change', 'object-uri': uri},
+        {'change-reports': [
+            {'property-name': name, 'old-value': old, 'new-value': new}]},
+    )
+
+
+def _status_change(uri, old, new):
+    """Return a status change notification for merge tests."""
+    return (
+        {'notification-type': 'status-change', 'object-uri': uri},
+        {'change-reports': [{'old-status': old, 'new-status': new}]},
+    )
+
+
+def _inventory_change(uri, action):
+    """Return an inventory change notification for merge tests."""
+    return (
+        {'notification-type': 'inventory-change', 'object-uri': uri,
+         'action': action},
+        None,
+    )
+
+
+TESTCASES_MERGE_NOTIFICATIONS = [
+    # Each list item is a testcase with:
+    # * desc (str): Testcase description
+    # * notifications (list): Input notifications
+    # * exp_notifications (list): Expected merged notifications
+    (
+        "Empty list",
+        [],
+        [],
+    ),
+    (
+        "Property changes for the same resource and property",
+        [
+            _prop_change('/api/p1', 'description', 'd0', 'd1'),
+            _prop_change('/api/p1', 'description', 'd1', 'd2'),
+            _prop_change('/api/p1', 'description', 'd2', 'd3'),
+        ],
+        [
+            _prop_change('/api/p1', 'description', 'd0', 'd3'),
+        ],
+    ),
+    (
+        "Property changes for the same resource and different properties",
+        [
+            _prop_change('/api/p1', 'description', 'd0', 'd1'),
+            _prop_change('/api/p1', 'name', 'n0', 'n1'),
+        ],
+        [
+            (
+                {'notification-type': 'property-change',
+                 'object-uri': '/api/p1'},
+                {'change-reports': [
+                    {'property-name': 'description', 'old-value': 'd0',
+                     'new-value': 'd1'},
+                    {'property-name': 'name', 'old-value': 'n0',
+                     'new-value': 'n1'},
+                ]},
+            ),
+        ],
+    ),
+    (
+        "Property changes for different resources",
+        [
+            _prop_change('/api/p1', 'description', 'd0', 'd1'),
+            _prop_change('/api/p2', 'description', 'e0', 'e1'),
+            _prop_change('/api/p1', 'description', 'd1', 'd2'),
+        ],
+        [
+            _prop_change('/api/p1', 'description', 'd0', 'd2'),
+            _prop_change('/api/p2', 'description', 'e0', 'e1'),
+        ],
+    ),
+    (
+        "Status changes for the same resource",
+        [
+            _status_change('/api/p1', 'stopped', 'starting'),
+            _status_change('/api/p1', 'starting', 'active'),
+        ],
+        [
+            _status_change('/api/p1', 'stopped', 'active'),
+        ],
+    ),
+    (
+        "Changes for the same resource separated by other notifications",
+        [
+            _prop_change('/api/p1', 'description', 'd0', 'd1'),
+            _status_change('/api/p1', 'stopped', 'active'),
+            _prop_change('/api/p1', 'description', 'd1', 'd2'),
+            _inventory_change('/api/p1', 'remove'),
+            _prop_change('/api/p1', 'description', 'd2', 'd3'),
+        ],
+        [
+            _prop_change('/api/p1', 'description', 'd0', 'd1'),
+            _status_change('/api/p1', 'stopped', 'active'),
+            _prop_change('/api/p1', 'description', 'd1', 'd2'),
+            _inventory_change('/api/p1', 'remove'),
+            _prop_change('/api/p1', 'description', 'd2', 'd3'),
+        ],
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "desc, notifications, exp_notifications",
+    TESTCASES_MERGE_NOTIFICATIONS)
+def test_merge_notifications(desc, notifications, exp_notifications):
+    # pylint: disable=unused-argument
+    """
+    Test function for merge_notifications().
+    """
+    result = merge_notifications(notifications)
+    assert result == exp_notifications
+
+
+@patch(target='stomp.Connection', new=MockedStompConnection)
+def test_notification_batches():
+    """
+    Test function for NotificationReceiver.notification_batches().
+    """
+    receiver = NotificationReceiver(
+        'fake-topic', 'fake-hmc', 'fake-userid', 'fake-password')
+    receiver.connect()
+    mocked_conn = receiver._conn  # pylint: disable=protected-access
+
+    for i in range(3):
+        headers, message = _prop_change('/api/p1', 'description', i, i + 1)
+        # pylint: disable=no-member
+        mocked_conn.mock_add_message(headers, message)
+
+    stop_event = threading.Event()
+    batches = []
+
+    def receive():
+        for batch in receiver.notification_batches(
+                window=0.2, stop_event=stop_event):
+            batches.append(batch)
+            stop_event.set()
+
+    receiver_thread = threading.Thread(target=receive)
+    receiver_thread.start()
+    mocked_conn.mock_start()  # pylint: disable=no-member
+    receiver_thread.join(STOMP_MIN_CONNECTION_CHECK_TIME + 2)
+    mocked_conn.mock_stop()  # pylint: disable=no-member
+    assert not receiver_thread.is_alive()
+    receiver.close()
+
+    assert batches == [
+        [_prop_change('/api/p1', 'description', 0, 3)],
+    ]
+
+
+@patch(target='stomp.Connection', new=MockedStompConnection)
+def test_notification_journal(tmp_path):
+    """
+    Test function for NotificationJournal and the tracking of session sequence
+    numbers in NotificationReceiver.
+    """
+    journal_file = tmp_path / 'journal.jsonl'
+    journal = NotificationJournal(str(journal_file))
+    receiver = NotificationReceiver(
+        'fake-topic', 'fake-hmc', 'fake-userid', 'fake-password',
+        journal=journal)
+
+    # notifications() connects, which resets the tracking of the session
+    # sequence numbers, so the messages are sent only after it has connected.
+    connected = threading.Event()
+    connect = receiver.connect
+
+    def connect_and_signal():
+        connect()
+        connected.set()
+
+    receiver.connect = connect_and_signal
+
+    notifications = []
+    for seq_nr in (0, 1, 3):
+        headers, message = _prop_change('/api/p1', 'description', 0, seq_nr)
+        headers['session-sequence-nr'] = str(seq_nr)
+        notifications.append((headers, message))
+
+    msg_items = []
+    all_received = threading.Event()
+
+    def receive():
+        for headers, message in receiver.notifications():
+            msg_items.append((headers, message))
+            if len(msg_items) == len(notifications):
+                # Do not wait for the disconnect of the mocked connection
+                all_received.set()
+                break
+
+    receiver_thread = threading.Thread(target=receive)
+    receiver_thread.start()
+    assert connected.wait(5)
+    mocked_conn = receiver._conn  # pylint: disable=protected-access
+    for headers, message in notifications:
+        # pylint: disable=no-member
+        mocked_conn.mock_add_message(headers, message)
+    mocked_conn.mock_start()  # pylint: disable=no-member
+    mocked_conn.mock_stop()  # pylint: disable=no-member
+
+    assert all_received.wait(5)
+    receiver_thread.join(5)
+    assert not receiver_thread.is_alive()
+    receiver.close()
+
+    assert msg_items == notifications
+    assert receiver.journal is journal
+    assert receiver.last_sequence_nr == 3
+    assert receiver.sequence_gaps == 1
+
+    journal.close()
+    with open(journal_file, 'a', encoding='utf-8') as fp:
+        # Incomplete line, e.g. from a terminated process
+        fp.write('{"time": 1')
+
+    assert list(journal.replay()) == notifications
+    assert list(journal.replay(since=time.time() + 10)) == []
+    assert list(NotificationJournal(str(tmp_path / 'none')).replay()) == []
+
+
+def _handover_item(headers, message):
+    """Return a handover item for a notification."""
+    return _NotificationItem(
+        msgtype='message', headers=headers, message=json.dumps(message))
+
+
+TESTCASES_HANDOVER_QUEUE = [
+    # Testcases for test_handover_queue(), each with these items:
+    # * desc (str): Testcase description
+    # * policy (str): Overflow policy
+    # * notifications (list): Notifications put into a queue with maxsize 2
+    # * exp_notifications (list): Expected notifications in the queue
+    # * exp_dropped (int): Expected number of dropped notifications
+    # * exp_coalesced (int): Expected number of coalesced notifications
+    (
+        "block drops the received notification",
+        'block',
+        [_prop_change('/api/p1', 'description', 0, 1),
+         _prop_change('/api/p2', 'description', 0, 1),
+         _prop_change('/api/p3', 'description', 0, 1)],
+        [_prop_change('/api/p1', 'description', 0, 1),
+         _prop_change('/api/p2', 'description', 0, 1)],
+        1, 0,
+    ),
+    (
+        "drop-oldest drops the oldest notification",
+        'drop-oldest',
+        [_prop_change('/api/p1', 'description', 0, 1),
+         _prop_change('/api/p2', 'description', 0, 1),
+         _prop_change('/api/p3', 'description', 0, 1)],
+        [_prop_change('/api/p2', 'description', 0, 1),
+         _prop_change('/api/p3', 'description', 0, 1)],
+        1, 0,
+    ),
+    (
+        "coalesce merges into the notification for the same resource",
+        'coalesce',
+        [_prop_change('/api/p1', 'description', 0, 1),
+         _prop_change('/api/p2', 'description', 0, 1),
+         _prop_change('/api/p1', 'description', 1, 2)],
+        [_prop_change('/api/p1', 'description', 0, 2),
+         _prop_change('/api/p2', 'description', 0, 1)],
+        0, 1,
+    ),
+    (
+        "coalesce falls back to dropping the oldest notification",
+        'coalesce',
+        [_status_change('/api/p1', 'active', 'stopped'),
+         _prop_change('/api/p2', 'description', 0, 1),
+         _prop_change('/api/p1', 'description', 1, 2)],
+        [_prop_change('/api/p2', 'description', 0, 1),
+         _prop_change('/api/p1', 'description', 1, 2)],
+        1, 0,
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "desc, policy, notifications, exp_notifications, exp_dropped, "
+    "exp_coalesced",
+    TESTCASES_HANDOVER_QUEUE)
+@patch(target='zhmcclient._notification._HANDOVER_BLOCK_TIMEOUT', new=0.1)
+def test_handover_queue(
+        desc, policy, notifications, exp_notifications, exp_dropped,
+        exp_coalesced):
+    # pylint: disable=unused-argument
+    """
+    Test function for the overflow policies of the handover queue.
+    """
+    handover_queue = _HandoverQueue(2, policy)
+    for headers, message in notifications:
+        handover_queue.put(_handover_item(headers, message))
+
+    # Connection events are always queued
+    disc_item = _NotificationItem(
+        msgtype='disconnected', headers=None, message=None)
+    handover_queue.put(disc_item)
+    first_item = handover_queue.get(timeout=0)
+    handover_queue.put_front(first_item)
+
+    items = [handover_queue.get(timeout=0) for _ in range(3)]
+    with pytest.raises(queue.Empty):
+        handover_queue.get(timeout=0)
+
+    assert items[-1] == disc_item
+    assert [(item.headers, json.loads(item.message))
+            for item in items[:-1]] == exp_notifications
+    assert handover_queue.dropped == exp_dropped
+    assert handover_queue.coalesced == exp_coalesced
+    assert handover_queue.max_qsize == 3
+
+
+def test_handover_queue_config():
+    """
+    Test the handover queue configuration of NotificationReceiver.
+    """
+    rt_config = StompRetryTimeoutConfig(
+        handover_queue_size=10, handover_overflow_policy='drop-oldest')
+    receiver = NotificationReceiver(
+        'fake-topic', 'fake-hmc', 'fake-userid', 'fake-password',
+        stomp_rt_config=rt_config)
+    # pylint: disable=protected-access
+    assert receiver._rt_config.handover_queue_size == 10
+    assert receiver._rt_config.handover_overflow_policy == 'drop-oldest'
+    assert receiver._rt_config.heartbeat_receive_check == \
+        NotificationReceiver.default_stomp_rt_config.heartbeat_receive_check
+    assert receiver.queue_depth == 0
+    assert receiver.max_queue_depth == 0
+    assert receiver.dropped == 0
+    assert receiver.coalesced == 0
+
+    rt_config = StompRetryTimeoutConfig(handover_overflow_policy='invalid')
+    with pytest.raises(ValueError):
+        NotificationReceiver(
+            'fake-topic', 'fake-hmc', 'fake-userid', 'fake-password',
+            stomp_rt_config=rt_config)
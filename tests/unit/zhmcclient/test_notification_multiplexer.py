@@ -0,0 +1,279 @@
+# Copyright 2026 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for _notification_multiplexer module.
+"""
+
+
+import time
+import threading
+from unittest.mock import patch
+import pytest
+
+from zhmcclient import Client, NotificationMultiplexer, \
+    NotificationConnectionError, SubscriptionNotFound
+from zhmcclient.mock import FakedSession
+
+from .test_notification import MockedStompConnection, _prop_change
+from .test_auto_updater import TEST_RESOURCES_BASE
+
+
+def _topic_message(mux, topic_name, notification, seq_nr=None):
+    """
+    Return the notification with the STOMP headers for a topic subscribed
+    on the multiplexer.
+    """
+    headers, message = notification
+    headers = dict(headers)
+    # pylint: disable=protected-access
+    headers['subscription'] = mux._topics[topic_name]['id']
+    headers['destination'] = f'/topic/{topic_name}'
+    if seq_nr is not None:
+        headers['session-sequence-nr'] = str(seq_nr)
+    return headers, message
+
+
+@patch(target='stomp.Connection', new=MockedStompConnection)
+def test_multiplexer_subscriptions():
+    """
+    Test subscribing and unsubscribing on a NotificationMultiplexer, and the
+    delivery of the notifications to the subscriptions for their topic.
+    """
+    mux = NotificationMultiplexer('fake-hmc', 'fake-userid', 'fake-password')
+    assert not mux.is_connected()
+
+    sub1a = mux.subscribe('topic1')
+    sub1b = mux.subscribe('topic1')
+    received2 = []
+    sub2 = mux.subscribe(
+        'topic2', callback=lambda h, m: received2.append((h, m)))
+
+    conn = mux._conn  # pylint: disable=protected-access
+    assert mux.is_connected()
+    assert sorted(mux.topic_names) == ['topic1', 'topic2']
+    # One STOMP subscription per topic
+    # pylint: disable=protected-access
+    assert sorted(s[0] for s in conn._subscriptions) == \
+        ['/topic/topic1', '/topic/topic2']
+
+    notifications1 = [
+        _topic_message(mux, 'topic1', _prop_change('/api/p1', 'a', i, i + 1))
+        for i in range(3)]
+    notification2 = _topic_message(
+        mux, 'topic2', _prop_change('/api/p2', 'b', 0, 1))
+    for headers, message in notifications1 + [notification2]:
+        conn.mock_add_message(headers, message)  # pylint: disable=no-member
+    conn.mock_start()  # pylint: disable=no-member
+    conn.mock_stop()  # pylint: disable=no-member
+
+    assert sub1a.queue_depth == 3
+    assert sub1b.queue_depth == 3
+    assert sub2.queue_depth == 0
+    assert len(received2) == 1
+    with pytest.raises(ValueError):
+        next(sub2.notifications())
+    assert received2[0][0]['subscription'] == notification2[0]['subscription']
+
+    for sub in (sub1a, sub1b):
+        received = []
+        for headers, message in sub.notifications():
+            received.append((headers, message))
+            if len(received) == 3:
+                break
+        assert received == notifications1
+
+    # Unsubscribing the last subscription of a topic unsubscribes via STOMP
+    sub1b.unsubscribe()
+    assert len(conn._subscriptions) == 2
+    sub1a.unsubscribe()
+    assert [s[0] for s in conn._subscriptions] == ['/topic/topic2']
+    assert sub1a.closed
+    assert list(sub1a.notifications()) == []
+    with pytest.raises(SubscriptionNotFound):
+        mux.unsubscribe(sub1a)
+
+    mux.close()
+    assert sub2.closed
+    assert not mux.is_connected()
+
+
+@patch(target='stomp.Connection', new=MockedStompConnection)
+def test_multiplexer_lost_notifications():
+    """
+    Test the detection of lost notifications and the re-establishing of a
+    lost STOMP connection by a NotificationMultiplexer.
+    """
+    mux = NotificationMultiplexer('fake-hmc', 'fake-userid', 'fake-password')
+    lost = []
+    sub1 = mux.subscribe('topic1', lost_callback=lambda: lost.append(1))
+    received2 = []
+    mux.subscribe(
+        'topic2', callback=lambda h, m: received2.append(h),
+        lost_callback=lambda: lost.append(2))
+
+    conn = mux._conn  # pylint: disable=protected-access
+    for topic_name, seq_nr in (('topic1', 0), ('topic2', 1), ('topic1', 3)):
+        headers, message = _topic_message(
+            mux, topic_name, _prop_change('/api/p1', 'a', 0, 1), seq_nr)
+        conn.mock_add_message(headers, message)  # pylint: disable=no-member
+    conn.mock_start()  # pylint: disable=no-member
+    conn.mock_stop()  # pylint: disable=no-member
+
+    assert mux.sequence_gaps == 1
+    assert sorted(lost) == [1, 2]
+    assert len(received2) == 1
+    assert sub1.queue_depth == 2
+
+    # Lose the STOMP connection
+    lost.clear()
+    conn._state_connected = False  # pylint: disable=protected-access
+    conn._listener.on_disconnected()  # pylint: disable=protected-access
+    time.sleep(0.5)
+
+    new_conn = mux._conn  # pylint: disable=protected-access
+    assert new_conn is not conn
+    assert new_conn.is_connected()
+    # pylint: disable=protected-access
+    assert sorted(s[0] for s in new_conn._subscriptions) == \
+        ['/topic/topic1', '/topic/topic2']
+    assert sorted(lost) == [1, 2]
+
+    # The queued notifications are followed by the connection loss
+    notifications = sub1.notifications()
+    next(notifications)
+    next(notifications)
+    with pytest.raises(NotificationConnectionError):
+        next(notifications)
+
+    mux.close()
+
+
+@patch(target='stomp.Connection', new=MockedStompConnection)
+def test_multiplexer_close_while_reconnecting():
+    """
+    Test that closing a NotificationMultiplexer is not blocked while its
+    lost STOMP connection is being re-established, and that the new
+    connection is discarded.
+    """
+    mux = NotificationMultiplexer('fake-hmc', 'fake-userid', 'fake-password')
+    mux.subscribe('topic1')
+    conn = mux._conn  # pylint: disable=protected-access
+
+    connecting = threading.Event()
+    release = threading.Event()
+    new_conns = []
+    # pylint: disable=protected-access
+    create_connection = mux._create_connection
+
+    def slow_create_connection():
+        connecting.set()
+        assert release.wait(5)
+        new_conn, listener = create_connection()
+        new_conns.append(new_conn)
+        return new_conn, listener
+
+    with patch.object(mux, '_create_connection', slow_create_connection):
+
+        # Lose the STOMP connection
+        conn._state_connected = False  # pylint: disable=protected-access
+        conn._listener.on_disconnected()  # pylint: disable=protected-access
+        assert connecting.wait(5)
+
+        closer = threading.Thread(target=mux.close)
+        closer.start()
+        closer.join(5)
+        assert not closer.is_alive()
+
+        release.set()
+        reconnect_thread = mux._reconnect_thread
+        reconnect_thread.join(5)
+        assert not reconnect_thread.is_alive()
+
+    assert mux._conn is None
+    assert len(new_conns) == 1
+    assert not new_conns[0].is_connected()
+
+
+@patch(target='stomp.Connection', new=MockedStompConnection)
+def test_multiplexer_discarded_connection():
+    """
+    Test that creating a STOMP connection that is not installed does not
+    reset the tracking of the session sequence numbers.
+    """
+    mux = NotificationMultiplexer('fake-hmc', 'fake-userid', 'fake-password')
+    mux.subscribe('topic1')
+    conn = mux._conn  # pylint: disable=protected-access
+    headers, message = _topic_message(
+        mux, 'topic1', _prop_change('/api/p1', 'a', 0, 1), 5)
+    conn.mock_add_message(headers, message)  # pylint: disable=no-member
+    conn.mock_start()  # pylint: disable=no-member
+    conn.mock_stop()  # pylint: disable=no-member
+    # pylint: disable=protected-access
+    assert mux._seq_tracker.last_sequence_nr == 5
+
+    # Execute the code to be tested
+    new_conn, _ = mux._create_connection()
+    new_conn.disconnect()
+
+    assert mux._seq_tracker.last_sequence_nr == 5
+    mux.close()
+
+
+@patch(target='stomp.Connection', new=MockedStompConnection)
+def test_multiplexer_auto_updater():
+    """
+    Test sharing the NotificationMultiplexer of a session with the auto
+    updater of the session.
+    """
+    faked_session = FakedSession(
+        'fake-hmc', 'fake-hmc', 'fake-version', 'fake-version')
+    client = Client(faked_session)
+    faked_session.hmc.add_resources(TEST_RESOURCES_BASE)
+
+    mux = NotificationMultiplexer.for_session(faked_session)
+    assert NotificationMultiplexer.for_session(faked_session) is mux
+    updater = faked_session.auto_updater
+    updater.multiplexer = mux
+
+    cpc = client.cpcs.find(name='fake-cpc1')
+    partition = cpc.partitions.find(name='fake-part1')
+    partition.enable_auto_update()
+    assert updater.is_open()
+    with pytest.raises(RuntimeError):
+        updater.multiplexer = None
+
+    received = []
+    mux.subscribe('other-topic', callback=lambda h, m: received.append(h))
+    assert sorted(mux.topic_names) == \
+        sorted([faked_session.object_topic, 'other-topic'])
+
+    conn = mux._conn  # pylint: disable=protected-access
+    headers, message = _topic_message(
+        mux, faked_session.object_topic,
+        _prop_change(partition.uri, 'description', 'old', 'new'))
+    conn.mock_add_message(headers, message)  # pylint: disable=no-member
+    conn.mock_start()  # pylint: disable=no-member
+    conn.mock_stop()  # pylint: disable=no-member
+    time.sleep(0.2)
+
+    assert partition.get_properties_local('description') == 'new'
+    assert not received
+
+    partition.disable_auto_update()
+    updater.close()
+    assert not updater.is_open()
+    assert mux.topic_names == ['other-topic']
+    mux.close()
+    assert NotificationMultiplexer.for_session(faked_session) is not mux
@@ -22,7 +22,8 @@ import copy
 import logging
 import pytest
 
-from zhmcclient import Client, Partition, HTTPError, NotFound
+from zhmcclient import Client, Partition, HTTPError, NotFound, StatusTimeout, \
+    CeasedExistence
 from zhmcclient.mock import FakedSession
 from tests.common.utils import assert_resources, assert_blanked_in_message
 
@@ -1281,7 +1282,59 @@ class TestPartition:
 
     # TODO: Test for Partition.create_os_websocket()
 
-    # TODO: Test for Partition.wait_for_status()
+    def test_pm_wait_for_statuses(self):
+        """
+        Test PartitionManager.wait_for_statuses() and
+        Partition.wait_for_status() with polling.
+        """
+        faked_part1 = self.add_partition1()
+        faked_part2 = self.add_partition2()
+        partition_mgr = self.cpc.partitions
+        part1 = partition_mgr.find(name=faked_part1.name)
+        part2 = partition_mgr.find(name=faked_part2.name)
+        faked_part2.properties['status'] = 'stopped'
+
+        # Execute the code to be tested
+        partition_mgr.wait_for_statuses(
+            {part1: 'active', part2: ['starting', 'stopped']},
+            status_timeout=5)
+        part1.wait_for_status('active', status_timeout=5)
+
+        assert part2.get_properties_local('status') == 'stopped'
+
+        with pytest.raises(StatusTimeout) as exc_info:
+
+            # Execute the code to be tested
+            partition_mgr.wait_for_statuses(
+                {part1: 'active', part2: 'active'}, status_timeout=0.5)
+
+        exc = exc_info.value
+        assert exc.actual_status == 'stopped'
+        assert exc.desired_statuses == ['active']
+        assert exc.status_timeout == 0.5
+
+        # An outdated locally cached status that is the desired status does
+        # not end the waiting
+        faked_part1.properties['status'] = 'stopped'
+        assert part1.get_properties_local('status') == 'active'
+        with pytest.raises(StatusTimeout) as exc_info:
+
+            # Execute the code to be tested
+            partition_mgr.wait_for_statuses(
+                {part1: 'active'}, status_timeout=0.5)
+
+        assert exc_info.value.actual_status == 'stopped'
+
+        # A deleted partition causes CeasedExistence
+        part2.manager.session.delete(part2.uri)
+        with pytest.raises(CeasedExistence):
+
+            # Execute the code to be tested
+            partition_mgr.wait_for_statuses(
+                {part1: 'stopped', part2: 'active'}, status_timeout=5)
+
+        assert part2.ceased_existence
+        assert not part1.ceased_existence
 
     # TODO: Test for Partition.increase_crypto_config()
 
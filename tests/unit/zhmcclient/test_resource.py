@@ -792,6 +792,105 @@ class TestPropertyMethodsMocked:
             assert propnames_pull.issuperset(propnames_find)
             assert dict(resource.properties) == faked_res.properties
 
+            # Properties that are no longer returned by the HMC remain cached
+            resource.update_properties_local({'local-prop': 42})
+
+            # The code to be tested
+            resource.pull_full_properties()
+
+            assert resource.properties['local-prop'] == 42
+
+    @pytest.mark.parametrize(
+        # Indicates whether to delete the resource before test
+        "delete", [False, True])
+    def test_refresh(self, delete):
+        """
+        Test BaseResource.refresh().
+        """
+        faked_res = self.add_standard_hipersocket()
+        res_mgr = self.cpc.adapters
+        resource = res_mgr.find(name=faked_res.name)
+        resource.pull_full_properties()
+
+        if delete:
+            resource.manager.session.delete(resource.uri)
+
+            with pytest.raises(CeasedExistence):
+
+                # The code to be tested
+                resource.refresh()
+
+            assert resource.ceased_existence is True
+
+        else:
+
+            # The code to be tested
+            changes = resource.refresh()
+
+            assert changes == {}
+
+            faked_res.update({'description': 'new desc', 'new-prop': 42})
+
+            # The code to be tested
+            changes = resource.refresh()
+
+            assert changes == {
+                'description': (self.RESOURCE_DESC, 'new desc'),
+                'new-prop': (None, 42),
+            }
+            assert resource.properties['description'] == 'new desc'
+            assert resource.full_properties is True
+
+            del faked_res.properties['new-prop']
+
+            # The code to be tested
+            changes = resource.refresh()
+
+            assert changes == {'new-prop': (42, None)}
+            assert 'new-prop' not in resource.properties
+
+    def test_refresh_all(self):
+        """
+        Test BaseManager.refresh_all().
+        """
+        faked_parts = []
+        for i in range(3):
+            faked_parts.append(self.faked_cpc.partitions.add({
+                'object-id': f'part{i}-oid',
+                'parent': self.faked_cpc.uri,
+                'class': 'partition',
+                'name': f'part{i}',
+                'description': f'Partition {i}',
+                'type': 'linux',
+                'status': 'stopped',
+            }))
+        res_mgr = self.cpc.partitions
+        resources = res_mgr.list(full_properties=True)
+        assert len(resources) == 3
+
+        # The code to be tested
+        changed = res_mgr.refresh_all(resources)
+
+        assert changed == []
+
+        faked_parts[1].update({'status': 'active'})
+        self.session.delete(faked_parts[2].uri)
+
+        # The code to be tested
+        changed = res_mgr.refresh_all(resources)
+
+        assert len(changed) == 1
+        resource, changes = changed[0]
+        assert resource.name == 'part1'
+        assert changes == {'status': ('stopped', 'active')}
+        ceased = [r.name for r in resources if r.ceased_existence]
+        assert ceased == ['part2']
+
+        # The code to be tested
+        changed = res_mgr.refresh_all([])
+
+        assert changed == []
+
     TESTCASES_PULL_PROPERTIES = [
         # Testcases for test_pull_properties().
         # Each list item is a tuple defining a testcase in the following format:
@@ -30,7 +30,9 @@ from ._session import *       # noqa: F401
 from ._auto_updater import *  # noqa: F401
 from ._timestats import *     # noqa: F401
 from ._client import *        # noqa: F401
+from ._inventory import *     # noqa: F401
 from ._cpc import *           # noqa: F401
+from ._dpm_import import *    # noqa: F401
 from ._group import *         # noqa: F401
 from ._lpar import *          # noqa: F401
 from ._partition import *     # noqa: F401
@@ -42,7 +44,13 @@ from ._virtual_function import *       # noqa: F401
 from ._virtual_switch import *         # noqa: F401
 from ._port import *          # noqa: F401
 from ._notification import *  # noqa: F401
+from ._async_notification import *     # noqa: F401
+from ._notification_multiplexer import *     # noqa: F401
 from ._metrics import *       # noqa: F401
+from ._metrics_poller import *         # noqa: F401
+from ._metrics_store import *          # noqa: F401
+from ._metrics_export import *         # noqa: F401
+from ._metrics_collector import *      # noqa: F401
 from ._utils import *         # noqa: F401
 from ._console import *       # noqa: F401
 from ._user import *          # noqa: F401
@@ -0,0 +1,333 @@
+# Copyright 2026 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+An :class:`~zhmcclient.AsyncNotificationReceiver` receives HMC notifications
+like a :class:`~zhmcclient.NotificationReceiver`, but provides them for
+consumption in an :mod:`asyncio` event loop, so that notifications from
+many HMCs can be consumed in one event loop without a blocking thread per
+receiver.
+
+The basic usage of the asynchronous notification receiver is shown in this
+example:
+
+.. code-block:: python
+
+    async def receive(topic, hmc, session):
+        receiver = zhmcclient.AsyncNotificationReceiver(
+            topic, hmc, session.session_id, session.session_credential)
+        async with receiver:
+            async for headers, message in receiver.notifications():
+                print(f"HMC {hmc}: {headers['notification-type']}")
+
+    async def main(receiver_args):
+        await asyncio.gather(*[receive(*args) for args in receiver_args])
+"""
+
+import asyncio
+import queue
+
+from ._constants import STOMP_MIN_CONNECTION_CHECK_TIME
+from ._exceptions import NotificationConnectionError
+from ._notification import NotificationReceiver, merge_notifications, \
+    _HandoverQueue, _message_obj, _jms_error
+
+__all__ = ['AsyncNotificationReceiver']
+
+
+class _AsyncHandoverQueue(_HandoverQueue):
+    """
+    Handover queue that wakes up a consumer in an asyncio event loop when
+    items are put into it.
+
+    The items are put into the queue in the listener thread. The wake-up is
+    scheduled in the event loop using loop.call_soon_threadsafe(), so that
+    the consumer does not need to poll the queue.
+
+    This is an internal class that does not need to be accessed or created by
+    the user.
+    """
+
+    def __init__(self, maxsize, overflow_policy):
+        super().__init__(maxsize, overflow_policy)
+        self._loop = None
+        self.event = None
+
+    def bind(self, loop):
+        """
+        Bind the queue to the event loop of the consumer.
+        """
+        self._loop = loop
+        self.event = asyncio.Event()
+
+    def wakeup(self):
+        """
+        Wake up the consumer. This method can be called in any thread.
+        """
+        loop = self._loop
+        if loop is None:
+            return
+        try:
+            loop.call_soon_threadsafe(self.event.set)
+        except RuntimeError:
+            # The event loop has been closed
+            pass
+
+    def put(self, item):
+        super().put(item)
+        self.wakeup()
+
+    def put_front(self, item):
+        super().put_front(item)
+        self.wakeup()
+
+
+class AsyncNotificationReceiver(NotificationReceiver):
+    """
+    A class for receiving HMC notifications that are published to particular
+    HMC notification topics, for consumption in an :mod:`asyncio` event loop.
+
+    **Experimental:** This class is considered experimental at this point, and
+    its API may change incompatibly as long as it is experimental.
+
+    Derived from :class:`~zhmcclient.NotificationReceiver`; see there for
+    the init parameters and the common methods and attributes. The
+    :meth:`notifications` and :meth:`notification_batches` methods of this
+    class are asynchronous generators that are used with ``async for``.
+
+    The notifications are received in the thread of the STOMP connection as
+    for :class:`~zhmcclient.NotificationReceiver`, and the consumer in the
+    event loop is woken up when a notification has been received. The
+    handover queue configuration of the STOMP retry/timeout configuration
+    applies as well.
+
+    The blocking operations for connecting to the HMC and for closing the
+    receiver are performed in the default executor of the event loop.
+
+    HMC/SE version requirements: None
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._handover_queue = _AsyncHandoverQueue(
+            self._rt_config.handover_queue_size,
+            self._rt_config.handover_overflow_policy)
+
+    async def __aenter__(self):
+        """
+        Enter the asynchronous runtime context of this receiver.
+        """
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """
+        Exit the asynchronous runtime context of this receiver, by closing it.
+        """
+        await self.aclose()
+
+    def __aiter__(self):
+        """
+        Return an asynchronous iterator over the received notifications,
+        see :meth:`notifications`.
+        """
+        return self.notifications()
+
+    async def notifications(self):
+        # pylint: disable=invalid-overridden-method
+        """
+        Asynchronous generator method that yields all HMC notifications
+        (= JMS messages) received by this notification receiver.
+
+        The method connects to the HMC if needed, so after raising
+        :exc:`~zhmcclient.NotificationConnectionError` or
+        :exc:`stomp.exception.StompException`, it can simply be called
+        again to reconnect and resume waiting for notifications.
+
+        This method returns when the receiver is closed (using
+        :meth:`close` or :meth:`aclose`). To stop consuming notifications
+        without closing the receiver, leave the ``async for`` loop.
+
+        Yields:
+
+          : A tuple (headers, message) representing one HMC notification. For
+          a description of the tuple items, see
+          :meth:`zhmcclient.NotificationReceiver.notifications`.
+
+        Raises:
+
+          Same exceptions as
+          :meth:`zhmcclient.NotificationReceiver.notifications`.
+        """
+        async for notification in self._async_notifications():
+            yield notification
+
+    async def notification_batches(self, window=0.05):
+        # pylint: disable=invalid-overridden-method,arguments-differ
+        """
+        Asynchronous generator method that yields the HMC notifications
+        (= JMS messages) received by this notification receiver in batches,
+        with the property change and status change notifications for the
+        same resource merged.
+
+        For details, see
+        :meth:`zhmcclient.NotificationReceiver.notification_batches`.
+
+        Parameters:
+
+          window (:term:`number`): Time window for a batch in seconds.
+
+        Yields:
+
+          : A list of tuple (headers, message) representing the HMC
+          notifications of one batch, in the order they were received.
+
+        Raises:
+
+          Same exceptions as
+          :meth:`zhmcclient.NotificationReceiver.notifications`.
+        """
+        async for batch in self._async_notifications(window):
+            yield batch
+
+    def close(self):
+        """
+        Close the receiver and cause its :meth:`notifications` and
+        :meth:`notification_batches` methods to return.
+
+        This method blocks until the STOMP session has been disconnected from
+        the HMC. In an event loop, use :meth:`aclose` instead.
+
+        Raises:
+
+            stomp.exception.StompException: From stomp.Connection.disconnect()
+        """
+        super().close()
+        self._handover_queue.wakeup()
+
+    async def aclose(self):
+        """
+        Close the receiver and cause its :meth:`notifications` and
+        :meth:`notification_batches` methods to return, without blocking the
+        event loop.
+
+        Raises:
+
+            stomp.exception.StompException: From stomp.Connection.disconnect()
+        """
+        if self._closed:
+            return
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.close)
+
+    async def _get_item(self, timeout):
+        """
+        Wait for an item from the listener for up to the specified timeout,
+        and return it, or `None` if no item was received or the receiver has
+        been closed.
+        """
+        handover_queue = self._handover_queue
+        loop = asyncio.get_running_loop()
+        end_time = loop.time() + timeout
+        while True:
+            # Clearing the event before checking the queue ensures that an
+            # item put into the queue after the check sets the event again.
+            handover_queue.event.clear()
+            try:
+                return handover_queue.get(timeout=0)
+            except queue.Empty:
+                pass
+            if self._closed:
+                return None
+            wait_time = end_time - loop.time()
+            if wait_time <= 0:
+                return None
+            try:
+                await asyncio.wait_for(
+                    handover_queue.event.wait(), wait_time)
+            except asyncio.TimeoutError:
+                return None
+
+    async def _async_notifications(self, batch_window=None):
+        """
+        Asynchronous generator method that yields the HMC notifications, or
+        if a batch window is specified, lists of merged HMC notifications.
+        """
+        # For details on the timeout, see NotificationReceiver._notifications()
+        ho_get_timeout = STOMP_MIN_CONNECTION_CHECK_TIME
+        if self._rt_config:
+            ho_get_timeout = max(
+                ho_get_timeout, self._rt_config.heartbeat_receive_cycle + 1)
+
+        loop = asyncio.get_running_loop()
+        self._handover_queue.bind(loop)
+        await loop.run_in_executor(None, self.connect)
+
+        while True:
+
+            item = await self._get_item(ho_get_timeout)
+            if self._closed:
+                return
+            if item is None:
+                # This check detects a disconnect only when heartbeating is
+                # enabled in the stomp retry/timeout configuration.
+                if not self._conn.is_connected():
+                    raise NotificationConnectionError(
+                        "Lost STOMP connection to HMC")
+                continue
+
+            if item.msgtype == 'message':
+                msg_obj = _message_obj(item)
+            elif item.msgtype == 'error':
+                raise _jms_error(item)
+            elif item.msgtype in ('disconnected', 'heartbeat_timeout'):
+                # Get all contiguous such entries to handle them just once
+                counts = {'disconnected': 0, 'heartbeat_timeout': 0}
+                counts[item.msgtype] += 1
+                while True:
+                    try:
+                        item_ = self._handover_queue.get(timeout=0)
+                    except queue.Empty:
+                        break
+                    if item_.msgtype not in counts:
+                        # Put the item back, for the next call
+                        self._handover_queue.put_front(item_)
+                        break
+                    counts[item_.msgtype] += 1
+                raise NotificationConnectionError(
+                    f"STOMP received {counts['heartbeat_timeout']} heartbeat "
+                    f"timeouts and {counts['disconnected']} disconnect "
+                    "messages")
+            else:
+                raise RuntimeError(
+                    f"Invalid handover item: {item.msgtype}")
+
+            if batch_window is None:
+                yield item.headers, msg_obj
+                continue
+
+            # Collect the notifications for the batch
+            batch = [(item.headers, msg_obj)]
+            end_time = loop.time() + batch_window
+            while True:
+                wait_time = end_time - loop.time()
+                if wait_time <= 0:
+                    break
+                item = await self._get_item(wait_time)
+                if item is None:
+                    break
+                if item.msgtype != 'message':
+                    self._handover_queue.put_front(item)
+                    break
+                batch.append((item.headers, _message_obj(item)))
+            yield merge_notifications(batch)
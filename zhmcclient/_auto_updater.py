@@ -23,6 +23,10 @@ import logging
 import json
 from json import JSONDecodeError
 import ssl
+import queue
+import threading
+import time
+import weakref
 
 from ._constants import DEFAULT_STOMP_PORT, JMS_LOGGER_NAME, \
     DEFAULT_STOMP_CONNECT_TIMEOUT, \
@@ -30,13 +34,16 @@ from ._constants import DEFAULT_STOMP_PORT, JMS_LOGGER_NAME, \
     DEFAULT_STOMP_RECONNECT_SLEEP_INCREASE, DEFAULT_STOMP_RECONNECT_SLEEP_MAX, \
     DEFAULT_STOMP_RECONNECT_SLEEP_JITTER, DEFAULT_STOMP_KEEPALIVE, \
     DEFAULT_STOMP_HEARTBEAT_SEND_CYCLE, DEFAULT_STOMP_HEARTBEAT_RECEIVE_CYCLE, \
-    DEFAULT_STOMP_HEARTBEAT_RECEIVE_CHECK
+    DEFAULT_STOMP_HEARTBEAT_RECEIVE_CHECK, \
+    DEFAULT_AUTO_UPDATE_DISPATCH_WORKERS, \
+    DEFAULT_AUTO_UPDATE_DISPATCH_QUEUE_SIZE
 from ._utils import RC_CPC, RC_CHILDREN_CLIENT, RC_CHILDREN_CPC, \
     RC_CHILDREN_CONSOLE, get_stomp_rt_kwargs, get_headers_message
 from ._client import Client
 from ._manager import BaseManager
 from ._resource import BaseResource
-from ._notification import StompRetryTimeoutConfig
+from ._notification import StompRetryTimeoutConfig, merge_notifications, \
+    _SequenceTracker
 
 __all__ = ['AutoUpdater']
 
@@ -79,6 +86,28 @@ class AutoUpdater:
     Zhmcclient resource objects or manager objects that are not enabled for
     auto-updating remain unchanged.
 
+    The notifications are received in the thread of the STOMP connection and
+    are processed in a pool of worker threads, so that a burst of
+    notifications does not delay the receiving of further notifications and
+    STOMP heartbeats. The notifications for the same resource are always
+    processed by the same worker thread, in the order in which they were
+    received. The state of this processing is available via
+    :attr:`queue_depth`, :attr:`max_queue_depth`, :attr:`lag`, :attr:`max_lag`
+    and :attr:`dropped`.
+
+    If notifications have been lost, the auto-updated resource objects are
+    re-synchronized with the HMC (see :meth:`resync`). Lost notifications are
+    detected by gaps in the session sequence numbers of the received
+    notifications, and by notifications that had to be dropped. If the STOMP
+    connection to the HMC is lost, it is re-established in a background
+    thread (see :meth:`reconnect`), and the auto-updated resource objects are
+    re-synchronized as well. The received notifications can be journaled to
+    a local file (see :attr:`journal`).
+
+    Instead of using its own STOMP connection, the auto updater can share the
+    STOMP connection of a :class:`~zhmcclient.NotificationMultiplexer` with
+    other users of HMC notifications (see :attr:`multiplexer`).
+
     HMC/SE version requirements: None
     """
 
@@ -95,7 +124,9 @@ class AutoUpdater:
         heartbeat_receive_check=DEFAULT_STOMP_HEARTBEAT_RECEIVE_CHECK,
     )
 
-    def __init__(self, session, stomp_rt_config=None):
+    def __init__(self, session, stomp_rt_config=None, dispatch_workers=None,
+                 dispatch_queue_size=None, coalesce_window=None,
+                 journal=None, multiplexer=None):
         """
         Parameters:
 
@@ -116,17 +147,90 @@ class AutoUpdater:
             of its attributes.
 
             See :ref:`Constants` for the default values.
-        """
+
+          dispatch_workers (:term:`integer`): Number of worker threads that
+            process the received notifications. `None` means to use
+            :attr:`~zhmcclient._constants.DEFAULT_AUTO_UPDATE_DISPATCH_WORKERS`.
+
+          dispatch_queue_size (:term:`integer`): Maximum number of received
+            notifications that wait for being processed, per worker thread.
+            If that maximum is reached, further notifications are dropped
+            and a re-synchronization of the auto-updated objects is
+            requested.
+            `None` means to use
+            :attr:`~zhmcclient._constants.DEFAULT_AUTO_UPDATE_DISPATCH_QUEUE_SIZE`.
+
+          coalesce_window (:term:`number`): Coalescing window in seconds for
+            property change and status change notifications, or `None` for no
+            coalescing. See :attr:`coalesce_window` for details.
+
+          journal (:class:`~zhmcclient.NotificationJournal`): Journal to which
+            the received notifications are appended, or `None` for not
+            journaling the notifications. See :attr:`journal` for details.
+
+          multiplexer (:class:`~zhmcclient.NotificationMultiplexer`):
+            Notification multiplexer whose STOMP connection is used, or `None`
+            for using a separate STOMP connection. See :attr:`multiplexer` for
+            details.
+        """  # noqa: E501
 
         self._session = session
         self._rt_config = stomp_rt_config
 
-        # STOMP connection
+        # STOMP connection. It is installed and torn down under the lock.
         self._conn = None
+        self._lock = threading.RLock()
+
+        # Indicates that the JMS session is open. This is maintained
+        # separately from the STOMP connection, which is not set while it is
+        # being re-established.
+        self._open = False
+
+        # Listener for the STOMP connection. Is created when the JMS session
+        # is opened, and is used for any reconnected STOMP connection.
+        self._listener = None
+
+        # Indicates that the JMS session is being closed, so that the
+        # disconnect is not treated as a connection loss.
+        self._closing = False
+
+        # Thread that re-establishes a lost STOMP connection, and the event
+        # that stops its waiting between retries when closing
+        self._reconnect_thread = None
+        self._close_event = threading.Event()
+
+        # Thread that performs a requested resync, and whether another resync
+        # has been requested while it was running
+        self._resync_thread = None
+        self._resync_pending = False
+        self._resync_lock = threading.Lock()
+        self._resyncs = 0
+
+        self._journal = journal
+
+        # Notification multiplexer, and the subscription on it while the JMS
+        # session is open
+        self._multiplexer = multiplexer
+        self._subscription = None
+
+        # Tracking of the session sequence numbers of the notifications
+        self._seq_tracker = _SequenceTracker()
+
+        # Dispatcher for processing the received notifications in worker
+        # threads. Is created when the JMS session is opened.
+        self._dispatcher = None
+        self._dispatch_workers = dispatch_workers or \
+            DEFAULT_AUTO_UPDATE_DISPATCH_WORKERS
+        self._dispatch_queue_size = dispatch_queue_size or \
+            DEFAULT_AUTO_UPDATE_DISPATCH_QUEUE_SIZE
+        self._coalesce_window = coalesce_window
 
         # Registered resource and manager objects, as:
-        #   dict(key: uri, value: dict(key: id, value: object))
+        #   dict(key: uri, value: dict(key: id, value: weakref to object))
+        # The objects are referenced weakly, so that objects that are no
+        # longer used are unregistered automatically when they are deleted.
         self._registered_objects = {}
+        self._registered_lock = threading.Lock()
 
         # Subscription ID. We use some value that allows to identify on the
         # HMC that this is the zhmcclient, but otherwise we are not using
@@ -152,29 +256,163 @@ class AutoUpdater:
         if not self._session.object_topic:
             self._session.logon()  # This sets actual_host
 
+        with self._lock:
+            self._closing = False
+            self._close_event.clear()
+        listener = _UpdateListener(self, self._session)
+        self._dispatcher = _NotificationDispatcher(
+            listener.process_messages, self._dispatch_workers,
+            self._dispatch_queue_size, self._coalesce_window)
+        listener.dispatcher = self._dispatcher
+        self._listener = listener
+
+        if self._multiplexer is not None:
+            self._subscription = self._multiplexer.subscribe(
+                self._session.object_topic, callback=listener.handle_message,
+                lost_callback=self.request_resync)
+        else:
+            self._connect()
+        self._open = True
+
+        listener.init_cpcs()
+
+        JMS_LOGGER.info(
+            "JMS session for object notification topic '%s' has been "
+            "established", self._session.object_topic)
+
+    def _connect(self):
+        """
+        Create a STOMP connection with the actual HMC of the session and
+        subscribe to the object notification topic, using the listener of
+        this auto updater.
+
+        The connection is established without holding the lock, because
+        connecting is retried for some time and would block close() in the
+        meantime. If this auto updater has been closed in the meantime, the
+        new connection is disconnected again.
+
+        Returns:
+          bool: Indicates whether the connection has been installed (`True`)
+          or has been discarded because this auto updater is being closed
+          (`False`).
+        """
         rt_kwargs = get_stomp_rt_kwargs(self._rt_config)
-        self._conn = self._stomp.Connection(
+        conn = self._stomp.Connection(
             [(self._session.actual_host, DEFAULT_STOMP_PORT)], **rt_kwargs)
         set_kwargs = dict()
         set_kwargs['ssl_version'] = ssl.PROTOCOL_TLS_CLIENT
-        self._conn.set_ssl(
+        conn.set_ssl(
             for_hosts=[(self._session.actual_host, DEFAULT_STOMP_PORT)],
             **set_kwargs)
+        conn.set_listener('', self._listener)
 
-        listener = _UpdateListener(self, self._session)
-        self._conn.set_listener('', listener)
         # pylint: disable=protected-access
-        self._conn.connect(self._session.userid, self._session._password,
-                           wait=True)
+        conn.connect(self._session.userid, self._session._password,
+                     wait=True)
 
-        dest = "/topic/" + self._session.object_topic
-        self._conn.subscribe(destination=dest, id=self._sub_id, ack='auto')
+        installed = False
+        try:
+            with self._lock:
+                if not self._closing:
+                    # The session sequence numbers of the new connection are
+                    # not related to the ones of a previous connection.
+                    self._seq_tracker.reset()
+                    dest = "/topic/" + self._session.object_topic
+                    conn.subscribe(
+                        destination=dest, id=self._sub_id, ack='auto')
+                    self._conn = conn
+                    installed = True
+        finally:
+            if not installed:
+                # Closed in the meantime, or subscribing failed
+                try:
+                    conn.disconnect()
+                except Exception:  # pylint: disable=broad-exception-caught
+                    pass
+        return installed
+
+    def reconnect(self):
+        """
+        Re-establish the STOMP connection with the HMC and re-synchronize the
+        auto-updated objects with the HMC (see :meth:`resync`), because
+        notifications may have been missed while the connection was lost.
 
-        listener.init_cpcs()
+        This method is called automatically in a background thread when the
+        STOMP connection is lost. It does not need to be called by the user.
 
+        Raises:
+
+          :exc:`~zhmcclient.HTTPError`
+          :exc:`~zhmcclient.ParseError`
+          :exc:`~zhmcclient.AuthError`
+          :exc:`~zhmcclient.ConnectionError`
+          stomp.exception.StompException: From stomp.Connection.connect()
+        """
+        with self._lock:
+            if self._closing:
+                return
+            old_conn = self._conn
+            # Reset the connection first, so that disconnecting the previous
+            # connection is not treated as a connection loss.
+            self._conn = None
+        if old_conn is not None:
+            try:
+                old_conn.disconnect()
+            except Exception:  # pylint: disable=broad-exception-caught
+                pass
+        if not self._connect():
+            return
         JMS_LOGGER.info(
             "JMS session for object notification topic '%s' has been "
-            "established", self._session.object_topic)
+            "re-established", self._session.object_topic)
+        self.resync()
+
+    def _connection_lost(self):
+        """
+        Handle the loss of the STOMP connection, by re-establishing it in a
+        background thread.
+
+        Disconnects that are caused by closing this auto updater or by
+        reconnecting are ignored.
+        """
+        with self._lock:
+            conn = self._conn
+            if self._closing or conn is None or conn.is_connected():
+                return
+            if self._reconnect_thread is not None and \
+                    self._reconnect_thread.is_alive():
+                return
+            JMS_LOGGER.warning(
+                "JMS session for object notification topic '%s' has been "
+                "lost - reconnecting", self._session.object_topic)
+            self._reconnect_thread = threading.Thread(
+                target=self._reconnect_run,
+                name='zhmcclient.AutoUpdater.reconnect', daemon=True)
+            self._reconnect_thread.start()
+
+    def _reconnect_run(self):
+        """
+        Thread function that re-establishes the STOMP connection, retrying
+        with increasing wait times until it succeeds or this auto updater is
+        closed.
+        """
+        rt_config = self.default_stomp_rt_config.override_with(
+            self._rt_config)
+        sleep_time = rt_config.reconnect_sleep_initial
+        while not self._closing:
+            try:
+                self.reconnect()
+                return
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                JMS_LOGGER.error(
+                    "Re-establishing the JMS session for object notification "
+                    "topic '%s' failed (retrying in %s s): %s: %s",
+                    self._session.object_topic, sleep_time,
+                    exc.__class__.__name__, exc)
+            self._close_event.wait(sleep_time)
+            sleep_time = min(
+                sleep_time * (1 + rt_config.reconnect_sleep_increase),
+                rt_config.reconnect_sleep_max)
 
     def close(self):
         """
@@ -183,8 +421,28 @@ class AutoUpdater:
         This implicitly unsubscribes from the object notification topic this
         auto updater was created for.
         """
-        self._conn.disconnect()
-        self._conn = None
+        with self._lock:
+            self._closing = True
+            self._close_event.set()
+            self._open = False
+            conn = self._conn
+            self._conn = None
+            reconnect_thread = self._reconnect_thread
+        if self._subscription is not None:
+            self._subscription.unsubscribe()
+            self._subscription = None
+        if conn is not None:
+            conn.disconnect()
+
+        # Wait for a reconnect in progress to discard its new connection.
+        # The auto updater may be closed in a callback function that is
+        # invoked during the re-synchronization after a reconnect.
+        if reconnect_thread is not None and \
+                reconnect_thread is not threading.current_thread():
+            reconnect_thread.join()
+
+        # Process the notifications that have already been received
+        self._dispatcher.stop()
 
         JMS_LOGGER.info(
             "JMS session for object notification topic '%s' has been "
@@ -194,7 +452,257 @@ class AutoUpdater:
         """
         Return whether the JMS session with the HMC is open.
         """
-        return self._conn is not None
+        return self._open
+
+    @property
+    def multiplexer(self):
+        """
+        :class:`~zhmcclient.NotificationMultiplexer`: Notification multiplexer
+        whose STOMP connection is used by this auto updater, or `None` if it
+        uses a separate STOMP connection.
+
+        When a multiplexer is used, the auto updater subscribes to the object
+        notification topic on the multiplexer, which also takes care of
+        re-establishing a lost STOMP connection and of detecting gaps in the
+        session sequence numbers. In both cases, the auto-updated objects are
+        re-synchronized with the HMC. The :attr:`last_sequence_nr` and
+        :attr:`sequence_gaps` properties of the auto updater are not
+        maintained in that case; see
+        :attr:`zhmcclient.NotificationMultiplexer.sequence_gaps` instead.
+
+        The multiplexer can be set only while the JMS session is not open.
+        """
+        return self._multiplexer
+
+    @multiplexer.setter
+    def multiplexer(self, value):
+        if self.is_open():
+            raise RuntimeError(
+                "The multiplexer of an auto updater cannot be changed while "
+                "its JMS session is open")
+        self._multiplexer = value
+
+    @property
+    def coalesce_window(self):
+        """
+        :term:`number`: Coalescing window in seconds for property change and
+        status change notifications, or `None` for no coalescing.
+
+        If set, a worker thread that starts processing a notification first
+        waits for further notifications for up to that time. Successive
+        property change notifications for the same resource that were
+        received within that time are merged into one update of the
+        resource properties, keeping the last value of each property, and so
+        are successive status change notifications. This reduces the
+        number of updates of resource objects if the HMC emits many changes
+        for the same resource within a short time, e.g. during the
+        activation of a CPC, at the expense of delaying the updates by up to
+        that time. A value of 0.05 is a reasonable choice.
+
+        This property can be set at any time.
+        """
+        return self._coalesce_window
+
+    @coalesce_window.setter
+    def coalesce_window(self, value):
+        self._coalesce_window = value
+        if self._dispatcher:
+            self._dispatcher.window = value
+
+    @property
+    def journal(self):
+        """
+        :class:`~zhmcclient.NotificationJournal`: Journal to which the received
+        notifications are appended, or `None` for not journaling the
+        notifications.
+
+        The notifications are journaled as they are received, before they
+        are coalesced and processed, so that downstream consumers can replay
+        them (see :meth:`zhmcclient.NotificationJournal.replay`).
+
+        This property can be set at any time.
+        """
+        return self._journal
+
+    @journal.setter
+    def journal(self, value):
+        self._journal = value
+
+    @property
+    def last_sequence_nr(self):
+        """
+        :term:`integer`: The session sequence number of the last notification
+        received on the current STOMP connection, or `None`.
+        """
+        return self._seq_tracker.last_sequence_nr
+
+    @property
+    def sequence_gaps(self):
+        """
+        :term:`integer`: The number of gaps in the session sequence numbers of
+        the received notifications, since this auto updater was created.
+        """
+        return self._seq_tracker.gaps
+
+    @property
+    def resyncs(self):
+        """
+        :term:`integer`: The number of re-synchronizations of the auto-updated
+        objects with the HMC (see :meth:`resync`) that have been performed,
+        since this auto updater was created.
+        """
+        return self._resyncs
+
+    def request_resync(self):
+        """
+        Request a re-synchronization of the auto-updated objects with the HMC
+        (see :meth:`resync`), which is performed in a background thread.
+
+        If a re-synchronization is already in progress, another one is
+        performed after it.
+        """
+        with self._resync_lock:
+            if self._resync_thread is not None:
+                self._resync_pending = True
+                return
+            self._resync_thread = threading.Thread(
+                target=self._resync_run, name='zhmcclient.AutoUpdater.resync',
+                daemon=True)
+            self._resync_thread.start()
+
+    def _resync_run(self):
+        """
+        Thread function that performs the requested re-synchronizations.
+        """
+        while True:
+            try:
+                self.resync()
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                JMS_LOGGER.error(
+                    "Re-synchronizing the auto-updated objects for object "
+                    "notification topic '%s' failed: %s: %s",
+                    self._session.object_topic, exc.__class__.__name__, exc)
+            with self._resync_lock:
+                if not self._resync_pending:
+                    self._resync_thread = None
+                    return
+                self._resync_pending = False
+
+    def resync(self):
+        """
+        Re-synchronize the auto-updated objects with the HMC, after
+        notifications may have been lost.
+
+        The properties of all resource objects that are enabled for
+        auto-updating are retrieved from the HMC using bulk operations
+        "Submit Requests" (one for each manager object), and are updated in
+        the resource objects. Resource objects that no longer exist on the
+        HMC are set to have ceased to exist. The change callbacks of the
+        resource objects are invoked with the properties that have changed.
+
+        Since resources that have been added or removed cannot be determined
+        without listing them, the manager objects that are enabled for
+        auto-updating are marked to re-list their resources from the HMC
+        in their next list() call. The re-listing is not performed by this
+        method.
+
+        Raises:
+
+          :exc:`~zhmcclient.HTTPError`
+          :exc:`~zhmcclient.ParseError`
+          :exc:`~zhmcclient.AuthError`
+          :exc:`~zhmcclient.ConnectionError`
+        """
+        # Resource objects to be refreshed, as:
+        #   dict(key: id of manager, value: tuple(manager, dict(key: uri,
+        #   value: list of resource objects)))
+        resources = {}
+        with self._registered_lock:
+            obj_refs = [obj_ref for id_dict in self._registered_objects.values()
+                        for obj_ref in id_dict.values()]
+        for obj_ref in obj_refs:
+            obj = obj_ref()
+            if obj is None or not obj.auto_update_enabled():
+                continue
+            if isinstance(obj, BaseManager):
+                # Notifications for added or removed resources may have been
+                # lost. This only marks the manager for re-listing.
+                obj.auto_update_trigger_pull()
+            else:
+                _, objs_by_uri = resources.setdefault(
+                    id(obj.manager), (obj.manager, {}))
+                objs_by_uri.setdefault(obj.uri, []).append(obj)
+
+        for manager, objs_by_uri in resources.values():
+            uris = list(objs_by_uri)
+            # pylint: disable=protected-access
+            results = manager._bulk_get(uris)
+            for index, status, body in results:
+                for obj in objs_by_uri[uris[index]]:
+                    if status == 200:
+                        local_props = obj.properties
+                        changed_props = {
+                            name: value for name, value in body.items()
+                            if name not in local_props or
+                            local_props[name] != value}
+                        obj.update_properties_local(body)
+                        if changed_props:
+                            obj.auto_update_notify_change(changed_props)
+                    elif status == 404 and (body or {}).get('reason') == 1:
+                        obj.cease_existence_local()
+                        obj.auto_update_notify_change(None)
+                    else:
+                        JMS_LOGGER.error(
+                            "Re-synchronizing auto-updated resource %s "
+                            "failed with HTTP status %s: %r",
+                            uris[index], status, body)
+
+        self._resyncs += 1
+        JMS_LOGGER.info(
+            "Auto-updated objects for object notification topic '%s' have "
+            "been re-synchronized with the HMC", self._session.object_topic)
+
+    @property
+    def queue_depth(self):
+        """
+        :term:`integer`: Number of received notifications that currently wait
+        for being processed.
+        """
+        return self._dispatcher.queue_depth if self._dispatcher else 0
+
+    @property
+    def max_queue_depth(self):
+        """
+        :term:`integer`: Maximum number of received notifications that have
+        waited for being processed at the same time, since the JMS session was
+        opened.
+        """
+        return self._dispatcher.max_queue_depth if self._dispatcher else 0
+
+    @property
+    def lag(self):
+        """
+        float: Time in seconds between receiving and starting to process the
+        notification that was processed last.
+        """
+        return self._dispatcher.lag if self._dispatcher else 0.0
+
+    @property
+    def max_lag(self):
+        """
+        float: Maximum time in seconds between receiving and starting to
+        process a notification, since the JMS session was opened.
+        """
+        return self._dispatcher.max_lag if self._dispatcher else 0.0
+
+    @property
+    def dropped(self):
+        """
+        :term:`integer`: Number of received notifications that have been
+        dropped because the maximum number of notifications waiting for being
+        processed was reached, since the JMS session was opened.
+        """
+        return self._dispatcher.dropped if self._dispatcher else 0
 
     def register_object(self, obj):
         """
@@ -202,15 +710,52 @@ class AutoUpdater:
 
         If this object (identified by its Python id) is already registered,
         nothing is done.
+
+        The object is referenced weakly, so registering it does not keep it
+        alive. When the object is deleted, it is automatically unregistered.
         """
         assert isinstance(obj, (BaseResource, BaseManager))
         uri = obj.uri
         res_id = id(obj)
-        if uri not in self._registered_objects:
-            self._registered_objects[uri] = {}
-        id_dict = self._registered_objects[uri]
-        if res_id not in id_dict:
-            id_dict[res_id] = obj
+        with self._registered_lock:
+            id_dict = self._registered_objects.setdefault(uri, {})
+            obj_ref = id_dict.get(res_id)
+            if obj_ref is None or obj_ref() is not obj:
+                id_dict[res_id] = weakref.ref(
+                    obj, self._object_deleted_callback(uri, res_id))
+
+    def _object_deleted_callback(self, uri, res_id):
+        """
+        Return a callback function for the weakref to a registered object,
+        that unregisters the object when it is deleted.
+
+        The callback function references this auto updater weakly, so that
+        the registered objects do not keep it alive.
+        """
+        updater_ref = weakref.ref(self)
+
+        def callback(obj_ref):
+            updater = updater_ref()
+            if updater is not None:
+                # pylint: disable=protected-access
+                updater._remove_object_ref(uri, res_id, obj_ref)
+
+        return callback
+
+    def _remove_object_ref(self, uri, res_id, obj_ref):
+        """
+        Remove the weakref to a registered object, if it is still registered
+        with that weakref.
+        """
+        with self._registered_lock:
+            id_dict = self._registered_objects.get(uri)
+            if id_dict is None or id_dict.get(res_id) is not obj_ref:
+                # The object has already been unregistered, or a different
+                # object that got the same Python id has been registered.
+                return
+            del id_dict[res_id]
+            if not id_dict:
+                del self._registered_objects[uri]
 
     def unregister_object(self, obj):
         """
@@ -222,9 +767,12 @@ class AutoUpdater:
         assert isinstance(obj, (BaseResource, BaseManager))
         uri = obj.uri
         res_id = id(obj)
-        if uri in self._registered_objects:
-            id_dict = self._registered_objects[uri]
-            if res_id in id_dict:
+        with self._registered_lock:
+            id_dict = self._registered_objects.get(uri)
+            if id_dict is None:
+                return
+            obj_ref = id_dict.get(res_id)
+            if obj_ref is not None and obj_ref() is obj:
                 del id_dict[res_id]
             if not id_dict:
                 del self._registered_objects[uri]
@@ -234,17 +782,217 @@ class AutoUpdater:
         Generator that yields the resource or manager objects for the specified
         URI.
         """
-        if uri in self._registered_objects:
-            id_dict = self._registered_objects[uri]
-            # pylint: disable=use-yield-from
-            yield from id_dict.values()
+        with self._registered_lock:
+            id_dict = self._registered_objects.get(uri)
+            if not id_dict:
+                return
+            objs = [obj_ref() for obj_ref in id_dict.values()]
+        for obj in objs:
+            if obj is not None:
+                yield obj
 
     def has_objects(self):
         """
         Return boolean indicating whether there are any resource objects
         registered.
         """
-        return bool(self._registered_objects)
+        with self._registered_lock:
+            return bool(self._registered_objects)
+
+
+class _NotificationDispatcher:
+    """
+    Processes notifications in a pool of worker threads.
+
+    Each worker thread has its own bounded queue. The notifications are
+    assigned to the worker threads by the URI of the resource they apply to,
+    so that the notifications for the same resource are processed in the
+    order in which they were dispatched.
+
+    The notifications are passed to the processing function in batches. If a
+    coalescing window is set, a worker thread that got a notification from
+    its queue waits for further notifications for up to that time, and
+    passes all of them as one batch.
+
+    This is an internal class that does not need to be accessed or created by
+    the user.
+    """
+
+    def __init__(self, process_func, num_workers, queue_size, window=None):
+        """
+        Parameters:
+
+          process_func (callable): Function that processes a batch of
+            notifications. It is called with a list of the notifications that
+            were passed to dispatch().
+
+          num_workers (int): Number of worker threads.
+
+          queue_size (int): Maximum number of waiting notifications, per
+            worker thread.
+
+          window (float): Coalescing window in seconds, or `None`.
+        """
+        self._process_func = process_func
+        self.window = window
+
+        # Attributes that are updated under the lock
+        self._lock = threading.Lock()
+        self._max_queue_depth = 0
+        self._lag = 0.0
+        self._max_lag = 0.0
+        self._dropped = 0
+
+        # Queue items: tuple(receive time, notification), or None to stop the
+        # worker
+        self._queues = [queue.Queue(queue_size) for _ in range(num_workers)]
+        self._threads = []
+        for index, work_queue in enumerate(self._queues):
+            thread = threading.Thread(
+                target=self._worker, args=(work_queue,),
+                name=f'zhmcclient.AutoUpdater.worker{index}', daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    @property
+    def queue_depth(self):
+        """
+        int: Number of notifications that currently wait for being processed.
+        """
+        return sum(work_queue.qsize() for work_queue in self._queues)
+
+    @property
+    def max_queue_depth(self):
+        """
+        int: Maximum number of notifications that have waited at the same
+        time.
+        """
+        return self._max_queue_depth
+
+    @property
+    def lag(self):
+        """
+        float: Waiting time in seconds of the last processed notification.
+        """
+        return self._lag
+
+    @property
+    def max_lag(self):
+        """
+        float: Maximum waiting time in seconds of a processed notification.
+        """
+        return self._max_lag
+
+    @property
+    def dropped(self):
+        """
+        int: Number of dropped notifications.
+        """
+        return self._dropped
+
+    def dispatch(self, uri, notification):
+        """
+        Queue a notification for being processed by the worker thread for a
+        resource URI.
+
+        If the queue of that worker thread is full, the notification is
+        dropped without waiting, so that the thread receiving the
+        notifications is never blocked. The caller is expected to recover
+        from dropped notifications by re-synchronizing.
+
+        Parameters:
+
+          uri (str): URI of the resource the notification applies to, or
+            `None`.
+
+          notification (object): The notification, in the form that is
+            expected by the processing function.
+
+        Returns:
+
+          bool: Indicates whether the notification has been queued (`True`)
+          or dropped (`False`).
+        """
+        work_queue = self._queues[hash(uri) % len(self._queues)]
+        try:
+            work_queue.put_nowait((time.monotonic(), notification))
+        except queue.Full:
+            with self._lock:
+                self._dropped += 1
+            JMS_LOGGER.error(
+                "Auto updater dispatch queue is full - dropping notification "
+                "for resource %s", uri)
+            return False
+        queue_depth = self.queue_depth
+        with self._lock:
+            if queue_depth > self._max_queue_depth:
+                self._max_queue_depth = queue_depth
+        return True
+
+    def wait_processed(self):
+        """
+        Wait until the notifications that are already queued have been
+        processed.
+        """
+        for work_queue in self._queues:
+            work_queue.join()
+
+    def stop(self):
+        """
+        Stop the worker threads after they have processed the notifications
+        that are already queued, and wait for them to end.
+        """
+        for work_queue in self._queues:
+            work_queue.put(None)
+        current_thread = threading.current_thread()
+        for thread in self._threads:
+            # The auto updater may be closed while processing a notification
+            if thread is not current_thread:
+                thread.join()
+
+    def _worker(self, work_queue):
+        """
+        Worker thread function that processes the notifications of its queue.
+        """
+        stopped = False
+        while not stopped:
+            item = work_queue.get()
+            if item is None:
+                work_queue.task_done()
+                return
+            items = [item]
+            window = self.window
+            if window:
+                end_time = time.monotonic() + window
+                while True:
+                    wait_time = end_time - time.monotonic()
+                    if wait_time <= 0:
+                        break
+                    try:
+                        item = work_queue.get(timeout=wait_time)
+                    except queue.Empty:
+                        break
+                    if item is None:
+                        # Process the batch and then stop
+                        work_queue.task_done()
+                        stopped = True
+                        break
+                    items.append(item)
+            now = time.monotonic()
+            lag = now - items[0][0]
+            with self._lock:
+                self._lag = now - items[-1][0]
+                if lag > self._max_lag:
+                    self._max_lag = lag
+            try:
+                self._process_func([_item[1] for _item in items])
+            except Exception:  # pylint: disable=broad-exception-caught
+                JMS_LOGGER.exception(
+                    "Processing of JMS message for object notification "
+                    "failed (ignored)")
+            finally:
+                for _ in items:
+                    work_queue.task_done()
 
 
 class _UpdateListener:
@@ -268,6 +1016,10 @@ class _UpdateListener:
         self._session = session
         self._client = None
 
+        # Dispatcher for processing the notifications in worker threads. If
+        # None, the notifications are processed in on_message().
+        self.dispatcher = None
+
         # Lazy importing of the stomp module, because the import is slow in some
         # versions.
         # pylint: disable=import-outside-toplevel
@@ -386,22 +1138,103 @@ class _UpdateListener:
         Event method that gets called when this listener has received a JMS
         message (representing an HMC notification).
 
+        If notifications have been lost, a re-synchronization of the
+        auto-updated objects is requested. The notification is then handled
+        by :meth:`handle_message`.
+
         Parameters:
 
           frame_args: The STOMP frame. For details, see get_headers_message().
         """
+        # pylint: disable=protected-access
         headers, message = get_headers_message(frame_args)
+        if self._updater._seq_tracker.check(headers):
+            JMS_LOGGER.warning(
+                "Gap in session sequence numbers of notifications for object "
+                "notification topic '%s' before %s - re-synchronizing",
+                self._session.object_topic, headers['session-sequence-nr'])
+            self._updater.request_resync()
+        self.handle_message(headers, message)
+
+    def handle_message(self, headers, message):
+        """
+        Handle a received JMS message (representing an HMC notification).
+
+        The notification is appended to the journal of the auto updater, and
+        is passed on to the dispatcher, so that it is processed in a worker
+        thread. If the notification had to be dropped, a re-synchronization
+        of the auto-updated objects is requested.
 
+        This method is also used as the callback function of the subscription
+        on a :class:`~zhmcclient.NotificationMultiplexer`.
+
+        Parameters:
+
+          headers (dict): STOMP message headers.
+
+          message (str): STOMP message body, or `None`.
+        """
+        journal = self._updater.journal
+        if journal is not None:
+            journal.append(headers, message)
+        if self.dispatcher is None:
+            self.process_messages([(headers, message)])
+            return
+        uri = headers.get('element-uri') or headers.get('object-uri')
+        if not self.dispatcher.dispatch(uri, (headers, message)):
+            self._updater.request_resync()
+
+    def process_messages(self, messages):
+        """
+        Process a batch of JMS messages (representing HMC notifications).
+
+        Successive property change and status change notifications for the
+        same resource are merged and applied as one update.
+
+        Parameters:
+
+          messages (list of tuple(headers, message)): The JMS messages, with:
+
+            * headers (dict): STOMP message headers.
+            * message (str): STOMP message body, or `None`.
+        """
+        notifications = []
+        for headers, message in messages:
+            if headers.get('notification-type') in \
+                    ('property-change', 'status-change'):
+                try:
+                    message = json.loads(message)
+                except (JSONDecodeError, TypeError):
+                    JMS_LOGGER.error(
+                        "JMS message for object notification topic '%s' "
+                        "has a non-JSON message body (ignored): %r",
+                        self._session.object_topic, message)
+                    continue
+            notifications.append((headers, message))
+        if len(notifications) > 1:
+            notifications = merge_notifications(notifications)
+        added_managers = {}
+        for headers, msg_obj in notifications:
+            self.process_notification(headers, msg_obj, added_managers)
+        for mgr_obj in added_managers.values():
+            mgr_obj.auto_update_notify_added()
+
+    def process_notification(self, headers, msg_obj, added_managers):
+        """
+        Process an HMC notification.
+
+        Parameters:
+
+          headers (dict): STOMP message headers.
+
+          msg_obj (dict or str): STOMP message body, converted into a JSON
+            object for property change and status change notifications.
+
+          added_managers (dict): Manager objects to which resources have been
+            added, by their Python id. Is updated by this method.
+        """
         noti_type = headers['notification-type']
         if noti_type == 'property-change':
-            try:
-                msg_obj = json.loads(message)
-            except JSONDecodeError:
-                JMS_LOGGER.error(
-                    "JMS message for object notification topic '%s' "
-                    "has a non-JSON message body (ignored): %r",
-                    self._session.object_topic, message)
-                return
             uri = self._get_uri(headers)
             if uri is None:
                 # Some error - details are already logged
@@ -418,15 +1251,8 @@ class _UpdateListener:
             for obj in self._updater.registered_objects(uri):
                 if obj.auto_update_enabled():
                     obj.update_properties_local(new_props)
+                    obj.auto_update_notify_change(new_props)
         elif noti_type == 'status-change':
-            try:
-                msg_obj = json.loads(message)
-            except JSONDecodeError:
-                JMS_LOGGER.error(
-                    "JMS message for object notification topic '%s' "
-                    "has a non-JSON message body (ignored): %r",
-                    self._session.object_topic, message)
-                return
             uri = self._get_uri(headers)
             if uri is None:
                 # Some error - details are already logged
@@ -449,6 +1275,7 @@ class _UpdateListener:
             for obj in self._updater.registered_objects(uri):
                 if obj.auto_update_enabled():
                     obj.update_properties_local(new_props)
+                    obj.auto_update_notify_change(new_props)
         elif noti_type == 'inventory-change':
             uri = self._get_uri(headers)
             if uri is None:
@@ -467,7 +1294,8 @@ class _UpdateListener:
                 for mgr_uri in mgr_uris:
                     for mgr_obj in self._updater.registered_objects(mgr_uri):
                         if mgr_obj.auto_update_enabled():
-                            mgr_obj.auto_update_trigger_pull()
+                            mgr_obj.auto_update_add_resource(uri)
+                            added_managers[id(mgr_obj)] = mgr_obj
             elif action == 'remove':
                 mgr_uris = self._manager_uri_from_notification(headers)
                 if mgr_uris is None:
@@ -476,10 +1304,12 @@ class _UpdateListener:
                 for mgr_uri in mgr_uris:
                     for mgr_obj in self._updater.registered_objects(mgr_uri):
                         if mgr_obj.auto_update_enabled():
-                            mgr_obj.remove_resource_local(uri)
+                            res_obj = mgr_obj.remove_resource_local(uri)
+                            mgr_obj.auto_update_notify_removed(uri, res_obj)
                 for obj in self._updater.registered_objects(uri):
                     if obj.auto_update_enabled():
                         obj.cease_existence_local()
+                        obj.auto_update_notify_change(None)
             else:
                 JMS_LOGGER.error(
                     "JMS message for inventory change notification specifies "
@@ -511,8 +1341,19 @@ class _UpdateListener:
         """
         Event method that gets called when the JMS session has been
         disconnected.
+
+        If the STOMP connection has been lost, it is re-established in a
+        background thread.
+
+        This method does not wait for the processing of the notifications
+        that have been received before, because the disconnect may have been
+        caused in a worker thread of the dispatcher (e.g. by a callback
+        function that disables auto-updating), which would then never
+        complete.
         """
         JMS_LOGGER.info(
             "JMS session for object notification topic '%s' has been "
             "disconnected",
             self._session.object_topic)
+        # pylint: disable=protected-access
+        self._updater._connection_lost()
@@ -23,6 +23,7 @@ import yaml
 from ._cpc import CpcManager
 from ._console import ConsoleManager
 from ._metrics import MetricsContextManager, MetricsResponse, CLASS_FROM_GROUP
+from ._inventory import InventoryIndex
 from ._logging import logged_api_call
 from ._exceptions import Error, OperationTimeout
 
@@ -185,6 +186,43 @@ class Client:
         result = self.session.post(uri, body=body)
         return result
 
+    @logged_api_call
+    def get_inventory_index(self, resources):
+        """
+        Returns a local in-memory index of the requested resources and their
+        properties, that are managed by the HMC.
+
+        This method performs the 'Get Inventory' HMC operation once and builds
+        an :class:`~zhmcclient.InventoryIndex` from its result. Lookups on the
+        returned index by resource class, URI, parent and name, as well as the
+        materialization of zhmcclient resource objects from the index, do not
+        perform any further HMC operations.
+
+        Parameters:
+
+          resources (:term:`iterable` of :term:`string`):
+            Resource classes and/or resource classifiers specifying the types
+            of resources that should be included in the result. For details,
+            see :meth:`~zhmcclient.Client.get_inventory`.
+
+        Returns:
+
+          :class:`~zhmcclient.InventoryIndex`: The inventory index.
+
+        Example:
+
+            index = client.get_inventory_index(['dpm-resources'])
+            partitions = index.resources('partition')
+
+        Raises:
+
+          :exc:`~zhmcclient.HTTPError`
+          :exc:`~zhmcclient.ParseError`
+          :exc:`~zhmcclient.ConnectionError`
+        """
+        inventory_list = self.get_inventory(resources)
+        return InventoryIndex(self, inventory_list)
+
     @logged_api_call
     def wait_for_available(self, operation_timeout=None):
         """
@@ -46,6 +46,10 @@ __all__ = ['DEFAULT_CONNECT_TIMEOUT',
            'DEFAULT_STOMP_HEARTBEAT_SEND_CYCLE',
            'DEFAULT_STOMP_HEARTBEAT_RECEIVE_CYCLE',
            'DEFAULT_STOMP_HEARTBEAT_RECEIVE_CHECK',
+           'DEFAULT_STOMP_HANDOVER_QUEUE_SIZE',
+           'DEFAULT_STOMP_HANDOVER_OVERFLOW_POLICY',
+           'DEFAULT_AUTO_UPDATE_DISPATCH_WORKERS',
+           'DEFAULT_AUTO_UPDATE_DISPATCH_QUEUE_SIZE',
            'HMC_LOGGER_NAME',
            'JMS_LOGGER_NAME',
            'API_LOGGER_NAME',
@@ -53,6 +57,7 @@ __all__ = ['DEFAULT_CONNECT_TIMEOUT',
            'HTML_REASON_WEB_SERVICES_DISABLED',
            'HTML_REASON_OTHER',
            'STOMP_MIN_CONNECTION_CHECK_TIME',
+           'STATUS_FALLBACK_POLL_INTERVAL',
            'DEFAULT_WS_TIMEOUT',
            'BLANKED_OUT_STRING',
            'BLANKED_OUT_PROPERTY_PATTERN',
@@ -185,6 +190,27 @@ DEFAULT_STOMP_HEARTBEAT_RECEIVE_CYCLE = 5.0
 #: :class:`~zhmcclient.NotificationReceiver`.
 DEFAULT_STOMP_HEARTBEAT_RECEIVE_CHECK = 1.0
 
+#: Default value for the ``handover_queue_size``
+#: property of the :class:`~zhmcclient.StompRetryTimeoutConfig` configuration,
+#: if not specified in the ``stomp_rt_config`` init argument to
+#: :class:`~zhmcclient.NotificationReceiver`.
+DEFAULT_STOMP_HANDOVER_QUEUE_SIZE = 1000
+
+#: Default value for the ``handover_overflow_policy``
+#: property of the :class:`~zhmcclient.StompRetryTimeoutConfig` configuration,
+#: if not specified in the ``stomp_rt_config`` init argument to
+#: :class:`~zhmcclient.NotificationReceiver`.
+DEFAULT_STOMP_HANDOVER_OVERFLOW_POLICY = 'block'
+
+#: Default number of worker threads of the :class:`~zhmcclient.AutoUpdater`
+#: that process the notifications received from the HMC.
+DEFAULT_AUTO_UPDATE_DISPATCH_WORKERS = 4
+
+#: Default maximum number of received notifications that wait for being
+#: processed by a worker thread of the :class:`~zhmcclient.AutoUpdater`,
+#: per worker thread.
+DEFAULT_AUTO_UPDATE_DISPATCH_QUEUE_SIZE = 1000
+
 #: Name of the Python logger that logs HMC operations.
 HMC_LOGGER_NAME = 'zhmcclient.hmc'
 
@@ -207,6 +233,12 @@ HTML_REASON_OTHER = 999
 #: Minimum time between checks for STOMP connection loss.
 STOMP_MIN_CONNECTION_CHECK_TIME = 5.0
 
+#: Time in seconds after which the status of resources is retrieved from the
+#: HMC when waiting for status changes using notifications and no status
+#: change notification has been received in that time. This protects against
+#: lost notifications.
+STATUS_FALLBACK_POLL_INTERVAL = 10.0
+
 #: Default WebSocket connect and receive timeout in seconds, for interacting
 #: with the :class:`zhmcclient.OSConsole` class.
 DEFAULT_WS_TIMEOUT = 5
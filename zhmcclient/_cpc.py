@@ -60,6 +60,7 @@ from ._adapter import AdapterManager
 from ._virtual_switch import VirtualSwitchManager
 from ._capacity_group import CapacityGroupManager
 from ._hw_message import HwMessageManager
+from ._inventory import InventoryIndex
 from ._logging import logged_api_call
 from ._exceptions import ParseError, ConsistencyError
 from ._utils import get_api_features, get_firmware_features, \
@@ -70,7 +71,8 @@ from ._utils import get_api_features, get_firmware_features, \
     RC_VIRTUAL_STORAGE_RESOURCE, RC_VIRTUAL_SWITCH, RC_STORAGE_SITE, \
     RC_STORAGE_FABRIC, RC_STORAGE_SWITCH, RC_STORAGE_SUBSYSTEM, \
     RC_STORAGE_PATH, RC_STORAGE_CONTROL_UNIT, RC_VIRTUAL_TAPE_RESOURCE, \
-    RC_TAPE_LINK, RC_TAPE_LIBRARY, RC_CERTIFICATE, RC_AI_FUNCTION
+    RC_TAPE_LINK, RC_TAPE_LIBRARY, RC_CERTIFICATE, RC_AI_FUNCTION, \
+    RC_PARTITION_LINK
 
 __all__ = ['STPNode', 'CpcManager', 'Cpc']
 
@@ -2975,7 +2977,12 @@ class Cpc(BaseResource):
         features must be omitted if empty.
         """
         cpc_uri = self.get_property('object-uri')
-        cpc_uris = [cpc_uri]
+        cpc_uris = {cpc_uri}
+
+        # The inventory list is indexed once by resource class, so that each
+        # of the extractions below only needs to look at the items of one
+        # resource class, using set-based membership tests.
+        index = InventoryIndex(self.manager.client, inventory_list)
 
         config_dict = {}
 
@@ -2992,144 +2999,143 @@ class Cpc(BaseResource):
             dict(group.properties) for group in
             self.capacity_groups.list(full_properties=True)]
 
-        partitions = extractByParent(
-            RC_PARTITION, cpc_uris, inventory_list)
+        partitions = _select_by_prop(
+            index.by_class(RC_PARTITION), 'parent', cpc_uris)
         # This item is required by the "Import DPM Configuration" operation
         config_dict['partitions'] = partitions
-        partition_uris = [x['object-uri'] for x in partitions]
+        partition_uris = _uri_set(partitions)
 
-        adapters = extractAdapters(cpc_uri, inventory_list)
+        adapters = _select_by_prop(
+            index.by_class(RC_ADAPTER), 'parent', cpc_uris)
         if adapters:
             config_dict['adapters'] = adapters
-        adapter_uris = [x['object-uri'] for x in adapters]
+        adapter_uris = _uri_set(adapters)
 
-        nics = extractByParent(
-            RC_NIC, partition_uris, inventory_list)
+        nics = _select_by_prop(
+            index.by_class(RC_NIC), 'parent', partition_uris)
         if nics:
             config_dict['nics'] = nics
 
-        hbas = extractByParent(
-            RC_HBA, partition_uris, inventory_list)
+        hbas = _select_by_prop(
+            index.by_class(RC_HBA), 'parent', partition_uris)
         if hbas:
             config_dict['hbas'] = hbas
 
-        virtual_functions = extractByParent(
-            RC_VIRTUAL_FUNCTION, partition_uris, inventory_list)
+        virtual_functions = _select_by_prop(
+            index.by_class(RC_VIRTUAL_FUNCTION), 'parent', partition_uris)
         if virtual_functions:
             config_dict['virtual-functions'] = virtual_functions
 
-        virtual_switches = extractByParent(
-            RC_VIRTUAL_SWITCH, cpc_uris, inventory_list)
+        virtual_switches = _select_by_prop(
+            index.by_class(RC_VIRTUAL_SWITCH), 'parent', cpc_uris)
         if virtual_switches:
             config_dict['virtual-switches'] = virtual_switches
 
-        storage_sites = extractByValueInListProperty(
-            RC_STORAGE_SITE, cpc_uri, 'cpc-uris', inventory_list)
+        storage_sites = [x for x in index.by_class(RC_STORAGE_SITE)
+                         if cpc_uri in x['cpc-uris']]
         if storage_sites:
             config_dict['storage-sites'] = storage_sites
-        storage_site_uris = [x['object-uri'] for x in storage_sites]
+        storage_site_uris = _uri_set(storage_sites)
 
-        storage_subsystems = extractByPropertyInListValue(
-            RC_STORAGE_SUBSYSTEM, 'storage-site-uri', storage_site_uris,
-            inventory_list)
+        storage_subsystems = _select_by_prop(
+            index.by_class(RC_STORAGE_SUBSYSTEM), 'storage-site-uri',
+            storage_site_uris)
         if storage_subsystems:
             config_dict['storage-subsystems'] = storage_subsystems
-        storage_subsystem_uris = [x['object-uri'] for x in storage_subsystems]
+        storage_subsystem_uris = _uri_set(storage_subsystems)
 
-        storage_fabrics = extractByPropertyInListValue(
-            RC_STORAGE_FABRIC, 'cpc-uri', cpc_uris, inventory_list)
+        storage_fabrics = _select_by_prop(
+            index.by_class(RC_STORAGE_FABRIC), 'cpc-uri', cpc_uris)
         if storage_fabrics:
             config_dict['storage-fabrics'] = storage_fabrics
 
-        storage_switches = extractByPropertyInListValue(
-            RC_STORAGE_SWITCH, 'storage-site-uri', storage_site_uris,
-            inventory_list)
+        storage_switches = _select_by_prop(
+            index.by_class(RC_STORAGE_SWITCH), 'storage-site-uri',
+            storage_site_uris)
         if storage_switches:
             config_dict['storage-switches'] = storage_switches
 
-        storage_control_units = extractByPropertyInListValue(
-            RC_STORAGE_CONTROL_UNIT, 'parent', storage_subsystem_uris,
-            inventory_list)
+        storage_control_units = _select_by_prop(
+            index.by_class(RC_STORAGE_CONTROL_UNIT), 'parent',
+            storage_subsystem_uris)
         if storage_control_units:
             config_dict['storage-control-units'] = storage_control_units
-        storage_control_unit_uris = [x['object-uri']
-                                     for x in storage_control_units]
+        storage_control_unit_uris = _uri_set(storage_control_units)
 
-        storage_paths = extractByPropertyInListValue(
-            RC_STORAGE_PATH, 'parent', storage_control_unit_uris,
-            inventory_list)
+        storage_paths = _select_by_prop(
+            index.by_class(RC_STORAGE_PATH), 'parent',
+            storage_control_unit_uris)
         if storage_paths:
             config_dict['storage-paths'] = storage_paths
 
-        storage_ports = extractByPropertyInListValue(
-            RC_STORAGE_PORT, 'parent', adapter_uris, inventory_list)
+        storage_ports = _select_by_prop(
+            index.by_class(RC_STORAGE_PORT), 'parent', adapter_uris)
         if storage_ports:
             config_dict['storage-ports'] = storage_ports
 
-        network_ports = extractByPropertyInListValue(
-            RC_NETWORK_PORT, 'parent', adapter_uris, inventory_list)
+        network_ports = _select_by_prop(
+            index.by_class(RC_NETWORK_PORT), 'parent', adapter_uris)
         if network_ports:
             config_dict['network-ports'] = network_ports
 
-        storage_groups = extractByPropertyInListValue(
-            RC_STORAGE_GROUP, 'cpc-uri', cpc_uris, inventory_list)
+        storage_groups = _select_by_prop(
+            index.by_class(RC_STORAGE_GROUP), 'cpc-uri', cpc_uris)
         if storage_groups:
             config_dict['storage-groups'] = storage_groups
-        storage_group_uris = [x['object-uri'] for x in storage_groups]
+        storage_group_uris = _uri_set(storage_groups)
 
-        storage_volumes = extractByPropertyInListValue(
-            RC_STORAGE_VOLUME, 'parent', storage_group_uris, inventory_list)
+        storage_volumes = _select_by_prop(
+            index.by_class(RC_STORAGE_VOLUME), 'parent', storage_group_uris)
         if storage_volumes:
             config_dict['storage-volumes'] = storage_volumes
 
-        storage_templates = extractByPropertyInListValue(
-            RC_STORAGE_TEMPLATE, 'cpc-uri', cpc_uris, inventory_list)
+        storage_templates = _select_by_prop(
+            index.by_class(RC_STORAGE_TEMPLATE), 'cpc-uri', cpc_uris)
         if storage_templates:
             config_dict['storage-templates'] = storage_templates
-        storage_template_uris = [x['object-uri'] for x in storage_templates]
+        storage_template_uris = _uri_set(storage_templates)
 
-        storage_template_volumes = extractByPropertyInListValue(
-            RC_STORAGE_TEMPLATE_VOLUME, 'parent', storage_template_uris,
-            inventory_list)
+        storage_template_volumes = _select_by_prop(
+            index.by_class(RC_STORAGE_TEMPLATE_VOLUME), 'parent',
+            storage_template_uris)
         if storage_template_volumes:
             config_dict['storage-template-volumes'] = storage_template_volumes
 
-        virtual_storage_resources = extractByPropertyInListValue(
-            RC_VIRTUAL_STORAGE_RESOURCE, 'parent', storage_group_uris,
-            inventory_list)
+        virtual_storage_resources = _select_by_prop(
+            index.by_class(RC_VIRTUAL_STORAGE_RESOURCE), 'parent',
+            storage_group_uris)
         if virtual_storage_resources:
             config_dict['virtual-storage-resources'] = virtual_storage_resources
 
-        tape_links = extractByPropertyInListValue(
-            RC_TAPE_LINK, 'cpc-uri', cpc_uris, inventory_list)
+        tape_links = _select_by_prop(
+            index.by_class(RC_TAPE_LINK), 'cpc-uri', cpc_uris)
         if tape_links:
             config_dict['tape-links'] = tape_links
-        tape_link_uris = [x['object-uri'] for x in tape_links]
+        tape_link_uris = _uri_set(tape_links)
 
-        tape_libraries = extractByPropertyInListValue(
-            RC_TAPE_LIBRARY, 'cpc-uri', cpc_uris, inventory_list)
+        tape_libraries = _select_by_prop(
+            index.by_class(RC_TAPE_LIBRARY), 'cpc-uri', cpc_uris)
         if tape_libraries:
             config_dict['tape-libraries'] = tape_libraries
 
-        virtual_tape_resources = extractByParent(
-            RC_VIRTUAL_TAPE_RESOURCE, tape_link_uris, inventory_list)
+        virtual_tape_resources = _select_by_prop(
+            index.by_class(RC_VIRTUAL_TAPE_RESOURCE), 'parent', tape_link_uris)
         if virtual_tape_resources:
             config_dict['virtual-tape-resources'] = virtual_tape_resources
 
-        classname_for_partition_links = 'partition-link'
-        partition_links = extractByPropertyInListValue(
-            classname_for_partition_links, 'cpc-uri', cpc_uris, inventory_list)
+        partition_links = _select_by_prop(
+            index.by_class(RC_PARTITION_LINK), 'cpc-uri', cpc_uris)
         if partition_links:
             config_dict['partition-links'] = partition_links
 
-        certificates = extractByPropertyInListValue(
-            RC_CERTIFICATE, 'parent', cpc_uris, inventory_list)
+        certificates = _select_by_prop(
+            index.by_class(RC_CERTIFICATE), 'parent', cpc_uris)
         if certificates:
             _add_encoded(self.manager.console, certificates)
             config_dict['certificates'] = certificates
 
-        ai_resources = extractByPropertyInListValue(
-            RC_AI_FUNCTION, 'parent', partition_uris, inventory_list)
+        ai_resources = _select_by_prop(
+            index.by_class(RC_AI_FUNCTION), 'parent', partition_uris)
         if ai_resources:
             config_dict['ai-accelerator-functions'] = ai_resources
 
@@ -3235,88 +3241,23 @@ class Cpc(BaseResource):
 # exportDpmResourcesToFile.py script available at
 # https://www-01.ibm.com/servers/resourcelink/lib03020.nsf/0/2C88A77CEA71062E8525829500667BCD?OpenDocument
 
-def extractByParent(classname, parent_list, inventory_list):
+def _select_by_prop(items, prop_name, values):
     """
-    Extract all items from inventory_list that have the classname and where the
-    parent is in parent_list.
+    Return the items (of one resource class) where the value of the prop_name
+    property is in the values set.
 
-    This is used for example to get all partitions of a CPC or all NICs of a
-    partition.
+    This is used by Cpc._convert_to_config() on the items of one resource
+    class from the inventory index, so that the entire inventory list does not
+    need to be scanned.
     """
-    result_list = [x for x in inventory_list
-                   if (x['class'] == classname and x['parent'] in parent_list)]
-    return result_list
+    return [x for x in items if x[prop_name] in values]
 
 
-def extractByPropertyInListValue(classname, prop_name, values, inventory_list):
+def _uri_set(items):
     """
-    Extract all items from inventory_list that have the classname and where the
-    value of the prop_name property is in the values list.
-
-    Used for example to get all storage groups that have value for property
-    'cpc-uri' in a list of CPC uris.
+    Return the set of 'object-uri' property values of the items.
     """
-    result_list = [x for x in inventory_list
-                   if x['class'] == classname and x[prop_name] in values]
-    return result_list
-
-
-def extractByValueInListProperty(classname, value, prop_name, inventory_list):
-    """
-    Extract all items from inventory_list that have the classname and where
-    value is in the value of the prop_name array property.
-
-    Used for example to get all storage-sites that have a 'cpc-uris' list
-    containing the specified cpc-uri value.
-    """
-    result_list = [x for x in inventory_list
-                   if x['class'] == classname and value in x[prop_name]]
-    return result_list
-
-
-def extractAdapters(cpc_uri, inventory_list):
-    """
-    Extract all items from inventory_list with class "adapter" and parent
-    cpc_uri.
-    """
-
-    # Export all adapters even when not used. If False, only adapters that
-    # are used, are exported.
-    all_adapters = True
-
-    result_list = []
-    excluded_classes = (RC_ADAPTER, RC_NETWORK_PORT, RC_STORAGE_PORT)
-    for x in inventory_list:
-        if x['class'] == RC_ADAPTER and x['parent'] == cpc_uri:
-            # It is an adapter of this CPC
-            if all_adapters:
-                result_list.append(x)
-            elif containsItemsWithSubstring(
-                    x['object-uri'], excluded_classes, inventory_list):
-                # The adapter is used.
-                # Note that the test above checks only adapter URIs, but in
-                # case of OSA adapters the virtual switches are referencing
-                # the backing network ports, and in case of FICON adapters the
-                # HBAs/VSRs are referencing the storage ports. The reason this
-                # test works nevertheless, is that the storage and network ports
-                # are element resources that are children of the adapter
-                # resources, and thus their URIs happen to contain the adapter
-                # URIs.
-                result_list.append(x)
-    return result_list
-
-
-def containsItemsWithSubstring(substr, excluded_classes, inventory_list):
-    """
-    Check if inventory_list contains items where substr appears in the
-    string representation of the item, excluding the items with a class in
-    excluded_classes.
-    """
-    find_list = [x for x in inventory_list
-                 if x['class'] not in excluded_classes
-                 and str(x).find(substr) != -1]
-    found = len(find_list) > 0
-    return found
+    return {x['object-uri'] for x in items}
 
 
 def retrieveInventoryData(client):
@@ -3355,9 +3296,9 @@ def _add_encoded(console, certificates):
     Takes a list of dicts representing certificate objects and adds
     the corresponding encoded certificate data to each dict.
     """
+    certs_by_name = {cert.name: cert for cert in console.certificates.list()}
     for cert_dict in certificates:
-        cert = console.certificates.list(
-            filter_args={'name': cert_dict['name']})[0]
+        cert = certs_by_name[cert_dict['name']]
         cert_dict.update(cert.get_encoded())
 
 
@@ -3378,11 +3319,11 @@ def _drop_unused_virtual_switches(dpm_config):
     if 'virtual-switches' not in dpm_config:
         return
 
-    str_config = str(
-        {key: dpm_config[key] for key in dpm_config
-         if key not in ['virtual-switches', 'adapters']})
+    referenced_ids = _referenced_ids(
+        [dpm_config[key] for key in dpm_config
+         if key not in ['virtual-switches', 'adapters']])
 
-    _drop_elements('virtual-switches', str_config, dpm_config)
+    _drop_elements('virtual-switches', referenced_ids, dpm_config)
 
 
 def _drop_unused_adapters(dpm_config):
@@ -3400,29 +3341,52 @@ def _drop_unused_adapters(dpm_config):
             required_storage_ports.append(port)
     dpm_config['storage-ports'] = required_storage_ports
 
-    config = str(dpm_config)
+    referenced_ids = _referenced_ids(dpm_config)
 
     # restore original content
     dpm_config['adapters'] = adapters
     dpm_config['network-ports'] = network_ports
     dpm_config['storage-ports'] = storage_ports
 
-    return _drop_elements('adapters', config, dpm_config)
+    return _drop_elements('adapters', referenced_ids, dpm_config)
+
 
+def _referenced_ids(value, ids=None):
+    """
+    Returns the set of strings that may be object-ids referenced in the
+    (nested) value of a "reduced" dpm config. These are all string values
+    and the segments of all string values that are URIs.
 
-def _drop_elements(key_to_update, str_config, dict_config):
+    This is collected once per reduced dpm config, so that the references to
+    each element can be checked with a set lookup, instead of a substring
+    search over the string representation of the entire dpm config.
+    """
+    if ids is None:
+        ids = set()
+    if isinstance(value, str):
+        ids.update(value.split('/'))
+    elif isinstance(value, dict):
+        for item in value.values():
+            _referenced_ids(item, ids)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            _referenced_ids(item, ids)
+    return ids
+
+
+def _drop_elements(key_to_update, referenced_ids, dict_config):
     """
-    Receives a field name to update, a "reduced" string representation of
-    a dpm config, and the dpm config as dict. Iterates the to key_to_update
-    entries within the dict to collect those that are referenced by their
-    object-id within the string config. Finally updates the dict config
+    Receives a field name to update, the set of referenced ids of a
+    "reduced" dpm config (see _referenced_ids()), and the dpm config as dict.
+    Iterates the to key_to_update entries within the dict to collect those
+    that are referenced by their object-id. Finally updates the dict config
     for key_to_update in place to that list of elements that are actually
     referenced.
     """
     referenced_keys = []
     dropped_uris = []
     for elem in dict_config[key_to_update]:
-        if elem['object-id'] in str_config:
+        if elem['object-id'] in referenced_ids:
             referenced_keys.append(elem)
         else:
             dropped_uris.append(elem['object-uri'])
@@ -3435,6 +3399,7 @@ def _remove_child_elements(dpm_config, key_to_update, dropped_parents):
     Updates dpm_config for key_to_update in place removing all those elements
     with a parent in the list of dropped_parents.
     """
+    dropped_parents = set(dropped_parents)
     retained = []
     for elem in dpm_config[key_to_update]:
         if elem['parent'] not in dropped_parents:
@@ -0,0 +1,725 @@
+# Copyright 2026 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+A :class:`~zhmcclient.DpmConfigurationImporter` imports a DPM configuration
+into a CPC on the client side, as an alternative to the monolithic
+"Import DPM Configuration" HMC operation that is performed by
+:meth:`~zhmcclient.Cpc.import_dpm_configuration`.
+
+The importer orders the resources in the DPM configuration by their
+dependencies into stages (capacity groups, partitions, adapters and ports,
+NICs, HBAs and virtual functions, storage groups). The resources of a stage
+do not depend on each other, so they are created or updated in parallel
+batches using the "Submit Requests" HMC operation (aggregation service).
+The progress of the import can be saved in a checkpoint file, so that an
+import that failed can be resumed without repeating the completed work.
+"""
+
+import os
+import re
+import json
+import copy
+
+from ._manager import BULK_MAX_SIZE, BULK_MAX_THREADS, BULK_OVHD, \
+    BULK_OVHD_PER_REQ
+from ._logging import logged_api_call
+from ._utils import RC_ADAPTER, RC_CAPACITY_GROUP, RC_HBA, RC_NIC, \
+    RC_PARTITION, RC_NETWORK_PORT, RC_STORAGE_PORT, RC_STORAGE_GROUP, \
+    RC_VIRTUAL_FUNCTION, RC_VIRTUAL_SWITCH, repr_obj_id
+
+__all__ = ['DpmConfigurationImporter']
+
+# URI of the "Submit Requests" HMC operation
+SUBMIT_REQUESTS_URI = '/api/services/aggregation/submit'
+
+# The import stages, in the order in which they are performed. Resources
+# within a stage do not depend on each other, and resources in a stage
+# depend only on resources in earlier stages.
+IMPORT_STAGES = (
+    'capacity-groups',
+    'partitions',
+    'capacity-group-members',
+    'adapters',
+    'ports',
+    'virtual-switches',
+    'nics',
+    'hbas',
+    'virtual-functions',
+    'storage-groups',
+    'storage-group-attachments',
+)
+
+# Default number of requests in a single "Submit Requests" operation
+DEFAULT_BATCH_SIZE = 100
+
+# Properties that are not specified when creating the resources, as:
+#   key: Field name of the resources in the DPM configuration
+#   value: Set of property names that are read-only or are set by the importer
+CREATE_EXCLUDED_PROPS = {
+    'capacity-groups': {
+        'element-id', 'element-uri', 'parent', 'class', 'partition-uris',
+    },
+    'partitions': {
+        'object-id', 'object-uri', 'parent', 'class', 'status',
+        'has-unacceptable-status', 'is-locked', 'os-name', 'os-type',
+        'os-version', 'degraded-adapters', 'current-cp-processing-weight',
+        'current-ifl-processing-weight', 'cpc-name', 'se-version',
+        'available-features-list', 'nic-uris', 'hba-uris',
+        'virtual-function-uris', 'storage-group-uris', 'tape-link-uris',
+        'partition-link-uris', 'assigned-certificate-uris',
+        'crypto-configuration', 'boot-network-device', 'boot-storage-device',
+        'boot-storage-volume', 'boot-storage-group',
+    },
+    'nics': {
+        'element-id', 'element-uri', 'parent', 'class', 'type',
+        'network-adapter-port-uri', 'virtual-switch-uri',
+    },
+    'hbas': {
+        'element-id', 'element-uri', 'parent', 'class', 'wwpn',
+        'adapter-port-uri',
+    },
+    'virtual-functions': {
+        'element-id', 'element-uri', 'parent', 'class', 'adapter-uri',
+    },
+    'storage-groups': {
+        'object-id', 'object-uri', 'parent', 'class', 'cpc-uri',
+        'fulfillment-state', 'storage-volume-uris',
+        'virtual-storage-resource-uris', 'active-connectivity',
+        'active-max-partitions', 'unassigned-worldwide-port-names',
+        'candidate-adapter-port-uris',
+    },
+    'storage-volumes': {
+        'element-id', 'element-uri', 'parent', 'class', 'fulfillment-state',
+        'active-size', 'active-model', 'uuid', 'paths', 'control-unit-uri',
+        'eckd-type', 'unit-address', 'storage-subsystem-name', 'ssid',
+    },
+}
+
+# Properties of resources in the DPM configuration that reference other
+# resources, as:
+#   key: Field name of the resources in the DPM configuration
+#   value: List of property names with a URI or list of URIs
+REFERENCE_PROPS = {
+    'nics': ['network-adapter-port-uri', 'virtual-switch-uri'],
+    'hbas': ['adapter-port-uri'],
+    'virtual-functions': ['adapter-uri'],
+    'storage-groups': ['candidate-adapter-port-uris'],
+}
+
+# Pattern for port URIs, used to derive the URIs of ports in the target CPC
+# from the URIs of their adapters in the target CPC.
+PORT_URI_PATTERN = re.compile(
+    r'^(/api/adapters/[^/]+)(/(?:network|storage)-ports/[^/]+)$')
+
+
+class _UnresolvedReference(Exception):
+    """
+    Internal exception indicating that a URI in the DPM configuration cannot
+    be mapped to a URI in the target CPC.
+    """
+
+    def __init__(self, uri):
+        super().__init__(uri)
+        self.uri = uri
+
+
+class _ImportAction:
+    """
+    An internal action of the import, that results in one request in a
+    "Submit Requests" operation.
+    """
+
+    # pylint: disable=too-few-public-methods,too-many-arguments
+
+    def __init__(self, key, stage, res_class, name, target, body,
+                 refs=None, source_uri=None, result_prop=None,
+                 element_uris=None):
+        """
+        Parameters:
+
+          key (string): Unique key of the action, used for checkpointing.
+
+          stage (string): The import stage the action belongs to.
+
+          res_class (string): Resource class of the imported resource.
+
+          name (string): Name of the imported resource, for reporting.
+
+          target (tuple): URI of the request, as a tuple(ref_uri, suffix),
+            where ref_uri is a URI in the DPM configuration that is mapped to
+            the target CPC, or `None` if suffix is the complete URI.
+
+          body (dict): Request body, without the reference properties.
+
+          refs (dict): Reference properties for the request body, with the
+            URIs in the DPM configuration that need to be mapped to the
+            target CPC, as a URI string or a list of URI strings.
+
+          source_uri (string): URI of the resource in the DPM configuration
+            that is mapped to the URI of the created resource, or `None`.
+
+          result_prop (string): Name of the property in the response body
+            that has the URI of the created resource, or `None`.
+
+          element_uris (list of string): URIs of element resources in the
+            DPM configuration that are mapped to the URIs in the
+            'element-uris' property of the response body, or `None`.
+        """
+        self.key = key
+        self.stage = stage
+        self.res_class = res_class
+        self.name = name
+        self.target = target
+        self.body = body
+        self.refs = refs or {}
+        self.source_uri = source_uri
+        self.result_prop = result_prop
+        self.element_uris = element_uris
+
+
+class DpmConfigurationImporter:
+    """
+    An importer for a DPM configuration into a CPC in DPM mode, that
+    creates and updates the resources on the client side.
+
+    In contrast to :meth:`~zhmcclient.Cpc.import_dpm_configuration`, which
+    performs the import in a single "Import DPM Configuration" HMC operation,
+    this importer reports progress, can resume an import that failed, and
+    performs the independent parts of the import in parallel.
+
+    The resources in the DPM configuration are processed in these stages,
+    in this order:
+
+    * 'capacity-groups' - Create the capacity groups.
+    * 'partitions' - Create the partitions.
+    * 'capacity-group-members' - Add the partitions to their capacity groups.
+    * 'adapters' - Map the adapters to the adapters of the target CPC by
+      adapter ID (PCHID), create missing Hipersocket adapters, and update
+      the name and description of the adapters.
+    * 'ports' - Update the description of the network and storage ports.
+    * 'virtual-switches' - Map the virtual switches to the virtual switches
+      of the target CPC by their backing adapter and port. This stage does
+      not perform any requests.
+    * 'nics', 'hbas', 'virtual-functions' - Create the NICs, HBAs and
+      virtual functions in the created partitions.
+    * 'storage-groups' - Create the storage groups with their storage
+      volumes.
+    * 'storage-group-attachments' - Attach the storage groups to the
+      created partitions.
+
+    All requests of a stage are performed in batches using the
+    "Submit Requests" HMC operation, and the requests of a batch are
+    processed in parallel by the HMC.
+
+    URIs in the DPM configuration are mapped to the URIs of the
+    corresponding resources in the target CPC. A resource that references a
+    resource that could not be imported or mapped is not imported and is
+    reported as not applied.
+
+    The following parts of a DPM configuration are not imported by this
+    importer: CPC properties, certificates, partition links, tape links,
+    crypto configurations, and the boot device settings of partitions.
+
+    If a checkpoint file is specified, the URI mapping and the completed
+    requests are saved in the checkpoint file after each batch. If the
+    checkpoint file exists when the importer is created, the import resumes
+    from the saved state, so that the completed requests are not performed
+    again.
+    """
+
+    def __init__(self, cpc, dpm_configuration, adapter_mapping=None,
+                 checkpoint_file=None, batch_size=DEFAULT_BATCH_SIZE,
+                 threads=BULK_MAX_THREADS):
+        # pylint: disable=too-many-arguments
+        """
+        Parameters:
+
+          cpc (:class:`~zhmcclient.Cpc`): The target CPC. It must be in DPM
+            mode.
+
+          dpm_configuration (dict): The DPM configuration to be imported, in
+            the format returned by
+            :meth:`~zhmcclient.Cpc.export_dpm_configuration`.
+
+          adapter_mapping (dict): Mapping of adapter IDs (PCHIDs) of adapters
+            in the DPM configuration to adapter IDs of adapters in the target
+            CPC, for adapters whose adapter ID differs. `None` means that the
+            adapter IDs are the same.
+
+          checkpoint_file (string): Path name of the checkpoint file, or
+            `None` for not using a checkpoint file.
+
+          batch_size (int): Maximum number of requests in a single
+            "Submit Requests" operation. The number of requests is also
+            limited by the maximum request content size of that operation.
+
+          threads (int): Number of threads the HMC uses for processing the
+            requests of a single "Submit Requests" operation.
+
+        Raises:
+
+          ValueError: The checkpoint file is for a different CPC.
+        """
+        self._cpc = cpc
+        self._config = dpm_configuration
+        self._adapter_mapping = dict(adapter_mapping or {})
+        self._checkpoint_file = checkpoint_file
+        self._batch_size = batch_size
+        self._threads = threads
+
+        # Mapping of URIs in the DPM configuration to URIs in the target CPC
+        self._uri_map = {}
+
+        # Keys of the completed actions
+        self._completed = set()
+
+        # Resources that were not applied in the current run
+        self._failures = []
+
+        if checkpoint_file and os.path.exists(checkpoint_file):
+            self._load_checkpoint()
+
+    def __repr__(self):
+        """
+        Return a string with the state of this importer, for debug purposes.
+        """
+        ret = (
+            f"{repr_obj_id(self)} (\n"
+            f"  _cpc = {self._cpc!r}\n"
+            f"  _checkpoint_file = {self._checkpoint_file!r}\n"
+            f"  _batch_size = {self._batch_size!r}\n"
+            f"  _threads = {self._threads!r}\n"
+            f"  len(_uri_map) = {len(self._uri_map)}\n"
+            f"  len(_completed) = {len(self._completed)}\n"
+            ")")
+        return ret
+
+    @property
+    def cpc(self):
+        """
+        :class:`~zhmcclient.Cpc`: The target CPC.
+        """
+        return self._cpc
+
+    @property
+    def uri_map(self):
+        """
+        dict: Mapping of URIs of resources in the DPM configuration to URIs
+        of the corresponding resources in the target CPC, for the resources
+        that have been imported or mapped so far.
+        """
+        return dict(self._uri_map)
+
+    @logged_api_call
+    def run(self, progress=None):
+        """
+        Import the DPM configuration into the target CPC.
+
+        The method can be called again after it failed (or after a new
+        importer has been created with the same checkpoint file), in which
+        case the import resumes and only the requests that have not been
+        completed yet are performed.
+
+        Parameters:
+
+          progress (callable): A function that is called after each batch,
+            with the following positional arguments:
+
+            * stage (string): The import stage.
+            * completed (int): Number of completed requests in the stage.
+            * total (int): Total number of requests in the stage.
+
+            `None` means no progress is reported.
+
+        Returns:
+
+          list or None:
+            If the complete DPM configuration has been applied to the CPC,
+            `None` is returned.
+
+            If only a part of the DPM configuration has been applied, a list
+            of dict objects is returned that describe the resources that were
+            not applied, with these items:
+
+            * 'stage' (string): The import stage.
+            * 'class' (string): Resource class of the resource.
+            * 'name' (string): Name of the resource.
+            * 'http-status' (int): HTTP status code of the failed request, or
+              `None` if no request was performed for the resource.
+            * 'reason' (int): HMC reason code of the failed request, or
+              `None`.
+            * 'message' (string): Message describing the failure.
+
+        Raises:
+
+          :exc:`~zhmcclient.HTTPError`
+          :exc:`~zhmcclient.ParseError`
+          :exc:`~zhmcclient.AuthError`
+          :exc:`~zhmcclient.ConnectionError`
+        """
+        self._failures = []
+        self._map_adapters()
+        for stage in IMPORT_STAGES:
+            if stage == 'virtual-switches':
+                self._map_virtual_switches()
+                continue
+            actions = self._stage_actions(stage)
+            self._run_stage(stage, actions, progress)
+        return self._failures or None
+
+    def _map_uri(self, uri):
+        """
+        Return the URI in the target CPC for a URI in the DPM configuration.
+
+        Raises:
+          _UnresolvedReference: The URI cannot be mapped.
+        """
+        try:
+            return self._uri_map[uri]
+        except KeyError:
+            pass
+        m = PORT_URI_PATTERN.match(uri)
+        if m and m.group(1) in self._uri_map:
+            new_uri = self._uri_map[m.group(1)] + m.group(2)
+            self._uri_map[uri] = new_uri
+            return new_uri
+        raise _UnresolvedReference(uri)
+
+    def _map_adapters(self):
+        """
+        Map the adapters in the DPM configuration to the existing adapters in
+        the target CPC by their adapter IDs.
+        """
+        adapters = self._cpc.adapters.list()
+        target_uris = {a.get_property('adapter-id'): a.uri for a in adapters}
+        for adapter in self._config.get('adapters', []):
+            uri = adapter['object-uri']
+            if uri in self._uri_map:
+                continue
+            adapter_id = adapter.get('adapter-id')
+            adapter_id = self._adapter_mapping.get(adapter_id, adapter_id)
+            if adapter_id is not None and adapter_id in target_uris:
+                self._uri_map[uri] = target_uris[adapter_id]
+
+    def _map_virtual_switches(self):
+        """
+        Map the virtual switches in the DPM configuration to the virtual
+        switches in the target CPC by their backing adapters and ports.
+        """
+        vswitches = self._cpc.virtual_switches.list(full_properties=True)
+        target_uris = {
+            (vs.get_property('backing-adapter-uri'), vs.get_property('port')):
+            vs.uri for vs in vswitches}
+        for vswitch in self._config.get('virtual-switches', []):
+            uri = vswitch['object-uri']
+            if uri in self._uri_map:
+                continue
+            try:
+                adapter_uri = self._map_uri(vswitch['backing-adapter-uri'])
+                self._uri_map[uri] = target_uris[
+                    (adapter_uri, vswitch.get('port'))]
+            except (_UnresolvedReference, KeyError):
+                self._failures.append({
+                    'stage': 'virtual-switches',
+                    'class': RC_VIRTUAL_SWITCH,
+                    'name': vswitch.get('name'),
+                    'http-status': None,
+                    'reason': None,
+                    'message': "No virtual switch for the backing adapter "
+                               "and port found in the target CPC",
+                })
+
+    @staticmethod
+    def _create_body(field, props):
+        """
+        Return the request body for creating a resource, from its properties
+        in the DPM configuration.
+        """
+        excluded = CREATE_EXCLUDED_PROPS[field]
+        body = {k: copy.deepcopy(v) for k, v in props.items()
+                if k not in excluded}
+        return body
+
+    @staticmethod
+    def _refs(field, props):
+        """
+        Return the reference properties of a resource in the DPM
+        configuration that are set.
+        """
+        return {k: props[k] for k in REFERENCE_PROPS.get(field, [])
+                if props.get(k) is not None}
+
+    def _stage_actions(self, stage):
+        # pylint: disable=too-many-locals,too-many-branches
+        """
+        Return the list of import actions for an import stage.
+        """
+        config = self._config
+        cpc_uri = self._cpc.uri
+        actions = []
+
+        if stage == 'capacity-groups':
+            for cg in config.get('capacity-groups', []):
+                actions.append(_ImportAction(
+                    key=f'create:{cg["element-uri"]}', stage=stage,
+                    res_class=RC_CAPACITY_GROUP, name=cg.get('name'),
+                    target=(None, f'{cpc_uri}/capacity-groups'),
+                    body=self._create_body('capacity-groups', cg),
+                    source_uri=cg['element-uri'],
+                    result_prop='element-uri'))
+
+        elif stage == 'partitions':
+            for part in config.get('partitions', []):
+                body = self._create_body('partitions', part)
+                if body.get('autogenerate-partition-id', True):
+                    body.pop('partition-id', None)
+                actions.append(_ImportAction(
+                    key=f'create:{part["object-uri"]}', stage=stage,
+                    res_class=RC_PARTITION, name=part.get('name'),
+                    target=(None, f'{cpc_uri}/partitions'), body=body,
+                    source_uri=part['object-uri'],
+                    result_prop='object-uri'))
+
+        elif stage == 'capacity-group-members':
+            for cg in config.get('capacity-groups', []):
+                cg_uri = cg['element-uri']
+                for part_uri in cg.get('partition-uris', []):
+                    actions.append(_ImportAction(
+                        key=f'add-partition:{cg_uri}:{part_uri}',
+                        stage=stage, res_class=RC_CAPACITY_GROUP,
+                        name=cg.get('name'),
+                        target=(cg_uri, '/operations/add-partition'),
+                        body={}, refs={'partition-uri': part_uri}))
+
+        elif stage == 'adapters':
+            for adapter in config.get('adapters', []):
+                uri = adapter['object-uri']
+                body = {k: adapter[k] for k in ('name', 'description')
+                        if k in adapter}
+                if uri not in self._uri_map and \
+                        adapter.get('type') == 'hipersockets':
+                    if 'maximum-transmission-unit-size' in adapter:
+                        body['maximum-transmission-unit-size'] = \
+                            adapter['maximum-transmission-unit-size']
+                    actions.append(_ImportAction(
+                        key=f'create:{uri}', stage=stage,
+                        res_class=RC_ADAPTER, name=adapter.get('name'),
+                        target=(None, f'{cpc_uri}/adapters'), body=body,
+                        source_uri=uri, result_prop='object-uri'))
+                else:
+                    # Adapters that are not found in the target CPC are
+                    # reported as unresolved when performing the action.
+                    actions.append(_ImportAction(
+                        key=f'update:{uri}', stage=stage,
+                        res_class=RC_ADAPTER, name=adapter.get('name'),
+                        target=(uri, ''), body=body))
+
+        elif stage == 'ports':
+            for field, res_class in (('network-ports', RC_NETWORK_PORT),
+                                     ('storage-ports', RC_STORAGE_PORT)):
+                for port in config.get(field, []):
+                    if 'description' not in port:
+                        continue
+                    uri = port['element-uri']
+                    actions.append(_ImportAction(
+                        key=f'update:{uri}', stage=stage,
+                        res_class=res_class, name=port.get('name'),
+                        target=(uri, ''),
+                        body={'description': port['description']}))
+
+        elif stage in ('nics', 'hbas', 'virtual-functions'):
+            res_class = {'nics': RC_NIC, 'hbas': RC_HBA,
+                         'virtual-functions': RC_VIRTUAL_FUNCTION}[stage]
+            for elem in config.get(stage, []):
+                actions.append(_ImportAction(
+                    key=f'create:{elem["element-uri"]}', stage=stage,
+                    res_class=res_class, name=elem.get('name'),
+                    target=(elem['parent'], f'/{stage}'),
+                    body=self._create_body(stage, elem),
+                    refs=self._refs(stage, elem),
+                    source_uri=elem['element-uri'],
+                    result_prop='element-uri'))
+
+        elif stage == 'storage-groups':
+            volumes_by_sg = {}
+            for volume in config.get('storage-volumes', []):
+                volumes_by_sg.setdefault(volume['parent'], []).append(volume)
+            for sg in config.get('storage-groups', []):
+                uri = sg['object-uri']
+                volumes = volumes_by_sg.get(uri, [])
+                body = self._create_body('storage-groups', sg)
+                body['cpc-uri'] = cpc_uri
+                if volumes:
+                    body['storage-volumes'] = []
+                    for volume in volumes:
+                        vol_body = self._create_body(
+                            'storage-volumes', volume)
+                        vol_body['operation'] = 'create'
+                        body['storage-volumes'].append(vol_body)
+                actions.append(_ImportAction(
+                    key=f'create:{uri}', stage=stage,
+                    res_class=RC_STORAGE_GROUP, name=sg.get('name'),
+                    target=(None, '/api/storage-groups'), body=body,
+                    refs=self._refs(stage, sg), source_uri=uri,
+                    result_prop='object-uri',
+                    element_uris=[v['element-uri'] for v in volumes]))
+
+        elif stage == 'storage-group-attachments':
+            for part in config.get('partitions', []):
+                part_uri = part['object-uri']
+                for sg_uri in part.get('storage-group-uris', []):
+                    actions.append(_ImportAction(
+                        key=f'attach:{part_uri}:{sg_uri}', stage=stage,
+                        res_class=RC_PARTITION, name=part.get('name'),
+                        target=(part_uri, '/operations/attach-storage-group'),
+                        body={}, refs={'storage-group-uri': sg_uri}))
+
+        return actions
+
+    def _request(self, action, req_id):
+        """
+        Return the request for an import action in a "Submit Requests"
+        operation.
+
+        Raises:
+          _UnresolvedReference: A URI in the action cannot be mapped.
+        """
+        ref_uri, suffix = action.target
+        uri = suffix if ref_uri is None else self._map_uri(ref_uri) + suffix
+        body = dict(action.body)
+        for prop, value in action.refs.items():
+            if isinstance(value, list):
+                body[prop] = [self._map_uri(v) for v in value]
+            else:
+                body[prop] = self._map_uri(value)
+        req = {
+            'method': 'POST',
+            'uri': uri,
+            'body': body,
+            'id': req_id,
+        }
+        return req
+
+    def _add_failure(self, action, message, result=None):
+        """
+        Add a failure for an import action.
+        """
+        result = result or {}
+        self._failures.append({
+            'stage': action.stage,
+            'class': action.res_class,
+            'name': action.name,
+            'http-status': result.get('http-status'),
+            'reason': result.get('reason'),
+            'message': result.get('message', message),
+        })
+
+    def _run_stage(self, stage, actions, progress):
+        """
+        Perform the import actions of an import stage in batches.
+        """
+        total = len(actions)
+        completed = 0
+        batch = []  # list of tuple(action, request)
+        batch_len = BULK_OVHD
+        for action in actions:
+            if action.key in self._completed:
+                completed += 1
+                continue
+            try:
+                req = self._request(action, str(len(batch)))
+            except _UnresolvedReference as exc:
+                self._add_failure(
+                    action, f"Referenced resource {exc.uri} has not been "
+                    "imported or mapped to the target CPC")
+                continue
+            req_len = BULK_OVHD_PER_REQ + len(json.dumps(req['body']))
+            if batch and (len(batch) >= self._batch_size or
+                          batch_len + req_len > BULK_MAX_SIZE):
+                completed += self._submit(batch)
+                if progress:
+                    progress(stage, completed, total)
+                batch = []
+                batch_len = BULK_OVHD
+                req['id'] = '0'
+            batch.append((action, req))
+            batch_len += req_len
+        if batch:
+            completed += self._submit(batch)
+            if progress:
+                progress(stage, completed, total)
+
+    def _submit(self, batch):
+        """
+        Perform a batch of import actions in a "Submit Requests" operation,
+        update the URI mapping and the checkpoint, and return the number of
+        successfully completed actions.
+        """
+        actions_by_id = {req['id']: action for action, req in batch}
+        body = {
+            'requests': [req for _, req in batch],
+            'threads': min(self._threads, len(batch)),
+        }
+        result = self._cpc.manager.session.post(SUBMIT_REQUESTS_URI, body=body)
+        completed = 0
+        for res in result:
+            action = actions_by_id[res['id']]
+            res_body = res.get('body') or {}
+            if not 200 <= res['status'] < 300:
+                self._add_failure(action, "Request failed", res_body)
+                continue
+            if action.source_uri and action.result_prop:
+                self._uri_map[action.source_uri] = \
+                    res_body[action.result_prop]
+            if action.element_uris:
+                for src_uri, new_uri in zip(
+                        action.element_uris,
+                        res_body.get('element-uris', [])):
+                    self._uri_map[src_uri] = new_uri
+            self._completed.add(action.key)
+            completed += 1
+        if self._checkpoint_file:
+            self._save_checkpoint()
+        return completed
+
+    def _load_checkpoint(self):
+        """
+        Load the import state from the checkpoint file.
+        """
+        with open(self._checkpoint_file, encoding='utf-8') as fp:
+            checkpoint = json.load(fp)
+        if checkpoint.get('cpc-uri') != self._cpc.uri:
+            raise ValueError(
+                f"Checkpoint file {self._checkpoint_file} is for CPC "
+                f"{checkpoint.get('cpc-uri')}, not for CPC {self._cpc.uri}")
+        self._uri_map = dict(checkpoint.get('uri-map', {}))
+        self._completed = set(checkpoint.get('completed', []))
+
+    def _save_checkpoint(self):
+        """
+        Save the import state in the checkpoint file.
+
+        The checkpoint file is replaced atomically, so that an interrupted
+        import always leaves a consistent checkpoint file.
+        """
+        checkpoint = {
+            'cpc-uri': self._cpc.uri,
+            'uri-map': self._uri_map,
+            'completed': sorted(self._completed),
+        }
+        tmp_file = self._checkpoint_file + '.tmp'
+        with open(tmp_file, 'w', encoding='utf-8') as fp:
+            json.dump(checkpoint, fp)
+        os.replace(tmp_file, self._checkpoint_file)
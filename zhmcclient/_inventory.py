@@ -0,0 +1,445 @@
+# Copyright 2026 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+An :class:`~zhmcclient.InventoryIndex` is a local in-memory index of the
+resources returned by the "Get Inventory" HMC operation.
+
+The index is built once from the flat resource list returned by
+:meth:`~zhmcclient.Client.get_inventory` and supports looking up resources
+by resource class, URI, parent URI and name without any further interaction
+with the HMC. The indexed resources can be materialized as zhmcclient resource
+objects that have their properties prefilled from the inventory data.
+"""
+
+import time
+
+from ._utils import RC_ADAPTER, RC_CAPACITY_GROUP, RC_HBA, RC_NIC, \
+    RC_PARTITION, RC_NETWORK_PORT, RC_STORAGE_PORT, RC_STORAGE_TEMPLATE, \
+    RC_STORAGE_GROUP, RC_STORAGE_TEMPLATE_VOLUME, RC_STORAGE_VOLUME, \
+    RC_VIRTUAL_FUNCTION, RC_VIRTUAL_STORAGE_RESOURCE, RC_VIRTUAL_SWITCH, \
+    RC_VIRTUAL_TAPE_RESOURCE, RC_TAPE_LINK, RC_TAPE_LIBRARY, \
+    RC_PARTITION_LINK, RC_CERTIFICATE, RC_RESET_ACTIVATION_PROFILE, \
+    RC_IMAGE_ACTIVATION_PROFILE, RC_LOAD_ACTIVATION_PROFILE, \
+    RC_LOGICAL_PARTITION, RC_CONSOLE, RC_CPC, RC_PASSWORD_RULE, RC_TASK, \
+    RC_USER_PATTERN, RC_USER_ROLE, RC_USER, RC_GROUP, \
+    RC_LDAP_SERVER_DEFINITION, RC_SSO_SERVER_DEFINITION, \
+    RC_MFA_SERVER_DEFINITION, repr_obj_id
+
+__all__ = ['InventoryIndex']
+
+# Resource class of the 'class' property of inventory error items
+INVENTORY_ERROR_CLASS = 'inventory-error'
+
+# Manager objects for the resource classes that can be materialized, as:
+#   key: resource class
+#   value: tuple(parent_class, manager_attr), where:
+#     parent_class: Resource class of the parent resource that has the manager
+#       object, or `None` for the client.
+#     manager_attr: Name of the attribute of the parent resource object (or
+#       client) that is the manager object for the resource class.
+MANAGER_FROM_CLASS = {
+    RC_CPC: (None, 'cpcs'),
+    RC_CONSOLE: (None, 'consoles'),
+    RC_PARTITION: (RC_CPC, 'partitions'),
+    RC_ADAPTER: (RC_CPC, 'adapters'),
+    RC_VIRTUAL_SWITCH: (RC_CPC, 'virtual_switches'),
+    RC_CAPACITY_GROUP: (RC_CPC, 'capacity_groups'),
+    RC_LOGICAL_PARTITION: (RC_CPC, 'lpars'),
+    RC_RESET_ACTIVATION_PROFILE: (RC_CPC, 'reset_activation_profiles'),
+    RC_IMAGE_ACTIVATION_PROFILE: (RC_CPC, 'image_activation_profiles'),
+    RC_LOAD_ACTIVATION_PROFILE: (RC_CPC, 'load_activation_profiles'),
+    RC_NIC: (RC_PARTITION, 'nics'),
+    RC_HBA: (RC_PARTITION, 'hbas'),
+    RC_VIRTUAL_FUNCTION: (RC_PARTITION, 'virtual_functions'),
+    RC_NETWORK_PORT: (RC_ADAPTER, 'ports'),
+    RC_STORAGE_PORT: (RC_ADAPTER, 'ports'),
+    RC_STORAGE_GROUP: (RC_CONSOLE, 'storage_groups'),
+    RC_STORAGE_VOLUME: (RC_STORAGE_GROUP, 'storage_volumes'),
+    RC_VIRTUAL_STORAGE_RESOURCE:
+        (RC_STORAGE_GROUP, 'virtual_storage_resources'),
+    RC_STORAGE_TEMPLATE: (RC_CONSOLE, 'storage_group_templates'),
+    RC_STORAGE_TEMPLATE_VOLUME:
+        (RC_STORAGE_TEMPLATE, 'storage_volume_templates'),
+    RC_TAPE_LINK: (RC_CONSOLE, 'tape_links'),
+    RC_TAPE_LIBRARY: (RC_CONSOLE, 'tape_library'),
+    RC_VIRTUAL_TAPE_RESOURCE: (RC_TAPE_LINK, 'virtual_tape_resources'),
+    RC_PARTITION_LINK: (RC_CONSOLE, 'partition_links'),
+    RC_CERTIFICATE: (RC_CONSOLE, 'certificates'),
+    RC_USER: (RC_CONSOLE, 'users'),
+    RC_USER_ROLE: (RC_CONSOLE, 'user_roles'),
+    RC_USER_PATTERN: (RC_CONSOLE, 'user_patterns'),
+    RC_PASSWORD_RULE: (RC_CONSOLE, 'password_rules'),
+    RC_TASK: (RC_CONSOLE, 'tasks'),
+    RC_GROUP: (RC_CONSOLE, 'groups'),
+    RC_LDAP_SERVER_DEFINITION: (RC_CONSOLE, 'ldap_server_definitions'),
+    RC_MFA_SERVER_DEFINITION: (RC_CONSOLE, 'mfa_server_definitions'),
+    RC_SSO_SERVER_DEFINITION: (RC_CONSOLE, 'sso_server_definitions'),
+}
+
+
+def inventory_item_uri(item):
+    """
+    Return the canonical URI of a resource item in an inventory list.
+
+    For element resources, that is the 'element-uri' property, and for object
+    resources, that is the 'object-uri' property. `None` is returned if the
+    item has neither of the two properties (e.g. for inventory error items).
+    """
+    uri = item.get('element-uri')
+    if uri is None:
+        uri = item.get('object-uri')
+    return uri
+
+
+class InventoryIndex:
+    """
+    A local in-memory index of the resources returned by the "Get Inventory"
+    HMC operation.
+
+    The index is built in a single pass over the inventory list and maintains
+    hash indexes by resource class, resource URI, parent URI and resource name.
+    All lookups on the index are performed locally, without any interaction
+    with the HMC.
+
+    Resources in the index are represented as the property dictionaries from
+    the inventory list. The :meth:`resource` and :meth:`resources` methods
+    materialize them as zhmcclient resource objects (e.g.
+    :class:`~zhmcclient.Partition`) whose properties are prefilled from the
+    inventory data and that have
+    :attr:`~zhmcclient.BaseResource.full_properties` set. Materialized resource
+    objects are cached in the index, so the same URI always results in the same
+    resource object.
+
+    Items in the inventory list that describe errors (i.e. with a 'class'
+    property of 'inventory-error') are not indexed, but are available via the
+    :attr:`errors` property.
+
+    Objects of this class are usually created using
+    :meth:`~zhmcclient.Client.get_inventory_index`, which performs the "Get
+    Inventory" HMC operation and builds the index from its result.
+
+    Example::
+
+        index = client.get_inventory_index(['dpm-resources'])
+        for partition in index.resources('partition'):
+            nics = index.children(partition.uri, 'nic')
+            print(partition.name, partition.get_property('status'), len(nics))
+
+    HMC/SE version requirements: None
+    """
+
+    def __init__(self, client, inventory_list):
+        """
+        Parameters:
+
+          client (:class:`~zhmcclient.Client`):
+            Client that is used as the root for materializing zhmcclient
+            resource objects.
+
+          inventory_list (list of dict):
+            The inventory list, as returned by
+            :meth:`~zhmcclient.Client.get_inventory`.
+        """
+        self._client = client
+        self._timestamp = int(time.time())
+
+        # The indexes, as:
+        # _by_uri: key: resource URI, value: resource properties
+        # _by_class: key: resource class, value: list of resource properties
+        # _by_parent: key: parent URI, value: list of resource properties
+        # _by_name: key: tuple(class, name), value: list of resource properties
+        self._by_uri = {}
+        self._by_class = {}
+        self._by_parent = {}
+        self._by_name = {}
+        self._errors = []
+
+        # Materialized zhmcclient resource objects, as:
+        # key: resource URI, value: resource object
+        self._resource_objs = {}
+
+        for item in inventory_list:
+            res_class = item.get('class')
+            if res_class == INVENTORY_ERROR_CLASS:
+                self._errors.append(item)
+                continue
+            uri = inventory_item_uri(item)
+            if uri is None:
+                continue
+            self._by_uri[uri] = item
+            self._by_class.setdefault(res_class, []).append(item)
+            parent_uri = item.get('parent')
+            if parent_uri is not None:
+                self._by_parent.setdefault(parent_uri, []).append(item)
+            name = item.get('name')
+            if name is not None:
+                self._by_name.setdefault((res_class, name), []).append(item)
+
+    def __repr__(self):
+        """
+        Return a string with the state of this inventory index, for debug
+        purposes.
+        """
+        ret = (
+            f"{repr_obj_id(self)} (\n"
+            f"  _client={repr_obj_id(self._client)},\n"
+            f"  _timestamp={self._timestamp!r},\n"
+            f"  _by_class(counts)="
+            f"{ {k: len(v) for k, v in self._by_class.items()}!r},\n"
+            f"  _errors(count)={len(self._errors)!r},\n"
+            f"  _resource_objs(count)={len(self._resource_objs)!r}\n"
+            ")")
+        return ret
+
+    def __len__(self):
+        """
+        Return the number of resources in the index.
+        """
+        return len(self._by_uri)
+
+    def __contains__(self, uri):
+        """
+        Return a boolean indicating whether the resource with the specified
+        URI is in the index.
+        """
+        return uri in self._by_uri
+
+    @property
+    def client(self):
+        """
+        :class:`~zhmcclient.Client`: The client that is used as the root for
+        materializing zhmcclient resource objects.
+        """
+        return self._client
+
+    @property
+    def timestamp(self):
+        """
+        The point in time when the index was built, as Unix time (an integer
+        that is the number of seconds since the Unix epoch).
+        """
+        return self._timestamp
+
+    @property
+    def errors(self):
+        """
+        list of dict: The error items from the inventory list (i.e. with a
+        'class' property of 'inventory-error').
+        """
+        return list(self._errors)
+
+    @property
+    def classes(self):
+        """
+        list of string: The resource classes of the resources in the index.
+        """
+        return list(self._by_class.keys())
+
+    def get(self, uri, default=None):
+        """
+        Return the properties of the resource with the specified URI.
+
+        Parameters:
+
+          uri (:term:`string`): Canonical URI of the resource.
+
+          default: Value to be returned if the resource is not in the index.
+
+        Returns:
+
+          dict: The resource properties from the inventory list, or the
+          specified default if the resource is not in the index.
+        """
+        return self._by_uri.get(uri, default)
+
+    def by_class(self, res_class, parent=None):
+        """
+        Return the properties of the resources of a resource class, optionally
+        limited to the children of a parent resource.
+
+        Parameters:
+
+          res_class (:term:`string`): Resource class (e.g. 'partition').
+
+          parent (:term:`string`): URI of the parent resource, or `None` for
+            no restriction on the parent.
+
+        Returns:
+
+          list of dict: The resource properties from the inventory list.
+        """
+        if parent is not None:
+            return self.children(parent, res_class)
+        return list(self._by_class.get(res_class, []))
+
+    def children(self, parent, res_class=None):
+        """
+        Return the properties of the child resources of a parent resource, as
+        indicated by their 'parent' property.
+
+        Parameters:
+
+          parent (:term:`string`): URI of the parent resource.
+
+          res_class (:term:`string`): Resource class of the child resources,
+            or `None` for child resources of any resource class.
+
+        Returns:
+
+          list of dict: The resource properties from the inventory list.
+        """
+        items = self._by_parent.get(parent, [])
+        if res_class is None:
+            return list(items)
+        return [item for item in items if item['class'] == res_class]
+
+    def by_name(self, res_class, name, parent=None):
+        """
+        Return the properties of the resources of a resource class with a
+        particular name, optionally limited to the children of a parent
+        resource.
+
+        Resource names are unique only within their parent resource, so the
+        result may contain more than one resource if no parent is specified.
+
+        Parameters:
+
+          res_class (:term:`string`): Resource class (e.g. 'partition').
+
+          name (:term:`string`): Resource name. The name is matched with
+            case sensitive string comparison.
+
+          parent (:term:`string`): URI of the parent resource, or `None` for
+            no restriction on the parent.
+
+        Returns:
+
+          list of dict: The resource properties from the inventory list.
+        """
+        items = self._by_name.get((res_class, name), [])
+        if parent is None:
+            return list(items)
+        return [item for item in items if item.get('parent') == parent]
+
+    def resource(self, uri):
+        """
+        Return the zhmcclient resource object for the resource with the
+        specified URI.
+
+        The resource object has its properties prefilled from the inventory
+        data and has :attr:`~zhmcclient.BaseResource.full_properties` set.
+        Its parent resource objects are materialized from the index as well,
+        if they are in the index.
+
+        Materialized resource objects are cached in the index, so repeated
+        calls for the same URI return the same resource object.
+
+        Parameters:
+
+          uri (:term:`string`): Canonical URI of the resource.
+
+        Returns:
+
+          :class:`~zhmcclient.BaseResource`: The resource object.
+
+        Raises:
+
+          KeyError: The resource is not in the index, or its resource class
+            is not supported for materialization, or its parent resource
+            cannot be determined.
+        """
+        try:
+            return self._resource_objs[uri]
+        except KeyError:
+            pass
+
+        props = self._by_uri[uri]
+        manager = self._manager_for(props)
+
+        # pylint: disable=protected-access
+        resource_obj = manager.resource_class(
+            manager=manager,
+            uri=uri,
+            name=props.get(manager._name_prop, None),
+            properties=props)
+        resource_obj._full_properties = True
+        resource_obj._properties_timestamp = self._timestamp
+        # pylint: enable=protected-access
+
+        self._resource_objs[uri] = resource_obj
+        return resource_obj
+
+    def resources(self, res_class, parent=None):
+        """
+        Return the zhmcclient resource objects for the resources of a resource
+        class, optionally limited to the children of a parent resource.
+
+        See :meth:`resource` for details about the returned resource objects.
+
+        Parameters:
+
+          res_class (:term:`string`): Resource class (e.g. 'partition').
+
+          parent (:term:`string`): URI of the parent resource, or `None` for
+            no restriction on the parent.
+
+        Returns:
+
+          list of :class:`~zhmcclient.BaseResource`: The resource objects.
+
+        Raises:
+
+          KeyError: The resource class is not supported for materialization,
+            or the parent resource of a resource cannot be determined.
+        """
+        return [self.resource(inventory_item_uri(item))
+                for item in self.by_class(res_class, parent)]
+
+    def _manager_for(self, props):
+        """
+        Return the zhmcclient manager object for a resource in the index.
+
+        Raises:
+          KeyError: Manager cannot be determined.
+        """
+        res_class = props['class']
+        try:
+            parent_class, manager_attr = MANAGER_FROM_CLASS[res_class]
+        except KeyError:
+            new_exc = KeyError(
+                f"Resource class {res_class!r} is not supported for "
+                "materializing resource objects from the inventory index")
+            new_exc.__cause__ = None
+            raise new_exc  # KeyError
+
+        if parent_class is None:
+            parent_obj = self._client
+        elif parent_class == RC_CONSOLE:
+            parent_obj = self._client.consoles.console
+        else:
+            parent_uri = props.get('parent')
+            if parent_uri in self._by_uri:
+                parent_obj = self.resource(parent_uri)
+            elif parent_class == RC_CPC and parent_uri:
+                parent_obj = self._client.cpcs.resource_object(parent_uri)
+            else:
+                new_exc = KeyError(
+                    f"Parent resource {parent_uri!r} of resource "
+                    f"{inventory_item_uri(props)!r} is not in the inventory "
+                    "index")
+                new_exc.__cause__ = None
+                raise new_exc  # KeyError
+
+        return getattr(parent_obj, manager_attr)
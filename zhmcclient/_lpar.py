@@ -157,6 +157,72 @@ class LparManager(BaseManager):
         return self._list_with_operation(
             list_uri, result_prop, full_properties, filter_args, None)
 
+    def _pull_statuses(self, resources):
+        """
+        Retrieve the status of LPARs from the HMC with one List operation.
+        """
+        self._pull_statuses_with_list(
+            resources, f'{self.cpc.uri}/logical-partitions',
+            'logical-partitions')
+
+    @logged_api_call
+    def wait_for_statuses(self, statuses, status_timeout=None,
+                          use_notifications=False):
+        """
+        Wait until the status of multiple LPARs of this CPC has reached a
+        desired value.
+
+        By default, the status of the LPARs is polled by performing one
+        List operation every second for all LPARs that have not yet reached
+        their desired status.
+
+        If `use_notifications` is `True`, the method waits for status change
+        notifications from the HMC instead, so that it returns as soon as the
+        status has been reached. For this, the LPARs are enabled for
+        :ref:`auto-updating` (if not yet enabled) for the duration of the
+        wait. To protect against lost notifications, the status is retrieved
+        from the HMC if no status change notification has been received for
+        :data:`~zhmcclient._constants.STATUS_FALLBACK_POLL_INTERVAL` seconds.
+
+        HMC/SE version requirements: None
+
+        Parameters:
+
+          statuses (dict):
+            The LPARs to wait for, with key: :class:`~zhmcclient.Lpar`
+            object of this CPC, value: desired status or iterable of desired
+            status values (see the `status` parameter of
+            :meth:`~zhmcclient.Lpar.wait_for_status`).
+
+          status_timeout (:term:`number`):
+            Timeout in seconds, for waiting that the status of all LPARs
+            has reached one of their desired status values. The special value
+            0 means that no timeout is set.
+            `None` means that the default status timeout will be used.
+            If the timeout expires, a :exc:`~zhmcclient.StatusTimeout` is
+            raised.
+
+          use_notifications (bool):
+            Wait for status change notifications from the HMC instead of
+            polling the status.
+
+        Raises:
+
+          :exc:`~zhmcclient.HTTPError`
+          :exc:`~zhmcclient.ParseError`
+          :exc:`~zhmcclient.AuthError`
+          :exc:`~zhmcclient.ConnectionError`
+          :exc:`~zhmcclient.StatusTimeout`: The status timeout expired while
+            waiting for the desired LPAR statuses. The exception has the
+            current status and the desired statuses of the first LPAR that
+            has not reached its desired status.
+          :exc:`~zhmcclient.CeasedExistence`: One of the LPARs ceased to
+            exist while waiting.
+        """
+        self._wait_for_statuses(
+            statuses, status_timeout=status_timeout,
+            use_notifications=use_notifications)
+
 
 class Lpar(BaseResource):
     """
@@ -2079,7 +2145,8 @@ class Lpar(BaseResource):
         return result
 
     @logged_api_call
-    def wait_for_status(self, status, status_timeout=None):
+    def wait_for_status(self, status, status_timeout=None,
+                        use_notifications=False):
         """
         Wait until the status of this LPAR has a desired value.
 
@@ -2111,6 +2178,11 @@ class Lpar(BaseResource):
             If the timeout expires , a :exc:`~zhmcclient.StatusTimeout` is
             raised.
 
+          use_notifications (bool):
+            Wait for status change notifications from the HMC instead of
+            polling the status. For details, see
+            :meth:`~zhmcclient.LparManager.wait_for_statuses`.
+
         Raises:
 
           :exc:`~zhmcclient.HTTPError`
@@ -2119,7 +2191,14 @@ class Lpar(BaseResource):
           :exc:`~zhmcclient.ConnectionError`
           :exc:`~zhmcclient.StatusTimeout`: The timeout expired while
             waiting for the desired LPAR status.
+          :exc:`~zhmcclient.CeasedExistence`: The LPAR ceased to exist while
+            waiting (only with `use_notifications`).
         """
+        if use_notifications:
+            self.manager.wait_for_statuses(
+                {self: status}, status_timeout=status_timeout,
+                use_notifications=True)
+            return
         if status_timeout is None:
             status_timeout = \
                 self.manager.session.retry_timeout_config.status_timeout
@@ -34,9 +34,11 @@ import threading
 from nocasedict import NocaseDict
 
 from ._logging import logged_api_call
-from ._exceptions import NotFound, NoUniqueMatch, HTTPError
+from ._exceptions import Error, NotFound, NoUniqueMatch, HTTPError, \
+    StatusTimeout, CeasedExistence
+from ._constants import STATUS_FALLBACK_POLL_INTERVAL
 from ._utils import repr_list, matches_filters, divide_filter_args, \
-    make_query_str, RC_LOGICAL_PARTITION, repr_obj_id
+    make_query_str, RC_LOGICAL_PARTITION, repr_obj_id, invoke_callbacks
 
 __all__ = ['BaseManager']
 
@@ -220,6 +222,18 @@ class _ResourceList:
         self._resources = {}  # key: resource URI, value: resource obj
         self._needs_pull = True  # list() method needs to pull from HMC
         self._enabled = False  # Auto-updating of manager is enabled
+        # URIs of resources that have been added on the HMC and that still
+        # need to be pulled from the HMC, in the order of their notifications
+        self._added_uris = {}  # key: resource URI, value: None
+        # Generation counter that is increased by each removal of a resource
+        # and by each trigger for pulling all resources. It allows to detect
+        # whether added resources pulled from the HMC are outdated.
+        self._generation = 0
+        self._pull_generation = 0  # generation of last pull trigger
+        # Number of pulls of added resources in progress, and the generation
+        # of the resources removed during them
+        self._added_pulls = 0
+        self._removed_uris = {}  # key: resource URI, value: generation
 
     def __repr__(self):
         """
@@ -229,6 +243,7 @@ class _ResourceList:
             f"{repr_obj_id(self)} (\n"
             f"  _enabled={self._enabled!r},\n"
             f"  _resources(keys)={list(self._resources.keys())!r}\n"
+            f"  _added_uris={list(self._added_uris)!r}\n"
             ")")
         return ret
 
@@ -281,6 +296,7 @@ class _ResourceList:
                 self._resources = {}
                 for res_obj in resource_list:
                     self._resources[res_obj.uri] = res_obj
+                self._added_uris = {}
                 self._needs_pull = False
                 self._enabled = True
 
@@ -301,8 +317,11 @@ class _ResourceList:
                 session.unsubscribe_auto_update()
             with self._lock:
                 self._resources = {}
+                self._added_uris = {}
                 self._needs_pull = True
                 self._enabled = False
+                self._generation += 1
+                self._pull_generation = self._generation
 
     def list(self):
         """
@@ -335,6 +354,9 @@ class _ResourceList:
         with self._lock:
             for res_obj in resource_obj_list:
                 self._resources[res_obj.uri] = res_obj
+            if self._needs_pull:
+                # The pull of all resources included the added resources
+                self._added_uris = {}
             self._needs_pull = False
 
     def trigger_pull(self):
@@ -347,7 +369,81 @@ class _ResourceList:
         by the user.
         """
         with self._lock:
+            # The pull of all resources includes the added resources
+            self._added_uris = {}
             self._needs_pull = True
+            self._generation += 1
+            self._pull_generation = self._generation
+
+    def add_uri(self, resource_uri):
+        """
+        Record the URI of a resource that has been added on the HMC, so that
+        the resource is pulled from the HMC upon the next list() call of the
+        manager object.
+
+        If the resource URI is already in this list of resources, do nothing.
+
+        This method is called when an inventory change notification indicates
+        that a new object on the HMC has been created. It should not be called
+        by the user.
+        """
+        with self._lock:
+            if resource_uri not in self._resources:
+                self._added_uris[resource_uri] = None
+
+    def take_added_uris(self):
+        """
+        Return the URIs of the resources that have been added on the HMC and
+        that still need to be pulled from the HMC, and reset them.
+
+        If URIs are returned, the pull of the added resources is in progress
+        until add_pulled() is called with the returned generation.
+
+        This method is called in list(). It should not be called by the user.
+
+        Returns:
+          tuple(list of URIs, generation)
+        """
+        with self._lock:
+            uri_list = [uri for uri in self._added_uris
+                        if uri not in self._resources]
+            self._added_uris = {}
+            if uri_list:
+                self._added_pulls += 1
+            return uri_list, self._generation
+
+    def add_pulled(self, resource_obj_list, generation):
+        """
+        Add the resource objects for added resources that have been pulled
+        from the HMC to this list of resources, and end the pull that has
+        been started with take_added_uris().
+
+        In contrast to add_list(), this does not change whether this list of
+        resources needs to be pulled from the HMC, because the pull of the
+        added resources is performed without holding the lock. Resources that
+        have been removed since take_added_uris() are not added, and no
+        resources are added if pulling all resources has been triggered since
+        then.
+
+        This method is called in list(). It should not be called by the user.
+
+        Returns:
+          list of BaseResource: The resource objects that have been added.
+        """
+        added_list = []
+        with self._lock:
+            if self._pull_generation <= generation:
+                for res_obj in resource_obj_list:
+                    uri = res_obj.uri
+                    if uri in self._resources or \
+                            self._removed_uris.get(uri, 0) > generation:
+                        continue
+                    self._resources[uri] = res_obj
+                    added_list.append(res_obj)
+            self._added_pulls -= 1
+            if not self._added_pulls:
+                self._removed_uris = {}
+        return added_list
 
     def remove(self, resource_uri):
         """
@@ -358,12 +454,16 @@ class _ResourceList:
         This method is called when an inventory change notification indicates
         that an object on the HMC has been deleted. It should not be called
         by the user.
+
+        Returns:
+          BaseResource: The removed resource object, or `None`.
         """
         with self._lock:
-            try:
-                del self._resources[resource_uri]
-            except KeyError:
-                pass
+            self._added_uris.pop(resource_uri, None)
+            self._generation += 1
+            if self._added_pulls:
+                self._removed_uris[resource_uri] = self._generation
+            return self._resources.pop(resource_uri, None)
 
 
 class BaseManager:
@@ -467,6 +567,9 @@ class BaseManager:
         self._supports_properties = supports_properties
 
         self._resource_list = _ResourceList(self)
+        # Callbacks for resources added or removed by auto-updating
+        self._added_callbacks = []
+        self._removed_callbacks = []
         self._name_uri_cache = _NameUriCache(
             self, session.retry_timeout_config.name_uri_cache_timetolive,
             case_insensitive_names)
@@ -753,6 +856,9 @@ class BaseManager:
           :exc:`~zhmcclient.FilterConversionError`
         """
         resource_obj_list = []
+        if self.auto_update_enabled() and not self.auto_update_needs_pull():
+            # A pull of all resources would include the added resources
+            self._pull_added_resources()
         if self.auto_update_enabled() and not self.auto_update_needs_pull():
             for resource_obj in self.list_resources_local():
                 if matches_filters(resource_obj, filter_args):
@@ -844,77 +950,174 @@ class BaseManager:
         if not props_list:
             return []
 
+        uris = [props[self._uri_prop] for props in props_list]
+        resource_obj_list = []
+        for index, status, body in self._bulk_get(uris):
+            props = props_list[index]
+
+            # We first use the properties from the props_list parameter,
+            # and then update that with the properties returned from the
+            # HMC:
+            resource_props = dict(props)
+            resource_props.update(body)
+
+            if status != 200:
+                # Similar to the non-full case: The first
+                # error raises an exception.
+                raise HTTPError(resource_props)
+
+            resource_obj = self._resource_object_full(
+                props[self._uri_prop], resource_props)
+
+            if matches_filters(resource_obj, client_filters):
+                resource_obj_list.append(resource_obj)
+
+        return resource_obj_list
+
+    def _resource_object_full(self, uri, props):
+        """
+        Return a resource object for this manager that has the full set of
+        resource properties, from the properties retrieved from the HMC.
+        """
+        resource_obj = self.resource_class(
+            manager=self,
+            uri=uri,
+            name=props.get(self._name_prop, None),
+            properties=props)
+
+        # pylint: disable=protected-access
+        with resource_obj._property_lock:
+            resource_obj._properties = dict(props)
+            resource_obj._properties_timestamp = int(time.time())
+            resource_obj._full_properties = True
+        # pylint: enable=protected-access
+
+        return resource_obj
+
+    def _pull_added_resources(self):
+        """
+        Pull the resources that have been added on the HMC since the last
+        list() call from the HMC, and add them to the local auto-updated list
+        of resources.
+
+        The resources are retrieved with their full set of properties using a
+        single bulk operation "Submit Requests", so that a burst of inventory
+        change notifications for added resources (e.g. when many partitions
+        are created) results in a single HMC operation instead of a full
+        re-list for each added resource.
+
+        Resources that no longer exist on the HMC are ignored. If the
+        resources cannot be retrieved that way, the need to pull all resources
+        is triggered instead.
+
+        This method is called in list(). It should not be called by the user.
+        """
+        uris, generation = self._resource_list.take_added_uris()
+        if not uris:
+            return
+
+        resource_obj_list = []
+        try:
+            try:
+                results = self._bulk_get(uris)
+            except Error:
+                self.auto_update_trigger_pull()
+                return
+
+            for index, status, body in results:
+                if status == 404:
+                    # The resource has been deleted again in the meantime
+                    continue
+                if status != 200:
+                    self.auto_update_trigger_pull()
+                    return
+                resource_obj_list.append(
+                    self._resource_object_full(uris[index], body))
+        finally:
+            # Resources that have been removed or a pull of all resources
+            # that has been triggered in the meantime (e.g. by another thread
+            # that pulled added resources) take precedence.
+            resource_obj_list = self._resource_list.add_pulled(
+                resource_obj_list, generation)
+
+        added_callbacks = list(self._added_callbacks)
+        for resource_obj in resource_obj_list:
+            invoke_callbacks(added_callbacks, self, resource_obj)
+
+    def _bulk_get(self, uris):
+        """
+        Perform "Get Properties" requests for a list of resource URIs using
+        the bulk operation "Submit Requests".
+
+        The maximum for the request content is checked and exceeding it results
+        in multiple bulk operations that are performed one after another.
+
+        Parameters:
+
+          uris (list of string): The resource URIs. Must not be empty.
+
+        Returns:
+
+          list of tuple(index, status, body): The results of the requests, in
+          the order returned by the HMC, with:
+
+          - index (int): Index of the resource URI in the `uris` parameter.
+          - status (int): HTTP status code of the request.
+          - body (dict): Response body of the request. For failed requests,
+            this is the error information.
+
+        Raises:
+
+          :exc:`~zhmcclient.HTTPError`
+          :exc:`~zhmcclient.ParseError`
+          :exc:`~zhmcclient.AuthError`
+          :exc:`~zhmcclient.ConnectionError`
+        """
+
         # Max number of requests for a single "Submit Requests" operation
-        req_len = BULK_OVHD_PER_REQ + len(props_list[0][self._uri_prop])
+        req_len = BULK_OVHD_PER_REQ + len(uris[0])
         max_req_id = int((BULK_MAX_SIZE - BULK_OVHD) / req_len) - 1
 
         # Prepare the bulk operation request and split if needed
 
-        bulk_ops = []  # item: tuple(bulk_reqs, bulk_reqs_by_id)
+        bulk_ops = []  # item: tuple(bulk_reqs, bulk_index_by_id)
         bulk_reqs = []  # requests for one "Submit Requests" operation
-        bulk_props_by_id = {}  # key: req_id; value: list result props
+        bulk_index_by_id = {}  # key: req_id; value: index in uris
         req_id = 0
-        for props in props_list:
+        for index, uri in enumerate(uris):
             req_id += 1
             req_id_str = str(req_id)
             req = {
                 'method': 'GET',
-                'uri': props[self._uri_prop],
+                'uri': uri,
                 'id': req_id_str,
             }
             bulk_reqs.append(req)
-            bulk_props_by_id[req_id_str] = props
+            bulk_index_by_id[req_id_str] = index
             if req_id > max_req_id:
-                bulk_ops.append((bulk_reqs, bulk_props_by_id))
+                bulk_ops.append((bulk_reqs, bulk_index_by_id))
                 bulk_reqs = []
-                bulk_props_by_id = {}
+                bulk_index_by_id = {}
                 req_id = 0
         if bulk_reqs:
-            bulk_ops.append((bulk_reqs, bulk_props_by_id))
+            bulk_ops.append((bulk_reqs, bulk_index_by_id))
 
         # Run the bulk operations and collect the result
 
         uri = '/api/services/aggregation/submit'
-        threads = min(BULK_MAX_THREADS, round(len(props_list) / 2 + 0.51))
-        resource_obj_list = []
-        for bulk_reqs, bulk_props_by_id in bulk_ops:
+        threads = min(BULK_MAX_THREADS, round(len(uris) / 2 + 0.51))
+        results = []
+        for bulk_reqs, bulk_index_by_id in bulk_ops:
             body = {
                 'requests': bulk_reqs,
                 'threads': threads,
             }
             result = self.session.post(uri, body=body)
             for res in result:
-                req_id = res['id']
-                props = bulk_props_by_id[req_id]
-
-                # We first use the properties from the props_list parameter,
-                # and then update that with the properties returned from the
-                # HMC:
-                resource_props = dict(props)
-                resource_props.update(res['body'])
-
-                if res['status'] != 200:
-                    # Similar to the non-full case: The first
-                    # error raises an exception.
-                    raise HTTPError(resource_props)
-
-                resource_obj = self.resource_class(
-                    manager=self,
-                    uri=props[self._uri_prop],
-                    name=resource_props.get(self._name_prop, None),
-                    properties=resource_props)
-
-                # pylint: disable=protected-access
-                with resource_obj._property_lock:
-                    resource_obj._properties = dict(resource_props)
-                    resource_obj._properties_timestamp = int(time.time())
-                    resource_obj._full_properties = True
-                # pylint: enable=protected-access
-
-                if matches_filters(resource_obj, client_filters):
-                    resource_obj_list.append(resource_obj)
+                index = bulk_index_by_id[res['id']]
+                results.append((index, res['status'], res['body']))
 
-        return resource_obj_list
+        return results
 
     def _list_with_parent_array(
             self, parent_obj, uris_prop, full_properties, filter_args):
@@ -969,6 +1172,9 @@ class BaseManager:
           :exc:`~zhmcclient.FilterConversionError`
         """
         resource_obj_list = []
+        if self.auto_update_enabled() and not self.auto_update_needs_pull():
+            # A pull of all resources would include the added resources
+            self._pull_added_resources()
         if self.auto_update_enabled() and not self.auto_update_needs_pull():
             for resource_obj in self.list_resources_local():
                 if matches_filters(resource_obj, filter_args):
@@ -1061,6 +1267,21 @@ class BaseManager:
         """
         self._resource_list.trigger_pull()
 
+    def auto_update_add_resource(self, resource_uri):
+        """
+        Record that a resource has been added on the HMC, so that the resource
+        is pulled from the HMC and added to the local auto-updated list of
+        resources upon the next list() call.
+
+        The resources added since the last list() call are pulled together in
+        a single bulk operation.
+
+        This method is called when an inventory change notification indicates
+        that a new object on the HMC has been created. It should not be called
+        by the user.
+        """
+        self._resource_list.add_uri(resource_uri)
+
     def add_resources_local(self, resource_obj_list):
         """
         Add a resource object to the local auto-updated list of resources.
@@ -1080,8 +1301,123 @@ class BaseManager:
         This method is called when an inventory change notification indicates
         that an object on the HMC has been deleted. It should not be called
         by the user.
+
+        Returns:
+          BaseResource: The removed resource object, or `None`.
+        """
+        return self._resource_list.remove(resource_uri)
+
+    def on_added(self, callback):
         """
-        self._resource_list.remove(resource_uri)
+        Register a callback function that is invoked when a resource has been
+        added to the list of resources of this manager object by
+        :ref:`auto-updating`.
+
+        While callback functions are registered, the auto updater of the
+        session pulls the resources that have been added on the HMC as soon
+        as it receives the corresponding inventory change notifications,
+        instead of upon the next :meth:`list` call.
+
+        The callback function is invoked in a thread of the auto updater of
+        the session, and only while auto-updating is enabled for this manager
+        object. It should return quickly, because it delays the processing of
+        further notifications. Exceptions raised by the callback function are
+        logged and otherwise ignored.
+
+        Parameters:
+
+          callback (callable): The callback function. It is invoked with the
+            following positional arguments:
+
+            * manager (:class:`~zhmcclient.BaseManager`): This manager object.
+            * resource (:class:`~zhmcclient.BaseResource`): The added resource
+              object, with its full set of properties.
+        """
+        self._added_callbacks.append(callback)
+
+    def on_removed(self, callback):
+        """
+        Register a callback function that is invoked when a resource has been
+        removed from the list of resources of this manager object by
+        :ref:`auto-updating`, because it has been deleted on the HMC.
+
+        The callback function is invoked in a thread of the auto updater of
+        the session, and only while auto-updating is enabled for this manager
+        object. It should return quickly, because it delays the processing of
+        further notifications. Exceptions raised by the callback function are
+        logged and otherwise ignored.
+
+        Parameters:
+
+          callback (callable): The callback function. It is invoked with the
+            following positional arguments:
+
+            * manager (:class:`~zhmcclient.BaseManager`): This manager object.
+            * resource (:class:`~zhmcclient.BaseResource`): The removed
+              resource object from the list of resources of this manager
+              object, or a minimal resource object if the resource was not in
+              that list.
+        """
+        self._removed_callbacks.append(callback)
+
+    def remove_callback(self, callback):
+        """
+        Unregister a callback function that has been registered with
+        :meth:`on_added` or :meth:`on_removed`.
+
+        If the callback function is not registered, nothing is done.
+
+        Parameters:
+
+          callback (callable): The callback function.
+        """
+        self._added_callbacks = [
+            cb for cb in self._added_callbacks if cb != callback]
+        self._removed_callbacks = [
+            cb for cb in self._removed_callbacks if cb != callback]
+
+    def auto_update_notify_added(self):
+        """
+        Pull the resources that have been added on the HMC, if callback
+        functions are registered with :meth:`on_added`, and invoke these
+        callback functions for the added resources.
+
+        This method is called by the auto updater after it has processed
+        inventory change notifications for added resources. It should not be
+        called by the user.
+
+        Raises:
+
+          :exc:`~zhmcclient.HTTPError`
+          :exc:`~zhmcclient.ParseError`
+          :exc:`~zhmcclient.AuthError`
+          :exc:`~zhmcclient.ConnectionError`
+        """
+        if self._added_callbacks:
+            self._pull_added_resources()
+
+    def auto_update_notify_removed(self, resource_uri, resource_obj):
+        """
+        Invoke the callback functions registered with :meth:`on_removed` for
+        a removed resource.
+
+        This method is called by the auto updater after it has removed the
+        resource from the local auto-updated list of resources. It should not
+        be called by the user.
+
+        Parameters:
+
+          resource_uri (string): The URI of the removed resource.
+
+          resource_obj (BaseResource): The removed resource object, or `None`
+            if the resource was not in the local list of resources.
+        """
+        removed_callbacks = list(self._removed_callbacks)
+        if not removed_callbacks:
+            return
+        if resource_obj is None:
+            resource_obj = self.resource_object(resource_uri)
+        invoke_callbacks(removed_callbacks, self, resource_obj)
 
     def list_resources_local(self):
         """
@@ -1092,6 +1428,170 @@ class BaseManager:
         """
         return self._resource_list.list()
 
+    def _pull_statuses(self, resources):
+        """
+        Retrieve the current values of the 'status' property of resources of
+        this manager from the HMC, and update the resource objects with them.
+
+        This implementation retrieves the status of each resource separately.
+        Manager classes whose List operation returns the status override this
+        method to retrieve the status of all resources with one operation.
+
+        Parameters:
+
+          resources (list of BaseResource): The resource objects.
+
+        Raises:
+
+          :exc:`~zhmcclient.HTTPError`
+          :exc:`~zhmcclient.ParseError`
+          :exc:`~zhmcclient.AuthError`
+          :exc:`~zhmcclient.ConnectionError`
+          :exc:`~zhmcclient.CeasedExistence`
+        """
+        for resource in resources:
+            resource.pull_properties(['status'])
+
+    def _pull_statuses_with_list(self, resources, list_uri, result_prop):
+        """
+        Implementation of _pull_statuses() that uses a List operation, for use
+        by manager classes whose List operation returns the status.
+
+        Resources that are not in the list result no longer exist on the HMC
+        and are set to have ceased to exist.
+        """
+        try:
+            result = self.session.get(list_uri)
+        except HTTPError as exc:
+            if self.class_name == RC_LOGICAL_PARTITION and \
+                    exc.http_status == 404 and exc.reason == 1:
+                # "List Logical Partitions of CPC" fails with 404.1 if there
+                # are no LPARs.
+                result = None
+            else:
+                raise
+        statuses = {props[self._uri_prop]: props['status']
+                    for props in (result or {}).get(result_prop, [])}
+        for resource in resources:
+            try:
+                status = statuses[resource.uri]
+            except KeyError:
+                resource.cease_existence_local()
+                continue
+            resource.update_properties_local({'status': status})
+
+    def _wait_for_statuses(self, resource_statuses, status_timeout=None,
+                           use_notifications=False):
+        """
+        Wait until the status of resources of this manager has reached a
+        desired value.
+
+        For a description of the parameters and exceptions, see the
+        wait_for_statuses() methods of the manager classes that support it.
+        """
+        # pylint: disable=too-many-locals,too-many-branches
+        if status_timeout is None:
+            status_timeout = self.session.retry_timeout_config.status_timeout
+        end_time = time.time() + status_timeout if status_timeout > 0 \
+            else None
+        desired = {}  # key: resource, value: list of desired statuses
+        for resource, status in resource_statuses.items():
+            if isinstance(status, (list, tuple, set, frozenset)):
+                desired[resource] = list(status)
+            else:
+                desired[resource] = [status]
+        resources = list(desired)
+
+        # Counter for the status change callbacks, protected by the condition
+        changes = [0]
+        changed = threading.Condition()
+
+        def status_changed(resource, properties):
+            # pylint: disable=unused-argument
+            with changed:
+                changes[0] += 1
+                changed.notify_all()
+
+        enabled_resources = []
+        if use_notifications:
+            for resource in resources:
+                if not resource.auto_update_enabled():
+                    # This retrieves the current properties
+                    resource.enable_auto_update()
+                    enabled_resources.append(resource)
+                resource.on_change(status_changed, properties=['status'])
+        try:
+            pull_needed = not use_notifications
+            last_pull_time = time.time()
+            # The resources whose status is pulled. The locally cached status
+            # of the resources may be outdated, so all of them are pulled
+            # initially, and only those that have not reached their desired
+            # status in the previous check afterwards.
+            pending = resources
+            while True:
+                with changed:
+                    seen_changes = changes[0]
+                if pull_needed:
+                    self._pull_statuses(pending)
+                    last_pull_time = time.time()
+                pending = []
+                for resource in resources:
+                    if resource.ceased_existence:
+                        raise CeasedExistence(resource.uri)
+                    if resource.get_properties_local('status') not in \
+                            desired[resource]:
+                        pending.append(resource)
+                if not pending:
+                    return
+
+                now = time.time()
+                if end_time is not None and now > end_time:
+                    actual = {res.name: res.get_properties_local('status')
+                              for res in pending}
+                    desired_statuses = desired[pending[0]]
+                    if len(resources) == 1:
+                        msg = (
+                            f"Waiting for {self.class_name} "
+                            f"{pending[0].name} to reach status(es) "
+                            f"'{desired_statuses}' timed out after "
+                            f"{status_timeout} s - current status is "
+                            f"'{actual[pending[0].name]}'")
+                    else:
+                        msg = (
+                            f"Waiting for {len(pending)} of {len(resources)} "
+                            f"{self.class_name} resources to reach their "
+                            f"desired status(es) timed out after "
+                            f"{status_timeout} s - current statuses are "
+                            f"{actual!r}")
+                    raise StatusTimeout(
+                        msg, pending[0].get_properties_local('status'),
+                        desired_statuses, status_timeout)
+
+                if not use_notifications:
+                    time.sleep(1)  # Avoid hot spin loop
+                    continue
+
+                # Wait for a status change notification, and retrieve the
+                # status from the HMC if there was none for some time.
+                wait_time = last_pull_time + STATUS_FALLBACK_POLL_INTERVAL - \
+                    now
+                if end_time is not None:
+                    wait_time = min(wait_time, end_time - now + 0.01)
+                with changed:
+                    got_change = changed.wait_for(
+                        lambda: changes[0] != seen_changes,
+                        timeout=max(wait_time, 0))
+                pull_needed = not got_change and \
+                    time.time() >= last_pull_time + \
+                    STATUS_FALLBACK_POLL_INTERVAL
+                if got_change:
+                    last_pull_time = time.time()
+        finally:
+            for resource in resources:
+                resource.remove_callback(status_changed)
+            for resource in enabled_resources:
+                resource.disable_auto_update()
+
     def resource_object(self, uri_or_oid, props=None):
         """
         Return a minimalistic Python resource object for this resource class,
@@ -1370,6 +1870,78 @@ class BaseManager:
         """
         raise NotImplementedError
 
+    @logged_api_call
+    def refresh_all(self, resources=None):
+        """
+        Retrieve the full set of resource properties from the HMC for a list
+        of resources of this manager, cache them in the resource objects, and
+        return the resources whose properties have changed, with their change
+        sets.
+
+        The properties are retrieved using the bulk operation
+        "Submit Requests", so that the number of HMC operations does not
+        depend on the number of resources.
+
+        Resources that no longer exist on the HMC are marked accordingly (see
+        :attr:`~zhmcclient.BaseResource.ceased_existence`) and are not
+        included in the result.
+
+        Authorization requirements:
+
+        * Object-access permission to the resources.
+
+        Parameters:
+
+          resources (list of :class:`~zhmcclient.BaseResource`):
+            The resource objects to be refreshed. They must be resource
+            objects of this manager.
+
+            `None` means that the resource objects returned by :meth:`list`
+            are refreshed. This is useful when :ref:`auto-updating` is enabled
+            for this manager, because :meth:`list` then returns the same
+            resource objects each time.
+
+        Returns:
+
+          list of tuple(resource, changes): The resources whose properties
+          have changed, with:
+
+          - resource (:class:`~zhmcclient.BaseResource`): The resource object.
+          - changes (dict): The change set of the resource, as described for
+            :meth:`~zhmcclient.BaseResource.refresh`.
+
+        Raises:
+
+          :exc:`~zhmcclient.HTTPError`
+          :exc:`~zhmcclient.ParseError`
+          :exc:`~zhmcclient.AuthError`
+          :exc:`~zhmcclient.ConnectionError`
+        """
+        if resources is None:
+            resources = self.list()
+        resources = [r for r in resources if not r.ceased_existence]
+        if not resources:
+            return []
+
+        changed = []
+        for index, status, body in self._bulk_get([r.uri for r in resources]):
+            resource = resources[index]
+            # The body of a failed request may be missing
+            body = body or {}
+            if status == 404 and body.get('reason') == 1:
+                # The resource no longer exists
+                resource.cease_existence_local()
+                continue
+            if status != 200:
+                error_body = dict(body)
+                error_body.setdefault('http-status', status)
+                raise HTTPError(error_body)
+            # pylint: disable=protected-access
+            changes = resource._update_full_properties(body)
+            if changes:
+                changed.append((resource, changes))
+        return changed
+
     @logged_api_call
     def find_by_name(self, name):
         """
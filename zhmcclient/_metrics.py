@@ -65,9 +65,21 @@ The basic usage of the metrics API is shown in this example:
 
 
 from collections import namedtuple
+import functools
+import os
 import re
+import json
+import struct
+import sys
+import tempfile
+from array import array
 from datetime import datetime, timezone
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 from ._manager import BaseManager
 from ._resource import BaseResource
 from ._cpc import Cpc
@@ -82,7 +94,7 @@ from ._utils import datetime_from_timestamp, repr_list, datetime_to_isoformat, \
 
 __all__ = ['MetricsContextManager', 'MetricsContext', 'MetricGroupDefinition',
            'MetricDefinition', 'MetricsResponse', 'MetricGroupValues',
-           'MetricObjectValues']
+           'MetricObjectValues', 'MetricGroupColumns']
 
 # Initial HMC API version for certain HMC versions
 API_VERSION_HMC_2_14_0 = (2, 20)
@@ -94,7 +106,7 @@ API_FEATURE_ADAPTER_NETWORK_INFORMATION = 'adapter-network-information'
 class MetricsContextManager(BaseManager):
     """
     Manager providing access to the :term:`Metrics Context` resources that
-    were created through this manager object.
+    were created or attached through this manager object.
 
     Derived from :class:`~zhmcclient.BaseManager`; see there for common methods
     and attributes.
@@ -161,15 +173,16 @@ class MetricsContextManager(BaseManager):
     def list(self, full_properties=False):
         # pylint: disable=arguments-differ
         """
-        List the :term:`Metrics Context` resources that were created through
-        this manager object.
+        List the :term:`Metrics Context` resources that were created or
+        attached through this manager object.
 
         Note that the HMC does not provide a way to enumerate the existing
         :term:`Metrics Context` resources. Therefore, this method will only
-        list the :term:`Metrics Context` resources that were created through
-        this manager object. For example, :term:`Metrics Context` resources
-        created through a second :class:`~zhmcclient.Client` object will not be
-        listed.
+        list the :term:`Metrics Context` resources that were created or
+        attached (see :meth:`attach`) through this manager object. For
+        example, :term:`Metrics Context` resources created through a second
+        :class:`~zhmcclient.Client` object will not be listed unless they
+        have been attached.
 
         HMC/SE version requirements: None
 
@@ -229,6 +242,108 @@ class MetricsContextManager(BaseManager):
         self._metrics_contexts.append(new_metrics_context)
         return new_metrics_context
 
+    @logged_api_call
+    def attach(self, uri, definitions, properties=None):
+        """
+        Attach to an existing :term:`Metrics Context` resource on the HMC,
+        without creating it and without performing any HMC operation.
+
+        This allows reusing a :term:`Metrics Context` resource that was
+        created by an earlier process (e.g. before a restart of a
+        collector) or by another process. The metric group definitions of the
+        :term:`Metrics Context` are provided by the caller in the compact form
+        returned by :attr:`zhmcclient.MetricsContext.definitions`, so that
+        they do not need to be retrieved from the HMC.
+
+        The HMC deletes :term:`Metrics Context` resources for example when it
+        is restarted. Whether the :term:`Metrics Context` still exists is not
+        verified by this method; if it no longer exists,
+        :meth:`~zhmcclient.MetricsContext.get_metrics` raises
+        :exc:`~zhmcclient.HTTPError` with HTTP status 404 and reason 1.
+
+        If a :term:`Metrics Context` with the specified URI is already in the
+        list of this manager, that object is returned.
+
+        HMC/SE version requirements: None
+
+        Parameters:
+
+          uri (:term:`string`):
+            The URI of the :term:`Metrics Context` resource (i.e. its
+            'metrics-context-uri' property).
+
+          definitions (dict):
+            The metric group definitions of the :term:`Metrics Context`
+            resource, in the compact form returned by
+            :attr:`zhmcclient.MetricsContext.definitions`.
+
+          properties (dict):
+            Additional properties of the :term:`Metrics Context` resource
+            (e.g. 'anticipated-frequency-seconds'), or `None`.
+
+        Returns:
+
+          :class:`~zhmcclient.MetricsContext`:
+            The resource object for the :term:`Metrics Context` resource.
+        """
+        for mc in self._metrics_contexts:
+            if mc.uri == uri:
+                return mc
+        mc_properties = dict(properties or {})
+        mc_properties['metrics-context-uri'] = uri
+        mc_properties['metric-groups'] = list(definitions)
+        mc_properties['metric-group-infos'] = [
+            {
+                'group-name': mg_name,
+                'metric-infos': [
+                    {'metric-name': m_name, 'metric-type': m_type}
+                    for m_name, m_type in m_infos],
+            }
+            for mg_name, m_infos in definitions.items()]
+        mc = MetricsContext(self, uri, None, mc_properties)
+        self._metrics_contexts.append(mc)
+        return mc
+
+    @logged_api_call
+    def load(self, filename):
+        """
+        Attach to an existing :term:`Metrics Context` resource on the HMC
+        whose URI and metric group definitions have been saved in a file
+        with :meth:`zhmcclient.MetricsContext.save`, without performing any
+        HMC operation.
+
+        See :meth:`attach` for details.
+
+        HMC/SE version requirements: None
+
+        Parameters:
+
+          filename (:term:`string`):
+            Path name of the file.
+
+        Returns:
+
+          :class:`~zhmcclient.MetricsContext`:
+            The resource object for the :term:`Metrics Context` resource.
+
+        Raises:
+
+          OSError: The file cannot be read.
+          ValueError: The file content is invalid.
+        """
+        with open(filename, encoding='utf-8') as fp:
+            data = json.load(fp)
+        try:
+            uri = data['metrics-context-uri']
+            definitions = data['definitions']
+            properties = data.get('properties')
+        except (KeyError, TypeError) as exc:
+            new_exc = ValueError(
+                f"Invalid metrics context file {filename}: {exc}")
+            new_exc.__cause__ = None
+            raise new_exc  # ValueError
+        return self.attach(uri, definitions, properties)
+
 
 class MetricsContext(BaseResource):
     """
@@ -301,6 +416,71 @@ class MetricsContext(BaseResource):
         """
         return self._metric_group_definitions
 
+    @property
+    def definitions(self):
+        """
+        dict: The metric group definitions of this :term:`Metrics Context`
+          resource in a compact, JSON-serializable form that can be passed to
+          :meth:`zhmcclient.MetricsContextManager.attach`.
+
+          The dictionary key is the metric group name, and the value is a list
+          of [metric name, metric type] lists in the order of the metric
+          values in the metrics response, where the metric type is the
+          'metric-type' field from the 'metric-group-infos' property (e.g.
+          'long-metric').
+        """
+        return {
+            mg_info['group-name']: [
+                [m_info['metric-name'], m_info['metric-type']]
+                for m_info in mg_info['metric-infos']]
+            for mg_info in self._properties['metric-group-infos']}
+
+    @logged_api_call
+    def save(self, filename):
+        """
+        Save the URI and the metric group definitions of this
+        :term:`Metrics Context` resource in a file, so that a later or
+        another process can attach to it using
+        :meth:`zhmcclient.MetricsContextManager.load`.
+
+        The file is written as JSON, and is replaced atomically.
+
+        HMC/SE version requirements: None
+
+        Parameters:
+
+          filename (:term:`string`):
+            Path name of the file.
+
+        Raises:
+
+          OSError: The file cannot be written.
+        """
+        properties = {}
+        if 'anticipated-frequency-seconds' in self._properties:
+            properties['anticipated-frequency-seconds'] = \
+                self._properties['anticipated-frequency-seconds']
+        data = {
+            'metrics-context-uri': self.uri,
+            'definitions': self.definitions,
+            'properties': properties,
+        }
+        # The temporary file has a unique name, so that concurrent saves of
+        # the same file do not interfere with each other.
+        with tempfile.NamedTemporaryFile(
+                'w', encoding='utf-8', delete=False,
+                dir=os.path.dirname(filename) or None,
+                prefix=os.path.basename(filename) + '.',
+                suffix='.tmp') as fp:
+            tmp_file = fp.name
+            try:
+                json.dump(data, fp)
+            except BaseException:
+                fp.close()
+                os.remove(tmp_file)
+                raise
+        os.replace(tmp_file, filename)
+
     @logged_api_call
     def get_metrics(self):
         """
@@ -399,6 +579,20 @@ class MetricGroupDefinition(_MetricGroupDefinitionTuple):
             f"metric_definitions={self.metric_definitions!r})")
         return repr_str
 
+    @property
+    def row_decoder(self):
+        """
+        callable: A function that converts the metric value strings of a
+        ValueRow line in a metrics response string (i.e. the line split at
+        the commas) into a dictionary of the Python-typed metric values, by
+        metric name.
+
+        The function is built once for the metric definitions and is then
+        cached, so metric group definitions with the same metric definitions
+        share the function.
+        """
+        return _row_decoder(tuple(self.metric_definitions.values()))
+
 
 _MetricDefinitionTuple = namedtuple(
     '_MetricDefinitionTuple',
@@ -503,17 +697,128 @@ def _metric_value(value_str, metric_type):
             new_exc.__cause__ = None
             raise new_exc  # ValueError
     elif metric_type is str:
-        # In Python 3, decode('unicode_escape) requires bytes, so we need
-        # to encode to bytes. This also works in Python 2.
-        return value_str.strip('"').encode('utf-8').decode('unicode_escape')
+        return _string_metric_value(value_str)
     else:
         assert metric_type is bool
-        lower_str = value_str.lower()
-        if lower_str == 'true':
-            return True
-        if lower_str == 'false':
-            return False
-        raise ValueError(f"Invalid boolean metric value: {value_str!r}")
+        return _bool_metric_value(value_str)
+
+
+def _bool_metric_value(value_str):
+    """
+    Return the Python bool value from a boolean metric value string.
+    """
+    lower_str = value_str.lower()
+    if lower_str == 'true':
+        return True
+    if lower_str == 'false':
+        return False
+    raise ValueError(f"Invalid boolean metric value: {value_str!r}")
+
+
+def _string_metric_value(value_str):
+    """
+    Return the Python string value from a string metric value string.
+    """
+    value_str = value_str.strip('"')
+    if '\\' in value_str or not value_str.isascii():
+        # decode('unicode_escape') requires bytes, so we need to encode to
+        # bytes. Strings without escape sequences that are pure ASCII are
+        # not changed by this, so that step is skipped for them.
+        return value_str.encode('utf-8').decode('unicode_escape')
+    return value_str
+
+
+# Functions converting a metric value string to the Python-typed metric value,
+# by Python type of the metric. Invalid integer and float values raise a
+# ValueError with a less specific message than _metric_value().
+_METRIC_CONVERTERS = {
+    int: int,
+    float: float,
+    str: _string_metric_value,
+    bool: _bool_metric_value,
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _row_decoder(metric_definitions):
+    """
+    Return a function that converts the value strings of a ValueRow line
+    (i.e. the line split at the commas) into a dictionary of the Python-typed
+    metric values, by metric name.
+
+    The metric names, their converters and their positions in the ValueRow
+    line are determined once, so that decoding a value row does not need to
+    look at the metric definitions. The functions are cached by the metric
+    definitions (a tuple of MetricDefinition objects).
+    """
+    m_defs = sorted(metric_definitions, key=lambda m_def: m_def.index)
+    names = tuple(m_def.name for m_def in m_defs)
+    converters = tuple(_METRIC_CONVERTERS[m_def.type] for m_def in m_defs)
+    num_values = len(m_defs)
+    in_order = all(m_def.index == i for i, m_def in enumerate(m_defs))
+
+    def decode_row_slow(str_values):
+        return {m_def.name: _metric_value(str_values[m_def.index], m_def.type)
+                for m_def in m_defs}
+
+    if not in_order:
+        return decode_row_slow
+
+    def decode_row(str_values):
+        if len(str_values) == num_values:
+            try:
+                return dict(zip(names, [
+                    convert(value_str)
+                    for convert, value_str in zip(converters, str_values)]))
+            except ValueError:
+                pass
+        # Raise the same exceptions as _metric_value(), and handle value
+        # rows with a different number of values
+        return decode_row_slow(str_values)
+
+    return decode_row
+
+
+# Typecodes of the arrays for the columns of MetricGroupColumns objects, by
+# Python type of the metric. String metrics are stored in lists.
+_COLUMN_TYPECODES = {
+    int: 'q',
+    float: 'd',
+    bool: 'b',
+}
+
+# Integer values of boolean metric value strings, in lower case
+_BOOL_COLUMN_VALUES = {
+    'true': 1,
+    'false': 0,
+}
+
+
+def _metric_column(value_strs, metric_type):
+    """
+    Return a typed column with the Python-typed metric values from a sequence
+    of metric value strings.
+
+    Integer, float and boolean metrics are returned as an
+    :class:`py:array.array` (with booleans as 0 or 1), and string metrics are
+    returned as a list.
+    """
+    try:
+        if metric_type is str:
+            return [_string_metric_value(v) for v in value_strs]
+        if metric_type is bool:
+            return array('b', [_BOOL_COLUMN_VALUES[v.lower()]
+                               for v in value_strs])
+        return array(_COLUMN_TYPECODES[metric_type],
+                     map(metric_type, value_strs))
+    except OverflowError:
+        # Integer values that exceed 64 bits
+        return [_metric_value(v, metric_type) for v in value_strs]
+    except (ValueError, KeyError):
+        # Raise the same exception as the row-based parsing does
+        for value_str in value_strs:
+            _metric_value(value_str, metric_type)
+        raise
 
 
 def _metric_unit_from_name(metric_name):
@@ -522,12 +827,24 @@ def _metric_unit_from_name(metric_name):
     the metric name.
 
     If a unit cannot be inferred, `None` is returned.
+
+    The results are cached per metric name.
     """
-    for item in _PATTERN_UNIT_LIST:
-        pattern, unit = item
+    try:
+        return _METRIC_UNITS[metric_name]
+    except KeyError:
+        pass
+    unit = None
+    for pattern, pattern_unit in _PATTERN_UNIT_LIST:
         if pattern.match(metric_name):
-            return unit
-    return None
+            unit = pattern_unit
+            break
+    _METRIC_UNITS[metric_name] = unit
+    return unit
+
+
+# Cache for _metric_unit_from_name(), with the metric units by metric name
+_METRIC_UNITS = {}
 
 
 _USE_UNICODE = True
@@ -540,20 +857,9 @@ else:
     CELSIUS = "degree Celsius"  # Official SI unit when not using degree sign
 
 
-_PATTERN_UNIT_LIST = {
-    # End patterns:
-    (re.compile(r".+-usage$"), "%"),
-    (re.compile(r".+-time$"), MICROSECONDS),
-    (re.compile(r".+-time-used$"), MICROSECONDS),
-    (re.compile(r".+-celsius$"), CELSIUS),
-    (re.compile(r".+-watts$"), "W"),
-    (re.compile(r".+-paging-rate$"), "pages/s"),
-    (re.compile(r".+-sampling-rate$"), "samples/s"),
-    # Begin patterns:
-    (re.compile(r"^bytes-.+"), "B"),
-    (re.compile(r"^heat-load.+"), "BTU/h"),  # Note: No trailing hyphen
-    (re.compile(r"^interval-bytes-.+"), "B"),
-    (re.compile(r"^bytes-per-second-.+"), "B/s"),
+# Patterns for the metric names and their metric units. The first matching
+# pattern determines the unit, so more specific patterns must come first.
+_PATTERN_UNIT_LIST = (
     # Special cases:
     (re.compile(r"^storage-rate$"), "kB/s"),
     (re.compile(r"^humidity$"), "%"),
@@ -562,7 +868,20 @@ _PATTERN_UNIT_LIST = {
     (re.compile(r"^velocity-numerator$"), MICROSECONDS),
     (re.compile(r"^velocity-denominator$"), MICROSECONDS),
     (re.compile(r"^utilization$"), "%"),
-}
+    # Begin patterns:
+    (re.compile(r"^bytes-per-second-.+"), "B/s"),
+    (re.compile(r"^bytes-.+"), "B"),
+    (re.compile(r"^heat-load.+"), "BTU/h"),  # Note: No trailing hyphen
+    (re.compile(r"^interval-bytes-.+"), "B"),
+    # End patterns:
+    (re.compile(r".+-usage$"), "%"),
+    (re.compile(r".+-time$"), MICROSECONDS),
+    (re.compile(r".+-time-used$"), MICROSECONDS),
+    (re.compile(r".+-celsius$"), CELSIUS),
+    (re.compile(r".+-watts$"), "W"),
+    (re.compile(r".+-paging-rate$"), "pages/s"),
+    (re.compile(r".+-sampling-rate$"), "samples/s"),
+)
 
 
 def _resource_class_from_group(metric_group_name):
@@ -597,6 +916,302 @@ CLASS_FROM_GROUP = {
 }
 
 
+def _datetime_from_metrics_timestamp(timestamp_str):
+    """
+    Return a timezone-aware datetime object from a timestamp string in a
+    metrics response string.
+    """
+    try:
+        return datetime_from_timestamp(int(timestamp_str))
+    except ValueError:
+        # Sometimes, the returned epoch timestamp values are way
+        # too large, e.g. 3651584404810066 (which would translate
+        # to the year 115791 A.D.). Python datetime supports
+        # up to the year 9999. We circumvent this issue by
+        # simply using the current date&time.
+        # TODO: Remove the circumvention for too large timestamps.
+        return datetime.now(timezone.utc)
+
+
+def _iter_object_values(client, mg_def, lines):
+    """
+    Generator that parses the lines of the ObjectValues items of a metric
+    group in a metrics response string, and yields a MetricObjectValues
+    object for each value row.
+    """
+    decode_row = mg_def.row_decoder
+    num_lines = len(lines)
+    i = 0
+    while i < num_lines:
+        if lines[i] == '':
+            # The empty line after the last ValueRow line
+            i += 1
+            continue
+        resource_uri = lines[i].strip('"')  # No " or \ inside
+        dt_timestamp = _datetime_from_metrics_timestamp(lines[i + 1])
+        i += 2
+        while i < num_lines and lines[i] != '':
+            metrics = decode_row(lines[i].split(','))
+            yield MetricObjectValues(
+                client, mg_def, resource_uri, dt_timestamp, metrics)
+            i += 1
+
+
+def _group_columns(mg_def, lines):
+    """
+    Parse the lines of the ObjectValues items of a metric group in a metrics
+    response string, and return a MetricGroupColumns object.
+
+    The value rows are split into their values once, and the values are then
+    converted column by column, without creating any objects per value row.
+    """
+    num_lines = len(lines)
+    resource_uris = []
+    timestamps = []
+    value_rows = []
+    i = 0
+    while i < num_lines:
+        if lines[i] == '':
+            # The empty line after the last ValueRow line
+            i += 1
+            continue
+        resource_uri = lines[i].strip('"')  # No " or \ inside
+        timestamp = int(lines[i + 1])
+        i += 2
+        while i < num_lines and lines[i] != '':
+            value_rows.append(lines[i].split(','))
+            i += 1
+        num_rows = len(value_rows) - len(resource_uris)
+        resource_uris.extend([resource_uri] * num_rows)
+        timestamps.extend([timestamp] * num_rows)
+
+    value_columns = list(zip(*value_rows))
+    columns = {}
+    for m_name, m_def in mg_def.metric_definitions.items():
+        value_strs = value_columns[m_def.index] if value_columns else ()
+        columns[m_name] = _metric_column(value_strs, m_def.type)
+    return MetricGroupColumns(
+        mg_def, resource_uris, array('q', timestamps), columns)
+
+
+def _metric_value_str(value, metric_type):
+    """
+    Return the metric value string in a metrics response string for a
+    Python-typed metric value. This is the inverse of _metric_value().
+    """
+    if metric_type is bool:
+        return 'true' if value else 'false'
+    if metric_type is str:
+        if not value.isascii() or not value.isprintable() or '\\' in value:
+            value = value.encode('unicode_escape').decode('ascii')
+        if '"' in value or ',' in value:
+            # Double quotes and commas would end the string value or split
+            # the value row, so they are represented as hex escape sequences
+            # that _string_metric_value() decodes.
+            value = value.replace('"', '\\x22').replace(',', '\\x2c')
+        return f'"{value}"'
+    return repr(metric_type(value))
+
+
+def _response_str_from_columns(metric_group_columns):
+    """
+    Return a metrics response string for a list of MetricGroupColumns
+    objects. Consecutive value rows with the same resource URI and timestamp
+    are represented as one ObjectValues item.
+    """
+    lines = []
+    for mgc in metric_group_columns:
+        lines.append(f'"{mgc.name}"')
+        m_defs = mgc.metric_group_definition.metric_definitions
+        value_columns = [None] * len(m_defs)
+        for m_name, column in mgc.columns.items():
+            m_type = m_defs[m_name].type
+            value_columns[m_defs[m_name].index] = [
+                _metric_value_str(value, m_type) for value in column]
+        value_rows = [','.join(row) for row in zip(*value_columns)]
+        prev_item = None
+        for i, resource_uri in enumerate(mgc.resource_uris):
+            item = (resource_uri, mgc.timestamps[i])
+            if item != prev_item:
+                if prev_item is not None:
+                    lines.append('')
+                lines.append(f'"{resource_uri}"')
+                lines.append(str(mgc.timestamps[i]))
+                prev_item = item
+            lines.append(value_rows[i])
+        if prev_item is not None:
+            lines.append('')
+        lines.append('')
+    lines.append('')
+    return '\n'.join(lines) + '\n'
+
+
+# Magic bytes and format version at the begin of the binary form of a
+# MetricsResponse object
+_BINARY_MAGIC = b'ZMR\x01'
+
+# Column kinds in the binary form, in addition to the array typecodes 'q',
+# 'd' and 'b' for integer, float and boolean columns
+_BINARY_STRING_COLUMN = b's'  # dictionary-encoded strings
+_BINARY_BIGINT_COLUMN = b'i'  # integers exceeding 64 bits, as strings
+
+
+# Struct format codes for the array typecodes used in the binary form. In
+# little endian ('<') mode, struct uses these fixed sizes independent of the
+# platform, while the item sizes of arrays are those of the C types of the
+# platform.
+_BINARY_ARRAY_CODES = {
+    'b': 'b',  # 1 byte
+    'h': 'h',  # 2 bytes
+    'i': 'i',  # 4 bytes
+    'q': 'q',  # 8 bytes
+    'H': 'H',  # 2 bytes
+    'I': 'I',  # 4 bytes
+    'd': 'd',  # 8 bytes
+}
+
+
+def _array_native(typecode):
+    """
+    Return whether the items of an array with the typecode can be copied
+    as bytes, i.e. whether the platform is little endian and the array item
+    size is the fixed size of the typecode in the binary form.
+    """
+    return sys.byteorder == 'little' and \
+        array(typecode).itemsize == struct.calcsize(
+            '<' + _BINARY_ARRAY_CODES[typecode])
+
+
+def _array_bytes(arr):
+    """
+    Return the bytes of an array in little endian byte order, with the fixed
+    item size of its typecode in the binary form.
+    """
+    if _array_native(arr.typecode):
+        return arr.tobytes()
+    return struct.pack(
+        f'<{len(arr)}{_BINARY_ARRAY_CODES[arr.typecode]}', *arr)
+
+
+# Typecodes for storing integer columns in the binary form, from the
+# narrowest to the widest, with their value ranges
+_NARROW_INT_TYPECODES = (
+    ('b', -0x80, 0x7f),
+    ('h', -0x8000, 0x7fff),
+    ('i', -0x80000000, 0x7fffffff),
+)
+
+
+def _narrow_int_array(arr):
+    """
+    Return an integer array with typecode 'q' converted to the narrowest
+    typecode that can hold its values.
+    """
+    if arr.typecode != 'q' or not arr:
+        return arr
+    min_value = min(arr)
+    max_value = max(arr)
+    for typecode, type_min, type_max in _NARROW_INT_TYPECODES:
+        if type_min <= min_value and max_value <= type_max:
+            return array(typecode, arr)
+    return arr
+
+
+def _dict_encode(values):
+    """
+    Return a tuple(distinct values, index array) for a sequence of values.
+    """
+    indexes = {}
+    index_list = [indexes.setdefault(v, len(indexes)) for v in values]
+    typecode = 'H' if len(indexes) <= 0x10000 else 'I'
+    return list(indexes), array(typecode, index_list)
+
+
+class _BinaryWriter:
+    """
+    Writer for the binary form of a MetricsResponse object.
+    """
+
+    def __init__(self):
+        self.parts = []
+
+    def pack(self, fmt, *values):
+        """Append values packed with a struct format (little endian)."""
+        self.parts.append(struct.pack('<' + fmt, *values))
+
+    def string(self, value):
+        """Append a length-prefixed UTF-8 string."""
+        data = value.encode('utf-8')
+        self.pack('I', len(data))
+        self.parts.append(data)
+
+    def strings(self, values):
+        """Append a count-prefixed list of strings."""
+        self.pack('I', len(values))
+        for value in values:
+            self.string(value)
+
+    def array(self, arr):
+        """Append a typecode-prefixed array (without its length)."""
+        self.parts.append(arr.typecode.encode('ascii'))
+        self.parts.append(_array_bytes(arr))
+
+    def getvalue(self):
+        """Return the bytes written."""
+        return b''.join(self.parts)
+
+
+class _BinaryReader:
+    """
+    Reader for the binary form of a MetricsResponse object.
+    """
+
+    def __init__(self, data):
+        self.data = memoryview(data)
+        self.pos = 0
+
+    def unpack(self, fmt):
+        """Return the values unpacked with a struct format (little endian)."""
+        fmt = '<' + fmt
+        values = struct.unpack_from(fmt, self.data, self.pos)
+        self.pos += struct.calcsize(fmt)
+        return values
+
+    def raw(self, size):
+        """Return the next bytes."""
+        if self.pos + size > len(self.data):
+            raise ValueError("Truncated binary metrics response")
+        data = self.data[self.pos:self.pos + size]
+        self.pos += size
+        return data
+
+    def string(self):
+        """Return a length-prefixed UTF-8 string."""
+        size, = self.unpack('I')
+        return str(self.raw(size), 'utf-8')
+
+    def strings(self):
+        """Return a count-prefixed list of strings."""
+        count, = self.unpack('I')
+        return [self.string() for _ in range(count)]
+
+    def array(self, count):
+        """Return a typecode-prefixed array with count items."""
+        typecode = str(self.raw(1), 'ascii')
+        try:
+            fmt = f'<{count}{_BINARY_ARRAY_CODES[typecode]}'
+        except KeyError:
+            raise ValueError(
+                f"Invalid array typecode in binary metrics response: "
+                f"{typecode!r}")
+        data = self.raw(struct.calcsize(fmt))
+        if _array_native(typecode):
+            arr = array(typecode)
+            arr.frombytes(data)
+            return arr
+        return array(typecode, struct.unpack(fmt, data))
+
+
 class MetricsResponse:
     """
     Represents the metric values returned by one call to the
@@ -606,7 +1221,8 @@ class MetricsResponse:
     HMC/SE version requirements: None
     """
 
-    def __init__(self, metrics_context, metrics_response_str):
+    def __init__(self, metrics_context, metrics_response_str, columnar=False,
+                 lazy=False):
         """
         Parameters:
 
@@ -618,12 +1234,100 @@ class MetricsResponse:
           metrics_response_str (:term:`string`):
             The metrics response string, as returned by the
             :meth:`~zhmcclient.MetricsContext.get_metrics` method.
+
+          columnar (bool):
+            Controls how the metrics response string is parsed:
+
+            * `False`: The metrics response string is parsed into
+              :class:`~zhmcclient.MetricObjectValues` objects (one per value
+              row) when this object is created.
+            * `True`: The metrics response string is parsed only when it is
+              accessed. Accessing :attr:`metric_group_columns` parses it into
+              typed columns (one per metric and metric group) without creating
+              objects for the value rows, which is significantly faster for
+              large responses. Accessing :attr:`metric_group_values` parses it
+              into :class:`~zhmcclient.MetricObjectValues` objects.
+
+          lazy (bool):
+            If `True`, only the boundaries of the metric groups in the
+            metrics response string are indexed when this object is created,
+            and a metric group is parsed only when it is accessed, e.g. via
+            :meth:`metric_group` or :meth:`iter_object_values`. This saves
+            processing time and memory when only some of the metric groups in
+            the metrics response are used.
+
+            If `False`, the parsing is controlled by the `columnar` parameter.
         """
         self._metrics_context = metrics_context
         self._metrics_response_str = metrics_response_str
         self._client = self._metrics_context.manager.client
 
-        self._metric_group_values = self._setup_metric_group_values()
+        # Index of the metric groups in the metrics response string, as a
+        # dict with key: metric group name, value: tuple(start, end) of the
+        # ObjectValues items of the metric group in the string.
+        self._group_index = None  # Lazy initialization
+
+        # MetricGroupValues objects parsed on demand, by metric group name
+        self._group_values = {}
+
+        self._metric_group_columns = None  # Lazy initialization
+        if lazy:
+            self._metric_group_values = None  # Lazy initialization
+            self._group_index = self._setup_group_index()
+        elif columnar:
+            self._metric_group_values = None  # Lazy initialization
+        else:
+            self._metric_group_values = self._setup_metric_group_values()
+
+    def _setup_group_index(self):
+        """
+        Return the index of the metric groups in the metrics response string,
+        by scanning it once for the boundaries of the metric groups.
+
+        The value rows of an ObjectValues item are skipped in one step by
+        searching for the empty line that ends the item, so the Python code
+        runs only once per ObjectValues item and not for each value row. For
+        the format of the metrics response string, see
+        :meth:`_setup_metric_group_values`.
+        """
+        mr_str = self.metrics_response_str
+        if '\r' in mr_str:
+            mr_str = mr_str.replace('\r\n', '\n')
+            self._metrics_response_str = mr_str
+        mr_len = len(mr_str)
+        group_index = {}
+        pos = 0
+        while True:
+            # Skip initial (or trailing) empty lines
+            while pos < mr_len and mr_str[pos] == '\n':
+                pos += 1
+            if pos >= mr_len:
+                break
+            eol = mr_str.find('\n', pos)
+            if eol < 0:
+                eol = mr_len
+            metric_group_name = mr_str[pos:eol].strip('"')  # No " or \ inside
+            start = end = eol + 1
+            while end < mr_len and mr_str[end] != '\n':
+                # Skip the ObjectValues item up to its empty line
+                blank = mr_str.find('\n\n', end)
+                end = mr_len if blank < 0 else blank + 2
+            group_index[metric_group_name] = (start, end)
+            pos = end + 1
+        return group_index
+
+    def _group_lines(self, metric_group_name):
+        """
+        Return the lines of the ObjectValues items of a metric group in the
+        metrics response string.
+
+        Raises:
+          KeyError: The metric group is not in the metrics response.
+        """
+        if self._group_index is None:
+            self._group_index = self._setup_group_index()
+        start, end = self._group_index[metric_group_name]
+        return self.metrics_response_str[start:end].splitlines()
 
     def _setup_metric_group_values(self):
         """
@@ -654,7 +1358,7 @@ class MetricsResponse:
         object_values = None
         metric_group_values = []
         state = 0
-        for mr_line in self._metrics_response_str.splitlines():
+        for mr_line in self.metrics_response_str.splitlines():
             if state == 0:
                 if object_values is not None:
                     # Store the result from the previous metric group
@@ -668,7 +1372,7 @@ class MetricsResponse:
                     # Process the next metrics group
                     metric_group_name = mr_line.strip('"')  # No " or \ inside
                     assert metric_group_name in mg_defs
-                    m_defs = mg_defs[metric_group_name].metric_definitions
+                    decode_row = mg_defs[metric_group_name].row_decoder
                     object_values = []
                     state = 1
             elif state == 1:
@@ -683,29 +1387,13 @@ class MetricsResponse:
             elif state == 2:
                 # Process the timestamp
                 assert mr_line != ''
-                try:
-                    dt_timestamp = datetime_from_timestamp(int(mr_line))
-                except ValueError:
-                    # Sometimes, the returned epoch timestamp values are way
-                    # too large, e.g. 3651584404810066 (which would translate
-                    # to the year 115791 A.D.). Python datetime supports
-                    # up to the year 9999. We circumvent this issue by
-                    # simply using the current date&time.
-                    # TODO: Remove the circumvention for too large timestamps.
-                    dt_timestamp = datetime.now(timezone.utc)
+                dt_timestamp = _datetime_from_metrics_timestamp(mr_line)
                 state = 3
             elif state == 3:
                 if mr_line != '':
                     # Process the metric values in the ValueRow line
-                    str_values = mr_line.split(',')
-                    metrics = {}
                     # pylint: disable=possibly-used-before-assignment
-                    for m_name in m_defs:
-                        m_def = m_defs[m_name]
-                        m_type = m_def.type
-                        m_value_str = str_values[m_def.index]
-                        m_value = _metric_value(m_value_str, m_type)
-                        metrics[m_name] = m_value
+                    metrics = decode_row(mr_line.split(','))
                     ov = MetricObjectValues(
                         self._client, mg_defs[metric_group_name], resource_uri,
                         dt_timestamp, metrics)
@@ -725,6 +1413,155 @@ class MetricsResponse:
         """
         return self._metrics_context
 
+    @property
+    def metrics_response_str(self):
+        """
+        :term:`string`: The metrics response string of this metric response.
+
+        For metric responses created with :meth:`from_bytes`, the metrics
+        response string is created from the metric values on first access.
+        """
+        if self._metrics_response_str is None:
+            self._metrics_response_str = _response_str_from_columns(
+                self._metric_group_columns)
+        return self._metrics_response_str
+
+    def to_bytes(self):
+        """
+        Return this metric response in a compact binary form, e.g. for
+        sending it to another process or for storing it.
+
+        The binary form contains the metric groups in the columnar form (see
+        :attr:`metric_group_columns`): Integer, float and boolean metrics are
+        stored as packed arrays of their values (integers with the
+        narrowest integer type that can hold the values of the column), and
+        the resource URIs, timestamps and string metrics are
+        dictionary-encoded, i.e. each distinct value is stored once and
+        referenced by index. The metric definitions are not
+        included; they are provided by the metrics context when converting
+        the binary form back with :meth:`from_bytes`.
+
+        Returns:
+
+          :class:`py:bytes`: The binary form of this metric response.
+        """
+        writer = _BinaryWriter()
+        writer.parts.append(_BINARY_MAGIC)
+        mg_columns = self.metric_group_columns
+        writer.pack('I', len(mg_columns))
+        for mgc in mg_columns:
+            writer.string(mgc.name)
+            writer.pack('I', len(mgc))
+            uris, uri_indexes = _dict_encode(mgc.resource_uris)
+            writer.strings(uris)
+            writer.array(uri_indexes)
+            distinct_timestamps, timestamp_indexes = \
+                _dict_encode(mgc.timestamps)
+            writer.pack('I', len(distinct_timestamps))
+            writer.array(array('q', distinct_timestamps))
+            writer.array(timestamp_indexes)
+            writer.pack('I', len(mgc.columns))
+            for m_name, column in mgc.columns.items():
+                writer.string(m_name)
+                if isinstance(column, array):
+                    writer.array(_narrow_int_array(column))
+                elif mgc.metric_group_definition.metric_definitions[
+                        m_name].type is str:
+                    writer.parts.append(_BINARY_STRING_COLUMN)
+                    values, value_indexes = _dict_encode(column)
+                    writer.strings(values)
+                    writer.array(value_indexes)
+                else:
+                    writer.parts.append(_BINARY_BIGINT_COLUMN)
+                    writer.strings([str(v) for v in column])
+        return writer.getvalue()
+
+    @classmethod
+    def from_bytes(cls, metrics_context, data):
+        """
+        Create a metric response from its binary form returned by
+        :meth:`to_bytes`.
+
+        The metric values are available in the columnar form (see
+        :attr:`metric_group_columns`) without any parsing. Accessing them in
+        other ways (e.g. via :attr:`metric_group_values`) creates the metrics
+        response string from the columnar form and parses it.
+
+        Parameters:
+
+          metrics_context (:class:`~zhmcclient.MetricsContext`):
+            The :class:`~zhmcclient.MetricsContext` object with the metric
+            definitions for the metric groups in the binary form. For metrics
+            contexts in another process, it can be attached using
+            :meth:`~zhmcclient.MetricsContextManager.attach`.
+
+          data (:term:`bytes`): The binary form of the metric response.
+
+        Returns:
+
+          :class:`~zhmcclient.MetricsResponse`: The metric response.
+
+        Raises:
+
+          ValueError: Invalid binary form, or the binary form contains metric
+            groups or metrics that are not defined in the metrics context.
+        """
+        reader = _BinaryReader(data)
+        if bytes(reader.raw(len(_BINARY_MAGIC))) != _BINARY_MAGIC:
+            raise ValueError("Invalid binary metrics response: Unknown format")
+        mg_defs = metrics_context.metric_group_definitions
+        mg_columns = []
+        try:
+            num_groups, = reader.unpack('I')
+            for _ in range(num_groups):
+                mg_name = reader.string()
+                mg_def = mg_defs.get(mg_name)
+                if mg_def is None:
+                    raise ValueError(
+                        "Invalid binary metrics response: Metric group "
+                        f"{mg_name!r} is not defined in the metrics context")
+                num_rows, = reader.unpack('I')
+                uris = reader.strings()
+                resource_uris = [uris[i] for i in reader.array(num_rows)]
+                num_timestamps, = reader.unpack('I')
+                distinct_timestamps = reader.array(num_timestamps)
+                timestamps = array('q', [
+                    distinct_timestamps[i] for i in reader.array(num_rows)])
+                num_columns, = reader.unpack('I')
+                columns = {}
+                for _ in range(num_columns):
+                    m_name = reader.string()
+                    if m_name not in mg_def.metric_definitions:
+                        raise ValueError(
+                            "Invalid binary metrics response: Metric "
+                            f"{m_name!r} is not defined in metric group "
+                            f"{mg_name!r} of the metrics context")
+                    kind = bytes(reader.raw(1))
+                    if kind == _BINARY_STRING_COLUMN:
+                        values = reader.strings()
+                        columns[m_name] = [
+                            values[i] for i in reader.array(num_rows)]
+                    elif kind == _BINARY_BIGINT_COLUMN:
+                        columns[m_name] = [int(v) for v in reader.strings()]
+                    else:
+                        reader.pos -= 1
+                        column = reader.array(num_rows)
+                        m_type = mg_def.metric_definitions[m_name].type
+                        typecode = _COLUMN_TYPECODES.get(m_type)
+                        if column.typecode != typecode:
+                            # Integer column stored with a narrower typecode
+                            column = array(typecode, column)
+                        columns[m_name] = column
+                mg_columns.append(MetricGroupColumns(
+                    mg_def, resource_uris, timestamps, columns))
+        except (struct.error, IndexError, UnicodeDecodeError) as exc:
+            new_exc = ValueError(f"Invalid binary metrics response: {exc}")
+            new_exc.__cause__ = None
+            raise new_exc  # ValueError
+        mr = cls(metrics_context, None, columnar=True)
+        mr._metric_group_columns = mg_columns
+        return mr
+
     @property
     def metric_group_values(self):
         """
@@ -736,8 +1573,258 @@ class MetricsResponse:
           metric values in this group (each for a single resource and point in
           time).
         """
+        if self._metric_group_values is None:
+            self._metric_group_values = [
+                self.metric_group(name) for name in self.metric_group_names]
         return self._metric_group_values
 
+    @property
+    def metric_group_names(self):
+        """
+        :class:`py:list`: The names of the metric groups in this metric
+          response, in the order in which they appear in the metrics response
+          string.
+        """
+        if self._metrics_response_str is None:
+            # Created from the binary form
+            return [mgc.name for mgc in self._metric_group_columns]
+        if self._group_index is None:
+            self._group_index = self._setup_group_index()
+        return list(self._group_index)
+
+    def metric_group(self, metric_group_name):
+        """
+        Return the metric values of a metric group in this metric response.
+
+        The metric group is parsed on first access, and the result is cached.
+
+        Parameters:
+
+          metric_group_name (:term:`string`): Name of the metric group.
+
+        Returns:
+
+          :class:`~zhmcclient.MetricGroupValues`: The metric values of the
+          metric group.
+
+        Raises:
+
+          KeyError: The metric group is not in this metric response.
+        """
+        if self._metric_group_values is not None and not self._group_values:
+            # All metric groups have been parsed eagerly
+            for mgv in self._metric_group_values:
+                self._group_values[mgv.name] = mgv
+        try:
+            return self._group_values[metric_group_name]
+        except KeyError:
+            pass
+        mgv = MetricGroupValues(
+            metric_group_name, list(self.iter_object_values(metric_group_name)))
+        self._group_values[metric_group_name] = mgv
+        return mgv
+
+    def iter_object_values(self, metric_group_name):
+        """
+        Generator that parses a metric group in this metric response and
+        yields its metric values, without storing them in this object.
+
+        Parameters:
+
+          metric_group_name (:term:`string`): Name of the metric group.
+
+        Returns:
+
+          :term:`iterable` of :class:`~zhmcclient.MetricObjectValues`: The
+          metric values of the metric group, each for a single resource and
+          point in time.
+
+        Raises:
+
+          KeyError: The metric group is not in this metric response.
+        """
+        lines = self._group_lines(metric_group_name)
+        mg_def = self._metrics_context.metric_group_definitions[
+            metric_group_name]
+        return _iter_object_values(self._client, mg_def, lines)
+
+    @property
+    def metric_group_columns(self):
+        """
+        :class:`py:list`: The list of :class:`~zhmcclient.MetricGroupColumns`
+          objects representing the metric groups in this metric response in
+          a columnar form.
+
+          The metrics response string is parsed into the columnar form on
+          first access of this property.
+        """
+        if self._metric_group_columns is None:
+            self._metric_group_columns = self._setup_metric_group_columns()
+        return self._metric_group_columns
+
+    @logged_api_call
+    def resolve_resources(self, resource_cache=None):
+        """
+        Resolve the resources of all metric values in this metric response
+        with as few HMC operations as possible.
+
+        The resource URIs of all metric values are collected per resource
+        class, and the resources of each resource class are then retrieved
+        with a single list operation (e.g.
+        :meth:`~zhmcclient.Console.list_permitted_partitions`), instead of one
+        operation per metric value as done by
+        :attr:`~zhmcclient.MetricObjectValues.resource`. The resulting
+        resource objects are set in the
+        :class:`~zhmcclient.MetricObjectValues` objects of this metric
+        response, so that accessing their
+        :attr:`~zhmcclient.MetricObjectValues.resource` property no longer
+        performs any HMC operations.
+
+        Resources that are not found on the HMC are not set, so that
+        accessing :attr:`~zhmcclient.MetricObjectValues.resource` for them
+        raises :exc:`~zhmcclient.MetricsResourceNotFound` as usual.
+
+        If this metric response has been parsed into the columnar form (see
+        :attr:`metric_group_columns`), the resource URIs are taken from the
+        columnar form, and only the :class:`~zhmcclient.MetricObjectValues`
+        objects that have already been parsed are updated. Otherwise, this
+        method parses all metric groups into
+        :class:`~zhmcclient.MetricObjectValues` objects.
+
+        Parameters:
+
+          resource_cache (dict): A cache of resource objects by resource URI,
+            that is used for resolving the resources and is updated with
+            the newly retrieved resource objects. Passing the same cache for
+            subsequent metric responses avoids retrieving the resources again.
+            `None` means that a new cache is used.
+
+        Returns:
+
+          dict: The resource cache, with:
+
+          - Key (string): The resource URI.
+          - Value (:class:`~zhmcclient.BaseResource`): The resource object.
+
+          The resource cache can also be used to look up the resources for
+          :attr:`~zhmcclient.MetricGroupColumns.resource_uris`.
+
+        Raises:
+
+          :exc:`~zhmcclient.HTTPError`
+          :exc:`~zhmcclient.ParseError`
+          :exc:`~zhmcclient.AuthError`
+          :exc:`~zhmcclient.ConnectionError`
+        """
+        if resource_cache is None:
+            resource_cache = {}
+
+        if self._metric_group_columns is not None:
+            parsed_group_values = self._metric_group_values or \
+                list(self._group_values.values())
+            group_uris = [
+                (mgc.metric_group_definition, mgc.resource_uris)
+                for mgc in self._metric_group_columns]
+        else:
+            parsed_group_values = self.metric_group_values
+            mg_defs = self._metrics_context.metric_group_definitions
+            group_uris = [
+                (mg_defs[mgv.name],
+                 [ov.resource_uri for ov in mgv.object_values])
+                for mgv in parsed_group_values]
+
+        # Resource URIs that are not in the cache, by resource class
+        missing_uris = {}
+        for mg_def, resource_uris in group_uris:
+            for resource_uri in resource_uris:
+                if resource_uri not in resource_cache:
+                    missing_uris.setdefault(
+                        mg_def.resource_class, set()).add(resource_uri)
+
+        for resource_class, uris in missing_uris.items():
+            self._resolve_resource_class(resource_class, uris, resource_cache)
+
+        for mgv in parsed_group_values:
+            for ov in mgv.object_values:
+                # pylint: disable=protected-access
+                if ov._resource is None:
+                    ov._resource = resource_cache.get(ov.resource_uri, None)
+
+        return resource_cache
+
+    def _resolve_resource_class(self, resource_class, uris, resource_cache):
+        """
+        Retrieve the resources of a resource class with a single list
+        operation where possible, and add them to the resource cache.
+
+        Parameters:
+          resource_class (string): The resource class.
+          uris (set of string): The resource URIs that need to be resolved.
+          resource_cache (dict): The resource cache to be updated.
+        """
+        client = self._client
+        if resource_class == 'cpc':
+            resources = client.cpcs.list()
+        elif resource_class == 'logical-partition':
+            if client.version_info() >= API_VERSION_HMC_2_14_0:
+                resources = client.consoles.console.list_permitted_lpars()
+            else:
+                resources = []
+                for cpc in client.cpcs.list():
+                    resources.extend(cpc.lpars.list())
+        elif resource_class == 'partition':
+            if client.version_info() >= API_VERSION_HMC_2_14_0:
+                resources = \
+                    client.consoles.console.list_permitted_partitions()
+            else:
+                resources = []
+                for cpc in client.cpcs.list():
+                    resources.extend(cpc.partitions.list())
+        elif resource_class == 'adapter':
+            resources = []
+            console = client.consoles.console
+            if console.list_api_features(
+                    API_FEATURE_ADAPTER_NETWORK_INFORMATION):
+                resources = console.list_permitted_adapters()
+            # The permitted adapters do not include adapters of classic mode
+            # CPCs with SE < 2.16.0
+            found_uris = {r.uri for r in resources}
+            if not uris.issubset(found_uris):
+                for cpc in client.cpcs.list():
+                    resources.extend(cpc.adapters.list())
+        elif resource_class == 'nic':
+            # The URI of a NIC starts with the URI of its parent partition
+            partition_uris = {uri.split('/nics/')[0] for uri in uris}
+            missing_partition_uris = {
+                uri for uri in partition_uris if uri not in resource_cache}
+            if missing_partition_uris:
+                self._resolve_resource_class(
+                    'partition', missing_partition_uris, resource_cache)
+            resources = []
+            for partition_uri in partition_uris:
+                partition = resource_cache.get(partition_uri, None)
+                if partition is not None:
+                    resources.extend(partition.nics.list())
+        else:
+            raise ValueError(
+                f"Invalid resource class: {resource_class!r}")
+
+        for resource in resources:
+            resource_cache.setdefault(resource.uri, resource)
+
+    def _setup_metric_group_columns(self):
+        """
+        Return the list of MetricGroupColumns objects for this metrics
+        response, by processing its metrics response string.
+        """
+        mg_defs = self._metrics_context.metric_group_definitions
+        metric_group_columns = []
+        for metric_group_name in self.metric_group_names:
+            lines = self._group_lines(metric_group_name)
+            metric_group_columns.append(
+                _group_columns(mg_defs[metric_group_name], lines))
+        return metric_group_columns
+
 
 class MetricGroupValues:
     """
@@ -779,6 +1866,134 @@ class MetricGroupValues:
         return self._object_values
 
 
+class MetricGroupColumns:
+    """
+    Represents the metric values for a metric group in a MetricsResponse
+    string in a columnar form, with one typed column per metric.
+
+    The value rows of the metric group are represented by the positions in
+    the columns: The metric values of value row i are at index i in each
+    column, and the resource URI and timestamp of value row i are at index i
+    in :attr:`resource_uris` and :attr:`timestamps`.
+
+    Objects of this class are returned by
+    :attr:`zhmcclient.MetricsResponse.metric_group_columns`.
+
+    HMC/SE version requirements: None
+    """
+
+    def __init__(self, metric_group_definition, resource_uris, timestamps,
+                 columns):
+        """
+        Parameters:
+
+          metric_group_definition (:class:`~zhmcclient.MetricGroupDefinition`):
+            Metric group definition for the metric values.
+
+          resource_uris (:class:`py:list`):
+            The resource URIs of the value rows.
+
+          timestamps (:class:`py:array.array`):
+            The timestamps of the value rows, as integer milliseconds since
+            the epoch, as returned by the HMC.
+
+          columns (dict):
+            The columns of metric values, by metric name.
+        """
+        self._metric_group_definition = metric_group_definition
+        self._resource_uris = resource_uris
+        self._timestamps = timestamps
+        self._columns = columns
+
+    def __len__(self):
+        """
+        Return the number of value rows.
+        """
+        return len(self._resource_uris)
+
+    @property
+    def name(self):
+        """
+        string: The metric group name.
+        """
+        return self._metric_group_definition.name
+
+    @property
+    def metric_group_definition(self):
+        """
+        :class:`~zhmcclient.MetricGroupDefinition`: Metric group definition for
+        the metric values.
+        """
+        return self._metric_group_definition
+
+    @property
+    def resource_uris(self):
+        """
+        :class:`py:list`: The canonical URI paths of the resources of the
+        value rows. Value rows for the same resource share the same string
+        object.
+        """
+        return self._resource_uris
+
+    @property
+    def timestamps(self):
+        """
+        :class:`py:array.array`: The points in time when the HMC captured the
+        metric values of the value rows, as integer milliseconds since the
+        epoch (typecode 'q').
+
+        They can be converted to timezone-aware datetime objects using
+        :func:`~zhmcclient.datetime_from_timestamp`.
+        """
+        return self._timestamps
+
+    @property
+    def columns(self):
+        """
+        dict: The columns of metric values, by metric name.
+
+        The column type depends on the metric type:
+
+        * Integer metrics: :class:`py:array.array` with typecode 'q'.
+          If a value exceeds 64 bits, a :class:`py:list` of integers.
+        * Float metrics: :class:`py:array.array` with typecode 'd'.
+        * Boolean metrics: :class:`py:array.array` with typecode 'b', with
+          the values 0 and 1.
+        * String metrics: :class:`py:list` of strings.
+        """
+        return self._columns
+
+    def to_numpy(self):
+        """
+        Return the columns of metric values as NumPy arrays.
+
+        Integer, float and boolean columns are converted without copying the
+        data. String columns are converted to NumPy arrays of dtype object.
+
+        This method requires the 'numpy' Python package to be installed.
+
+        Returns:
+
+          dict: The columns of metric values as NumPy arrays, by metric name.
+
+        Raises:
+
+          ImportError: The 'numpy' Python package is not installed.
+        """
+        if numpy is None:
+            raise ImportError(
+                "MetricGroupColumns.to_numpy() requires the 'numpy' Python "
+                "package")
+        numpy_columns = {}
+        for m_name, column in self._columns.items():
+            if isinstance(column, array):
+                dtype = 'bool' if column.typecode == 'b' else column.typecode
+                numpy_columns[m_name] = numpy.frombuffer(column, dtype=dtype)
+            else:
+                numpy_columns[m_name] = numpy.array(column, dtype=object)
+        return numpy_columns
+
+
 class MetricObjectValues:
     """
     Represents the metric values for a single resource at a single point in
@@ -0,0 +1,393 @@
+# Copyright 2026 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+A :class:`~zhmcclient.MetricsCollector` retrieves metrics from multiple HMCs
+in parallel, and merges the resulting metrics responses into a single stream
+of :class:`~zhmcclient.CollectedMetrics` objects that identify the HMC.
+
+The metrics of each HMC are retrieved through a
+:class:`~zhmcclient.MetricsPoller`, so the metrics contexts are created
+as needed and re-created if the HMC deleted them.
+
+The basic usage of the metrics collector is shown in this example:
+
+.. code-block:: python
+
+    metric_groups = ['partition-usage']
+    pollers = {
+        name: zhmcclient.MetricsPoller(client, metric_groups)
+        for name, client in clients.items()
+    }
+    with zhmcclient.MetricsCollector(pollers, interval=15) as collector:
+        for cm in collector.stream():
+            if cm.exception:
+                print(f"HMC {cm.hmc}: {cm.exception}")
+                continue
+            for mgc in cm.metrics_response.metric_group_columns:
+                ...
+"""
+
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+import queue
+import threading
+import time
+
+from ._exceptions import Error, OperationTimeout
+from ._logging import logged_api_call
+from ._utils import repr_obj_id
+
+__all__ = ['MetricsCollector', 'CollectedMetrics']
+
+
+_CollectedMetricsTuple = namedtuple(
+    '_CollectedMetricsTuple',
+    ['hmc', 'metrics_response', 'exception', 'duration']
+)
+
+
+class CollectedMetrics(_CollectedMetricsTuple):
+    """
+    A :func:`namedtuple <py:collections.namedtuple>` representing the result
+    of retrieving metrics from one HMC, as returned by
+    :class:`~zhmcclient.MetricsCollector`.
+
+    HMC/SE version requirements: None
+    """
+
+    def __new__(cls, hmc, metrics_response, exception, duration):
+        """
+        Parameters:
+
+          hmc (:term:`string`):
+            The name of the HMC, as specified in the `pollers` parameter of
+            :class:`~zhmcclient.MetricsCollector`.
+
+          metrics_response (:class:`~zhmcclient.MetricsResponse`):
+            The metrics response, or `None` if retrieving the metrics failed
+            or timed out.
+
+          exception (:exc:`py:Exception`):
+            `None` if the metrics were retrieved successfully. Otherwise, the
+            exception raised when retrieving the metrics, or
+            :exc:`~zhmcclient.OperationTimeout` if the retrieval had not
+            completed within the timeout of the collector.
+
+          duration (float):
+            The time in seconds the retrieval took, or for timeouts, the time
+            the retrieval has been in progress.
+
+        All these parameters are also available as same-named attributes.
+        """
+        self = super().__new__(
+            cls, hmc, metrics_response, exception, duration)
+        return self
+
+    __slots__ = ()
+
+    def __repr__(self):
+        repr_str = (
+            "CollectedMetrics("
+            f"hmc={self.hmc!r}, "
+            f"metrics_response={repr_obj_id(self.metrics_response)}, "
+            f"exception={self.exception!r}, "
+            f"duration={self.duration!r})")
+        return repr_str
+
+
+class MetricsCollector:
+    """
+    A collector that retrieves metrics from multiple HMCs in parallel.
+
+    Each HMC is represented by a :class:`~zhmcclient.MetricsPoller` object.
+    The metrics of the HMCs are retrieved in a thread pool with one thread per
+    HMC, and the results are returned in the order in which the retrievals
+    complete, so that a slow HMC does not delay the results of the other
+    HMCs.
+
+    There is at most one retrieval in progress for each HMC. If the previous
+    retrieval for an HMC is still in progress when a new round of
+    retrievals starts, no new retrieval is started for that HMC in that
+    round. This prevents a slow or hanging HMC from accumulating requests.
+    The number of rounds skipped this way is available in :attr:`skipped`.
+
+    HMC/SE version requirements: None
+    """
+
+    def __init__(self, pollers, interval=15, timeout=None):
+        """
+        Parameters:
+
+          pollers (dict):
+            The metrics pollers for the HMCs, with key: HMC name (used in the
+            results), value: :class:`~zhmcclient.MetricsPoller`. Each poller
+            should use a separate :class:`~zhmcclient.Session` object.
+
+          interval (:term:`number`):
+            Interval in seconds between the rounds of retrievals in
+            :meth:`stream`.
+
+          timeout (:term:`number`):
+            Time in seconds after which a retrieval that is still in progress
+            is reported with an :exc:`~zhmcclient.OperationTimeout`
+            exception. The retrieval itself is not aborted; if it completes
+            later, its result is returned then. `None` means to use the
+            interval.
+        """
+        self._pollers = dict(pollers)
+        self._interval = interval
+        self._timeout = timeout if timeout is not None else interval
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(len(self._pollers), 1),
+            thread_name_prefix='zhmcclient.MetricsCollector')
+
+        # Start time (monotonic) and timeout flag of the retrievals in
+        # progress, by HMC name
+        self._in_progress = {}
+
+        # Completed retrievals, as CollectedMetrics objects
+        self._results = queue.Queue()
+
+        self._skipped = {hmc: 0 for hmc in self._pollers}
+        self._stop_event = threading.Event()
+
+    def __repr__(self):
+        """
+        Return a string with the state of this collector, for debug purposes.
+        """
+        ret = (
+            f"{repr_obj_id(self)} (\n"
+            f"  _pollers = {list(self._pollers)!r}\n"
+            f"  _interval = {self._interval!r}\n"
+            f"  _timeout = {self._timeout!r}\n"
+            f"  _in_progress = {list(self._in_progress)!r}\n"
+            f"  _skipped = {self._skipped!r}\n"
+            ")")
+        return ret
+
+    def __enter__(self):
+        """
+        Enter the runtime context of this collector.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Exit the runtime context of this collector, by closing it.
+        """
+        self.close()
+
+    @property
+    def pollers(self):
+        """
+        dict: The metrics pollers for the HMCs, by HMC name.
+        """
+        return dict(self._pollers)
+
+    @property
+    def interval(self):
+        """
+        :term:`number`: Interval in seconds between the rounds of retrievals.
+        """
+        return self._interval
+
+    @property
+    def skipped(self):
+        """
+        dict: The number of rounds in which no retrieval was started for an
+        HMC because its previous retrieval was still in progress, by HMC
+        name.
+        """
+        return dict(self._skipped)
+
+    def _retrieve(self, hmc, poller):
+        """
+        Retrieve the metrics from an HMC. Runs in a thread of the pool.
+        """
+        start = time.monotonic()
+        try:
+            mr = poller.get_metrics_response()
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            result = CollectedMetrics(
+                hmc, None, exc, time.monotonic() - start)
+        else:
+            result = CollectedMetrics(
+                hmc, mr, None, time.monotonic() - start)
+        self._results.put(result)
+
+    def _start_round(self):
+        """
+        Start a retrieval for each HMC that has none in progress.
+        """
+        now = time.monotonic()
+        for hmc, poller in self._pollers.items():
+            if hmc in self._in_progress:
+                self._skipped[hmc] += 1
+                continue
+            self._in_progress[hmc] = [now, False]
+            self._executor.submit(self._retrieve, hmc, poller)
+
+    def _timeouts(self, all_pending=False):
+        """
+        Return the timeout results for the retrievals that are in progress
+        for longer than the timeout (or all retrievals in progress, if
+        all_pending is True) and have not been reported yet.
+        """
+        results = []
+        now = time.monotonic()
+        for hmc, entry in self._in_progress.items():
+            start, reported = entry
+            if reported or (not all_pending and now - start < self._timeout):
+                continue
+            entry[1] = True
+            exc = OperationTimeout(
+                f"Retrieving metrics from HMC {hmc} did not complete "
+                f"within {self._timeout} seconds", self._timeout)
+            results.append(CollectedMetrics(hmc, None, exc, now - start))
+        return results
+
+    def _next_timeout_time(self):
+        """
+        Return the time (monotonic) when the next timeout of a retrieval in
+        progress will happen, or `None`.
+        """
+        times = [start + self._timeout
+                 for start, reported in self._in_progress.values()
+                 if not reported]
+        return min(times) if times else None
+
+    def _get_result(self, wait_until):
+        """
+        Wait for the next completed retrieval until the specified time
+        (monotonic), and return it, or `None`.
+        """
+        wait_time = wait_until - time.monotonic()
+        try:
+            if wait_time > 0:
+                result = self._results.get(timeout=wait_time)
+            else:
+                result = self._results.get_nowait()
+        except queue.Empty:
+            return None
+        del self._in_progress[result.hmc]
+        return result
+
+    @logged_api_call
+    def collect(self):
+        """
+        Perform one round of retrievals and return its results.
+
+        A retrieval is started for each HMC that has no retrieval in
+        progress. The method returns when all retrievals have completed, or
+        when the timeout of the collector has expired. For the retrievals
+        that are still in progress at that point, the result has an
+        :exc:`~zhmcclient.OperationTimeout` exception.
+
+        Results of retrievals from earlier rounds that completed after their
+        timeout are also returned.
+
+        Returns:
+
+          list of :class:`~zhmcclient.CollectedMetrics`: The results, in the
+          order in which the retrievals completed, followed by the timeouts.
+        """
+        self._start_round()
+        deadline = time.monotonic() + self._timeout
+        results = []
+        while self._in_progress:
+            result = self._get_result(deadline)
+            if result is None:
+                break
+            results.append(result)
+        results.extend(self._timeouts(all_pending=True))
+        return results
+
+    def stream(self):
+        """
+        Generator that performs rounds of retrievals on a fixed schedule and
+        yields their results as soon as each retrieval completes, until
+        :meth:`stop` or :meth:`close` is called.
+
+        The first round starts immediately, and the subsequent rounds start
+        at multiples of the interval after the first round, independent of
+        how long the retrievals take. Retrievals that are in progress for
+        longer than the timeout are reported once with an
+        :exc:`~zhmcclient.OperationTimeout` exception, and their result is
+        yielded when they complete.
+
+        Returns:
+
+          :term:`iterable` of :class:`~zhmcclient.CollectedMetrics`: The
+          results of the retrievals.
+        """
+        self._stop_event.clear()
+        next_round = time.monotonic()
+        while not self._stop_event.is_set():
+            now = time.monotonic()
+            if now >= next_round:
+                self._start_round()
+                next_round += self._interval
+                if next_round <= now:
+                    # Skip the rounds that were missed
+                    missed = int((now - next_round) // self._interval) + 1
+                    next_round += missed * self._interval
+            yield from self._timeouts()
+            wait_until = next_round
+            timeout_time = self._next_timeout_time()
+            if timeout_time is not None:
+                wait_until = min(wait_until, timeout_time)
+            # Wait in short steps, so that stop() takes effect timely
+            wait_until = min(wait_until, time.monotonic() + 0.1)
+            result = self._get_result(wait_until)
+            if result is not None:
+                yield result
+
+    def stop(self):
+        """
+        Stop the :meth:`stream` generator.
+
+        The generator returns before it waits for the next result. Retrievals
+        in progress are not aborted.
+        """
+        self._stop_event.set()
+
+    def close(self):
+        """
+        Stop the :meth:`stream` generator, wait for the retrievals in progress
+        to complete, and close the metrics pollers, which deletes their
+        metrics contexts on the HMCs.
+
+        The retrievals in progress are waited for at most for the timeout of
+        the collector, so that a hanging HMC does not delay closing the
+        collector. The metrics pollers whose retrieval is still in progress
+        after that are not closed, since closing them would access the
+        hanging HMC as well.
+
+        :exc:`~zhmcclient.Error` exceptions when closing a metrics poller are
+        ignored, so that the other metrics pollers are closed as well.
+        """
+        self.stop()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        deadline = time.monotonic() + self._timeout
+        while self._in_progress:
+            if self._get_result(deadline) is None:
+                break
+        for hmc, poller in self._pollers.items():
+            if hmc in self._in_progress:
+                continue
+            try:
+                poller.close()
+            except Error:
+                pass
@@ -0,0 +1,336 @@
+# Copyright 2026 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+An :class:`~zhmcclient.OpenMetricsExporter` converts
+:class:`~zhmcclient.MetricsResponse` objects into the
+`OpenMetrics text format
+<https://prometheus.io/docs/specs/om/open_metrics_spec/>`_ that
+is used by Prometheus and other monitoring systems.
+
+The exporter is designed to be used for every scrape of a long-running
+exporter process: It renders the metric values directly from the columnar
+form of the metrics response, and it caches the rendered metric family
+headers and the rendered label sets of the resources across scrapes.
+
+The basic usage of the exporter is shown in this example:
+
+.. code-block:: python
+
+    exporter = zhmcclient.OpenMetricsExporter()
+    ...
+    # For each scrape:
+    mr_str = mc.get_metrics()
+    mr = zhmcclient.MetricsResponse(mc, mr_str, columnar=True)
+    text = exporter.export(mr)
+"""
+
+import math
+
+from ._metrics import CELSIUS, MICROSECONDS
+from ._metrics_poller import COUNTER_METRICS
+from ._resource import BaseResource
+from ._logging import logged_api_call
+from ._utils import repr_obj_id
+
+__all__ = ['OpenMetricsExporter']
+
+# OpenMetrics unit names for the metric units inferred from the metric names
+# (see MetricDefinition.unit). Units that are not in this dictionary are not
+# represented in the metric family names.
+OPENMETRICS_UNITS = {
+    '%': 'percent',
+    MICROSECONDS: 'microseconds',
+    CELSIUS: 'celsius',
+    'W': 'watts',
+    'B': 'bytes',
+    'B/s': 'bytes_per_second',
+    'kB/s': 'kilobytes_per_second',
+    'MiB': 'mebibytes',
+    'BTU/h': 'btu_per_hour',
+    'pages/s': 'pages_per_second',
+    'samples/s': 'samples_per_second',
+}
+
+
+def _openmetrics_name(name):
+    """
+    Return an OpenMetrics metric or label name from an HMC name.
+    """
+    return name.replace('-', '_')
+
+
+def _label_value(value):
+    """
+    Return an escaped and quoted OpenMetrics label value.
+    """
+    value = str(value).replace('\\', r'\\').replace('\n', r'\n'). \
+        replace('"', r'\"')
+    return f'"{value}"'
+
+
+def _float_value(value):
+    """
+    Return an OpenMetrics sample value for a float metric value.
+    """
+    if math.isfinite(value):
+        return f'{value}'
+    if math.isnan(value):
+        return 'NaN'
+    return '+Inf' if value > 0 else '-Inf'
+
+
+class OpenMetricsExporter:
+    """
+    Converts :class:`~zhmcclient.MetricsResponse` objects into the
+    OpenMetrics text format.
+
+    Each integer, float and boolean metric of a metric group becomes a
+    metric family named ``<prefix>_<group>_<metric>[_<unit>]``, with dashes
+    replaced by underscores. The unit is derived from
+    :attr:`zhmcclient.MetricDefinition.unit` (e.g. ``bytes`` or ``percent``).
+    Counter metrics (see the `counter_metrics` init parameter) become
+    OpenMetrics counters, and all other metrics become gauges. Boolean
+    metrics are rendered as 0 and 1.
+
+    String metrics are rendered as labels of the other metrics of the same
+    value row. This keeps the samples of metric groups with multiple value
+    rows per resource (e.g. 'channel-usage') unique.
+
+    The resource of a value row is represented by labels named after the
+    resource class and the classes of its parent resources (e.g.
+    ``cpc="CPC1",partition="PART1"``), with the resource names as values. The
+    resources are resolved in bulk using
+    :meth:`~zhmcclient.MetricsResponse.resolve_resources` when they are
+    first seen, and the rendered label sets are cached. Resources that are
+    not found are represented by a ``resource_uri`` label.
+
+    If a metrics response contains multiple samples for the same resource,
+    only the samples with the newest timestamp are rendered.
+
+    HMC/SE version requirements: None
+    """
+
+    def __init__(self, prefix='zhmc', counter_metrics=None,
+                 resolve_resources=True, timestamps=False):
+        """
+        Parameters:
+
+          prefix (:term:`string`):
+            Prefix for the metric family names. An empty string means no
+            prefix.
+
+          counter_metrics (dict):
+            The names of the metrics that are counters, as a dictionary with
+            key: metric group name, value: iterable of metric names.
+            `None` means to use the same default as
+            :class:`~zhmcclient.MetricsPoller`.
+
+          resolve_resources (bool):
+            Resolve the resources to get their names for the resource labels.
+            If `False`, the resources are represented by a ``resource_uri``
+            label, and no HMC operations are performed.
+
+          timestamps (bool):
+            Render the HMC timestamps of the samples. If `False`, the
+            scraping system assigns the time of the scrape.
+        """
+        self._prefix = f'{prefix}_' if prefix else ''
+        if counter_metrics is None:
+            counter_metrics = COUNTER_METRICS
+        self._counter_metrics = {
+            mg_name: frozenset(m_names)
+            for mg_name, m_names in counter_metrics.items()}
+        self._resolve_resources = resolve_resources
+        self._timestamps = timestamps
+
+        # Rendered family headers and sample names, by tuple(group, metric)
+        self._families = {}
+
+        # Rendered resource label sets, by resource URI
+        self._resource_labels = {}
+
+        # Resource objects, by resource URI
+        self._resource_cache = {}
+
+    def __repr__(self):
+        """
+        Return a string with the state of this exporter, for debug purposes.
+        """
+        ret = (
+            f"{repr_obj_id(self)} (\n"
+            f"  _prefix = {self._prefix!r}\n"
+            f"  _resolve_resources = {self._resolve_resources!r}\n"
+            f"  _timestamps = {self._timestamps!r}\n"
+            f"  len(_families) = {len(self._families)!r}\n"
+            f"  len(_resource_labels) = {len(self._resource_labels)!r}\n"
+            ")")
+        return ret
+
+    def clear_cache(self):
+        """
+        Clear the cached resource label sets and resources, e.g. after
+        resources have been renamed.
+        """
+        self._resource_labels.clear()
+        self._resource_cache.clear()
+
+    def _family(self, mg_name, m_def):
+        """
+        Return a tuple(header, sample_name) for a metric, where header is the
+        rendered metric family header.
+        """
+        key = (mg_name, m_def.name)
+        try:
+            return self._families[key]
+        except KeyError:
+            pass
+        name = (f'{self._prefix}{_openmetrics_name(mg_name)}_'
+                f'{_openmetrics_name(m_def.name)}')
+        unit = OPENMETRICS_UNITS.get(m_def.unit)
+        if unit and not name.endswith(f'_{unit}'):
+            name = f'{name}_{unit}'
+        header = ''
+        if m_def.name in self._counter_metrics.get(mg_name, ()):
+            header += f'# TYPE {name} counter\n'
+            sample_name = f'{name}_total'
+        else:
+            header += f'# TYPE {name} gauge\n'
+            sample_name = name
+        if unit:
+            header += f'# UNIT {name} {unit}\n'
+        family = (header, sample_name)
+        self._families[key] = family
+        return family
+
+    def _render_resource_labels(self, resource_uri):
+        """
+        Return the rendered label set for a resource.
+        """
+        resource = self._resource_cache.get(resource_uri)
+        if resource is None:
+            return f'resource_uri={_label_value(resource_uri)}'
+        labels = []
+        while isinstance(resource, BaseResource):
+            class_name = _openmetrics_name(resource.manager.class_name)
+            labels.insert(0, f'{class_name}={_label_value(resource.name)}')
+            resource = resource.manager.parent
+        return ','.join(labels)
+
+    def _update_resource_labels(self, metrics_response):
+        """
+        Render the label sets of the resources in a metrics response that are
+        not yet cached.
+        """
+        resource_labels = self._resource_labels
+        missing_uris = set()
+        for mgc in metrics_response.metric_group_columns:
+            missing_uris.update(mgc.resource_uris)
+        missing_uris.difference_update(resource_labels)
+        if not missing_uris:
+            return
+        if self._resolve_resources:
+            metrics_response.resolve_resources(self._resource_cache)
+        for resource_uri in missing_uris:
+            resource_labels[resource_uri] = \
+                self._render_resource_labels(resource_uri)
+
+    @logged_api_call
+    def export(self, metrics_response):
+        """
+        Convert a metrics response into the OpenMetrics text format.
+
+        Parameters:
+
+          metrics_response (:class:`~zhmcclient.MetricsResponse`):
+            The metrics response. It is converted via its columnar form (see
+            :attr:`~zhmcclient.MetricsResponse.metric_group_columns`), so it
+            is most efficient to create it with `columnar=True`.
+
+        Returns:
+
+          :term:`unicode string`: The metrics in the OpenMetrics text format,
+          including the terminating ``# EOF`` line.
+
+        Raises:
+
+          :exc:`~zhmcclient.HTTPError`
+          :exc:`~zhmcclient.ParseError`
+          :exc:`~zhmcclient.AuthError`
+          :exc:`~zhmcclient.ConnectionError`
+        """
+        self._update_resource_labels(metrics_response)
+        parts = []
+        for mgc in metrics_response.metric_group_columns:
+            self._export_group(mgc, parts)
+        parts.append('# EOF\n')
+        return ''.join(parts)
+
+    def _export_group(self, mgc, parts):
+        """
+        Append the rendered metric families of a metric group to a list of
+        strings.
+        """
+        # pylint: disable=too-many-locals
+        mg_name = mgc.name
+        m_defs = mgc.metric_group_definition.metric_definitions
+        resource_uris = mgc.resource_uris
+        timestamps = mgc.timestamps
+
+        # Select the value rows of the newest sample of each resource
+        newest = {}
+        for resource_uri, timestamp in zip(resource_uris, timestamps):
+            if timestamp > newest.get(resource_uri, -1):
+                newest[resource_uri] = timestamp
+        rows = [i for i, resource_uri in enumerate(resource_uris)
+                if timestamps[i] == newest[resource_uri]]
+
+        numeric_columns = []
+        string_columns = []
+        for m_name, column in mgc.columns.items():
+            if m_defs[m_name].type is str:
+                string_columns.append((_openmetrics_name(m_name), column))
+            else:
+                numeric_columns.append((m_defs[m_name], column))
+
+        # Render the label set and the rest of the sample line after the value
+        # once per value row
+        resource_labels = self._resource_labels
+        row_labels = []
+        row_suffixes = []
+        for i in rows:
+            labels = resource_labels[resource_uris[i]]
+            if string_columns:
+                labels += ''.join(
+                    f',{label}={_label_value(column[i])}'
+                    for label, column in string_columns)
+            row_labels.append(f'{{{labels}}} ')
+            if self._timestamps:
+                row_suffixes.append(f' {timestamps[i] / 1000}\n')
+        if not self._timestamps:
+            row_suffixes = ['\n'] * len(rows)
+
+        for m_def, column in numeric_columns:
+            header, sample_name = self._family(mg_name, m_def)
+            parts.append(header)
+            if len(rows) == len(column):
+                values = column
+            else:
+                values = [column[i] for i in rows]
+            if m_def.type is float:
+                values = [_float_value(value) for value in values]
+            parts.extend(
+                f'{sample_name}{labels}{value}{suffix}'
+                for labels, value, suffix
+                in zip(row_labels, values, row_suffixes))
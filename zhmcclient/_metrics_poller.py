@@ -0,0 +1,520 @@
+# Copyright 2026 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+A :class:`~zhmcclient.MetricsPoller` retrieves metrics from the HMC
+periodically, and returns only the metric values of samples that have not
+been returned before, as :class:`~zhmcclient.MetricsRecord` objects. For
+counter metrics, the records include the deltas and rates since the previous
+sample of the same resource.
+
+The basic usage of the metrics poller is shown in this example:
+
+.. code-block:: python
+
+    metric_groups = ['partition-usage', 'partition-attached-network-interface']
+    with zhmcclient.MetricsPoller(client, metric_groups) as poller:
+        for record in poller.records():
+            print(record.group_name, record.resource_uri, record.timestamp,
+                  record.metrics, record.rates)
+"""
+
+from collections import namedtuple
+import math
+import time
+import threading
+
+from ._metrics import MetricsResponse, _datetime_from_metrics_timestamp
+from ._exceptions import HTTPError
+from ._logging import logged_api_call
+from ._utils import repr_obj_id
+
+__all__ = ['MetricsPoller', 'MetricsRecord']
+
+# Default polling interval in seconds. This is the minimum sampling interval
+# of the HMC.
+DEFAULT_POLL_INTERVAL = 15
+
+# Names of the metrics that are counters (i.e. that have cumulative values),
+# by metric group name. These are used as the default for counter metrics.
+COUNTER_METRICS = {
+    'network-physical-adapter-port': (
+        'bytes-sent', 'bytes-received', 'packets-sent', 'packets-received',
+        'packets-sent-dropped', 'packets-received-dropped',
+        'packets-sent-discarded', 'packets-received-discarded',
+        'multicast-packets-sent', 'multicast-packets-received',
+        'broadcast-packets-sent', 'broadcast-packets-received',
+    ),
+    'partition-attached-network-interface': (
+        'bytes-sent', 'bytes-received', 'packets-sent', 'packets-received',
+        'packets-sent-dropped', 'packets-received-dropped',
+        'packets-sent-discarded', 'packets-received-discarded',
+        'multicast-packets-sent', 'multicast-packets-received',
+        'broadcast-packets-sent', 'broadcast-packets-received',
+    ),
+}
+
+
+_MetricsRecordTuple = namedtuple(
+    '_MetricsRecordTuple',
+    ['group_name', 'resource_uri', 'timestamp', 'metrics', 'deltas', 'rates']
+)
+
+
+class MetricsRecord(_MetricsRecordTuple):
+    """
+    A :func:`namedtuple <py:collections.namedtuple>` representing the metric
+    values of one value row of a metric group for a single resource and point
+    in time, as returned by :class:`~zhmcclient.MetricsPoller`.
+
+    HMC/SE version requirements: None
+    """
+
+    def __new__(cls, group_name, resource_uri, timestamp, metrics, deltas,
+                rates):
+        # pylint: disable=too-many-arguments
+        """
+        Parameters:
+
+          group_name (:term:`string`):
+            Metric group name.
+
+          resource_uri (:term:`string`):
+            Resource URI of the resource the metric values apply to.
+
+          timestamp (:class:`py:datetime.datetime`):
+            Point in time when the HMC captured the metric values (as a
+            timezone-aware datetime object).
+
+          metrics (dict):
+            The metric values, as a dictionary of the (Python typed) metric
+            values, by metric name.
+
+          deltas (dict):
+            The differences of the values of the counter metrics to their
+            values in the previous sample of the same resource, by metric
+            name. Counter metrics without a previous sample or whose value
+            has decreased (e.g. due to a reset of the counter) are not
+            included.
+
+          rates (dict):
+            The deltas of the counter metrics divided by the time in seconds
+            since the previous sample, by metric name.
+
+        All these parameters are also available as same-named attributes.
+        """
+        self = super().__new__(
+            cls, group_name, resource_uri, timestamp, metrics, deltas, rates)
+        return self
+
+    __slots__ = ()
+
+    def __repr__(self):
+        repr_str = (
+            "MetricsRecord("
+            f"group_name={self.group_name!r}, "
+            f"resource_uri={self.resource_uri!r}, "
+            f"timestamp={self.timestamp!r}, "
+            f"metrics={self.metrics!r}, "
+            f"deltas={self.deltas!r}, "
+            f"rates={self.rates!r})")
+        return repr_str
+
+
+class MetricsPoller:
+    """
+    A poller for metrics from the HMC, that maintains a
+    :term:`Metrics Context` and returns the metric values of new samples as
+    :class:`~zhmcclient.MetricsRecord` objects.
+
+    The poller has the following properties:
+
+    * The :term:`Metrics Context` is created on the first poll. If the HMC
+      deletes it (e.g. because it was not used for some time, or because the
+      HMC was restarted), it is re-created transparently.
+
+    * Metric values with a timestamp that is not newer than the timestamp of
+      the last returned metric values of the same metric group and resource
+      are skipped. Thus, polling more frequently than the HMC samples does
+      not return duplicate samples.
+
+    * For counter metrics, the deltas and rates since the previous sample of
+      the same resource are computed.
+
+    * The :meth:`records` generator polls on a fixed schedule that does not
+      drift with the processing time. If a poll does not return new samples
+      because the HMC has not sampled yet, it polls again shortly after, and
+      continues the schedule from the time the new samples were returned.
+      This aligns the polls to the sampling interval of the HMC, so that
+      samples are returned shortly after the HMC captured them and no
+      samples are missed.
+
+    HMC/SE version requirements: None
+    """
+
+    def __init__(self, client, metric_groups, interval=DEFAULT_POLL_INTERVAL,
+                 counter_metrics=None, retry_interval=None):
+        # pylint: disable=too-many-arguments
+        """
+        Parameters:
+
+          client (:class:`~zhmcclient.Client`):
+            The client for the HMC.
+
+          metric_groups (:term:`iterable` of :term:`string`):
+            The names of the metric groups to be polled.
+
+          interval (:term:`number`):
+            Polling interval in seconds. This is also used as the anticipated
+            frequency of the :term:`Metrics Context`, so it must be a valid
+            value for the 'anticipated-frequency-seconds' property (see the
+            'Create Metrics Context' operation in the :term:`HMC API` book).
+
+          counter_metrics (dict):
+            The names of the metrics that are counters, as a dictionary with
+            key: metric group name, value: iterable of metric names.
+            `None` means to use a default that includes the counter metrics
+            of the 'network-physical-adapter-port' and
+            'partition-attached-network-interface' metric groups.
+
+          retry_interval (:term:`number`):
+            Time in seconds to wait before polling again, if a poll of the
+            :meth:`records` generator did not return new samples.
+            `None` means to use one fifteenth of the polling interval.
+        """
+        self._client = client
+        self._metric_groups = list(metric_groups)
+        self._interval = interval
+        if counter_metrics is None:
+            counter_metrics = COUNTER_METRICS
+        self._counter_metrics = {
+            mg_name: frozenset(m_names)
+            for mg_name, m_names in counter_metrics.items()}
+        self._retry_interval = retry_interval if retry_interval is not None \
+            else interval / 15
+
+        self._metrics_context = None
+        self._context_creations = 0
+
+        # HMC timestamp of the last returned sample, by tuple(group, uri)
+        self._last_timestamps = {}
+
+        # Timestamp and counter values of the last returned sample, by
+        # tuple(group, uri, row), where row is the index of the value row
+        # within the ObjectValues item.
+        self._last_counters = {}
+
+        self._stop_event = threading.Event()
+
+    def __repr__(self):
+        """
+        Return a string with the state of this poller, for debug purposes.
+        """
+        ret = (
+            f"{repr_obj_id(self)} (\n"
+            f"  _client = {repr_obj_id(self._client)}\n"
+            f"  _metric_groups = {self._metric_groups!r}\n"
+            f"  _interval = {self._interval!r}\n"
+            f"  _retry_interval = {self._retry_interval!r}\n"
+            f"  _metrics_context = {repr_obj_id(self._metrics_context)}\n"
+            f"  _context_creations = {self._context_creations!r}\n"
+            ")")
+        return ret
+
+    def __enter__(self):
+        """
+        Enter the runtime context of this poller.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Exit the runtime context of this poller, by closing it.
+        """
+        self.close()
+
+    @property
+    def client(self):
+        """
+        :class:`~zhmcclient.Client`: The client for the HMC.
+        """
+        return self._client
+
+    @property
+    def metric_groups(self):
+        """
+        list of :term:`string`: The names of the polled metric groups.
+        """
+        return list(self._metric_groups)
+
+    @property
+    def interval(self):
+        """
+        :term:`number`: Polling interval in seconds.
+        """
+        return self._interval
+
+    @property
+    def metrics_context(self):
+        """
+        :class:`~zhmcclient.MetricsContext`: The current
+        :term:`Metrics Context` of this poller, or `None` if it has not been
+        created yet.
+        """
+        return self._metrics_context
+
+    @property
+    def context_creations(self):
+        """
+        int: The number of times the :term:`Metrics Context` has been created
+        by this poller. A value greater than 1 indicates that it has been
+        re-created.
+        """
+        return self._context_creations
+
+    def _create_context(self):
+        """
+        Create a new Metrics Context for this poller.
+        """
+        old_mc = self._metrics_context
+        if old_mc is not None:
+            # The HMC no longer has it, so remove it from the manager's list
+            # pylint: disable=protected-access
+            mc_list = self._client.metrics_contexts._metrics_contexts
+            if old_mc in mc_list:
+                mc_list.remove(old_mc)
+        self._metrics_context = self._client.metrics_contexts.create({
+            'anticipated-frequency-seconds': self._interval,
+            'metric-groups': self._metric_groups,
+        })
+        self._context_creations += 1
+
+    @logged_api_call
+    def get_metrics_response(self):
+        """
+        Retrieve the current metrics from the HMC once, and return them
+        as a metrics response, without skipping samples that have been
+        returned before.
+
+        If the :term:`Metrics Context` of this poller does not exist yet or no
+        longer exists on the HMC, it is created.
+
+        Returns:
+
+          :class:`~zhmcclient.MetricsResponse`: The metrics response, created
+          with `columnar=True`.
+
+        Raises:
+
+          :exc:`~zhmcclient.HTTPError`
+          :exc:`~zhmcclient.ParseError`
+          :exc:`~zhmcclient.AuthError`
+          :exc:`~zhmcclient.ConnectionError`
+        """
+        if self._metrics_context is None:
+            self._create_context()
+        try:
+            mr_str = self._metrics_context.get_metrics()
+        except HTTPError as exc:
+            if exc.http_status == 404 and exc.reason == 1:
+                # The Metrics Context no longer exists on the HMC
+                self._create_context()
+                mr_str = self._metrics_context.get_metrics()
+            else:
+                raise
+        return MetricsResponse(self._metrics_context, mr_str, columnar=True)
+
+    @logged_api_call
+    def poll(self):
+        """
+        Retrieve the current metrics from the HMC once, and return the
+        records for the samples that have not been returned before.
+
+        If the :term:`Metrics Context` of this poller does not exist yet or no
+        longer exists on the HMC, it is created.
+
+        Returns:
+
+          list of :class:`~zhmcclient.MetricsRecord`: The records of the new
+          samples, in the order of the metrics response.
+
+        Raises:
+
+          :exc:`~zhmcclient.HTTPError`
+          :exc:`~zhmcclient.ParseError`
+          :exc:`~zhmcclient.AuthError`
+          :exc:`~zhmcclient.ConnectionError`
+        """
+        mr = self.get_metrics_response()
+        records = []
+        for mgc in mr.metric_group_columns:
+            self._add_records(mgc, records)
+        return records
+
+    def _add_records(self, mgc, records):
+        """
+        Add the records for the new samples in a MetricGroupColumns object
+        to a list of records.
+        """
+        # pylint: disable=too-many-locals
+        group_name = mgc.name
+        counter_names = self._counter_metrics.get(group_name, frozenset())
+        columns = []  # tuple(name, column, is_bool)
+        for m_name, column in mgc.columns.items():
+            is_bool = mgc.metric_group_definition.metric_definitions[
+                m_name].type is bool
+            columns.append((m_name, column, is_bool))
+        last_timestamps = self._last_timestamps
+        last_counters = self._last_counters
+        datetimes = {}  # Converted timestamps, by HMC timestamp
+        resource_uris = mgc.resource_uris
+        timestamps = mgc.timestamps
+
+        prev_block = None
+        row = 0
+        is_new = False
+        for i, resource_uri in enumerate(resource_uris):
+            timestamp = timestamps[i]
+            # The value rows of one ObjectValues item have the same resource
+            # URI and timestamp
+            block = (resource_uri, timestamp)
+            if block == prev_block:
+                row += 1
+            else:
+                row = 0
+                prev_block = block
+                key = (group_name, resource_uri)
+                is_new = timestamp > last_timestamps.get(key, -1)
+                if is_new:
+                    last_timestamps[key] = timestamp
+            if not is_new:
+                continue
+
+            metrics = {}
+            for m_name, column, is_bool in columns:
+                value = column[i]
+                metrics[m_name] = bool(value) if is_bool else value
+
+            deltas = {}
+            rates = {}
+            if counter_names:
+                counters = {n: metrics[n] for n in counter_names
+                            if n in metrics}
+                row_key = (group_name, resource_uri, row)
+                last = last_counters.get(row_key)
+                if last is not None:
+                    last_timestamp, last_values = last
+                    seconds = (timestamp - last_timestamp) / 1000
+                    for m_name, value in counters.items():
+                        last_value = last_values.get(m_name)
+                        if last_value is None:
+                            continue
+                        delta = value - last_value
+                        if delta < 0:
+                            # The counter has been reset
+                            continue
+                        deltas[m_name] = delta
+                        if seconds > 0:
+                            rates[m_name] = delta / seconds
+                last_counters[row_key] = (timestamp, counters)
+
+            try:
+                dt_timestamp = datetimes[timestamp]
+            except KeyError:
+                dt_timestamp = _datetime_from_metrics_timestamp(timestamp)
+                datetimes[timestamp] = dt_timestamp
+
+            records.append(MetricsRecord(
+                group_name, resource_uri, dt_timestamp, metrics, deltas,
+                rates))
+
+    def records(self):
+        """
+        Generator that polls the metrics from the HMC on a fixed schedule
+        and yields the records of the new samples, until :meth:`stop` or
+        :meth:`close` is called.
+
+        The first poll happens immediately. The subsequent polls happen at
+        multiples of the polling interval after the first poll, independent
+        of the time needed for polling and for processing the records. If
+        polling falls behind the schedule, the missed polls are skipped
+        (the samples are not missed, because a poll returns all samples the
+        HMC has captured). If a poll does not return new samples, the
+        generator polls again after the retry interval, and continues the
+        schedule from there.
+
+        Returns:
+
+          :term:`iterable` of :class:`~zhmcclient.MetricsRecord`: The records
+          of the new samples.
+
+        Raises:
+
+          :exc:`~zhmcclient.HTTPError`
+          :exc:`~zhmcclient.ParseError`
+          :exc:`~zhmcclient.AuthError`
+          :exc:`~zhmcclient.ConnectionError`
+        """
+        self._stop_event.clear()
+        next_time = time.monotonic()
+        while True:
+            wait_time = next_time - time.monotonic()
+            if wait_time > 0:
+                self._stop_event.wait(wait_time)
+            if self._stop_event.is_set():
+                return
+            records = self.poll()
+            now = time.monotonic()
+            if records:
+                next_time += self._interval
+                if next_time <= now:
+                    # Polling fell behind the schedule; skip the missed polls
+                    missed = math.floor((now - next_time) / self._interval)
+                    next_time += (missed + 1) * self._interval
+            else:
+                # The HMC has not sampled yet; poll again shortly and continue
+                # the schedule from there
+                next_time = now + self._retry_interval
+            yield from records
+
+    def stop(self):
+        """
+        Stop the :meth:`records` generator.
+
+        The generator returns before its next poll. This method can be called
+        from another thread, or from the code that processes the records.
+        """
+        self._stop_event.set()
+
+    @logged_api_call
+    def close(self):
+        """
+        Stop the :meth:`records` generator and delete the
+        :term:`Metrics Context` of this poller on the HMC.
+
+        Raises:
+
+          :exc:`~zhmcclient.HTTPError`
+          :exc:`~zhmcclient.ParseError`
+          :exc:`~zhmcclient.AuthError`
+          :exc:`~zhmcclient.ConnectionError`
+        """
+        self.stop()
+        if self._metrics_context is not None:
+            try:
+                self._metrics_context.delete()
+            except HTTPError as exc:
+                if exc.http_status != 404 or exc.reason != 1:
+                    raise
+            self._metrics_context = None
@@ -0,0 +1,459 @@
+# Copyright 2026 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+A :class:`~zhmcclient.MetricsStore` keeps the recent history of numeric
+metric values in memory, with a bounded memory consumption. It is fed from
+:class:`~zhmcclient.MetricsResponse` objects and supports time range queries
+on the raw samples and on downsampled (averaged) samples.
+
+The basic usage of the metrics store is shown in this example:
+
+.. code-block:: python
+
+    store = zhmcclient.MetricsStore(
+        capacity=240, downsampling=[(60, 1440), (900, 672)])
+    while True:
+        mr_str = mc.get_metrics()
+        store.add(zhmcclient.MetricsResponse(mc, mr_str, columnar=True))
+        ...
+        last_hour = store.query(
+            partition_uri, 'processor-usage',
+            start=datetime.now(timezone.utc) - timedelta(hours=1),
+            interval=60)
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+
+from ._metrics import MetricsResponse, MetricGroupValues, MetricGroupColumns, \
+    _COLUMN_TYPECODES
+from ._utils import datetime_from_timestamp, timestamp_from_datetime, \
+    repr_obj_id
+
+__all__ = ['MetricsStore']
+
+# Default number of raw samples kept per metric. With the minimum sampling
+# interval of the HMC of 15 seconds, this is one hour.
+DEFAULT_STORE_CAPACITY = 240
+
+# Default downsampling levels, as tuples of (interval in seconds, number of
+# downsampled samples kept per metric): One day of 1-minute averages and one
+# week of 15-minute averages.
+DEFAULT_DOWNSAMPLING = ((60, 1440), (900, 672))
+
+
+def _row_indexes(resource_uris, timestamps):
+    """
+    Return the index of each value row within the consecutive value rows for
+    the same resource and timestamp.
+    """
+    rows = []
+    prev_key = None
+    row = 0
+    for key in zip(resource_uris, timestamps):
+        row = row + 1 if key == prev_key else 0
+        rows.append(row)
+        prev_key = key
+    return rows
+
+
+class _RingBuffer:
+    """
+    A ring buffer of (timestamp, value) samples in ascending timestamp order,
+    backed by typed arrays.
+
+    The arrays grow up to the capacity, and then the oldest samples are
+    overwritten.
+    """
+
+    __slots__ = ('_capacity', '_timestamps', '_values', '_start')
+
+    def __init__(self, capacity, typecode):
+        self._capacity = capacity
+        self._timestamps = array('q')
+        self._values = array(typecode)
+        self._start = 0  # Index of the oldest sample, once full
+
+    def __len__(self):
+        return len(self._timestamps)
+
+    def append(self, timestamp, value):
+        """
+        Append a sample, overwriting the oldest sample if the buffer is full.
+        """
+        try:
+            self._append(timestamp, value)
+        except OverflowError:
+            # An integer value exceeds 64 bits
+            self._values = array('d', self._values)
+            self._append(timestamp, value)
+
+    def _append(self, timestamp, value):
+        if len(self._timestamps) < self._capacity:
+            # Append the value first, since it may raise OverflowError
+            self._values.append(value)
+            self._timestamps.append(timestamp)
+        else:
+            start = self._start
+            self._values[start] = value
+            self._timestamps[start] = timestamp
+            self._start = (start + 1) % self._capacity
+
+    def last_timestamp(self):
+        """
+        Return the timestamp of the newest sample, or -1 if empty.
+        """
+        if not self._timestamps:
+            return -1
+        return self._timestamps[self._start - 1]
+
+    def _ordered(self):
+        """
+        Return the timestamps and values arrays in ascending timestamp order.
+        """
+        start = self._start
+        if start == 0:
+            return self._timestamps, self._values
+        return (self._timestamps[start:] + self._timestamps[:start],
+                self._values[start:] + self._values[:start])
+
+    def samples(self, start, end):
+        """
+        Return the samples with start <= timestamp <= end as a list of
+        tuple(timestamp, value).
+        """
+        timestamps, values = self._ordered()
+        first = 0 if start is None else bisect_left(timestamps, start)
+        last = len(timestamps) if end is None else \
+            bisect_right(timestamps, end)
+        return list(zip(timestamps[first:last], values[first:last]))
+
+
+class _Downsampler:
+    """
+    The averaged samples of one downsampling level of a metric, and the
+    accumulator for the current (incomplete) interval.
+    """
+
+    __slots__ = ('interval', 'buffer', '_bucket', '_sum', '_count')
+
+    def __init__(self, interval, capacity):
+        self.interval = interval  # in milliseconds
+        self.buffer = _RingBuffer(capacity, 'd')
+        self._bucket = None  # Start timestamp of the current interval
+        self._sum = 0
+        self._count = 0
+
+    def add(self, timestamp, value):
+        """
+        Add a raw sample. When the sample starts a new interval, the average
+        of the previous interval is appended to the buffer.
+        """
+        bucket = timestamp - timestamp % self.interval
+        if bucket != self._bucket:
+            if self._count:
+                self.buffer.append(self._bucket, self._sum / self._count)
+            self._bucket = bucket
+            self._sum = 0
+            self._count = 0
+        self._sum += value
+        self._count += 1
+
+
+class _MetricSeries:
+    """
+    The raw and downsampled samples of one metric of one resource.
+    """
+
+    __slots__ = ('raw', 'downsamplers')
+
+    def __init__(self, typecode, capacity, downsampling):
+        self.raw = _RingBuffer(capacity, typecode)
+        self.downsamplers = [_Downsampler(interval * 1000, ds_capacity)
+                             for interval, ds_capacity in downsampling]
+
+    def add(self, timestamp, value):
+        """
+        Add a raw sample, if it is newer than the newest raw sample.
+        """
+        if timestamp <= self.raw.last_timestamp():
+            return
+        self.raw.append(timestamp, value)
+        for downsampler in self.downsamplers:
+            downsampler.add(timestamp, value)
+
+
+class MetricsStore:
+    """
+    An in-memory store for the recent history of numeric metric values, with
+    a bounded memory consumption.
+
+    The store keeps one series of samples per resource URI, metric name and
+    value row. Metric groups that have multiple value rows per resource and
+    point in time (e.g. 'channel-usage' with one row per channel) have one
+    series per row, identified by the index of the row within the value rows
+    of the resource and point in time. For all other metric groups, the row
+    index is 0.
+    Each series consists of a ring buffer with the most recent raw samples,
+    and of one ring buffer per downsampling level with the averages of the
+    raw samples over the intervals of that level. The ring buffers are backed
+    by typed arrays (see :mod:`py:array`), so that each sample needs 16 bytes
+    or less. Once a ring buffer is full, its oldest samples are overwritten.
+
+    Only integer, float and boolean metrics are stored. String metrics are
+    ignored. Boolean metrics are stored as 0 and 1, so their averages are the
+    fraction of samples that were `True`.
+
+    A sample is stored only if it is newer than the newest sample of the
+    series, so adding the same metrics response multiple times stores its
+    samples only once.
+
+    HMC/SE version requirements: None
+    """
+
+    def __init__(self, capacity=DEFAULT_STORE_CAPACITY,
+                 downsampling=DEFAULT_DOWNSAMPLING):
+        """
+        Parameters:
+
+          capacity (int):
+            Maximum number of raw samples kept per series.
+
+          downsampling (:term:`iterable` of tuple(int, int)):
+            The downsampling levels, as tuples of (interval, capacity), where
+            interval is the downsampling interval in seconds, and capacity is
+            the maximum number of downsampled samples kept per series at
+            that level. An empty iterable disables downsampling.
+
+        Raises:
+
+          ValueError: Invalid capacity or downsampling level.
+        """
+        downsampling = tuple(tuple(level) for level in downsampling)
+        if capacity < 1:
+            raise ValueError(
+                f"Invalid metrics store capacity: {capacity!r}")
+        for interval, ds_capacity in downsampling:
+            if interval <= 0 or ds_capacity < 1:
+                raise ValueError(
+                    "Invalid metrics store downsampling level: "
+                    f"{(interval, ds_capacity)!r}")
+        self._capacity = capacity
+        self._downsampling = downsampling
+        self._series = {}  # by tuple(resource_uri, metric_name, row)
+
+    def __repr__(self):
+        """
+        Return a string with the state of this store, for debug purposes.
+        """
+        ret = (
+            f"{repr_obj_id(self)} (\n"
+            f"  _capacity = {self._capacity!r}\n"
+            f"  _downsampling = {self._downsampling!r}\n"
+            f"  len(_series) = {len(self._series)!r}\n"
+            ")")
+        return ret
+
+    def __len__(self):
+        """
+        Return the number of series in this store.
+        """
+        return len(self._series)
+
+    @property
+    def capacity(self):
+        """
+        int: Maximum number of raw samples kept per series.
+        """
+        return self._capacity
+
+    @property
+    def downsampling(self):
+        """
+        tuple of tuple(int, int): The downsampling levels, as tuples of
+        (interval in seconds, capacity).
+        """
+        return self._downsampling
+
+    def keys(self):
+        """
+        Return the keys of the series in this store.
+
+        Returns:
+
+          list of tuple(resource_uri, metric_name, row): The keys of the
+          series, where row is the index of the value row.
+        """
+        return list(self._series)
+
+    def add(self, metrics):
+        """
+        Add the samples of numeric metrics to this store.
+
+        Parameters:
+
+          metrics: The metric values to be added. May be a
+            :class:`~zhmcclient.MetricsResponse`, a
+            :class:`~zhmcclient.MetricGroupColumns` or a
+            :class:`~zhmcclient.MetricGroupValues` object, or an
+            :term:`iterable` of such objects.
+
+            Metrics responses are processed via their columnar form (see
+            :attr:`~zhmcclient.MetricsResponse.metric_group_columns`), so it
+            is most efficient to create them with `columnar=True`.
+        """
+        if isinstance(metrics, MetricsResponse):
+            for mgc in metrics.metric_group_columns:
+                self._add_columns(mgc)
+        elif isinstance(metrics, MetricGroupColumns):
+            self._add_columns(metrics)
+        elif isinstance(metrics, MetricGroupValues):
+            self._add_object_values(metrics)
+        else:
+            for item in metrics:
+                self.add(item)
+
+    def _get_series(self, resource_uri, metric_name, row, typecode):
+        """
+        Return the series for a resource, metric and value row, creating it if
+        needed.
+        """
+        key = (resource_uri, metric_name, row)
+        try:
+            return self._series[key]
+        except KeyError:
+            series = _MetricSeries(
+                typecode, self._capacity, self._downsampling)
+            self._series[key] = series
+            return series
+
+    def _add_columns(self, mgc):
+        """
+        Add the samples in a MetricGroupColumns object.
+        """
+        m_defs = mgc.metric_group_definition.metric_definitions
+        resource_uris = mgc.resource_uris
+        timestamps = mgc.timestamps
+        rows = _row_indexes(resource_uris, timestamps)
+        for m_name, column in mgc.columns.items():
+            typecode = _COLUMN_TYPECODES.get(m_defs[m_name].type)
+            if typecode is None:
+                continue
+            prev_uri = None
+            prev_row = None
+            series = None
+            for i, resource_uri in enumerate(resource_uris):
+                row = rows[i]
+                if resource_uri != prev_uri or row != prev_row:
+                    series = self._get_series(
+                        resource_uri, m_name, row, typecode)
+                    prev_uri = resource_uri
+                    prev_row = row
+                series.add(timestamps[i], column[i])
+
+    def _add_object_values(self, mgv):
+        """
+        Add the samples in a MetricGroupValues object.
+        """
+        object_values = mgv.object_values
+        timestamps = [timestamp_from_datetime(ov.timestamp)
+                      for ov in object_values]
+        rows = _row_indexes(
+            [ov.resource_uri for ov in object_values], timestamps)
+        for ov, timestamp, row in zip(object_values, timestamps, rows):
+            m_defs = ov.metric_group_definition.metric_definitions
+            for m_name, value in ov.metrics.items():
+                typecode = _COLUMN_TYPECODES.get(m_defs[m_name].type)
+                if typecode is None:
+                    continue
+                series = self._get_series(
+                    ov.resource_uri, m_name, row, typecode)
+                series.add(timestamp, value)
+
+    def query(self, resource_uri, metric_name, start=None, end=None,
+              interval=None, row=0):
+        """
+        Return the samples of a series in a time range.
+
+        Parameters:
+
+          resource_uri (:term:`string`): Resource URI of the series.
+
+          metric_name (:term:`string`): Metric name of the series.
+
+          start (:class:`py:datetime.datetime`):
+            Start of the time range (inclusive). `None` means no lower limit.
+
+          end (:class:`py:datetime.datetime`):
+            End of the time range (inclusive). `None` means no upper limit.
+
+          interval (int):
+            `None` returns the raw samples. Otherwise, the interval in
+            seconds of the downsampling level whose averaged samples are
+            returned. The timestamp of an averaged sample is the start of its
+            interval. The averaged sample of the current interval is returned
+            only once a raw sample in a later interval has been added.
+
+          row (int):
+            Index of the value row of the series, for metric groups that have
+            multiple value rows per resource and point in time.
+
+        Returns:
+
+          list of tuple(datetime, value): The samples in ascending order of
+          time, as tuples of a timezone-aware datetime object and the
+          (Python typed) metric value. Averaged samples are always floats,
+          and boolean metrics are returned as 0 and 1.
+
+        Raises:
+
+          KeyError: The store has no series for the resource, metric and
+            value row.
+          ValueError: No downsampling level with the specified interval.
+        """
+        series = self._series[(resource_uri, metric_name, row)]
+        if interval is None:
+            buffer = series.raw
+        else:
+            for downsampler in series.downsamplers:
+                if downsampler.interval == interval * 1000:
+                    buffer = downsampler.buffer
+                    break
+            else:
+                raise ValueError(
+                    f"Metrics store has no downsampling level with interval "
+                    f"{interval!r}")
+        start_ts = None if start is None else timestamp_from_datetime(start)
+        end_ts = None if end is None else timestamp_from_datetime(end)
+        return [(datetime_from_timestamp(ts), value)
+                for ts, value in buffer.samples(start_ts, end_ts)]
+
+    def remove(self, resource_uri):
+        """
+        Remove all series of a resource from this store, e.g. after the
+        resource has been deleted.
+
+        Parameters:
+
+          resource_uri (:term:`string`): Resource URI of the series.
+        """
+        for key in [k for k in self._series if k[0] == resource_uri]:
+            del self._series[key]
+
+    def clear(self):
+        """
+        Remove all series from this store.
+        """
+        self._series.clear()
@@ -81,7 +81,9 @@ import os
 import json
 import ssl
 import queue
-from collections import namedtuple
+import threading
+import time
+from collections import namedtuple, deque
 import logging
 import uuid
 import certifi
@@ -93,6 +95,7 @@ from ._constants import DEFAULT_STOMP_PORT, DEFAULT_STOMP_CONNECT_TIMEOUT, \
     DEFAULT_STOMP_RECONNECT_SLEEP_JITTER, DEFAULT_STOMP_KEEPALIVE, \
     DEFAULT_STOMP_HEARTBEAT_SEND_CYCLE, DEFAULT_STOMP_HEARTBEAT_RECEIVE_CYCLE, \
     DEFAULT_STOMP_HEARTBEAT_RECEIVE_CHECK, STOMP_MIN_CONNECTION_CHECK_TIME, \
+    DEFAULT_STOMP_HANDOVER_QUEUE_SIZE, DEFAULT_STOMP_HANDOVER_OVERFLOW_POLICY, \
     JMS_LOGGER_NAME
 from ._exceptions import NotificationJMSError, NotificationParseError, \
     SubscriptionNotFound, NotificationConnectionError, \
@@ -100,7 +103,8 @@ from ._exceptions import NotificationJMSError, NotificationParseError, \
 from ._utils import get_stomp_rt_kwargs, get_headers_message
 from ._vendor.python.ssl import match_hostname, CertificateError
 
-__all__ = ['NotificationReceiver', 'StompRetryTimeoutConfig']
+__all__ = ['NotificationReceiver', 'StompRetryTimeoutConfig',
+           'NotificationJournal']
 
 # Write a log message for each STOMP heartbeat sent or received
 DEBUG_HEARTBEATS = False
@@ -121,7 +125,8 @@ class StompRetryTimeoutConfig:
                  reconnect_sleep_initial=None, reconnect_sleep_increase=None,
                  reconnect_sleep_max=None, reconnect_sleep_jitter=None,
                  keepalive=None, heartbeat_send_cycle=None,
-                 heartbeat_receive_cycle=None, heartbeat_receive_check=None):
+                 heartbeat_receive_cycle=None, heartbeat_receive_check=None,
+                 handover_queue_size=None, handover_overflow_policy=None):
         # pylint: disable=line-too-long
         """
         For all parameters, `None` means that this object does not specify a
@@ -189,6 +194,30 @@ class StompRetryTimeoutConfig:
             'heartbeat_receive_cycle' time.
             This value should not be less than 0.5, and a value of 1 or 2 is
             a reasonable value.
+
+          handover_queue_size (:term:`integer`): Maximum number of received
+            notifications that wait for being consumed from a
+            :class:`~zhmcclient.NotificationReceiver`. Connection events
+            (e.g. disconnects) are always queued, even if the maximum is
+            reached.
+
+          handover_overflow_policy (:term:`string`): Policy for received
+            notifications when the maximum number of waiting notifications
+            is reached:
+
+            * ``'block'``: The receiving of notifications (and of STOMP
+              heartbeats) waits for up to 5 seconds for a notification to be
+              consumed, and then drops the received notification.
+            * ``'drop-oldest'``: The oldest waiting notification is dropped.
+            * ``'coalesce'``: If the newest waiting notification for the same
+              resource is a 'property-change' or 'status-change' notification
+              of the same type, the received notification is merged into it
+              (as described for
+              :meth:`~zhmcclient.NotificationReceiver.notification_batches`).
+              Otherwise, the oldest waiting notification is dropped.
+
+            The number of dropped and coalesced notifications is available
+            from the :class:`~zhmcclient.NotificationReceiver` object.
         """  # noqa: E501
         self.connect_timeout = connect_timeout
         self.connect_retries = connect_retries
@@ -200,11 +229,14 @@ class StompRetryTimeoutConfig:
         self.heartbeat_send_cycle = heartbeat_send_cycle
         self.heartbeat_receive_cycle = heartbeat_receive_cycle
         self.heartbeat_receive_check = heartbeat_receive_check
+        self.handover_queue_size = handover_queue_size
+        self.handover_overflow_policy = handover_overflow_policy
 
     _attrs = ('connect_timeout', 'connect_retries', 'reconnect_sleep_initial',
               'reconnect_sleep_increase', 'reconnect_sleep_max',
               'reconnect_sleep_jitter', 'keepalive', 'heartbeat_send_cycle',
-              'heartbeat_receive_cycle', 'heartbeat_receive_check')
+              'heartbeat_receive_cycle', 'heartbeat_receive_check',
+              'handover_queue_size', 'handover_overflow_policy')
 
     def override_with(self, override_config):
         """
@@ -267,11 +299,13 @@ class NotificationReceiver:
         heartbeat_send_cycle=DEFAULT_STOMP_HEARTBEAT_SEND_CYCLE,
         heartbeat_receive_cycle=DEFAULT_STOMP_HEARTBEAT_RECEIVE_CYCLE,
         heartbeat_receive_check=DEFAULT_STOMP_HEARTBEAT_RECEIVE_CHECK,
+        handover_queue_size=DEFAULT_STOMP_HANDOVER_QUEUE_SIZE,
+        handover_overflow_policy=DEFAULT_STOMP_HANDOVER_OVERFLOW_POLICY,
     )
 
     def __init__(self, topic_names, host, userid, password,
                  port=DEFAULT_STOMP_PORT, stomp_rt_config=None,
-                 verify_cert=False):
+                 verify_cert=False, journal=None):
         """
         Parameters:
 
@@ -343,6 +377,10 @@ class NotificationReceiver:
             For details, see the :ref:`HMC certificate` section.
 
             *Added in version 1.22.0*
+
+          journal (:class:`~zhmcclient.NotificationJournal`):
+            Journal to which the received notifications are appended, or
+            `None` for not journaling the notifications.
         """
         if not isinstance(topic_names, (list, tuple)):
             topic_names = [topic_names]
@@ -372,7 +410,9 @@ class NotificationReceiver:
 
         # Thread-safe handover queue between listener thread and receiver
         # thread
-        self._handover_queue = queue.Queue(1000)
+        self._handover_queue = _HandoverQueue(
+            self._rt_config.handover_queue_size,
+            self._rt_config.handover_overflow_policy)
 
         # STOMP connection
         self._conn = None
@@ -380,6 +420,11 @@ class NotificationReceiver:
         # Open/closed state of the receiver
         self._closed = False
 
+        self._journal = journal
+
+        # Tracking of the session sequence numbers of the notifications
+        self._seq_tracker = _SequenceTracker()
+
         # Lazy importing of the stomp module, because the import is slow in some
         # versions.
         # pylint: disable=import-outside-toplevel
@@ -412,33 +457,16 @@ class NotificationReceiver:
                 "Disconnecting previous STOMP connection")
             self._conn.disconnect(receipt=uuid.uuid4())
 
+        # The session sequence numbers of the new connection are not related
+        # to the ones of the previous connection.
+        self._seq_tracker.reset()
+
         # Set up the STOMP listener
-        JMS_LOGGER.info("Setting up a STOMP connection")
-        rt_kwargs = get_stomp_rt_kwargs(self._rt_config)
-        self._conn = self._stomp.Connection(
-            [(self._host, self._port)], **rt_kwargs)
-        set_kwargs = dict()
-        set_kwargs['ssl_version'] = ssl.PROTOCOL_TLS_CLIENT
-        if self._verify_cert is True:
-            ca_cert = certifi.where()
-        elif isinstance(self._verify_cert, str):
-            ca_cert = self._verify_cert
-        else:
-            ca_cert = None
-        if ca_cert:
-            JMS_LOGGER.info(
-                "Enabling certificate validation with CA path: %s", ca_cert)
-            set_kwargs['ca_certs'] = ca_cert
-            # Note: According to https://docs.python.org/3/library/ssl.html#
-            # ssl.SSLSocket.do_handshake, hostname validation is performed by
-            # OpenSSL since Python 3.7. However, this does not work with
-            # stomp.py for some reason. Therefore, we perform hostname
-            # validation ourselves.
-            set_kwargs['cert_validator'] = validate_cert_hostname
-        else:
-            JMS_LOGGER.warning("Certificate validation is disabled")
-        self._conn.set_ssl(for_hosts=[(self._host, self._port)], **set_kwargs)
-        listener = _NotificationListener(self._handover_queue)
+        self._conn = create_stomp_connection(
+            self._stomp, self._host, self._port, self._rt_config,
+            self._verify_cert)
+        listener = _NotificationListener(
+            self._handover_queue, self._track_message)
         self._conn.set_listener('', listener)
 
         connected = self.is_connected()
@@ -458,6 +486,75 @@ class NotificationReceiver:
         for topic_name in self._topic_names:
             self.subscribe(topic_name)
 
+    @property
+    def journal(self):
+        """
+        :class:`~zhmcclient.NotificationJournal`: The journal to which the
+        received notifications are appended, or `None`.
+        """
+        return self._journal
+
+    @property
+    def queue_depth(self):
+        """
+        :term:`integer`: Number of received notifications and connection
+        events that currently wait for being consumed.
+        """
+        return self._handover_queue.qsize()
+
+    @property
+    def max_queue_depth(self):
+        """
+        :term:`integer`: Maximum number of received notifications and
+        connection events that have waited for being consumed at the same
+        time (high-water mark), since this receiver was created.
+        """
+        return self._handover_queue.max_qsize
+
+    @property
+    def dropped(self):
+        """
+        :term:`integer`: Number of received notifications that have been
+        dropped because the maximum number of waiting notifications was
+        reached, since this receiver was created.
+        """
+        return self._handover_queue.dropped
+
+    @property
+    def coalesced(self):
+        """
+        :term:`integer`: Number of received notifications that have been
+        merged into a waiting notification because the maximum number of
+        waiting notifications was reached, since this receiver was created.
+        """
+        return self._handover_queue.coalesced
+
+    @property
+    def last_sequence_nr(self):
+        """
+        :term:`integer`: The session sequence number of the last notification
+        received on the current connection, or `None` if no notification has
+        been received on the current connection.
+        """
+        return self._seq_tracker.last_sequence_nr
+
+    @property
+    def sequence_gaps(self):
+        """
+        :term:`integer`: The number of gaps in the session sequence numbers of
+        the received notifications, since this receiver was created.
+
+        A gap indicates that notifications have been lost before they were
+        received. Notifications that were dropped after they were received
+        are counted in :attr:`dropped`. Notifications that were
+        published while the receiver was not connected to the HMC are not
+        counted, because the session sequence numbers start again on a new
+        connection. A user that maintains state based on the notifications
+        should re-retrieve that state from the HMC if this number or
+        :attr:`dropped` increases, or after reconnecting.
+        """
+        return self._seq_tracker.gaps
+
     @logged_api_call
     def is_connected(self):
         """
@@ -661,6 +758,63 @@ class NotificationReceiver:
               failed.
         """
 
+        yield from self._notifications(stop_event)
+
+    @logged_api_call
+    def notification_batches(self, window=0.05, stop_event=None):
+        """
+        Generator method that yields the HMC notifications (= JMS messages)
+        received by this notification receiver in batches, with the property
+        change and status change notifications for the same resource merged.
+
+        This method behaves like
+        :meth:`~zhmcclient.NotificationReceiver.notifications`, except that
+        after receiving a notification, it waits for further notifications
+        for up to the specified time window, and yields all notifications
+        received in that time window as a list.
+
+        Within a batch, successive 'property-change' notifications for the
+        same resource are merged into one notification, and so are
+        successive 'status-change' notifications for the same resource. The
+        merged notification has the headers of the last of the merged
+        notifications, and one change report per property (or for status
+        changes, one change report) with the old values of the first and the
+        new values of the last of the merged change reports. Notifications of
+        other types are not merged, and notifications are merged only as
+        long as no other notification for the same resource is between them.
+
+        This reduces the number of notifications to be processed if the HMC
+        emits many property or status changes for the same resource within a
+        short time, e.g. during the activation of a CPC.
+
+        Parameters:
+
+          window (:term:`number`): Time window for a batch in seconds.
+
+          stop_event (threading.Event): Stop event that is checked. This can
+            be used to end the iteration over the HMC notifications.
+            If None, no stop checking is performed.
+
+        Yields:
+
+          : A list of tuple (headers, message) representing the HMC
+          notifications of one batch, in the order they were received. For
+          a description of the tuple items, see
+          :meth:`~zhmcclient.NotificationReceiver.notifications`.
+
+        Raises:
+
+          Same exceptions as
+          :meth:`~zhmcclient.NotificationReceiver.notifications`.
+        """
+        yield from self._notifications(stop_event, window)
+
+    def _notifications(self, stop_event, batch_window=None):
+        """
+        Generator method that yields the HMC notifications, or if a batch
+        window is specified, lists of merged HMC notifications.
+        """
+
         # The timeout for getting an item from the handover queue. If the
         # timeout expires, a check for connection loss is performed and then
         # a new get from the handover queue. Since the connection loss
@@ -673,10 +827,14 @@ class NotificationReceiver:
 
         self.connect()
 
+        # Item that has been received while collecting a batch, and that is
+        # processed in the next loop iteration
+        next_item = None
+
         while True:
 
             # Get an item from the listener
-            while True:
+            while next_item is None:
 
                 if self._closed:
                     return
@@ -695,6 +853,9 @@ class NotificationReceiver:
                             "Lost STOMP connection to HMC")
                     continue
                 break
+            else:
+                item = next_item
+                next_item = None
 
             if stop_event and stop_event.is_set():
                 # This will cause the generator to return to Python. Python
@@ -704,26 +865,9 @@ class NotificationReceiver:
 
             # Now we have an item from the listener
             if item.msgtype == 'message':
-                if item.message is None:
-                    msg_obj = None
-                else:
-                    try:
-                        msg_obj = json.loads(item.message)
-                    except Exception as exc:
-                        raise NotificationParseError(
-                            "Cannot convert JMS message body to JSON: "
-                            f"{exc.__class__.__name__}: {exc}",
-                            item.message)
+                msg_obj = _message_obj(item)
             elif item.msgtype == 'error':
-                if 'message' in item.headers:
-                    # Not sure that is always the case, but it was the case
-                    # in issue #770.
-                    details = f": {item.headers['message'].strip()}"
-                else:
-                    details = ""
-                raise NotificationJMSError(
-                    f"Received JMS error from HMC{details}",
-                    item.headers, item.message)
+                raise _jms_error(item)
             elif item.msgtype in ('disconnected', 'heartbeat_timeout'):
                 # Get all contiguous such entries to handle them just once
                 num_disc = 0
@@ -742,14 +886,8 @@ class NotificationReceiver:
                     elif item_.msgtype == 'heartbeat_timeout':
                         num_hbto += 1
                     else:
-                        # Put the item back.
-                        # TODO: Find way to put it to the front of the queue.
-                        try:
-                            self._handover_queue.put(item_)
-                        except queue.Full:
-                            JMS_LOGGER.error(
-                                "Handover queue is full (put-back) - "
-                                "dropping %s event", item_.msgtype)
+                        # Put the item back, for the next call
+                        self._handover_queue.put_front(item_)
                         break
                 raise NotificationConnectionError(
                     f"STOMP received {num_hbto} heartbeat timeouts and "
@@ -758,7 +896,42 @@ class NotificationReceiver:
                 raise RuntimeError(
                     f"Invalid handover item: {item.msgtype}")
 
-            yield item.headers, msg_obj
+            if batch_window is None:
+                yield item.headers, msg_obj
+                continue
+
+            # Collect the notifications for the batch
+            batch = [(item.headers, msg_obj)]
+            end_time = time.monotonic() + batch_window
+            while True:
+                wait_time = end_time - time.monotonic()
+                if wait_time <= 0:
+                    break
+                try:
+                    item = self._handover_queue.get(timeout=wait_time)
+                except queue.Empty:
+                    break
+                if item.msgtype != 'message':
+                    next_item = item
+                    break
+                batch.append((item.headers, _message_obj(item)))
+            yield merge_notifications(batch)
+
+    def _track_message(self, headers, message):
+        """
+        Append a received message to the journal, and check its session
+        sequence number for gaps.
+
+        This method is called in the listener thread, before the message is
+        put into the handover queue.
+        """
+        if self._journal is not None:
+            self._journal.append(headers, message)
+        if self._seq_tracker.check(headers):
+            JMS_LOGGER.warning(
+                "Gap in session sequence numbers of received notifications "
+                "before %s - notifications have been lost",
+                headers.get('session-sequence-nr'))
 
     @logged_api_call
     def close(self):
@@ -778,6 +951,356 @@ class NotificationReceiver:
         self._conn.disconnect()
 
 
+def _message_obj(item):
+    """
+    Return the message of a handover item of type 'message', converted into a
+    JSON object.
+
+    Raises:
+        NotificationParseError: Cannot parse JMS message body as JSON.
+    """
+    return _json_message(item.message)
+
+
+def _jms_error(item):
+    """
+    Return the exception for a handover item of type 'error'.
+    """
+    if 'message' in item.headers:
+        # Not sure that is always the case, but it was the case
+        # in issue #770.
+        details = f": {item.headers['message'].strip()}"
+    else:
+        details = ""
+    return NotificationJMSError(
+        f"Received JMS error from HMC{details}",
+        item.headers, item.message)
+
+
+def _json_message(message):
+    """
+    Return a JMS message body converted into a JSON object, or `None` if
+    there is no message body.
+
+    Raises:
+        NotificationParseError: Cannot parse JMS message body as JSON.
+    """
+    if message is None:
+        return None
+    try:
+        return json.loads(message)
+    except Exception as exc:
+        raise NotificationParseError(
+            "Cannot convert JMS message body to JSON: "
+            f"{exc.__class__.__name__}: {exc}",
+            message)
+
+
+class _SequenceTracker:
+    """
+    Tracks the session sequence numbers of the notifications received on a
+    STOMP connection, and detects gaps in them.
+
+    This is an internal class that does not need to be accessed or created by
+    the user.
+    """
+
+    def __init__(self):
+        self.last_sequence_nr = None
+        self.gaps = 0
+
+    def reset(self):
+        """
+        Reset the tracking for a new connection.
+        """
+        self.last_sequence_nr = None
+
+    def check(self, headers):
+        """
+        Check the session sequence number in the headers of a received
+        notification, and return whether there is a gap to the previously
+        received notification.
+
+        Notifications without a valid session sequence number are ignored.
+        """
+        try:
+            seq_nr = int(headers['session-sequence-nr'])
+        except (KeyError, TypeError, ValueError):
+            return False
+        last_seq_nr = self.last_sequence_nr
+        self.last_sequence_nr = seq_nr
+        if last_seq_nr is None or seq_nr == last_seq_nr + 1:
+            return False
+        self.gaps += 1
+        return True
+
+
+class NotificationJournal:
+    """
+    An append-only journal of HMC notifications in a local file, for replay
+    by downstream consumers.
+
+    **Experimental:** This class is considered experimental at this point, and
+    its API may change incompatibly as long as it is experimental.
+
+    The journal file contains one line per notification, in the order in
+    which the notifications were received. Each line is a JSON object with
+    the following items:
+
+    * 'time' (float): The point in time the notification was received, as
+      Unix time.
+    * 'headers' (dict): The notification header fields.
+    * 'message' (:term:`string`): The notification body as received, or
+      `None`.
+
+    The file is opened in append mode, so an existing journal file is
+    continued, and multiple processes can append to the same journal file
+    line by line. The journal can be passed to
+    :class:`~zhmcclient.NotificationReceiver` or set on the
+    :class:`~zhmcclient.AutoUpdater` (see
+    :attr:`zhmcclient.AutoUpdater.journal`), and can be read while
+    notifications are appended to it.
+
+    HMC/SE version requirements: None
+    """
+
+    def __init__(self, filename):
+        """
+        Parameters:
+
+          filename (:term:`string`): Path name of the journal file. The file
+            is created if it does not exist.
+        """
+        self._filename = filename
+        self._file = None
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        """
+        Return a string with the state of this journal, for debug purposes.
+        """
+        return (
+            f"{self.__class__.__name__}("
+            f"filename={self._filename!r}, "
+            f"open={self._file is not None!r})")
+
+    def __enter__(self):
+        """
+        Enter the runtime context of this journal.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Exit the runtime context of this journal, by closing it.
+        """
+        self.close()
+
+    @property
+    def filename(self):
+        """
+        :term:`string`: Path name of the journal file.
+        """
+        return self._filename
+
+    def append(self, headers, message):
+        """
+        Append a notification to the journal.
+
+        This method can be called by multiple threads.
+
+        Parameters:
+
+          headers (dict): The notification header fields.
+
+          message (:term:`string`): The notification body as received, or
+            `None`.
+        """
+        line = json.dumps(
+            {'time': time.time(), 'headers': headers, 'message': message})
+        with self._lock:
+            if self._file is None:
+                # pylint: disable=consider-using-with
+                self._file = open(self._filename, 'a', encoding='utf-8')
+            self._file.write(line + '\n')
+            self._file.flush()
+
+    def close(self):
+        """
+        Close the journal file. A subsequent :meth:`append` opens it again.
+        """
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def replay(self, since=None):
+        """
+        Generator method that yields the notifications in the journal, in
+        the order in which they were received.
+
+        Parameters:
+
+          since (:term:`number`): If not `None`, only the notifications that
+            were received at or after this point in time (as Unix time) are
+            yielded.
+
+        Yields:
+
+          : A tuple (headers, message) representing one HMC notification,
+          with the message converted into a JSON object, as yielded by
+          :meth:`zhmcclient.NotificationReceiver.notifications`.
+
+        Raises:
+
+          :exc:`~zhmcclient.NotificationParseError`: Cannot parse a
+            notification body as JSON.
+        """
+        try:
+            # pylint: disable=consider-using-with
+            journal_file = open(self._filename, encoding='utf-8')
+        except FileNotFoundError:
+            return
+        with journal_file:
+            for line in journal_file:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # A line that is incomplete, e.g. because the appending
+                    # process was terminated while writing it.
+                    JMS_LOGGER.warning(
+                        "Ignoring invalid line in notification journal %s: "
+                        "%.100s", self._filename, line)
+                    continue
+                if since is not None and entry['time'] < since:
+                    continue
+                yield entry['headers'], _json_message(entry['message'])
+
+
+# Notification types that can be merged by merge_notifications()
+_MERGED_NOTIFICATION_TYPES = ('property-change', 'status-change')
+
+
+def _merge_change_reports(change_reports, key):
+    """
+    Merge change reports, keeping the old values of the first and the new
+    values of the last change report for each value of the key property
+    (or for all change reports, if key is None).
+    """
+    merged = {}  # key: key value, value: merged change report
+    for report in change_reports:
+        key_value = report.get(key) if key else None
+        try:
+            merged_report = merged[key_value]
+        except KeyError:
+            merged[key_value] = dict(report)
+            continue
+        for name, value in report.items():
+            if not name.startswith('old-'):
+                merged_report[name] = value
+    return list(merged.values())
+
+
+def merge_notifications(notifications):
+    """
+    Merge successive 'property-change' and 'status-change' notifications for
+    the same resource in a list of notifications.
+
+    For details, see
+    :meth:`~zhmcclient.NotificationReceiver.notification_batches`.
+
+    Parameters:
+
+      notifications (list of tuple(headers, message)): The notifications, in
+        the order they were received, with the message converted into a JSON
+        object.
+
+    Returns:
+
+      list of tuple(headers, message): The merged notifications.
+    """
+    result = []
+    # Index in the result of the last notification for a resource, if it can
+    # be merged with subsequent notifications. Key: resource URI.
+    open_entries = {}
+    for headers, message in notifications:
+        noti_type = headers.get('notification-type')
+        uri = headers.get('element-uri') or headers.get('object-uri')
+        index = open_entries.pop(uri, None)
+        if noti_type not in _MERGED_NOTIFICATION_TYPES or uri is None or \
+                not isinstance(message, dict) or \
+                'change-reports' not in message:
+            result.append((headers, message))
+            continue
+        if index is None or \
+                result[index][0].get('notification-type') != noti_type:
+            open_entries[uri] = len(result)
+            result.append((headers, message))
+            continue
+        change_reports = result[index][1]['change-reports'] + \
+            message['change-reports']
+        key = 'property-name' if noti_type == 'property-change' else None
+        merged_message = dict(message)
+        merged_message['change-reports'] = \
+            _merge_change_reports(change_reports, key)
+        result[index] = (headers, merged_message)
+        open_entries[uri] = index
+    return result
+
+
+def create_stomp_connection(stomp, host, port, rt_config, verify_cert):
+    """
+    Create a STOMP connection object for the HMC, with SSL set up.
+
+    The connection is not yet connected and has no listener set.
+
+    Parameters:
+
+      stomp (module): The stomp module.
+
+      host (str): HMC host.
+
+      port (int): STOMP TCP port.
+
+      rt_config (StompRetryTimeoutConfig): STOMP retry/timeout configuration.
+
+      verify_cert (bool or str): Controls whether and how the client verifies
+        the server certificate, see NotificationReceiver.
+
+    Returns:
+
+      stomp.Connection: The STOMP connection object.
+    """
+    JMS_LOGGER.info("Setting up a STOMP connection")
+    rt_kwargs = get_stomp_rt_kwargs(rt_config)
+    conn = stomp.Connection([(host, port)], **rt_kwargs)
+    set_kwargs = dict()
+    set_kwargs['ssl_version'] = ssl.PROTOCOL_TLS_CLIENT
+    if verify_cert is True:
+        ca_cert = certifi.where()
+    elif isinstance(verify_cert, str):
+        ca_cert = verify_cert
+    else:
+        ca_cert = None
+    if ca_cert:
+        JMS_LOGGER.info(
+            "Enabling certificate validation with CA path: %s", ca_cert)
+        set_kwargs['ca_certs'] = ca_cert
+        # Note: According to https://docs.python.org/3/library/ssl.html#
+        # ssl.SSLSocket.do_handshake, hostname validation is performed by
+        # OpenSSL since Python 3.7. However, this does not work with
+        # stomp.py for some reason. Therefore, we perform hostname
+        # validation ourselves.
+        set_kwargs['cert_validator'] = validate_cert_hostname
+    else:
+        JMS_LOGGER.warning("Certificate validation is disabled")
+    conn.set_ssl(for_hosts=[(host, port)], **set_kwargs)
+    return conn
+
+
 def validate_cert_hostname(cert, hostname):
     """
     Validate the common name in the subject of a certificate against the
@@ -822,6 +1345,163 @@ _NotificationItem = namedtuple(
 )
 
 
+# Overflow policies of the handover queue
+_HANDOVER_OVERFLOW_POLICIES = ('block', 'drop-oldest', 'coalesce')
+
+# Time in seconds the 'block' overflow policy waits for free space
+_HANDOVER_BLOCK_TIMEOUT = 5
+
+
+class _HandoverQueue:
+    """
+    Thread-safe bounded queue of _NotificationItem objects between the
+    listener thread and the notification receiver, with a configurable
+    policy for received notifications when the queue is full.
+
+    Only items of type 'message' are subject to the maximum size and the
+    overflow policy. Other items (connection events and errors) are always
+    queued.
+
+    This is an internal class that does not need to be accessed or created by
+    the user.
+    """
+
+    def __init__(self, maxsize, overflow_policy):
+        """
+        Parameters:
+
+          maxsize (int): Maximum number of items in the queue.
+
+          overflow_policy (str): Overflow policy for 'message' items, see
+            _HANDOVER_OVERFLOW_POLICIES.
+        """
+        if overflow_policy not in _HANDOVER_OVERFLOW_POLICIES:
+            raise ValueError(
+                f"Invalid handover overflow policy: {overflow_policy!r}")
+        self._maxsize = maxsize
+        self._policy = overflow_policy
+        self._items = deque()
+        self._cond = threading.Condition()
+        self.max_qsize = 0
+        self.dropped = 0
+        self.coalesced = 0
+
+    def qsize(self):
+        """
+        Return the number of items in the queue.
+        """
+        return len(self._items)
+
+    def put(self, item):
+        """
+        Put an item at the end of the queue, applying the overflow policy if
+        the queue is full.
+        """
+        with self._cond:
+            if item.msgtype == 'message' and \
+                    len(self._items) >= self._maxsize and \
+                    not self._make_room(item):
+                return
+            self._items.append(item)
+            if len(self._items) > self.max_qsize:
+                self.max_qsize = len(self._items)
+            self._cond.notify_all()
+
+    def put_front(self, item):
+        """
+        Put an item at the front of the queue, so that it is the next item to
+        be returned by get(). This is independent of the maximum size.
+        """
+        with self._cond:
+            self._items.appendleft(item)
+            self._cond.notify_all()
+
+    def get(self, timeout=None):
+        """
+        Remove and return the item at the front of the queue, waiting for up
+        to the specified timeout for an item to be available.
+
+        Raises:
+            queue.Empty: No item was available within the timeout.
+        """
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._items, timeout):
+                raise queue.Empty
+            item = self._items.popleft()
+            self._cond.notify_all()
+            return item
+
+    def _make_room(self, item):
+        """
+        Apply the overflow policy for a 'message' item to be put into the
+        full queue. Must be called with the condition acquired.
+
+        Returns:
+            bool: Indicates whether the item should be appended.
+        """
+        if self._policy == 'block':
+            if self._cond.wait_for(
+                    lambda: len(self._items) < self._maxsize,
+                    _HANDOVER_BLOCK_TIMEOUT):
+                return True
+            self.dropped += 1
+            JMS_LOGGER.error(
+                "Handover queue is full - dropping received notification")
+            return False
+        if self._policy == 'coalesce' and self._coalesce(item):
+            self.coalesced += 1
+            return False
+        for index, queued_item in enumerate(self._items):
+            if queued_item.msgtype == 'message':
+                del self._items[index]
+                self.dropped += 1
+                JMS_LOGGER.error(
+                    "Handover queue is full - dropping oldest received "
+                    "notification")
+                return True
+        # The queue is filled with connection events
+        return True
+
+    def _coalesce(self, item):
+        """
+        Merge a 'message' item into the newest queued 'message' item for the
+        same resource, if possible. Must be called with the condition
+        acquired.
+
+        Returns:
+            bool: Indicates whether the item has been merged.
+        """
+        headers = item.headers
+        uri = headers.get('element-uri') or headers.get('object-uri')
+        if uri is None or headers.get('notification-type') not in \
+                _MERGED_NOTIFICATION_TYPES:
+            return False
+        for index in range(len(self._items) - 1, -1, -1):
+            queued_item = self._items[index]
+            if queued_item.msgtype != 'message':
+                continue
+            queued_headers = queued_item.headers
+            if (queued_headers.get('element-uri') or
+                    queued_headers.get('object-uri')) != uri:
+                continue
+            # This is the newest queued notification for the resource
+            try:
+                notifications = merge_notifications([
+                    (queued_headers, json.loads(queued_item.message)),
+                    (headers, json.loads(item.message)),
+                ])
+            except (TypeError, ValueError):
+                return False
+            if len(notifications) != 1:
+                return False
+            merged_headers, merged_message = notifications[0]
+            self._items[index] = _NotificationItem(
+                msgtype='message', headers=merged_headers,
+                message=json.dumps(merged_message))
+            return True
+        return False
+
+
 class _NotificationListener:
     """
     A notification listener class for use by the Python `stomp-py` package.
@@ -837,15 +1517,21 @@ class _NotificationListener:
     methods here.
     """
 
-    def __init__(self, handover_queue):
+    def __init__(self, handover_queue, message_callback=None):
         """
         Parameters:
 
-          handover_queue (Queue): Thread-safe queue between this listener
-            object in the listener thread and the notification receiver object
-            in the main thread. The queue items are _NotificationItem objects.
+          handover_queue (_HandoverQueue): Thread-safe queue between this
+            listener object in the listener thread and the notification
+            receiver object in the main thread. The queue items are
+            _NotificationItem objects.
+
+          message_callback (callable): Function that is called with the
+            headers and message of each received message, before it is put
+            into the handover queue, or `None`.
         """
         self._handover_queue = handover_queue
+        self._message_callback = message_callback
 
         # Lazy importing of the stomp module, because the import is slow in some
         # versions.
@@ -953,13 +1639,11 @@ class _NotificationListener:
           frame_args: The STOMP frame. For details, see get_headers_message().
         """
         headers, message = get_headers_message(frame_args)
+        if self._message_callback is not None:
+            self._message_callback(headers, message)
         item = _NotificationItem(
             headers=headers, message=message, msgtype='message')
-        try:
-            self._handover_queue.put(item, timeout=5)
-        except queue.Full:
-            JMS_LOGGER.error(
-                "Handover queue is full - dropping 'message' event")
+        self._handover_queue.put(item)
 
     def on_receipt(self, *frame_args):
         """
@@ -990,11 +1674,7 @@ class _NotificationListener:
         headers, message = get_headers_message(frame_args)
         item = _NotificationItem(
             headers=headers, message=message, msgtype='error')
-        try:
-            self._handover_queue.put(item, timeout=5)
-        except queue.Full:
-            JMS_LOGGER.error(
-                "Handover queue is full - dropping 'error' event")
+        self._handover_queue.put(item)
 
     def on_send(self, *frame_args):
         # pylint: disable=no-self-use
@@ -0,0 +1,825 @@
+# Copyright 2026 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+A :class:`~zhmcclient.NotificationMultiplexer` receives HMC notifications for
+any number of notification topics over a single STOMP connection to an HMC,
+and delivers them to :class:`~zhmcclient.NotificationSubscription` objects
+that can be created and removed at any time.
+
+This reduces the number of STOMP connections and threads of a process that
+receives notifications for many topics, e.g. the OS message topics of many
+partitions, the job notification topic and the object notification topic
+used by the :class:`~zhmcclient.AutoUpdater`.
+
+The basic usage of the notification multiplexer is shown in this example:
+
+.. code-block:: python
+
+    session = zhmcclient.Session(hmc, userid, password)
+    mux = zhmcclient.NotificationMultiplexer.for_session(session)
+
+    # Share the STOMP connection with the auto updater of the session
+    session.auto_updater.multiplexer = mux
+
+    subs = []
+    for partition in partitions:
+        topic = partition.open_os_message_channel()
+        subs.append(mux.subscribe(topic))
+
+    # In one thread per subscription, or by using callback functions:
+    for headers, message in subs[0].notifications():
+        ...
+"""
+
+import os
+import itertools
+import queue
+import threading
+import time
+import logging
+
+from ._constants import DEFAULT_STOMP_PORT, STOMP_MIN_CONNECTION_CHECK_TIME, \
+    JMS_LOGGER_NAME
+from ._exceptions import NotificationConnectionError, \
+    NotificationSubscriptionError, SubscriptionNotFound
+from ._logging import logged_api_call
+from ._notification import NotificationReceiver, _HandoverQueue, \
+    _NotificationItem, _SequenceTracker, _message_obj, _jms_error, \
+    create_stomp_connection
+from ._utils import get_headers_message, invoke_callbacks, repr_obj_id
+
+__all__ = ['NotificationMultiplexer', 'NotificationSubscription']
+
+JMS_LOGGER = logging.getLogger(JMS_LOGGER_NAME)
+
+
+class NotificationSubscription:
+    """
+    A subscription for an HMC notification topic on a
+    :class:`~zhmcclient.NotificationMultiplexer`.
+
+    **Experimental:** This class is considered experimental at this point, and
+    its API may change incompatibly as long as it is experimental.
+
+    The notifications for the topic are either delivered to a callback
+    function, or are put into a delivery queue of this subscription, from
+    which they are consumed using :meth:`notifications`. Each subscription
+    has its own delivery queue, so a slow consumer of one subscription does
+    not delay the other subscriptions. The size and overflow policy of the
+    delivery queue are defined by the STOMP retry/timeout configuration of
+    the multiplexer.
+
+    Objects of this class are not created by the user; they are returned from
+    :meth:`zhmcclient.NotificationMultiplexer.subscribe`.
+
+    HMC/SE version requirements: None
+    """
+
+    def __init__(self, multiplexer, topic_name, callback=None,
+                 lost_callback=None):
+        # This function should not go into the docs.
+        # Parameters:
+        #   multiplexer (NotificationMultiplexer): The multiplexer.
+        #   topic_name (string): Name of the HMC notification topic.
+        #   callback (callable): Callback function for the notifications, or
+        #     None for using the delivery queue.
+        #   lost_callback (callable): Callback function for lost
+        #     notifications, or None.
+        self._multiplexer = multiplexer
+        self._topic_name = topic_name
+        self._callback = callback
+        self._lost_callback = lost_callback
+        rt_config = multiplexer.stomp_rt_config
+        self._queue = _HandoverQueue(
+            rt_config.handover_queue_size,
+            rt_config.handover_overflow_policy)
+        self._closed = False
+
+    def __repr__(self):
+        """
+        Return a string with the state of this subscription, for debug
+        purposes.
+        """
+        ret = (
+            f"{repr_obj_id(self)} (\n"
+            f"  _topic_name = {self._topic_name!r}\n"
+            f"  _callback = {self._callback!r}\n"
+            f"  _closed = {self._closed!r}\n"
+            f"  queue_depth = {self.queue_depth!r}\n"
+            ")")
+        return ret
+
+    @property
+    def multiplexer(self):
+        """
+        :class:`~zhmcclient.NotificationMultiplexer`: The multiplexer of this
+        subscription.
+        """
+        return self._multiplexer
+
+    @property
+    def topic_name(self):
+        """
+        :term:`string`: Name of the HMC notification topic.
+        """
+        return self._topic_name
+
+    @property
+    def closed(self):
+        """
+        bool: Indicates whether this subscription has been unsubscribed.
+        """
+        return self._closed
+
+    @property
+    def queue_depth(self):
+        """
+        :term:`integer`: Number of notifications that currently wait in the
+        delivery queue for being consumed.
+        """
+        return self._queue.qsize()
+
+    @property
+    def max_queue_depth(self):
+        """
+        :term:`integer`: Maximum number of notifications that have waited in
+        the delivery queue for being consumed at the same time.
+        """
+        return self._queue.max_qsize
+
+    @property
+    def dropped(self):
+        """
+        :term:`integer`: Number of notifications that have been dropped
+        because the delivery queue was full.
+        """
+        return self._queue.dropped
+
+    @property
+    def coalesced(self):
+        """
+        :term:`integer`: Number of notifications that have been merged into
+        a waiting notification because the delivery queue was full.
+        """
+        return self._queue.coalesced
+
+    def unsubscribe(self):
+        """
+        Unsubscribe this subscription from its multiplexer, and cause its
+        :meth:`notifications` method to return.
+
+        Raises:
+
+            NotificationSubscriptionError: STOMP unsubscription failed.
+        """
+        self._multiplexer.unsubscribe(self)
+
+    def notifications(self, stop_event=None):
+        """
+        Generator method that yields the HMC notifications (= JMS messages)
+        for the topic of this subscription.
+
+        This method returns when the subscription is unsubscribed or the
+        multiplexer is closed, or when the stop event is set. If the STOMP
+        connection to the HMC is lost, this method raises
+        :exc:`~zhmcclient.NotificationConnectionError`. The multiplexer
+        re-establishes the connection in the background, so the method can
+        simply be called again to resume waiting for notifications.
+
+        This method must not be used for subscriptions with a callback
+        function.
+
+        Parameters:
+
+          stop_event (threading.Event): Stop event that is checked. This can
+            be used to end the iteration over the HMC notifications.
+            If None, no stop checking is performed.
+
+        Yields:
+
+          : A tuple (headers, message) representing one HMC notification. For
+          a description of the tuple items, see
+          :meth:`zhmcclient.NotificationReceiver.notifications`.
+
+        Raises:
+
+            :exc:`~zhmcclient.NotificationJMSError`: Received JMS error from
+              the HMC.
+            :exc:`~zhmcclient.NotificationParseError`: Cannot parse JMS message
+              body as JSON.
+            :exc:`~zhmcclient.NotificationConnectionError`: Issue with STOMP
+              connection to HMC.
+            ValueError: The subscription has a callback function.
+        """
+        if self._callback is not None:
+            raise ValueError(
+                "notifications() must not be used for subscriptions with a "
+                "callback function")
+        ho_get_timeout = max(
+            STOMP_MIN_CONNECTION_CHECK_TIME,
+            self._multiplexer.stomp_rt_config.heartbeat_receive_cycle + 1)
+        while not self._closed:
+            try:
+                item = self._queue.get(timeout=ho_get_timeout)
+            except queue.Empty:
+                if stop_event and stop_event.is_set():
+                    return
+                if not self._multiplexer.is_connected():
+                    raise NotificationConnectionError(
+                        "Lost STOMP connection to HMC")
+                continue
+            if stop_event and stop_event.is_set():
+                return
+            if item.msgtype == 'message':
+                yield item.headers, _message_obj(item)
+            elif item.msgtype == 'error':
+                raise _jms_error(item)
+            elif item.msgtype == 'disconnected':
+                raise NotificationConnectionError(
+                    "Lost STOMP connection to HMC")
+            elif item.msgtype == 'closed':
+                return
+            else:
+                raise RuntimeError(
+                    f"Invalid handover item: {item.msgtype}")
+
+    def _deliver(self, item):
+        """
+        Deliver a handover item to the callback function or the delivery
+        queue. Called in the listener thread.
+        """
+        if self._callback is None:
+            self._queue.put(item)
+        elif item.msgtype == 'message':
+            invoke_callbacks([self._callback], item.headers, item.message)
+        elif item.msgtype == 'error':
+            JMS_LOGGER.error(
+                "JMS error message received for notification topic '%s' "
+                "(ignored): %s", self._topic_name, item.message)
+
+    def _notify_lost(self):
+        """
+        Invoke the callback function for lost notifications.
+        """
+        if self._lost_callback is not None:
+            invoke_callbacks([self._lost_callback])
+
+    def _close(self):
+        """
+        Close this subscription, causing notifications() to return.
+        """
+        self._closed = True
+        self._queue.put_front(
+            _NotificationItem(msgtype='closed', headers=None, message=None))
+
+
+class NotificationMultiplexer:
+    """
+    A receiver for HMC notifications that shares a single STOMP connection to
+    an HMC between any number of subscriptions for HMC notification topics.
+
+    **Experimental:** This class is considered experimental at this point, and
+    its API may change incompatibly as long as it is experimental.
+
+    Subscriptions can be created with :meth:`subscribe` and removed with
+    :meth:`unsubscribe` at any time. The STOMP connection is established when
+    the first subscription is created, and there is one STOMP subscription
+    per topic, regardless of how many subscriptions exist for the topic. The
+    received notifications are delivered to all subscriptions for their
+    topic.
+
+    If the STOMP connection is lost, it is re-established in a background
+    thread and the topics are subscribed again. Because notifications may
+    have been missed in the meantime, the callback functions for lost
+    notifications of the subscriptions are invoked after reconnecting, and
+    also when a gap in the session sequence numbers of the received
+    notifications is detected.
+
+    Use :meth:`for_session` to share one multiplexer per HMC and userid
+    within a process.
+
+    HMC/SE version requirements: None
+    """
+
+    # Shared multiplexers, by tuple(host, port, userid)
+    _shared = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, host, userid, password, port=DEFAULT_STOMP_PORT,
+                 stomp_rt_config=None, verify_cert=False):
+        """
+        Parameters:
+
+          host (:term:`string`):
+            HMC host. For valid formats, see the
+            :attr:`~zhmcclient.Session.host` property.
+            Must not be `None`.
+
+          userid (:term:`string`):
+            Userid for logging on to the HMC message broker, as described for
+            :class:`~zhmcclient.NotificationReceiver`.
+
+          password (:term:`string`):
+            Password for logging on to the HMC message broker, as described
+            for :class:`~zhmcclient.NotificationReceiver`.
+
+          port (:term:`integer`):
+            STOMP TCP port. Defaults to
+            :attr:`~zhmcclient._constants.DEFAULT_STOMP_PORT`.
+
+          stomp_rt_config (:class:`~zhmcclient.StompRetryTimeoutConfig`):
+            The STOMP retry/timeout configuration, overriding any defaults.
+            The handover queue attributes apply to the delivery queue of
+            each subscription.
+
+          verify_cert (bool or :term:`string`):
+            Controls whether and how the client verifies the server certificate
+            presented by the HMC, as described for
+            :class:`~zhmcclient.NotificationReceiver`.
+        """
+        self._host = host
+        self._userid = userid
+        self._password = password
+        self._port = port
+        self._rt_config = NotificationReceiver.default_stomp_rt_config. \
+            override_with(stomp_rt_config)
+        self._verify_cert = verify_cert
+
+        # STOMP connection, or None if not connected, and its listener
+        self._conn = None
+        self._listener = None
+
+        # Subscriptions, as dict(key: topic name, value: dict with items:
+        #   'id': STOMP subscription ID,
+        #   'subscriptions': list of NotificationSubscription)
+        self._topics = {}
+        self._topics_by_id = {}  # key: STOMP subscription ID, value: topic
+        self._lock = threading.RLock()
+        self._sub_counter = itertools.count(1)
+
+        self._closing = False
+        self._reconnect_thread = None
+        self._seq_tracker = _SequenceTracker()
+
+        # Lazy importing of the stomp module, because the import is slow in some
+        # versions.
+        # pylint: disable=import-outside-toplevel
+        import stomp
+        self._stomp = stomp
+
+    def __repr__(self):
+        """
+        Return a string with the state of this multiplexer, for debug
+        purposes.
+        """
+        ret = (
+            f"{repr_obj_id(self)} (\n"
+            f"  _host = {self._host!r}\n"
+            f"  _port = {self._port!r}\n"
+            f"  _userid = {self._userid!r}\n"
+            f"  _topics = {list(self._topics)!r}\n"
+            f"  _closing = {self._closing!r}\n"
+            ")")
+        return ret
+
+    @classmethod
+    def for_session(cls, session, stomp_rt_config=None):
+        """
+        Return the multiplexer that is shared for the HMC and userid of a
+        session within this process, creating it if needed.
+
+        If the session is not logged on, it is logged on. The session
+        credentials and the certificate verification of the session are used
+        for the STOMP connection. The STOMP retry/timeout configuration is
+        used only when the multiplexer is created.
+
+        Parameters:
+
+          session (:class:`~zhmcclient.Session`): The session.
+
+          stomp_rt_config (:class:`~zhmcclient.StompRetryTimeoutConfig`):
+            The STOMP retry/timeout configuration, overriding any defaults.
+
+        Returns:
+
+          :class:`~zhmcclient.NotificationMultiplexer`: The shared
+          multiplexer.
+        """
+        if not session.object_topic:
+            session.logon()  # This sets actual_host
+        key = (session.actual_host, DEFAULT_STOMP_PORT, session.userid)
+        with cls._shared_lock:
+            mux = cls._shared.get(key)
+            if mux is None or mux._closing:
+                # pylint: disable=protected-access
+                mux = cls(session.actual_host, session.userid,
+                          session._password, stomp_rt_config=stomp_rt_config,
+                          verify_cert=session.verify_cert)
+                cls._shared[key] = mux
+        return mux
+
+    @property
+    def stomp_rt_config(self):
+        """
+        :class:`~zhmcclient.StompRetryTimeoutConfig`: The STOMP retry/timeout
+        configuration, with the defaults applied.
+        """
+        return self._rt_config
+
+    @property
+    def topic_names(self):
+        """
+        list of :term:`string`: Names of the topics that are currently
+        subscribed for.
+        """
+        with self._lock:
+            return list(self._topics)
+
+    @property
+    def sequence_gaps(self):
+        """
+        :term:`integer`: The number of gaps in the session sequence numbers of
+        the received notifications, since this multiplexer was created.
+        """
+        return self._seq_tracker.gaps
+
+    def is_connected(self):
+        """
+        Return whether this multiplexer is currently connected to the HMC.
+        """
+        conn = self._conn
+        return conn is not None and conn.is_connected()
+
+    def _subscriptions(self):
+        """
+        Return a list of all subscriptions.
+        """
+        with self._lock:
+            return [sub for entry in self._topics.values()
+                    for sub in entry['subscriptions']]
+
+    def _connect(self):
+        """
+        Create and connect the STOMP connection, and subscribe for all
+        topics that have subscriptions.
+
+        Must be called with the lock acquired.
+        """
+        conn, listener = self._create_connection()
+        self._install_connection(conn, listener)
+
+    def _create_connection(self):
+        """
+        Create and connect a new STOMP connection, and return it and its
+        listener as a tuple(conn, listener).
+
+        Does not need the lock to be acquired.
+        """
+        conn = create_stomp_connection(
+            self._stomp, self._host, self._port, self._rt_config,
+            self._verify_cert)
+        listener = _MultiplexListener(self)
+        conn.set_listener('', listener)
+        try:
+            # wait=True causes the connection to be retried for some times
+            # and finally raises stomp.ConnectFailedException
+            conn.connect(self._userid, self._password, wait=True)
+        except Exception as exc:
+            msg = f"STOMP connection failed: {exc.__class__.__name__}: {exc}"
+            JMS_LOGGER.warning(msg)
+            raise NotificationConnectionError(msg)
+        JMS_LOGGER.info("STOMP connection successfully established")
+        return conn, listener
+
+    def _install_connection(self, conn, listener):
+        """
+        Make a connected STOMP connection the connection of this multiplexer,
+        and subscribe it for all topics that have subscriptions.
+
+        Must be called with the lock acquired.
+        """
+        # The session sequence numbers of the new connection are not related
+        # to the ones of a previous connection.
+        self._seq_tracker.reset()
+        self._conn = conn
+        self._listener = listener
+        for topic_name, entry in self._topics.items():
+            self._stomp_subscribe(topic_name, entry['id'])
+
+    def _stomp_subscribe(self, topic_name, sub_id):
+        """
+        Subscribe the STOMP connection for a topic.
+        """
+        JMS_LOGGER.info(
+            "Subscribing via STOMP for notification topic '%s'", topic_name)
+        try:
+            self._conn.subscribe(
+                destination=f"/topic/{topic_name}", id=sub_id, ack='auto')
+        except Exception as exc:
+            msg = f"STOMP subscription failed: {exc.__class__.__name__}: {exc}"
+            JMS_LOGGER.warning(msg)
+            raise NotificationSubscriptionError(msg)
+
+    @logged_api_call
+    def subscribe(self, topic_name, callback=None, lost_callback=None):
+        """
+        Create a subscription for an HMC notification topic.
+
+        If this is the first subscription for the topic, the STOMP connection
+        is subscribed for the topic. If this multiplexer is not connected to
+        the HMC, the connection is established first.
+
+        Parameters:
+
+          topic_name (:term:`string`): Name of the HMC notification topic.
+            Must not be `None`.
+
+          callback (callable): Callback function that is called with
+            parameters (headers, message) for each notification for the topic,
+            where headers is a dict with the notification header fields, and
+            message is the notification body as received (a JSON string) or
+            `None`. The callback function is called in the thread of the
+            STOMP connection and should return quickly. Exceptions raised by
+            it are logged and otherwise ignored.
+            `None` means that the notifications are put into the delivery
+            queue of the subscription and are consumed with
+            :meth:`zhmcclient.NotificationSubscription.notifications`.
+
+          lost_callback (callable): Callback function without parameters that
+            is called when notifications for the topic may have been lost,
+            i.e. after the STOMP connection has been re-established or when
+            a gap in the session sequence numbers has been detected, or
+            `None`.
+
+        Returns:
+
+          :class:`~zhmcclient.NotificationSubscription`: The new
+          subscription.
+
+        Raises:
+
+            NotificationConnectionError: STOMP connection failed.
+            NotificationSubscriptionError: STOMP subscription failed.
+        """
+        subscription = NotificationSubscription(
+            self, topic_name, callback, lost_callback)
+        with self._lock:
+            self._closing = False
+            if self._conn is None:
+                self._connect()
+            entry = self._topics.get(topic_name)
+            if entry is None:
+                sub_id = f'zhmcclient.mux.{os.getpid()}.{id(self)}.' \
+                    f'{next(self._sub_counter)}'
+                self._stomp_subscribe(topic_name, sub_id)
+                entry = {'id': sub_id, 'subscriptions': []}
+                self._topics[topic_name] = entry
+                self._topics_by_id[sub_id] = topic_name
+            entry['subscriptions'].append(subscription)
+        return subscription
+
+    @logged_api_call
+    def unsubscribe(self, subscription):
+        """
+        Remove a subscription, and cause its
+        :meth:`~zhmcclient.NotificationSubscription.notifications` method
+        to return.
+
+        If this is the last subscription for its topic, the STOMP connection
+        is unsubscribed from the topic.
+
+        Parameters:
+
+          subscription (:class:`~zhmcclient.NotificationSubscription`):
+            The subscription.
+
+        Raises:
+
+            SubscriptionNotFound: The subscription does not exist.
+            NotificationSubscriptionError: STOMP unsubscription failed.
+        """
+        with self._lock:
+            entry = self._topics.get(subscription.topic_name)
+            if entry is None or subscription not in entry['subscriptions']:
+                raise SubscriptionNotFound(
+                    f"Subscription for topic {subscription.topic_name!r} "
+                    "does not exist")
+            entry['subscriptions'].remove(subscription)
+            subscription._close()  # pylint: disable=protected-access
+            if entry['subscriptions']:
+                return
+            del self._topics[subscription.topic_name]
+            del self._topics_by_id[entry['id']]
+            if self._conn is None:
+                return
+            JMS_LOGGER.info(
+                "Unsubscribing via STOMP from notification topic '%s'",
+                subscription.topic_name)
+            try:
+                self._conn.unsubscribe(id=entry['id'])
+            except Exception as exc:
+                msg = (
+                    f"STOMP unsubscription failed: {exc.__class__.__name__}: "
+                    f"{exc}")
+                JMS_LOGGER.warning(msg)
+                raise NotificationSubscriptionError(msg)
+
+    @logged_api_call
+    def close(self):
+        """
+        Close all subscriptions and disconnect the STOMP connection from the
+        HMC.
+
+        Raises:
+
+            stomp.exception.StompException: From stomp.Connection.disconnect()
+        """
+        with self._lock:
+            self._closing = True
+            subscriptions = self._subscriptions()
+            self._topics.clear()
+            self._topics_by_id.clear()
+            conn = self._conn
+            self._conn = None
+        for subscription in subscriptions:
+            subscription._close()  # pylint: disable=protected-access
+        if conn is not None:
+            conn.disconnect()
+
+    def _route(self, item):
+        """
+        Deliver a received message to the subscriptions for its topic.
+        Called in the listener thread.
+        """
+        headers = item.headers
+        if self._seq_tracker.check(headers):
+            JMS_LOGGER.warning(
+                "Gap in session sequence numbers of received notifications "
+                "before %s - notifications have been lost",
+                headers['session-sequence-nr'])
+            for subscription in self._subscriptions():
+                subscription._notify_lost()  # pylint: disable=protected-access
+        with self._lock:
+            topic_name = self._topics_by_id.get(headers.get('subscription'))
+            if topic_name is None:
+                destination = headers.get('destination') or ''
+                topic_name = destination.rpartition('/')[2]
+            entry = self._topics.get(topic_name)
+            subscriptions = list(entry['subscriptions']) if entry else []
+        if not subscriptions:
+            JMS_LOGGER.warning(
+                "Received notification for a topic without subscriptions "
+                "(ignored): %r", headers)
+        for subscription in subscriptions:
+            subscription._deliver(item)  # pylint: disable=protected-access
+
+    def _broadcast(self, item):
+        """
+        Deliver a handover item to all subscriptions. Called in the listener
+        thread.
+        """
+        for subscription in self._subscriptions():
+            subscription._deliver(item)  # pylint: disable=protected-access
+
+    def _connection_lost(self, listener):
+        """
+        Handle the loss of the STOMP connection of a listener, by notifying
+        the subscriptions and re-establishing the connection in a background
+        thread.
+        """
+        with self._lock:
+            conn = self._conn
+            if self._closing or conn is None or \
+                    listener is not self._listener or \
+                    conn.is_connected():
+                return
+            if self._reconnect_thread is not None and \
+                    self._reconnect_thread.is_alive():
+                return
+            JMS_LOGGER.warning(
+                "STOMP connection to HMC %s has been lost - reconnecting",
+                self._host)
+            self._conn = None
+            self._reconnect_thread = threading.Thread(
+                target=self._reconnect_run,
+                name='zhmcclient.NotificationMultiplexer.reconnect',
+                daemon=True)
+            self._reconnect_thread.start()
+        self._broadcast(_NotificationItem(
+            msgtype='disconnected', headers=None, message=None))
+
+    def _reconnect_run(self):
+        """
+        Thread function that re-establishes the STOMP connection, retrying
+        with increasing wait times until it succeeds or this multiplexer is
+        closed.
+        """
+        rt_config = self._rt_config
+        sleep_time = rt_config.reconnect_sleep_initial
+        while True:
+            with self._lock:
+                if self._closing:
+                    return
+                if self._conn is not None:
+                    # Already reconnected by subscribe()
+                    break
+            # The connection is established without holding the lock, because
+            # connecting is retried for some time and would block close(),
+            # subscribe() and unsubscribe() in the meantime.
+            # pylint: disable=broad-exception-caught
+            try:
+                conn, listener = self._create_connection()
+            except Exception as exc:
+                JMS_LOGGER.error(
+                    "Re-establishing the STOMP connection to HMC %s "
+                    "failed (retrying in %s s): %s: %s",
+                    self._host, sleep_time, exc.__class__.__name__, exc)
+            else:
+                installed = False
+                with self._lock:
+                    closing = self._closing
+                    if not closing and self._conn is None:
+                        try:
+                            self._install_connection(conn, listener)
+                            installed = True
+                        except Exception as exc:
+                            self._conn = None
+                            JMS_LOGGER.error(
+                                "Re-subscribing the STOMP connection to HMC "
+                                "%s failed (retrying in %s s): %s: %s",
+                                self._host, sleep_time,
+                                exc.__class__.__name__, exc)
+                    reconnected = self._conn is not None
+                if installed:
+                    break
+                # Closed or reconnected by subscribe() in the meantime, or
+                # re-subscribing failed
+                conn.disconnect()
+                if closing:
+                    return
+                if reconnected:
+                    break
+            time.sleep(sleep_time)
+            sleep_time = min(
+                sleep_time * (1 + rt_config.reconnect_sleep_increase),
+                rt_config.reconnect_sleep_max)
+        for subscription in self._subscriptions():
+            subscription._notify_lost()  # pylint: disable=protected-access
+
+
+class _MultiplexListener:
+    """
+    A notification listener class for use by the Python `stomp` package, for
+    the STOMP connection of a :class:`~zhmcclient.NotificationMultiplexer`.
+
+    This is an internal class that does not need to be accessed or created by
+    the user.
+
+    Note: In the stomp examples, this class inherits from
+    stomp.ConnectionListener. However, since that class defines only empty
+    methods and since we want to import the stomp module in a lazy manner,
+    we are not using that class, and stomp does not require us to.
+    """
+
+    def __init__(self, multiplexer):
+        self._multiplexer = multiplexer
+
+    def on_message(self, *frame_args):
+        """
+        Event method that gets called when a STOMP MESSAGE frame has been
+        received from the HMC (representing an HMC notification).
+        """
+        headers, message = get_headers_message(frame_args)
+        # pylint: disable=protected-access
+        self._multiplexer._route(_NotificationItem(
+            msgtype='message', headers=headers, message=message))
+
+    def on_error(self, *frame_args):
+        """
+        Event method that gets called when a STOMP ERROR frame has been
+        received from the HMC.
+        """
+        headers, message = get_headers_message(frame_args)
+        # pylint: disable=protected-access
+        self._multiplexer._broadcast(_NotificationItem(
+            msgtype='error', headers=headers, message=message))
+
+    def on_disconnected(self):
+        """
+        Event method that gets called when the STOMP connection to the HMC
+        has been lost or disconnected.
+        """
+        # pylint: disable=protected-access
+        self._multiplexer._connection_lost(self)
@@ -224,6 +224,73 @@ class PartitionManager(BaseManager):
         self._name_uri_cache.update(name, uri)
         return part
 
+    def _pull_statuses(self, resources):
+        """
+        Retrieve the status of partitions from the HMC with one List operation.
+        """
+        self._pull_statuses_with_list(
+            resources, f'{self.cpc.uri}/partitions', 'partitions')
+
+    @logged_api_call
+    def wait_for_statuses(self, statuses, status_timeout=None,
+                          use_notifications=False):
+        """
+        Wait until the status of multiple partitions of this CPC has reached a
+        desired value.
+
+        By default, the status of the partitions is polled by performing one
+        List operation every second for all partitions that have not yet reached
+        their desired status.
+
+        If `use_notifications` is `True`, the method waits for status change
+        notifications from the HMC instead, so that it returns as soon as the
+        status has been reached. For this, the partitions are enabled for
+        :ref:`auto-updating` (if not yet enabled) for the duration of the
+        wait. To protect against lost notifications, the status is retrieved
+        from the HMC if no status change notification has been received for
+        :data:`~zhmcclient._constants.STATUS_FALLBACK_POLL_INTERVAL` seconds.
+
+        HMC/SE version requirements:
+
+        * SE version >= 2.13.1
+
+        Parameters:
+
+          statuses (dict):
+            The partitions to wait for, with key: :class:`~zhmcclient.Partition`
+            object of this CPC, value: desired status or iterable of desired
+            status values (see the `status` parameter of
+            :meth:`~zhmcclient.Partition.wait_for_status`).
+
+          status_timeout (:term:`number`):
+            Timeout in seconds, for waiting that the status of all partitions
+            has reached one of their desired status values. The special value
+            0 means that no timeout is set.
+            `None` means that the default status timeout will be used.
+            If the timeout expires, a :exc:`~zhmcclient.StatusTimeout` is
+            raised.
+
+          use_notifications (bool):
+            Wait for status change notifications from the HMC instead of
+            polling the status.
+
+        Raises:
+
+          :exc:`~zhmcclient.HTTPError`
+          :exc:`~zhmcclient.ParseError`
+          :exc:`~zhmcclient.AuthError`
+          :exc:`~zhmcclient.ConnectionError`
+          :exc:`~zhmcclient.StatusTimeout`: The status timeout expired while
+            waiting for the desired partition statuses. The exception has the
+            current status and the desired statuses of the first partition that
+            has not reached its desired status.
+          :exc:`~zhmcclient.CeasedExistence`: One of the partitions ceased to
+            exist while waiting.
+        """
+        self._wait_for_statuses(
+            statuses, status_timeout=status_timeout,
+            use_notifications=use_notifications)
+
 
 class Partition(BaseResource):
     """
@@ -1250,7 +1317,8 @@ class Partition(BaseResource):
         return result['websocket-uri']
 
     @logged_api_call
-    def wait_for_status(self, status, status_timeout=None):
+    def wait_for_status(self, status, status_timeout=None,
+                        use_notifications=False):
         """
         Wait until the status of this partition has a desired value.
 
@@ -1273,6 +1341,11 @@ class Partition(BaseResource):
             If the timeout expires, a :exc:`~zhmcclient.StatusTimeout` is
             raised.
 
+          use_notifications (bool):
+            Wait for status change notifications from the HMC instead of
+            polling the status. For details, see
+            :meth:`~zhmcclient.PartitionManager.wait_for_statuses`.
+
         Raises:
 
           :exc:`~zhmcclient.HTTPError`
@@ -1281,7 +1354,14 @@ class Partition(BaseResource):
           :exc:`~zhmcclient.ConnectionError`
           :exc:`~zhmcclient.StatusTimeout`: The status timeout expired while
             waiting for the desired partition status.
-        """
+          :exc:`~zhmcclient.CeasedExistence`: The partition ceased to exist
+            while waiting (only with `use_notifications`).
+        """
+        if use_notifications:
+            self.manager.wait_for_statuses(
+                {self: status}, status_timeout=status_timeout,
+                use_notifications=True)
+            return
         if status_timeout is None:
             status_timeout = \
                 self.manager.session.retry_timeout_config.status_timeout
@@ -25,7 +25,8 @@ import threading
 from immutabledict import immutabledict
 
 from ._logging import logged_api_call
-from ._utils import repr_dict, repr_timestamp, repr_obj_id
+from ._utils import repr_dict, repr_timestamp, repr_obj_id, \
+    invoke_callbacks
 from ._exceptions import CeasedExistence, HTTPError
 
 __all__ = ['BaseResource']
@@ -98,6 +99,9 @@ class BaseResource:
         self._property_lock = threading.RLock()
         self._auto_update = False
         self._ceased_existence = False
+        # Callbacks for auto-updated changes, as list of tuple(callback,
+        # property names or None)
+        self._change_callbacks = []
 
     @property
     def properties(self):
@@ -273,6 +277,96 @@ class BaseResource:
             self._properties_timestamp = int(time.time())
             self._full_properties = True
 
+    @logged_api_call
+    def refresh(self):
+        """
+        Retrieve the full set of resource properties from the HMC, cache them
+        in this Python object, and return the properties that have changed.
+
+        This method is like :meth:`pull_full_properties`, but in addition it
+        returns a change set with the properties whose values differ from the
+        values cached in this Python object before the refresh. This allows
+        callers to act only on what changed, without comparing the complete
+        set of properties themselves.
+
+        If the resource no longer exists on the HMC,
+        :exc:`~zhmcclient.CeasedExistence` will be raised.
+
+        This method serializes with other methods that access or change
+        resource properties on the same Python object.
+
+        Authorization requirements:
+
+        * Object-access permission to this resource.
+
+        Returns:
+
+          dict: The change set, with:
+
+          - Key: Name of the changed property.
+          - Value: tuple(old, new) with the old and new value of the property.
+            If the property was not cached in this Python object before the
+            refresh, the old value is `None`. If the property was cached in
+            this Python object but is no longer returned by the HMC, the new
+            value is `None` and the property is removed from this Python
+            object.
+
+          If no property has changed, an empty dictionary is returned.
+
+        Raises:
+
+          :exc:`~zhmcclient.HTTPError`
+          :exc:`~zhmcclient.ParseError`
+          :exc:`~zhmcclient.AuthError`
+          :exc:`~zhmcclient.ConnectionError`
+          :exc:`~zhmcclient.CeasedExistence`
+        """
+        with self._property_lock:
+            if self._ceased_existence:
+                raise CeasedExistence(self._uri)
+
+        try:
+            full_properties = self.manager.session.get(self._uri, resource=self)
+        except HTTPError as exc:
+            if exc.http_status == 404 and exc.reason == 1:
+                # The resource no longer exists
+                self.cease_existence_local()
+                raise CeasedExistence(self._uri)
+            raise
+
+        return self._update_full_properties(full_properties)
+
+    def _update_full_properties(self, full_properties):
+        """
+        Replace the cached properties of this Python object with a full set
+        of resource properties retrieved from the HMC, and return the
+        change set.
+
+        Cached properties that are not in the full set of resource properties
+        are removed.
+
+        Parameters:
+
+          full_properties (dict): Full set of resource properties.
+
+        Returns:
+
+          dict: The change set, as described for :meth:`refresh`.
+        """
+        with self._property_lock:
+            changes = {}
+            for name, new_value in full_properties.items():
+                old_value = self._properties.get(name, None)
+                if name not in self._properties or old_value != new_value:
+                    changes[name] = (old_value, new_value)
+            for name, old_value in self._properties.items():
+                if name not in full_properties:
+                    changes[name] = (old_value, None)
+            self._properties = dict(full_properties)
+            self._properties_timestamp = int(time.time())
+            self._full_properties = True
+        return changes
+
     @logged_api_call
     def pull_properties(self, properties):
         """
@@ -719,6 +813,98 @@ class BaseResource:
             if not session.auto_updater.has_objects():
                 session.unsubscribe_auto_update()
 
+    def on_change(self, callback, properties=None):
+        """
+        Register a callback function that is invoked when properties of this
+        resource object have been changed by :ref:`auto-updating`, or when
+        the resource has ceased to exist.
+
+        The callback function is invoked in a thread of the auto updater of
+        the session after the properties have been updated, and only while
+        auto-updating is enabled for this resource object. It should return
+        quickly, because it delays the processing of further notifications.
+        Exceptions raised by the callback function are logged and otherwise
+        ignored.
+
+        Example for a callback function that is invoked when the status of a
+        partition changes:
+
+        .. code-block:: python
+
+            def status_changed(partition, properties):
+                if properties is None:
+                    print(f"Partition {partition.name} has been deleted")
+                else:
+                    print(f"Partition {partition.name} has status "
+                          f"{properties['status']}")
+
+            partition.enable_auto_update()
+            partition.on_change(status_changed, properties=['status'])
+
+        Parameters:
+
+          callback (callable): The callback function. It is invoked with the
+            following positional arguments:
+
+            * resource (:class:`~zhmcclient.BaseResource`): This resource
+              object.
+            * properties (dict): The changed properties that match the
+              `properties` parameter, with their new values. `None` if the
+              resource has ceased to exist.
+
+          properties (iterable of :term:`string`): The names of the properties
+            whose changes cause the callback function to be invoked.
+            `None` means that changes of any property cause the callback
+            function to be invoked.
+        """
+        if properties is not None:
+            properties = frozenset(properties)
+        with self._property_lock:
+            self._change_callbacks.append((callback, properties))
+
+    def remove_callback(self, callback):
+        """
+        Unregister a callback function that has been registered with
+        :meth:`on_change`.
+
+        If the callback function is not registered, nothing is done.
+
+        Parameters:
+
+          callback (callable): The callback function.
+        """
+        with self._property_lock:
+            self._change_callbacks = [
+                item for item in self._change_callbacks
+                if item[0] != callback]
+
+    def auto_update_notify_change(self, properties):
+        """
+        Invoke the callback functions registered with :meth:`on_change` for
+        changed properties of this resource object.
+
+        This method is called by the auto updater after it has updated the
+        properties of this resource object, or after the resource has ceased
+        to exist. It should not be called by the user.
+
+        Parameters:
+
+          properties (dict): The changed properties with their new values, or
+            `None` if the resource has ceased to exist.
+        """
+        with self._property_lock:
+            change_callbacks = list(self._change_callbacks)
+        for callback, names in change_callbacks:
+            if properties is None or names is None:
+                changed_props = properties
+            else:
+                changed_props = {name: value
+                                 for name, value in properties.items()
+                                 if name in names}
+                if not changed_props:
+                    continue
+            invoke_callbacks([callback], self, changed_props)
+
     def dump(self):
         """
         Dump this resource with its properties and child resources
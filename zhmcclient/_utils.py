@@ -21,10 +21,12 @@ import re
 from collections.abc import Mapping, MutableSequence, Iterable
 from datetime import datetime, timezone
 import warnings
+import logging
 
 from requests.utils import quote
 
 from ._exceptions import HTTPError, FilterConversionError
+from ._constants import JMS_LOGGER_NAME
 
 __all__ = ['datetime_from_timestamp', 'timestamp_from_datetime']
 
@@ -878,3 +880,25 @@ def get_headers_message(frame_args):
     if message == '':
         message = None
     return headers, message
+
+
+def invoke_callbacks(callbacks, *args):
+    """
+    Invoke callback functions with the specified arguments.
+
+    Exceptions raised by a callback function are logged to the JMS logger and
+    do not prevent the invocation of the other callback functions.
+
+    Parameters:
+
+      callbacks (iterable of callable): The callback functions.
+
+      args: Positional arguments for the callback functions.
+    """
+    for callback in callbacks:
+        try:
+            callback(*args)
+        except Exception:  # pylint: disable=broad-exception-caught
+            logging.getLogger(JMS_LOGGER_NAME).exception(
+                "Callback function %r raised an exception (ignored)",
+                callback)
@@ -20,6 +20,7 @@ local Python object and maintains its resource state across operations.
 
 import re
 import copy
+from collections import deque
 from immutabledict import immutabledict
 
 from .._utils import repr_dict, repr_manager, repr_list, \
@@ -4168,6 +4169,10 @@ class FakedMetricsContext(FakedBaseResource):
         Initialization: Optional. If omitted or the empty list, all metric
         groups that are valid for the operational mode of each CPC will be
         returned.
+
+    In addition to returning the faked metric values of the faked HMC, a
+    faked Metrics Context can replay captured metrics responses (see
+    :meth:`replay`).
     """
 
     def __init__(self, manager, properties):
@@ -4175,6 +4180,34 @@ class FakedMetricsContext(FakedBaseResource):
             manager=manager,
             properties=properties)
         assert 'anticipated-frequency-seconds' in properties
+        self._replay_responses = deque()
+
+    def replay(self, metrics_responses):
+        """
+        Add metrics responses to be returned by the subsequent "Get Metrics"
+        operations on this context, one per operation and in the order
+        specified.
+
+        This allows replaying metrics responses that have been captured from
+        a real HMC, for example using
+        :meth:`zhmcclient.MetricsResponse.to_bytes` and
+        :meth:`zhmcclient.MetricsResponse.from_bytes`. Once all replayed
+        metrics responses have been returned, the "Get Metrics" operation
+        returns the faked metric values of the faked HMC again.
+
+        The metric groups in the replayed metrics responses must be defined
+        for this context.
+
+        Parameters:
+
+          metrics_responses (iterable): The metrics responses to be replayed,
+            each as a :class:`zhmcclient.MetricsResponse` object or as a
+            metrics response string.
+        """
+        for mr in metrics_responses:
+            if not isinstance(mr, str):
+                mr = mr.metrics_response_str
+            self._replay_responses.append(mr)
 
     def get_metric_group_definitions(self):
         """
@@ -4269,6 +4302,8 @@ class FakedMetricsContext(FakedBaseResource):
           "MetricsResponse" string as described for the "Get Metrics"
             operation response.
         """
+        if self._replay_responses:
+            return self._replay_responses.popleft()
         mv_list = self.get_metric_values()
         resp_lines = []
         for mv in mv_list:
@@ -26,6 +26,7 @@ the handling of the HTTP methods.
 
 import re
 import time
+import functools
 import copy
 import uuid
 from random import randrange
@@ -502,28 +503,94 @@ def get_additional_properties(query_parms, wo_properties=None):
     return add_props
 
 
+# Maximum number of URIs for which the result of looking up the URI handler
+# is cached in a UriHandler object.
+URI_HANDLER_CACHE_SIZE = 1024
+
+# Regexp matching the first URI segment after '/api/' of a URI pattern, if
+# that segment is a literal string that is followed by the next segment, by
+# an optional query string (i.e. the pattern '(?:\?(.*))?'), or by the end of
+# the URI.
+_LITERAL_SEGMENT_PATTERN = re.compile(
+    r'^/api/([A-Za-z0-9_-]+)(?:/|\(\?:\\\?\(\.\*\)\)\?$|$)')
+
+
+def _uri_segment(uri):
+    """
+    Return the first URI segment after '/api/' of a URI, without any query
+    string, or `None` if the URI does not start with '/api/'.
+    """
+    if not uri.startswith('/api/'):
+        return None
+    return uri[5:].split('/', 1)[0].split('?', 1)[0]
+
+
 class UriHandler:
     """
     Handle HTTP methods against a set of known URIs and invoke respective
     handlers.
+
+    The URI patterns are grouped by their first URI segment after '/api/'
+    (e.g. 'cpcs'), so that looking up the handler for a URI matches only the
+    patterns that can match the URI, in their original order. In addition, the
+    results of the most recent lookups are cached.
     """
 
     def __init__(self, uris):
         self._uri_handlers = []  # tuple of (regexp-pattern, handler-name)
+
+        # URI patterns by first URI segment, as:
+        #   dict(key: segment, value: list of tuple(regexp-pattern, handler))
+        # Each list also contains the URI patterns that do not start with a
+        # literal segment, in their original order.
+        self._segment_handlers = {}
+
+        # URI patterns that do not start with a literal segment
+        self._other_handlers = []
+
+        segments = []  # literal segment or None, for each URI pattern
         for uri, handler_class in uris:
             uri_pattern = re.compile('^' + uri + '$')
             tup = (uri_pattern, handler_class)
             self._uri_handlers.append(tup)
-
-    def handler(self, uri, method):
+            m = _LITERAL_SEGMENT_PATTERN.match(uri)
+            segment = m.group(1) if m else None
+            segments.append(segment)
+            if segment is None:
+                self._other_handlers.append(tup)
+        for segment in set(segments) - {None}:
+            self._segment_handlers[segment] = [
+                tup for tup, seg in zip(self._uri_handlers, segments)
+                if seg in (segment, None)]
+
+        self._lookup = functools.lru_cache(maxsize=URI_HANDLER_CACHE_SIZE)(
+            self._lookup_uncached)
+
+    def _lookup_uncached(self, uri):
         """
-        Return the handler function for an URI and HTTP method.
+        Return a tuple(handler_class, uri_parms) for the first URI pattern
+        that matches the URI, or `None`.
         """
-        for uri_pattern, handler_class in self._uri_handlers:
+        segment = _uri_segment(uri)
+        if segment is None:
+            uri_handlers = self._uri_handlers
+        else:
+            uri_handlers = self._segment_handlers.get(
+                segment, self._other_handlers)
+        for uri_pattern, handler_class in uri_handlers:
             m = uri_pattern.match(uri)
             if m:
                 uri_parms = m.groups()
                 return handler_class, uri_parms
+        return None
+
+    def handler(self, uri, method):
+        """
+        Return the handler function for an URI and HTTP method.
+        """
+        result = self._lookup(uri)
+        if result is not None:
+            return result
         new_exc = InvalidResourceError(method, uri)
         new_exc.__cause__ = None
         raise new_exc  # zhmcclient.mock.InvalidResourceError